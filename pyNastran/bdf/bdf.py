@@ -15,7 +15,7 @@ import io
 import traceback
 from collections import defaultdict
 
-from typing import List, Dict, Optional, Union, Set, Any, cast
+from typing import List, Dict, Tuple, Optional, Union, Set, Any, cast
 from six import string_types, iteritems, StringIO
 from six.moves.cPickle import load, dump, dumps  # type: ignore
 
@@ -171,12 +171,20 @@ from pyNastran.bdf.errors import (CrossReferenceError, DuplicateIDsError,
 from pyNastran.bdf.bdf_interface.pybdf import (
     BDFInputPy, _clean_comment, _clean_comment_bulk, EXECUTIVE_CASE_SPACES)
 from pyNastran.bdf.bdf_interface.add_card import CARD_MAP
+from pyNastran.bdf.bdf_interface.parallel_parse import parse_cards_parallel
+from pyNastran.bdf.bdf_interface.fast_parse import (
+    parse_cards_fast, parse_cards_fast_block, NCARDS_BLOCK)
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
+from pyNastran.bdf.bdf_interface.model_cache import BDFModelCache
+from pyNastran.bdf.bdf_interface.coord_arrays import (
+    CoordArrays, get_grid_arrays, get_xyz_in_coord_vectorized)
 
 def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
              save_file_structure=False,
              skip_cards=None, read_cards=None,
-             encoding=None, log=None, debug=True, mode='msc'):
-    # type: (Optional[str], bool, bool, bool, Optional[List[str]], Optional[str], Optional[SimpleLogger], Optional[bool], str) -> BDF
+             encoding=None, log=None, debug=True, mode='msc', nprocs=1, use_mmap=False,
+             storage='dict', cache_dir=None, nthreads=1):
+    # type: (Optional[str], bool, bool, bool, Optional[List[str]], Optional[str], Optional[SimpleLogger], Optional[bool], str, int, bool, str, Optional[str], int) -> BDF
     """
     Creates the BDF object
 
@@ -211,6 +219,21 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    nprocs : int; default=1
+        the number of processes used to create the bulk data cards
+        (see ``BDF.read_bdf``)
+    use_mmap : bool; default=False
+        memory-map the files and stream the bulk data deck
+        (see ``BDF.read_bdf``)
+    storage : str; default='dict'
+        the storage of the nodes, elements, and coords
+        (see ``BDF.__init__``)
+    cache_dir : str; default=None
+        the directory for the binary model cache
+        (see ``BDF.read_bdf``)
+    nthreads : int; default=1
+        the number of threads used to read the INCLUDE files
+        (see ``BDF.read_bdf``)
 
     Returns
     -------
@@ -237,7 +260,7 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
                does not have so many methods
     .. todo:: finish this
     """
-    model = BDF(log=log, debug=debug, mode=mode)
+    model = BDF(log=log, debug=debug, mode=mode, storage=storage)
     if read_cards and skip_cards:
         msg = 'read_cards=%s skip_cards=%s cannot be used at the same time'
         raise NotImplementedError(msg)
@@ -248,7 +271,8 @@ def read_bdf(bdf_filename=None, validate=True, xref=True, punch=False,
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, nprocs=nprocs, use_mmap=use_mmap,
+                   cache_dir=cache_dir, nthreads=nthreads)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -332,8 +356,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
     #: required for sphinx bug
     #: http://stackoverflow.com/questions/11208997/autoclass-and-instance-attributes
     #__slots__ = ['_is_dynamic_syntax']
-    def __init__(self, debug=True, log=None, mode='msc'):
-        # type: (Optional[bool], SimpleLogger, str) -> None
+    def __init__(self, debug=True, log=None, mode='msc', storage='dict'):
+        # type: (Optional[bool], SimpleLogger, str, str) -> None
         """
         Initializes the BDF_ object
 
@@ -350,14 +374,30 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         mode : str; default='msc'
             the type of Nastran
             valid_modes = {'msc', 'nx'}
+        storage : str; default='dict'
+            the storage of the nodes, elements, and coords
+            (see ``BDF.__init__``)
         """
         assert debug in [True, False, None], 'debug=%r' % debug
+        assert storage in ['dict', 'columnar'], 'storage=%r' % storage
         self.echo = False
         self.read_includes = True
 
+        # the number of processes used to create the bulk data cards
+        self._nprocs = 1
+
+        # parse the high-volume cards (e.g., GRID, CQUAD4) in blocks
+        self.fast_parse = True
+
+        # the storage of the nodes, elements, and coords
+        self.storage = storage
+
         # file management parameters
         self.active_filenames = []  # type: List[str]
         self.active_filename = None  # type: Optional[str]
+        #: the (bdf_filename, nbytes, read_time) of the INCLUDE files that
+        #: were read (see ``BDFInputPy.include_stats``)
+        self.include_stats = []  # type: List[Tuple[str, int, float]]
         self.include_dir = ''
         self.dumplines = False
 
@@ -884,26 +924,21 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         loads/spcs (not supported) are tricky because you can't replace
         cards one-to-one...not sure what to do
 
+        If the model was cross referenced with track_dependencies=True,
+        the replaced cards are re-linked by cross_reference_dirty().
+
         """
-        for nid, node in replace_model.nodes.items():
-            self.nodes[nid] = node
-        for eid, elem in self.elements.items():
-            self.elements[eid] = elem
-        for eid, elem in replace_model.rigid_elements.items():
-            self.rigid_elements[eid] = elem
-        for pid, prop in replace_model.properties.items():
-            self.properties[pid] = prop
-        for mid, mat in replace_model.materials.items():
-            self.materials[mid] = mat
-
-        for dvid, desvar in replace_model.desvars.items():
-            self.desvars[dvid] = desvar
-        for dvid, dvprel in replace_model.dvprels.items():
-            self.dvprels[dvid] = dvprel
-        for dvid, dvmrel in replace_model.dvmrels.items():
-            self.dvmrels[dvid] = dvmrel
-        for dvid, dvgrid in replace_model.dvgrids.items():
-            self.dvgrids[dvid] = dvgrid
+        slots = [
+            'nodes', 'elements', 'rigid_elements', 'properties', 'materials',
+            'desvars', 'dvprels', 'dvmrels', 'dvgrids',
+        ]
+        is_dirty = self._xref_dependents is not None
+        for slot in slots:
+            cards = getattr(self, slot)
+            for key, card in getattr(replace_model, slot).items():
+                cards[key] = card
+                if is_dirty:
+                    self._dirty_cards.add((slot, key))
 
     def disable_cards(self, cards):
         # type : (Sequence[str]) -> None
@@ -1048,11 +1083,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         #print('-------------ssett (end)----------')
         self.active_filenames += obj.active_filenames
         self.active_filename = obj.active_filename
+        self.include_stats += obj.include_stats
         self.include_dir = obj.include_dir
 
     def read_bdf(self, bdf_filename=None,
                  validate=True, xref=True, punch=False, read_includes=True,
-                 save_file_structure=False, encoding=None):
+                 save_file_structure=False, encoding=None, nprocs=1, use_mmap=False,
+                 cache_dir=None, nthreads=1):
         """
         Read method for the bdf files
 
@@ -1072,6 +1109,34 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        nprocs : int; default=1
+            the number of processes used to create the bulk data cards
+            1 : parse the cards on the main process
+            >1 : split the cards into chunks that are parsed by a pool of
+                 processes; the cards are added to the model in order, so
+                 duplicate IDs and parsing errors are handled the same way
+        use_mmap : bool; default=False
+            memory-map the BDF/INCLUDE files and stream the bulk data deck
+            into the card parser, so the cards are added to the model a
+            block at a time and the lines of the whole deck are never
+            stored (lowers the peak memory usage for large decks);
+            nprocs > 1 still collects all the cards before they're parsed;
+            not supported for StringIO/ZONA/AUXMODEL decks
+        cache_dir : str; default=None
+            the directory for the binary model cache
+            (see ``pyNastran.bdf.bdf_interface.model_cache``);
+            if the main BDF, the INCLUDE files, and the read options haven't
+            changed, the model is loaded from the cache instead of parsing
+            the deck; otherwise, the model is saved to the cache after it's
+            read; not supported for StringIO decks or save_file_structure=True
+        nthreads : int; default=1
+            the number of threads used to read the INCLUDE files
+            1 : the INCLUDE files are read as they're reached
+            >1 : the INCLUDE tree is found up front and the files are read
+                 and decoded concurrently (faster on a high latency file
+                 system); the files are spliced in the same order;
+                 ``model.include_stats`` has the (bdf_filename, nbytes,
+                 read_time) of each INCLUDE file; not used with use_mmap=True
 
         .. code-block:: python
 
@@ -1091,17 +1156,41 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         self.save_file_structure = save_file_structure
+        self._nprocs = nprocs
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
         self.log.debug('---starting BDF.read_bdf of %s---' % self.bdf_filename)
         self._parse_primary_file_header(bdf_filename)
 
+        cache = None
+        if (cache_dir is not None and isinstance(bdf_filename, string_types) and
+                not save_file_structure):
+            cache = BDFModelCache(cache_dir, log=self.log)
+            cache_options = self._get_cache_options()
+            bdf_filename_read = self.bdf_filename
+            if cache.load_model(self, bdf_filename, cache_options):
+                self.bdf_filename = bdf_filename_read
+                self._set_case_control_deck(self.case_control_lines)
+                if validate:
+                    self.validate()
+                self.cross_reference(xref=xref)
+                self._xref = xref
+                self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
+                return
+
         obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
                          nastran_format=self.nastran_format,
                          consider_superelements=self.is_superelements,
-                         log=self.log, debug=self.debug)
-        out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
-        system_lines, executive_control_lines, case_control_lines, bulk_data_lines, bulk_data_ilines, superelement_lines, superelement_ilines = out
-        self._set_pybdf_attributes(obj, save_file_structure)
+                         log=self.log, debug=self.debug, nthreads=nthreads)
+        is_stream = (use_mmap and isinstance(bdf_filename, string_types) and
+                     self.nastran_format in ['msc', 'nx'] and not self._is_cards_dict)
+        if is_stream:
+            out = obj.get_lines_mmap(bdf_filename, punch=self.punch)
+            system_lines, executive_control_lines, case_control_lines, bulk_data_lines, superelement_lines, superelement_ilines = out
+            bulk_data_ilines = None
+        else:
+            out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
+            system_lines, executive_control_lines, case_control_lines, bulk_data_lines, bulk_data_ilines, superelement_lines, superelement_ilines = out
+            self._set_pybdf_attributes(obj, save_file_structure)
 
         self.system_command_lines = system_lines
         self.executive_control_lines = executive_control_lines
@@ -1110,21 +1199,24 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         sol, method, sol_iline = parse_executive_control_deck(executive_control_lines)
         self.update_solution(sol, method, sol_iline)
 
-        self.case_control_deck = CaseControlDeck(case_control_lines, self.log)
-        self.case_control_deck.solmap_to_value = self._solmap_to_value
-        self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+        self._set_case_control_deck(case_control_lines)
 
         try:
-            self._parse_all_cards(bulk_data_lines, bulk_data_ilines)
+            self._parse_all_cards(bulk_data_lines, bulk_data_ilines, is_stream=is_stream)
         except SuperelementFlagError:
             self.clear_attributes()
             self.log.error('Attempting to use is_superelements=True.')
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, nprocs=nprocs, use_mmap=use_mmap,
+                          cache_dir=cache_dir, nthreads=nthreads)
             return
 
+        if is_stream:
+            # the INCLUDE files are found as the bulk data is streamed
+            self._set_pybdf_attributes(obj, save_file_structure)
+
         if superelement_lines:
             self._add_superelements(superelement_lines, superelement_ilines)
 
@@ -1134,19 +1226,60 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         if validate:
             self.validate()
 
+        if cache is not None:
+            cache.save_model(self, bdf_filename, cache_options)
+
         self.cross_reference(xref=xref)
         self._xref = xref
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
+    def _set_case_control_deck(self, case_control_lines):
+        """creates the case control deck"""
+        self.case_control_deck = CaseControlDeck(case_control_lines, self.log)
+        self.case_control_deck.solmap_to_value = self._solmap_to_value
+        self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+
+    def _get_cache_options(self):
+        """gets the read options that change the model for the BDFModelCache"""
+        cache_options = {
+            'punch' : self.punch,
+            'read_includes' : self.read_includes,
+            'encoding' : self._encoding,
+            'nastran_format' : self.nastran_format,
+            'storage' : self.storage,
+            'is_superelements' : self.is_superelements,
+            'cards_to_read' : sorted(self.cards_to_read),
+            'values_to_skip' : sorted(self.values_to_skip.items()),
+        }
+        return cache_options
+
     def _add_superelements(self, superelement_lines, superelement_ilines):  # pragma: no cover
         self.log.warning('_add_superelements should be overwritten')
 
-    def _parse_all_cards(self, bulk_data_lines, bulk_data_ilines):
-        """creates and loads all the cards the bulk data section"""
+    def _parse_all_cards(self, bulk_data_lines, bulk_data_ilines, is_stream=False):
+        """
+        creates and loads all the cards the bulk data section
+
+        Parameters
+        ----------
+        bulk_data_lines : List[str] / iterable
+            is_stream=False : the lines of the bulk data deck
+            is_stream=True : the (line, ifile_iline) pairs of the bulk data deck
+        bulk_data_ilines : (nlines, 2) int ndarray / None
+            the [ifile, iline] pair for each line (None if is_stream=True)
+        is_stream : bool; default=False
+            is bulk_data_lines a stream (see ``BDFInputPy.get_lines_mmap``)
+        """
         cards_list = []
         cards_dict = {}
-        if self._is_cards_dict:
+        if is_stream and self._nprocs == 1:
+            self._parse_cards_stream(bulk_data_lines)
+            card_count = {}
+        elif is_stream:
+            # the pool parses all the cards at once
+            cards_list, cards_dict, card_count = self.get_bdf_cards_stream(bulk_data_lines)
+        elif self._is_cards_dict:
             cards_dict, card_count = self.get_bdf_cards_dict(
                 bulk_data_lines, bulk_data_ilines)
             #if 0:
@@ -1170,7 +1303,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
                 dict_values = getattr(self, key)
-                if not isinstance(dict_values, dict):
+                if not isinstance(dict_values, (dict, ColumnarDict)):
                     msg = '%r is an invalid type; only dictionaries are supported' % key
                     raise TypeError(msg)
                 for value in values:
@@ -1187,6 +1320,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.read_includes = read_includes
         self.active_filenames = []
+        self.include_stats = []
 
         if bdf_filename is None:
             from pyNastran.utils.gui_io import load_file_dialog
@@ -1337,24 +1471,78 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         if bulk_data_ilines is None:
             bulk_data_ilines = np.zeros((len(bulk_data_lines), 2), dtype='int32')
 
+        nlines = len(bulk_data_lines)
+        if len(bulk_data_lines) != len(bulk_data_ilines):
+            msg = 'len(bulk_data_lines)=%s len(bulk_data_ilines)=%s' % (
+                len(bulk_data_lines), len(bulk_data_ilines))
+            self.log.warning(msg)
+
+        bulk_data_stream = ((line, bulk_data_ilines[iline_bulk, :])
+                            for iline_bulk, line in enumerate(bulk_data_lines))
+        return self.get_bdf_cards_stream(bulk_data_stream, nlines=nlines)
+
+    def get_bdf_cards_stream(self, bulk_data_stream, nlines=None):
+        """
+        Parses the BDF lines into a list of card_lines
+
+        Parameters
+        ----------
+        bulk_data_stream : iterable
+            the (line, ifile_iline) pairs of the bulk data deck
+            (e.g., from ``BDFInputPy.get_lines_mmap``)
+        nlines : int; default=None
+            the number of lines (only used for logging)
+
+        Returns
+        -------
+        cards_list : List[card]
+            card : [card_name, comment, card_lines, ifile_iline]
+        cards_dict : Dict[card_name] = List[[comment, card_lines, ifile_iline]]
+            the BAROR/BEAMOR cards
+        card_count : Dict[card_name] = int
+            the number of times each card was found
+
+        """
         cards_list = []
         cards_dict = defaultdict(list)
         dict_cards = ['BAROR', 'BEAMOR']
-        #cards = defaultdict(list)
         card_count = defaultdict(int)
+        for card in self.iter_bdf_cards_stream(bulk_data_stream, nlines=nlines):
+            card_name = card[0]
+            if card_name in dict_cards:
+                cards_dict[card_name].append(card[1:])
+            else:
+                cards_list.append(card)
+            card_count[card_name] += 1
+        return cards_list, cards_dict, card_count
+
+    def iter_bdf_cards_stream(self, bulk_data_stream, nlines=None):
+        """
+        Groups the BDF lines into cards, which are yielded as they're found,
+        so the card_lines of the whole deck are never stored
+
+        Parameters
+        ----------
+        bulk_data_stream : iterable
+            the (line, ifile_iline) pairs of the bulk data deck
+            (e.g., from ``BDFInputPy.get_lines_mmap``)
+        nlines : int; default=None
+            the number of lines (only used for logging)
+
+        Yields
+        ------
+        card : List[card_name, comment, card_lines, ifile_iline]
+            the unparsed card
+
+        """
         full_comment = ''
         card_lines = []
         old_ifile_iline = None
         old_card_name = None
         backup_comment = ''
-        nlines = len(bulk_data_lines)
-        if len(bulk_data_lines) != len(bulk_data_ilines):
-            msg = 'len(bulk_data_lines)=%s len(bulk_data_ilines)=%s' % (
-                len(bulk_data_lines), len(bulk_data_ilines))
-            self.log.warning(msg)
+        ifile_iline = None
 
-        for iline_bulk, line in enumerate(bulk_data_lines):
-            ifile_iline = bulk_data_ilines[iline_bulk, :]
+        for iline_bulk, (line, ifile_iline) in enumerate(bulk_data_stream):
             #print(iline_bulk, ifile_iline, line)
             #print('    backup=%r' % backup_comment)
             comment = ''
@@ -1373,14 +1561,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     # new list version
                     #if full_comment:
                         #print('full_comment = ', full_comment)
-                    if old_card_name in dict_cards:
-                        cards_dict[old_card_name].append([_prep_comment(full_comment),
-                                                          card_lines, ifile_iline])
-                    else:
-                        cards_list.append([old_card_name, _prep_comment(full_comment),
-                                           card_lines, old_ifile_iline])
-
-                    card_count[old_card_name] += 1
+                    yield [old_card_name, _prep_comment(full_comment),
+                           card_lines, old_ifile_iline]
                     card_lines = []
                     full_comment = ''
 
@@ -1393,11 +1575,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
                 if old_card_name == 'ENDDATA':
                     self.card_count['ENDDATA'] = 1
-                    if nlines - iline_bulk > 1:
+                    if nlines is not None and nlines - iline_bulk > 1:
                         nleftover = nlines - iline_bulk - 1
                         msg = 'exiting due to ENDDATA found with %i lines left' % nleftover
                         self.log.debug(msg)
-                    return cards_list, cards_dict, card_count
+                    return
                 #print("card_name = %s" % card_name)
 
             comment = _clean_comment(comment)
@@ -1421,7 +1603,6 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             #elif comment:
                 #backup_comment += '$' + comment + '\n'
 
-
         if card_lines:
             if self.echo and not self.force_echo_off:
                 self.log.info('Reading %s:\n' % old_card_name + full_comment + ''.join(card_lines))
@@ -1433,15 +1614,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             # new list version
             #if backup_comment + full_comment:
                 #print('backup_comment + full_comment = ', backup_comment + full_comment)
-            if old_card_name in dict_cards:
-                cards_dict[old_card_name].append([_prep_comment(
-                    backup_comment + full_comment), card_lines, ifile_iline])
-            else:
-                cards_list.append([old_card_name, _prep_comment(
-                    backup_comment + full_comment), card_lines, ifile_iline])
-            card_count[old_card_name] += 1
+            yield [old_card_name, _prep_comment(backup_comment + full_comment),
+                   card_lines, ifile_iline]
         self.echo = False
-        return cards_list, cards_dict, card_count
 
     def get_bdf_cards_dict(self, bulk_data_lines, bulk_data_ilines=None):
         """Parses the BDF lines into a list of card_lines"""
@@ -1622,6 +1797,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         # update the card
         obj.update_field(ifield, value)
+        self.mark_card_dirty(card_name, icard)
         return obj
 
     def set_dynamic_syntax(self, dict_of_vars):
@@ -2802,7 +2978,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         card_obj, unused_card = self.create_card_object(
             card_lines, card_name,
             is_list=is_list, has_none=has_none)
+        ncard_ids = self._count_card_ids()
         self._add_card_helper(card_obj, card_name, card_name, ifile, comment)
+        self._mark_added_cards_dirty(ncard_ids)
         return card_obj
 
     def add_card_fields(self, card_lines, card_name, comment='', has_none=True):
@@ -2830,7 +3008,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         card_name = card_name.upper()
         card_obj, card = self.create_card_object(card_lines, card_name,
                                                  is_list=True, has_none=has_none)
+        ncard_ids = self._count_card_ids()
         self._add_card_helper(card_obj, card, card_name, comment)
+        self._mark_added_cards_dirty(ncard_ids)
 
     def add_card_lines(self, card_lines, card_name, comment='', has_none=True):
         """
@@ -2852,14 +3032,18 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         card_name = card_name.upper()
         card_obj, card = self.create_card_object(card_lines, card_name,
                                                  is_list=False, has_none=has_none)
+        ncard_ids = self._count_card_ids()
         self._add_card_helper(card_obj, card, card_name, comment)
+        self._mark_added_cards_dirty(ncard_ids)
 
     def get_xyz_in_coord_no_xref(self, cid=0, fdtype='float64', sort_ids=True):
         """see get_xyz_in_coord"""
         npoints, nids, all_nodes = self._get_npoints_nids_allnids()
 
         xyz_cid0 = np.zeros((npoints, 3), dtype=fdtype)
-        if cid == 0:
+        if self._set_xyz_in_coord_vectorized(xyz_cid0, nids, cid):
+            pass
+        elif cid == 0:
             for i, nid in enumerate(nids):
                 node = self.nodes[nid]
                 xyz = node.get_position_no_xref(self)
@@ -2906,6 +3090,28 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             raise ValueError(msg)
         return npoints, nids, all_nodes
 
+    def _set_xyz_in_coord_vectorized(self, xyz_cid, nids, cid):
+        """
+        Sets the GRID positions (the first rows of xyz_cid) for
+        ``get_xyz_in_coord``, which resolves all the coordinate systems
+        at once
+
+        Returns
+        -------
+        is_set : bool
+            False : the model has an unsupported coordinate system (e.g.,
+                    CORD3G) and the nodes need to be transformed one by one
+        """
+        if self.is_bdf_vectorized:
+            return False
+        if len(nids) == 0:
+            return True
+        try:
+            xyz_cid[:len(nids), :] = get_xyz_in_coord_vectorized(self, nids, cid=cid)
+        except NotImplementedError:
+            return False
+        return True
+
     def get_xyz_in_coord(self, cid=0, fdtype='float64', sort_ids=True):
         """
         Gets the xyz points (including SPOINTS) in the desired coordinate frame
@@ -2928,7 +3134,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         #return self.get_displacement_index_xyz_cp_cd(cid=cid, fdtype=dtype)[2]
         npoints, nids, all_nodes = self._get_npoints_nids_allnids()
         xyz_cid0 = np.zeros((npoints, 3), dtype=fdtype)
-        if cid == 0:
+        if self._set_xyz_in_coord_vectorized(xyz_cid0, nids, cid):
+            pass
+        elif cid == 0:
             for i, nid in enumerate(nids):
                 node = self.nodes[nid]
                 xyz = node.get_position()
@@ -3092,6 +3300,43 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             #raise RuntimeError(card_obj)
             self.reject_cards.append(card_obj)
 
+    def _add_parsed_card(self, card_name, card, class_instance, exception):
+        """
+        Adds a card object that was created by ``parse_cards_parallel``
+        or ``parse_cards_fast``.
+
+        This is the same as ``_add_card_helper`` for cards in
+        ``self._card_parser``, but the card has already been created.
+        """
+        self.increase_card_count(card_name)
+        if self.echo and not self.force_echo_off:
+            self._echo_card(card, BDFCard(card, has_none=False))
+
+        if exception is None:
+            if card_name in self._card_parser:
+                add_card_function = self._card_parser[card_name][1]
+            else:
+                # CBAR, CHEXA8, CTETRA4 from parse_cards_fast
+                add_card_function = self._add_element_object
+            add_card_function(class_instance)
+            return
+
+        card_obj = BDFCard(card, has_none=False)
+        try:
+            # reraise the error from the worker, so the error handling
+            # (e.g., pop_parse_errors) is the same as the serial reader
+            raise exception
+        except TypeError:
+            print('problem adding %s' % card_obj)
+            raise
+        except (SyntaxError, AssertionError, KeyError, ValueError):
+            print('problem adding %s' % card_obj)
+            self._iparse_errors += 1
+            var = traceback.format_exception_only(type(exception), exception)
+            self._stored_parse_errors.append((card_name, var))
+            if self._iparse_errors > self._nparse_errors:
+                self.pop_parse_errors()
+
     def get_bdf_stats(self, return_type='string'):
         # type: (str) -> Union[str, List[str]]
         """
@@ -3171,9 +3416,6 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         [2]
 
         """
-        nids_cd_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
-        nids_cp_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
-
         nnodes = len(self.nodes)
         nspoints = 0
         nepoints = 0
@@ -3193,18 +3435,19 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 nnodes, nspoints, nepoints, nrings)
             raise ValueError(msg)
 
-        i = 0
         nxyz = nnodes + nspoints + nepoints + ngridb
         xyz_cp = np.zeros((nxyz, 3), dtype=fdtype)
         nid_cp_cd = np.zeros((nxyz, 3), dtype=idtype)
-        for nid, node in sorted(iteritems(self.nodes)):
-            cd = node.Cd()
-            cp = node.Cp()
-            nids_cp_transform[cp].append(nid)
-            nids_cd_transform[cd].append(nid)
-            nid_cp_cd[i, :] = [nid, cp, cd]
-            xyz_cp[i, :] = node.xyz
-            i += 1
+        is_grid = np.zeros(nxyz, dtype='bool')
+        if nnodes:
+            nids = np.array(sorted(self.nodes), dtype='int64')
+            cps, cds, xyz_cp[:nnodes, :] = get_grid_arrays(self, nids)
+            nid_cp_cd[:nnodes, 0] = nids
+            nid_cp_cd[:nnodes, 1] = cps
+            nid_cp_cd[:nnodes, 2] = cds
+            is_grid[:nnodes] = True
+
+        i = nnodes
         if nspoints:
             for nid in sorted(spoints):
                 nid_cp_cd[i, 0] = nid
@@ -3233,24 +3476,12 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             isort = nids.argsort()
             nid_cp_cd = nid_cp_cd[isort, :]
             xyz_cp = xyz_cp[isort, :]
-
-        icp_transform = {}
-        icd_transform = {}
-        nids_all = nid_cp_cd[:, 0]
+            is_grid = is_grid[isort]
 
         # get the indicies of the xyz array where the nodes that
         # need to be transformed are
-        for cd, nids in sorted(nids_cd_transform.items()):
-            if cd in [0, -1]:
-                continue
-            nids = np.array(nids)
-            icd_transform[cd] = np.where(np.in1d(nids_all, nids))[0]
-
-        for cp, nids in sorted(nids_cp_transform.items()):
-            if cp in [-1]:
-                continue
-            nids = np.array(nids)
-            icp_transform[cp] = np.where(np.in1d(nids_all, nids))[0]
+        icd_transform = _get_grid_index_by_coord(nid_cp_cd[:, 2], is_grid, [0, -1])
+        icp_transform = _get_grid_index_by_coord(nid_cp_cd[:, 1], is_grid, [-1])
         return icd_transform, icp_transform, xyz_cp, nid_cp_cd
 
     def get_xyz_in_coord_array(self, cid=0, fdtype='float64', idtype='int32'):
@@ -3344,6 +3575,32 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         #F:\work\pyNastran\examples\femap_examples\Support\nast\tpl\heli112em7.dat
+        coord_arrays = None
+        if not self.is_bdf_vectorized:
+            try:
+                coord_arrays = CoordArrays.from_model(self)
+            except NotImplementedError:
+                # CORD3G; fall back to transforming one CP at a time
+                pass
+        if coord_arrays is not None:
+            cps = np.zeros(len(nids), dtype='int64')
+            for cp, icp in iteritems(icp_transform):
+                cps[icp] = cp
+            xyz_cid0 = coord_arrays.transform_node_to_global(xyz_cp, cps)
+            if in_place:
+                xyz_cp[:, :] = xyz_cid0
+                xyz_cid0 = xyz_cp
+            if cid == 0:
+                return xyz_cid0
+            xyz_cid = coord_arrays.transform_node_to_local(xyz_cid0, cid)
+            if atol is not None:
+                xyz_cid_correct = self.get_xyz_in_coord(cid=cid)
+                if not np.allclose(xyz_cid, xyz_cid_correct, atol=atol):
+                    msg = ('xyz_cid:\n%s\n'
+                           'xyz_cid_correct:\n%s'% (xyz_cid, xyz_cid_correct))
+                    raise ValueError(msg)
+            return xyz_cid
+
         if self.is_bdf_vectorized:
             # this is used when xref=False (only for vectorized=True)
             # we now require nids, where the other approach
@@ -3862,6 +4119,53 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             # this is the block that actually runs
             self._parse_cards_list(cards_list)
 
+    def _parse_cards_stream(self, bulk_data_stream):
+        """
+        Splits the bulk data deck into cards and adds them to the model
+        ``NCARDS_BLOCK`` cards at a time, so the card_lines of the whole
+        deck are never stored
+
+        Parameters
+        ----------
+        bulk_data_stream : iterable
+            the (line, ifile_iline) pairs of the bulk data deck
+            (see ``BDFInputPy.get_lines_mmap``)
+
+        .. note:: like ``_parse_cards``, the BAROR/BEAMOR cards are parsed
+                  before the CBAR/CBEAM cards, so the CBAR/CBEAM cards are
+                  held until the end of the deck
+        """
+        cards_dict = defaultdict(list)
+        cards_list = []
+        bar_cards_list = []
+        icard0 = 0
+        is_bar = False
+        self.echo = False
+        for card in self.iter_bdf_cards_stream(bulk_data_stream):
+            card_name = card[0]
+            if card_name in ['BAROR', 'BEAMOR']:
+                cards_dict[card_name].append(card[1:])
+                continue
+
+            # a replicated card follows the card that it copies
+            is_bar = card_name in ['CBAR', 'CBEAM'] or ('=' in card_name and is_bar)
+            if is_bar:
+                bar_cards_list.append(card)
+                continue
+
+            cards_list.append(card)
+            if len(cards_list) - icard0 == NCARDS_BLOCK:
+                self._parse_cards_list(cards_list, icard0=icard0)
+
+                # the last cards are kept for the replicated cards
+                cards_list = cards_list[-2:]
+                icard0 = len(cards_list)
+
+        self._parse_cards_list(cards_list, icard0=icard0)
+        if cards_dict:
+            self._parse_cards_dict(cards_dict)
+        self._parse_cards_list(bar_cards_list)
+
     def _parse_cards_dict(self, cards_dict):
         """parses the cards that are in dictionary format"""
         if self.save_file_structure:
@@ -3879,11 +4183,21 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
                                   is_list=False, has_none=False)
 
-    def _parse_cards_list(self, cards_list):
-        """parses the cards that are in list format"""
+    def _parse_cards_list(self, cards_list, icard0=0):
+        """
+        parses the cards that are in list format
+
+        Parameters
+        ----------
+        cards_list : List[card]
+            card : [card_name, comment, card_lines, ifile_iline]
+        icard0 : int; default=0
+            the index of the first card to parse; the previous cards are
+            only used to expand the replicated cards
+        """
         save_file_structure = self.save_file_structure
         if save_file_structure:
-            for icard, card in enumerate(cards_list):
+            for icard, card in enumerate(cards_list[icard0:], start=icard0):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 if card_name is None:
                     msg = 'card_name = %r\n' % card_name
@@ -3910,7 +4224,23 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                         is_list=False, has_none=False)
 
         else:
-            for icard, card in enumerate(cards_list):
+            parsed_cards = {}
+            is_fast_block = False
+            if self._nprocs > 1 and not self._is_dynamic_syntax:
+                # the pool parses all the cards at once
+                if self.fast_parse:
+                    parsed_cards = parse_cards_fast(self, cards_list)
+                parsed_cards.update(parse_cards_parallel(
+                    self, cards_list, self._nprocs, icards_skip=parsed_cards))
+            elif self.fast_parse and not self._is_dynamic_syntax:
+                # the cards are parsed a block at a time, so the fields and
+                # the card objects of the whole deck aren't stored at once
+                is_fast_block = True
+
+            for icard, card in enumerate(cards_list[icard0:], start=icard0):
+                if is_fast_block and (icard - icard0) % NCARDS_BLOCK == 0:
+                    parsed_cards = parse_cards_fast_block(self, cards_list, icard,
+                                                          ncards=NCARDS_BLOCK)
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 #print(unused_ifile_iline, card_lines[0])
                 if card_name is None:
@@ -3918,6 +4248,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     msg += 'card_lines = %s' % card_lines
                     raise RuntimeError(msg)
 
+                if icard in parsed_cards:
+                    self._add_parsed_card(card_name, *parsed_cards.pop(icard))
+                    continue
+
                 if '=' in card_name:
                     #print(card)
                     replicated_cards = self._expand_replication(
@@ -4262,8 +4596,8 @@ class BDF(BDF_):
     NASTRAN BDF Reader/Writer/Editor class.
     """
     _properties = ['is_bdf_vectorized', 'nid_map', 'wtmass']
-    def __init__(self, debug=True, log=None, mode='msc'):
-        # type: (Optional[bool], SimpleLogger, str) -> None
+    def __init__(self, debug=True, log=None, mode='msc', storage='dict'):
+        # type: (Optional[bool], SimpleLogger, str, str) -> None
         """
         Initializes the BDF object
 
@@ -4280,11 +4614,18 @@ class BDF(BDF_):
         mode : str; default='msc'
             the type of Nastran
             valid_modes = {'msc', 'nx'}
+        storage : str; default='dict'
+            the storage of the nodes, elements, and coords
+                'dict':  a dict of card objects
+                'columnar':  the GRID, CORDx, shell, solid, and bar cards
+                             are stored in arrays and are accessed with
+                             proxy objects, which uses much less memory
+                             (see ``pyNastran.bdf.bdf_interface.columnar``)
 
         """
-        BDF_.__init__(self, debug=debug, log=log, mode=mode)
+        BDF_.__init__(self, debug=debug, log=log, mode=mode, storage=storage)
         #: stores SPOINT, GRID cards
-        self.nodes = {}  # type: Dict[int, Any]
+        self.nodes = self._new_card_dict()  # type: Dict[int, Any]
 
         # loads
         #: stores LOAD, FORCE, FORCE1, FORCE2, MOMENT, MOMENT1, MOMENT2,
@@ -4325,10 +4666,11 @@ class BDF(BDF_):
                 iminus += 1
 
             nlines = len(superelement_line) - iminus
-            model = BDF()
+            model = BDF(storage=self.storage)
             model.active_filenames = self.active_filenames
             model.log = self.log
             model.punch = True
+            model._nprocs = self._nprocs
             #model.nastran_format = ''
             superelement_ilines = np.zeros((nlines, 2), dtype='int32')  ## TODO: calculate this
             model._parse_all_cards(superelement_line[iminus:], superelement_ilines)
@@ -4392,6 +4734,21 @@ def _check_replicated_cards(replicated_cards):
             replicated_card_old = replicated_card
         raise
 
+def _get_grid_index_by_coord(cids, is_grid, cids_to_skip):
+    """
+    helper method for ``get_displacement_index_xyz_cp_cd``
+
+    Groups the GRIDs by their CP/CD (e.g., {10 : [0, 1], 50 : [2]}),
+    where the indices in each group are sorted
+    """
+    igrid = np.where(is_grid)[0]
+    cids = cids[igrid]
+    isort = np.argsort(cids, kind='mergesort')
+    ucids, istart = np.unique(cids[isort], return_index=True)
+    igroups = np.split(igrid[isort], istart[1:])
+    return {cid : igroup for cid, igroup in zip(ucids.tolist(), igroups)
+            if cid not in cids_to_skip}
+
 def _bool(value):
     """casts a lower string to a booean"""
     return True if value == 'true' else False
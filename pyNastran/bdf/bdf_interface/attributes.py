@@ -10,6 +10,7 @@ from pyNastran.bdf.bdf_interface.utils import deprecated
 from pyNastran.bdf.cards.coordinate_systems import CORD2R
 #from pyNastran.bdf.cards.constraints import ConstraintObject
 from pyNastran.bdf.cards.aero.zona import ZONA
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
 
 
 class BDFAttributes(object):
@@ -147,10 +148,30 @@ class BDFAttributes(object):
         """removes the attributes from the model"""
         self.__init_attributes()
 
-        self.nodes = {}
+        self.nodes = self._new_card_dict()
         self.loads = {}  # type: Dict[int, List[Any]]
         self.load_combinations = {}  # type: Dict[int, List[Any]]
 
+    def _new_card_dict(self, cards=None):
+        # type: (Optional[Dict[int, Any]]) -> Dict[int, Any]
+        """
+        Creates the storage for the nodes, elements, and coords
+
+        Parameters
+        ----------
+        cards : Dict[int] = card; default=None
+            the cards to add
+
+        Returns
+        -------
+        cards_dict : dict / ColumnarDict
+            a dict for storage='dict' or a ColumnarDict for storage='columnar'
+
+        """
+        if self.storage == 'columnar':
+            return ColumnarDict(cards)
+        return {} if cards is None else dict(cards)
+
     def reset_errors(self):
         """removes the errors from the model"""
         self._ixref_errors = 0
@@ -312,7 +333,7 @@ class BDFAttributes(object):
 
         #: stores elements (CQUAD4, CTRIA3, CHEXA8, CTETRA4, CROD, CONROD,
         #: etc.)
-        self.elements = {}  # type: Dict[int, Any]
+        self.elements = self._new_card_dict()  # type: Dict[int, Any]
 
         #: stores CBARAO, CBEAMAO
         self.ao_element_flags = {}  # type: Dict[int, Any]
@@ -384,7 +405,7 @@ class BDFAttributes(object):
         zaxis = array([0., 0., 1.])
         xzplane = array([1., 0., 0.])
         coord = CORD2R(cid=0, rid=0, origin=origin, zaxis=zaxis, xzplane=xzplane)
-        self.coords = {0 : coord}    # type: Dict[int, Any]
+        self.coords = self._new_card_dict({0 : coord})    # type: Dict[int, Any]
 
         # --------------------------- constraints ----------------------------
         #: stores SUPORT1s
@@ -0,0 +1,316 @@
+"""
+Defines the streaming BDF reader, which parses the cards of a deck without
+building a BDF model:
+  - iter_bdf_cards(bdf_filename, card_types=None, raw=False, punch=False,
+                   read_includes=True, encoding=None, mode='msc',
+                   log=None, debug=False)
+  - get_bdf_stats_stream(cards, return_type='string')
+
+The lines are read with ``BDFInputPy.get_lines_mmap``, so the INCLUDE files
+are opened as they're reached, and each card is created with the
+``add_card`` classmethod of the card class and yielded.  The cards aren't
+stored, so the memory usage doesn't depend on the size of the deck.  ZONA
+decks are loaded with ``BDFInputPy.get_lines`` instead.
+
+.. code-block:: python
+
+   >>> nodes_x = [node.xyz[0] for unused_super_id, node in
+   ...            iter_bdf_cards(bdf_filename, card_types=['GRID'])]
+
+   >>> cards = iter_bdf_cards(bdf_filename, raw=True)
+   >>> print(get_bdf_stats_stream(cards))
+
+"""
+from __future__ import print_function
+from io import open
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.utils import (
+    to_fields, fill_dmigs, parse_executive_control_deck)
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+
+#: the DMIx matrices are yielded at the end of the (superelement) deck
+#: because the columns are separate cards
+_MATRIX_SLOTS = {
+    'DMIG' : 'dmigs',
+    'DMI' : 'dmis',
+    'DMIJ' : 'dmijs',
+    'DMIJI' : 'dmijis',
+    'DMIK' : 'dmiks',
+}
+
+#: these cards aren't split into fields, so raw=True yields the lines
+_FREE_FORMAT_CARDS = ['DEQATN', 'PBRSECT', 'PBMSECT']
+
+#: the defaults for the CBAR/CBEAM, which are stored on the model
+_ORIENTATION_CARDS = ['BAROR', 'BEAMOR']
+
+#: the slots of the cards that aren't in ``_type_to_slot_map``
+_CARD_SLOTS = {
+    'DEFORM' : 'loads',
+    'TEMPAX' : 'loads',
+    'BAROR' : 'baror',
+    'BEAMOR' : 'beamor',
+}
+
+
+def iter_bdf_cards(bdf_filename, card_types=None, raw=False, punch=False,
+                   read_includes=True, encoding=None, mode='msc',
+                   log=None, debug=False):
+    """
+    Lazily parses the bulk data cards of a BDF
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the path to the bdf
+    card_types : List[str]; default=None -> all
+        the cards to yield (e.g., ['GRID', 'CQUAD4']); the other cards
+        aren't parsed
+    raw : bool; default=False
+        True : yield the fields of the card as a tuple of strings
+               (e.g., ('GRID', '1', None, '0.', '0.', '0.')); the
+               DEQATN, PBRSECT, and PBMSECT cards are (card_name, *lines)
+        False : yield the card objects
+    punch : bool; default=False
+        is this a punch file (no executive/case control decks)
+    read_includes : bool; default=True
+        should the INCLUDE files be read
+    encoding : str; default=None -> system default
+        the encoding of the file
+    mode : str; default='msc'
+        the type of Nastran ('msc', 'nx')
+    log : logger; default=None
+        a logger
+    debug : bool/None; default=False
+        the debug level of the logger
+
+    Yields
+    ------
+    super_id : int
+        the superelement id (0 for the main bulk data deck)
+    card : varies
+        raw=True : Tuple[str, ...]
+            the fields of the card
+        raw=False : BaseCard / BDFCard
+            the card object (e.g., GRID); unsupported cards are BDFCard
+            objects like ``model.reject_cards``
+
+    .. note:: a card line that defines multiple cards (e.g., PELAS, CORD1R)
+              yields each card
+    .. note:: DMIG/DMI/DMIJ/DMIJI/DMIK matrices are yielded at the end of
+              the deck (or superelement) because the columns are separate
+              cards
+    .. note:: BAROR/BEAMOR cards are only applied to the CBAR/CBEAM cards
+              that come after them in the deck
+    .. note:: parsing errors are raised when they're found
+    .. note:: replicated cards (e.g., '=', '==') aren't supported
+
+    """
+    if card_types is not None:
+        card_types = set(card_type.upper() for card_type in card_types)
+
+    # the model is only used for the card parsers and is emptied after
+    # each card
+    model = BDF(debug=debug, log=log, mode=mode)
+    model._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
+
+    # only the '$ pyNastran: key=value' lines at the top are read
+    with open(bdf_filename, 'r', encoding=model._encoding) as bdf_file:
+        model._check_pynastran_header(bdf_file, check_header=True)
+    if model.nastran_format == 'zona':
+        model.zona.update_for_zona()
+
+    obj = BDFInputPy(model.read_includes, model.dumplines, model._encoding,
+                     nastran_format=model.nastran_format,
+                     consider_superelements=True, log=model.log, debug=debug)
+    if model.nastran_format in ['msc', 'nx']:
+        out = obj.get_lines_mmap(bdf_filename, punch=model.punch, stream_superelements=True)
+        unused_system_lines, executive_control_lines = out[:2]
+        bulk_data_lines = out[3]
+    else:
+        # get_lines_mmap doesn't support the ZONA decks (ASSIGN FEM=...),
+        # so the lines are loaded at once
+        out = obj.get_lines(bdf_filename, punch=model.punch, make_ilines=True)
+        executive_control_lines = out[1]
+        bulk_data_lines = _iter_bulk_data_lines(*out[3:])
+
+    # the BCTSET depends on the solution
+    sol, method, sol_iline = parse_executive_control_deck(executive_control_lines)
+    model.update_solution(sol, method, sol_iline)
+
+    for super_id, super_lines in groupby(bulk_data_lines, key=itemgetter(0)):
+        # the 'BEGIN SUPER=n' line isn't a card
+        lines = (line_ifile_iline for unused_super_id, line_ifile_iline in super_lines
+                 if not (super_id and line_ifile_iline[0][:5].upper() == 'BEGIN'))
+        for card_name, comment, card_lines, unused_ifile_iline in model.iter_bdf_cards_stream(lines):
+            if card_types is not None and card_name not in card_types:
+                continue
+            if '=' in card_name:
+                msg = 'replicated cards are not supported by iter_bdf_cards\n%s' % (
+                    ''.join(card_lines))
+                raise NotImplementedError(msg)
+
+            if raw:
+                yield super_id, _get_raw_fields(card_name, card_lines)
+                continue
+
+            for card in _parse_card(model, card_name, comment, card_lines):
+                yield super_id, card
+
+        for card in _pop_matrices(model):
+            yield super_id, card
+        model.baror = None
+        model.beamor = None
+        model.grdset = None
+
+def _iter_bulk_data_lines(bulk_data_lines, bulk_data_ilines,
+                          superelement_lines, superelement_ilines):
+    """
+    Yields the (super_id, (line, (ifile, iline))) pairs of the loaded lines
+    like ``get_lines_mmap(..., stream_superelements=True)``
+    """
+    for line, ifile_iline in zip(bulk_data_lines, bulk_data_ilines):
+        yield 0, (line, tuple(ifile_iline))
+    for super_id, lines in sorted(superelement_lines.items()):
+        for line, ifile_iline in zip(lines, superelement_ilines[super_id]):
+            yield super_id, (line, tuple(ifile_iline))
+
+def _get_raw_fields(card_name, card_lines):
+    """gets the fields of a card as a tuple of strings"""
+    if card_name in _FREE_FORMAT_CARDS:
+        return (card_name, ) + tuple(card_lines)
+    fields = wipe_empty_fields(to_fields(card_lines, card_name))
+    fields[0] = card_name
+    return tuple(fields)
+
+def _parse_card(model, card_name, comment, card_lines):
+    """
+    Creates the card objects without storing them on the model
+
+    Returns
+    -------
+    cards : List[BaseCard / BDFCard]
+        the cards that were created (empty for a DMIx matrix card)
+
+    """
+    card_obj, unused_card = model.create_card_object(card_lines, card_name,
+                                                     is_list=False, has_none=False)
+    if model.is_reject(card_name):
+        return [card_obj]
+
+    if card_name in model._card_parser:
+        card_class, add_card_function = model._card_parser[card_name]
+        class_instance = card_class.add_card(card_obj, comment=comment)
+        if card_name in _ORIENTATION_CARDS:
+            add_card_function(class_instance)
+        return [class_instance]
+
+    if card_name not in model._card_parser_prepare:
+        return [card_obj]
+
+    add_card_function = model._card_parser_prepare[card_name]
+    cards = add_card_function(card_name, card_obj, comment=comment)
+    if card_name in _MATRIX_SLOTS:
+        # the matrix is yielded when all the columns have been read
+        return []
+
+    # the prepare functions add the cards to the model
+    slot_name = _CARD_SLOTS.get(card_name, model._type_to_slot_map.get(card_name))
+    slot = getattr(model, slot_name)
+    if isinstance(slot, dict):
+        slot.clear()
+    elif isinstance(slot, list):
+        del slot[:]
+    model._type_to_id_map.clear()
+
+    if isinstance(cards, int) and cards == -1:
+        # a DTI that isn't a UNITS table
+        del model.reject_cards[:]
+        del model.reject_lines[:]
+        return [card_obj]
+    if not isinstance(cards, list):
+        cards = [cards]
+    return cards
+
+def _pop_matrices(model):
+    """gets the completed DMIx matrices and removes them from the model"""
+    cards = []
+    if model._dmig_temp:
+        fill_dmigs(model)
+    for slot_name in _MATRIX_SLOTS.values():
+        slot = getattr(model, slot_name)
+        cards.extend(slot.values())
+        slot.clear()
+    model._type_to_id_map.clear()
+    return cards
+
+def get_bdf_stats_stream(cards, return_type='string'):
+    """
+    Gets a ``get_bdf_stats``-style summary of the cards from
+    ``iter_bdf_cards``, so the summary of a deck can be found without
+    building the model
+
+    Parameters
+    ----------
+    cards : iterable
+        the (super_id, card) pairs from ``iter_bdf_cards``
+    return_type : str (default='string')
+        the output type ('list', 'string')
+            'list' : list of strings
+            'string' : single, joined string
+
+    Returns
+    -------
+    return_data : str, optional
+        the output data
+
+    .. note:: raw=True counts the card lines (like ``model.card_count``),
+              while raw=False counts the card objects (e.g., a PELAS with
+              2 properties counts as 2)
+
+    """
+    card_counts = defaultdict(lambda: defaultdict(int))
+    for super_id, card in cards:
+        card_counts[super_id][_get_card_name(card)] += 1
+
+    type_to_slot_map = BDF(debug=None)._type_to_slot_map
+    msg = []
+    for super_id in sorted(set(card_counts) | set([0])):
+        word = '' if super_id == 0 else ' (Superelement %i)' % super_id
+        msg.append('---BDF Statistics%s---' % word)
+
+        groups = defaultdict(list)
+        rejects = []
+        for card_name, ncards in sorted(card_counts[super_id].items()):
+            slot_name = _CARD_SLOTS.get(card_name, type_to_slot_map.get(card_name))
+            if slot_name is None:
+                rejects.append('  %-8s %s' % (card_name + ':', ncards))
+            else:
+                groups[slot_name].append('  %-8s : %s' % (card_name, ncards))
+
+        for slot_name, group_msg in sorted(groups.items()):
+            msg.append('bdf.%s' % slot_name)
+            msg.extend(group_msg)
+            msg.append('')
+        if rejects:
+            msg.append('Rejected Cards')
+            msg.extend(rejects)
+        msg.append('')
+
+    if return_type == 'string':
+        return '\n'.join(msg)
+    return msg
+
+def _get_card_name(card):
+    """gets the card name of a card from ``iter_bdf_cards``"""
+    if isinstance(card, tuple):
+        return card[0]
+    elif isinstance(card, BDFCard):
+        return card.field(0).rstrip(' *').upper()
+    return card.type
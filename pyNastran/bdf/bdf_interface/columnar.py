@@ -0,0 +1,968 @@
+"""
+Defines the columnar (struct-of-arrays) storage for ``BDF(storage='columnar')``:
+  - ColumnarDict(cards=None)
+    - add_arrays(card, keys, arrays, attributes=None)
+  - get_card_identity(card)
+  - get_card_attributes(card)
+
+The GRID, CORDx, shell, solid, and bar cards are stored in contiguous int/float
+arrays (e.g., all the GRID xyz values are in a single (n, 3) float array)
+rather than as one Python object per card, which is much smaller for large
+models.  The other cards (e.g., CBEAM, CELAS1) are stored as objects.
+
+Accessing a card (e.g., ``model.nodes[nid]``) returns a lazy proxy, which is a
+subclass of the card class (e.g., GRID), so the card methods (e.g.,
+``get_position``, ``write_card``) work as usual.  The proxy doesn't store any
+data, so setting an attribute (e.g., ``node.xyz = xyz``, ``elem.nodes[0] = 2``)
+writes to the arrays.
+
+The rarely used attributes (e.g., CQUAD4 T1, the cross-referenced ``*_ref``
+objects) are stored sparsely; only the values that are different from the
+first card of that type are stored.  As such, ``xref=False`` uses the least
+memory.
+
+.. note:: a (3, ) float array (e.g., ``node.xyz``) is a view into the storage,
+          which isn't updated if cards are added after it's accessed
+"""
+from __future__ import print_function
+import math
+import weakref
+try:
+    from collections.abc import MutableMapping, ItemsView, ValuesView
+except ImportError:  # py2
+    from collections import MutableMapping, ItemsView, ValuesView
+
+from six import integer_types
+import numpy as np
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.coordinate_systems import (
+    CORD1R, CORD1C, CORD1S, CORD2R, CORD2C, CORD2S)
+from pyNastran.bdf.cards.elements.shell import (
+    CTRIA3, CQUAD4, CTRIA6, CQUAD8, CTRIAR, CQUADR)
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPYRAM5, CPYRAM13, CPENTA6, CPENTA15, CHEXA8, CHEXA20)
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.rods import CROD
+
+#: the int32 value that's used for None (e.g., CBAR g0, a CTETRA10 midside node)
+_NULL_INT = np.iinfo('int32').min
+
+#: the (3, ) float value that's used for None (e.g., CBAR x)
+_NAN3 = np.full(3, np.nan)
+
+#: indicates an attribute that doesn't exist for a card (e.g., no comment)
+_MISSING = object()
+
+#: the minimum number of keys that are added to the ColumnarDict before
+#: they're merged into the sorted index
+_MIN_MERGE = 4096
+
+#: the number of cards that are buffered before they're copied into the arrays
+_BUFFER_SIZE = 65536
+
+def _elements(nnodes):
+    """the fields of an element with an ``eid``, ``pid``, and ``nodes``"""
+    return [('eid', 'int', 1), ('pid', 'int', 1), ('nodes', 'nodes', nnodes)]
+
+_CORD1 = [('cid', 'int', 1), ('g1', 'int', 1), ('g2', 'int', 1), ('g3', 'int', 1)]
+_CORD2 = [('cid', 'int', 1), ('rid', 'int', 1),
+          ('e1', 'xyz', 3), ('e2', 'xyz', 3), ('e3', 'xyz', 3)]
+_BETA = [('origin', 'xyz?', 3), ('i', 'xyz?', 3), ('j', 'xyz?', 3), ('k', 'xyz?', 3)]
+
+#: card_class -> [(attribute name, kind, ncolumns), ...]
+#:   int   : int (int32)
+#:   int?  : int/None (int32)
+#:   nodes : List[int/None] (int32)
+#:   xyz   : (3, ) float64 ndarray
+#:   xyz?  : (3, ) float64 ndarray/None
+_CARD_FIELDS = {
+    GRID : [('nid', 'int', 1), ('cp', 'int', 1), ('xyz', 'xyz', 3),
+            ('cd', 'int', 1), ('seid', 'int', 1)],
+
+    CORD1R : _CORD1 + [('e1', 'xyz?', 3), ('e2', 'xyz?', 3), ('e3', 'xyz?', 3)] + _BETA,
+    CORD1C : _CORD1 + [('e1', 'xyz?', 3), ('e2', 'xyz?', 3), ('e3', 'xyz?', 3)] + _BETA,
+    CORD1S : _CORD1 + [('e1', 'xyz?', 3), ('e2', 'xyz?', 3), ('e3', 'xyz?', 3)] + _BETA,
+    CORD2R : _CORD2 + _BETA,
+    CORD2C : _CORD2 + _BETA,
+    CORD2S : _CORD2 + _BETA,
+
+    CTRIA3 : _elements(3),
+    CTRIAR : _elements(3),
+    CTRIA6 : _elements(6),
+    CQUAD4 : _elements(4),
+    CQUADR : _elements(4),
+    CQUAD8 : _elements(8),
+
+    CTETRA4 : _elements(4),
+    CTETRA10 : _elements(10),
+    CPYRAM5 : _elements(5),
+    CPYRAM13 : _elements(13),
+    CPENTA6 : _elements(6),
+    CPENTA15 : _elements(15),
+    CHEXA8 : _elements(8),
+    CHEXA20 : _elements(20),
+
+    CROD : _elements(2),
+    CBAR : [('eid', 'int', 1), ('pid', 'int', 1), ('ga', 'int', 1), ('gb', 'int', 1),
+            ('x', 'xyz?', 3), ('g0', 'int?', 1), ('wa', 'xyz', 3), ('wb', 'xyz', 3)],
+}
+
+#: the card_class -> proxy class map
+_PROXY_CLASSES = {}
+
+
+class ColumnarDict(MutableMapping):
+    """
+    A dictionary of cards (e.g., model.nodes) that stores the supported cards
+    (see ``_CARD_FIELDS``) in arrays
+
+    The keys are kept in insertion order, like a dict.  The integer keys are
+    indexed with a sorted array, so the index is ~16 bytes per key.
+
+    .. code-block:: python
+
+       >>> model = read_bdf(bdf_filename, xref=False, storage='columnar')
+       >>> model.nodes[1].xyz
+       array([0., 0., 0.])
+       >>> grids = model.nodes.get_arrays('GRID')
+       >>> grids['xyz']
+       array([[0., 0., 0.],
+              [1., 0., 0.]])
+
+    """
+    def __init__(self, cards=None):
+        """
+        Creates the ColumnarDict
+
+        Parameters
+        ----------
+        cards : Dict[key] = card; default=None
+            the cards to add
+
+        """
+        #: the storage for each card type; 0 is for the unsupported cards
+        self._stores = [_ObjectStore()]
+        #: card_class -> istore
+        self._istores = {}
+
+        # the slots, which are in insertion order
+        self._nslots = 0
+        self._slot_store = np.zeros(0, dtype='int16')  # -1 is a deleted slot
+        self._slot_row = np.zeros(0, dtype='int64')
+        self._slot_key = np.zeros(0, dtype='int64')
+        self._slot_other_keys = {}  # the non-integer keys; slot -> key
+        self._nkeys = 0
+
+        # the key -> slot index
+        self._sorted_keys = np.zeros(0, dtype='int64')
+        self._sorted_slots = np.zeros(0, dtype='int64')  # -1 is a deleted key
+        self._pending = {}  # the keys that haven't been merged yet
+        self._npending_int = 0
+
+        self._proxies = weakref.WeakValueDictionary()
+        if cards is not None:
+            self.update(cards)
+
+    def __getstate__(self):
+        """the proxies aren't pickleable"""
+        state = self.__dict__.copy()
+        del state['_proxies']
+        return state
+
+    def __setstate__(self, state):
+        """restores the proxy cache"""
+        self.__dict__.update(state)
+        self._proxies = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return self._nkeys
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __getitem__(self, key):
+        islot = self._find(key)
+        if islot < 0:
+            raise KeyError(key)
+        return self._get_slot(islot)
+
+    def __setitem__(self, key, card):
+        istore, irow = self._add_card(card)
+        islot = self._find(key)
+        if islot >= 0:
+            # overwriting a key keeps the original order
+            self._remove_slot(islot)
+            self._slot_store[islot] = istore
+            self._slot_row[islot] = irow
+            return
+
+        islot = self._nslots
+        if islot == len(self._slot_store):
+            nslots = max(2 * islot, 64)
+            self._slot_store = _resize(self._slot_store, nslots)
+            self._slot_row = _resize(self._slot_row, nslots)
+            self._slot_key = _resize(self._slot_key, nslots)
+        self._slot_store[islot] = istore
+        self._slot_row[islot] = irow
+        if _is_int_key(key):
+            self._slot_key[islot] = key
+            self._npending_int += 1
+        else:
+            self._slot_other_keys[islot] = key
+        self._nslots += 1
+        self._nkeys += 1
+        self._pending[key] = islot
+        if self._npending_int > max(_MIN_MERGE, len(self._sorted_keys) // 4):
+            self._merge_index()
+
+    def __delitem__(self, key):
+        islot = self._find(key)
+        if islot < 0:
+            raise KeyError(key)
+        if key in self._pending:
+            del self._pending[key]
+            if _is_int_key(key):
+                self._npending_int -= 1
+        else:
+            i = self._sorted_keys.searchsorted(key)
+            self._sorted_slots[i] = -1
+        self._remove_slot(islot)
+        self._slot_store[islot] = -1
+        self._slot_other_keys.pop(islot, None)
+        self._nkeys -= 1
+
+    def __iter__(self):
+        for islot in self._active_slots():
+            yield self._get_key(islot)
+
+    def items(self):
+        return _ColumnarItemsView(self)
+
+    def values(self):
+        return _ColumnarValuesView(self)
+
+    def copy(self):
+        """creates a shallow copy"""
+        return ColumnarDict(self.items())
+
+    def __repr__(self):
+        istores = self._slot_store[:self._nslots]
+        ncards = np.bincount(istores[istores >= 0], minlength=len(self._stores))
+        msg = ', '.join('%s=%i' % (store.name, ncardsi)
+                        for store, ncardsi in zip(self._stores, ncards) if ncardsi)
+        return 'ColumnarDict(%s)' % msg
+
+    def clear(self):
+        """removes all the cards"""
+        self.__init__()
+
+    def get_arrays(self, card_type):
+        """
+        Gets the arrays for the cards of a given type
+
+        Parameters
+        ----------
+        card_type : str
+            the card type (e.g., 'GRID', 'CQUAD4')
+
+        Returns
+        -------
+        arrays : Dict[name] = array
+            the attribute name (e.g., 'nid', 'xyz') to the (ncards, ...) array;
+            the cards are in insertion order and None is -2147483648/nan
+
+        """
+        for store in self._stores[1:]:
+            if store.name == card_type:
+                return store.get_arrays()
+        raise KeyError('card_type=%r is not stored in arrays' % card_type)
+
+    def _find(self, key):
+        """gets the slot of a key or -1"""
+        islot = self._pending.get(key)
+        if islot is not None:
+            return islot
+        if len(self._sorted_keys) and _is_int_key(key):
+            i = self._sorted_keys.searchsorted(key)
+            if i < len(self._sorted_keys) and self._sorted_keys[i] == key:
+                return int(self._sorted_slots[i])
+        return -1
+
+    def _merge_index(self):
+        """merges the pending integer keys into the sorted index"""
+        islots = [islot for key, islot in self._pending.items() if _is_int_key(key)]
+        islots = np.array(islots, dtype='int64')
+        self._insert_index(self._slot_key[islots], islots)
+        self._pending = {key: islot for key, islot in self._pending.items()
+                         if not _is_int_key(key)}
+        self._npending_int = 0
+
+    def _insert_index(self, keys, islots):
+        """adds integer keys that aren't in the dictionary to the sorted index"""
+        isort = np.argsort(keys)
+        keys = keys[isort]
+        islots = islots[isort]
+
+        active = self._sorted_slots >= 0
+        sorted_keys = self._sorted_keys[active]
+        sorted_slots = self._sorted_slots[active]
+        i = np.searchsorted(sorted_keys, keys)
+        self._sorted_keys = np.insert(sorted_keys, i, keys)
+        self._sorted_slots = np.insert(sorted_slots, i, islots)
+
+    def _active_slots(self, chunk_size=65536):
+        """iterates over the slots that haven't been deleted"""
+        for islot0 in range(0, self._nslots, chunk_size):
+            istores = self._slot_store[islot0:min(islot0 + chunk_size, self._nslots)]
+            for islot in (np.flatnonzero(istores >= 0) + islot0).tolist():
+                yield islot
+
+    def _get_key(self, islot):
+        """gets the key of a slot"""
+        if islot in self._slot_other_keys:
+            return self._slot_other_keys[islot]
+        return int(self._slot_key[islot])
+
+    def _get_slot(self, islot):
+        """gets the card/proxy of a slot"""
+        istore = self._slot_store[islot]
+        irow = int(self._slot_row[islot])
+        if istore == 0:
+            return self._stores[0].objects[irow]
+
+        card = self._proxies.get(islot)
+        if card is None:
+            store = self._stores[istore]
+            card = store.proxy_class.__new__(store.proxy_class)
+            card.__dict__['_store'] = store
+            card.__dict__['_row'] = irow
+            self._proxies[islot] = card
+        return card
+
+    def _remove_slot(self, islot):
+        """frees the data of a slot"""
+        self._proxies.pop(islot, None)
+        istore = self._slot_store[islot]
+        if istore >= 0:
+            self._stores[istore].remove(int(self._slot_row[islot]))
+
+    def _add_card(self, card):
+        """stores a card and gets the (istore, irow)"""
+        if isinstance(card, _ColumnarCard):
+            card_class = card._card_class
+            state = card._store.get_state(card._row)
+        else:
+            card_class = card.__class__
+            state = getattr(card, '__dict__', None)
+
+        if card_class in _CARD_FIELDS and state is not None:
+            istore = self._get_istore(card_class)
+            irow = self._stores[istore].append(state)
+            if irow >= 0:
+                return istore, irow
+        return 0, self._stores[0].append(card)
+
+    def _get_istore(self, card_class):
+        """gets the index of the storage of a card type, which is created if necessary"""
+        istore = self._istores.get(card_class)
+        if istore is None:
+            istore = len(self._stores)
+            self._stores.append(_CardArrays(card_class))
+            self._istores[card_class] = istore
+        return istore
+
+    def add_arrays(self, card, keys, arrays, attributes=None):
+        """
+        Adds a block of cards of the same type from arrays without creating
+        the card objects (e.g., for the GRIDs of an OP2)
+
+        Parameters
+        ----------
+        card : BaseCard
+            the first card of the block, which defines the card type and the
+            values of the attributes that aren't in ``arrays``/``attributes``
+            (e.g., ``cp_ref``)
+        keys : (n, ) int ndarray
+            the keys of the cards (e.g., the node ids)
+        arrays : Dict[name] = (n, ...) ndarray
+            the attributes that are stored in arrays (see ``_CARD_FIELDS``);
+            e.g., {'nid' : nids, 'cp' : cps, 'xyz' : xyzs, 'cd' : cds, 'seid' : seids}
+        attributes : Dict[name] = (n, ) ndarray / List; default=None
+            the other attributes that vary by card (e.g., {'ps' : pss});
+            only the values that are different from the first card of the
+            card type are stored
+
+        Returns
+        -------
+        is_added : bool
+            False if the cards can't be stored in arrays, so they must be
+            added one by one (e.g., a key is already in the dictionary, the
+            card type isn't supported)
+
+        """
+        card_class = card.__class__
+        state = getattr(card, '__dict__', None)
+        if card_class not in _CARD_FIELDS or state is None or isinstance(card, _ColumnarCard):
+            return False
+        fields = _CARD_FIELDS[card_class]
+        if any(kind.endswith('?') or name not in arrays for name, kind, unused_ncols in fields):
+            return False
+
+        nrows = len(keys)
+        keys = np.asarray(keys, dtype='int64')
+        if self._npending_int:
+            self._merge_index()
+        active_keys = self._sorted_keys[self._sorted_slots >= 0]
+        if len(np.unique(keys)) != nrows or np.in1d(keys, active_keys).any():
+            return False
+
+        istore = self._get_istore(card_class)
+        store = self._stores[istore]
+        irow0 = store.extend(state, arrays, nrows)
+        store.add_extras(irow0, state, {} if attributes is None else attributes, nrows)
+
+        islot0 = self._nslots
+        nslots = islot0 + nrows
+        if nslots > len(self._slot_store):
+            nslots_max = max(2 * len(self._slot_store), nslots, 64)
+            self._slot_store = _resize(self._slot_store, nslots_max)
+            self._slot_row = _resize(self._slot_row, nslots_max)
+            self._slot_key = _resize(self._slot_key, nslots_max)
+        self._slot_store[islot0:nslots] = istore
+        self._slot_row[islot0:nslots] = np.arange(irow0, irow0 + nrows)
+        self._slot_key[islot0:nslots] = keys
+        self._nslots = nslots
+        self._nkeys += nrows
+        self._insert_index(keys, np.arange(islot0, nslots, dtype='int64'))
+        return True
+
+
+class _ColumnarItemsView(ItemsView):
+    """iterates over the (key, card) pairs without the key lookups"""
+    def __iter__(self):
+        mapping = self._mapping
+        for islot in mapping._active_slots():
+            yield mapping._get_key(islot), mapping._get_slot(islot)
+
+
+class _ColumnarValuesView(ValuesView):
+    """iterates over the cards without the key lookups"""
+    def __iter__(self):
+        mapping = self._mapping
+        for islot in mapping._active_slots():
+            yield mapping._get_slot(islot)
+
+
+class _ObjectStore(object):
+    """stores the cards that aren't supported by the columnar storage"""
+    name = 'objects'
+
+    def __init__(self):
+        self.objects = []
+
+    def append(self, card):
+        """adds a card"""
+        self.objects.append(card)
+        return len(self.objects) - 1
+
+    def remove(self, irow):
+        """frees a card"""
+        self.objects[irow] = None
+
+
+class _CardArrays(object):
+    """stores the cards of a single type (e.g., GRID) in arrays"""
+    def __init__(self, card_class):
+        self.card_class = card_class
+        self.name = card_class.__name__
+        self.fields = _CARD_FIELDS[card_class]
+        self.nrows = 0
+        self._arrays = {}
+        for name, kind, ncols in self.fields:
+            dtype = 'float64' if kind.startswith('xyz') else 'int32'
+            shape = (0, ) if ncols == 1 and kind != 'nodes' else (0, ncols)
+            self._arrays[name] = np.zeros(shape, dtype=dtype)
+        self._active = np.zeros(0, dtype='bool')
+
+        #: the packed values of the cards that haven't been copied to the arrays
+        self._buffer = []
+
+        #: the attributes that aren't in arrays with the values of the first card
+        self.template = None
+        #: the attributes that aren't in arrays and are different from the template
+        #: irow -> {name: value}
+        self.extras = {}
+
+    @property
+    def arrays(self):
+        """gets the name -> array map"""
+        if self._buffer:
+            self._flush()
+        return self._arrays
+
+    @property
+    def active(self):
+        """gets the rows that haven't been removed"""
+        if self._buffer:
+            self._flush()
+        return self._active
+
+    @property
+    def proxy_class(self):
+        """gets the proxy class (e.g., GRID proxy)"""
+        return _get_proxy_class(self.card_class)
+
+    def append(self, state):
+        """
+        Adds a card
+
+        Parameters
+        ----------
+        state : Dict[name] = value
+            the card's ``__dict__``
+
+        Returns
+        -------
+        irow : int
+            the row of the card or -1 if the card can't be stored in arrays
+            (e.g., a pid is None)
+
+        """
+        try:
+            values = [_pack(kind, ncols, state[name]) for name, kind, ncols in self.fields]
+        except (KeyError, TypeError, ValueError):
+            return -1
+
+        arrays = self._arrays
+        if self.template is None:
+            self.template = _get_template(state, arrays)
+        template = self.template
+
+        irow = self.nrows
+        self._buffer.append(values)
+        self.nrows += 1
+        if len(self._buffer) == _BUFFER_SIZE:
+            self._flush()
+
+        extras = {}
+        nmatched = 0
+        for name, value in state.items():
+            if name in arrays:
+                continue
+            default = template.get(name, _MISSING)
+            if value is default or (default is not _MISSING and _is_same(value, default)):
+                nmatched += 1
+            else:
+                extras[name] = value
+        if nmatched != len(template):
+            for name in template:
+                if name not in state:
+                    extras[name] = _MISSING
+        if extras:
+            self.extras[irow] = extras
+        return irow
+
+    def _flush(self):
+        """copies the buffered cards into the arrays"""
+        buffer = self._buffer
+        self._buffer = []
+        irow0 = self.nrows - len(buffer)
+        self._grow()
+
+        self._active[irow0:self.nrows] = True
+        for ifield, (name, unused_kind, unused_ncols) in enumerate(self.fields):
+            self._arrays[name][irow0:self.nrows] = [values[ifield] for values in buffer]
+
+    def _grow(self):
+        """grows the arrays to fit nrows"""
+        if self.nrows > len(self._active):
+            nrows = max(2 * len(self._active), self.nrows, 64)
+            self._active = _resize(self._active, nrows)
+            for name, array in self._arrays.items():
+                self._arrays[name] = _resize(array, nrows)
+
+    def extend(self, state, arrays, nrows):
+        """
+        Adds a block of cards from arrays (see ``ColumnarDict.add_arrays``)
+
+        Parameters
+        ----------
+        state : Dict[name] = value
+            the ``__dict__`` of the first card, which sets the template
+        arrays : Dict[name] = (nrows, ...) ndarray
+            the attributes that are stored in arrays
+        nrows : int
+            the number of cards
+
+        Returns
+        -------
+        irow0 : int
+            the row of the first card
+
+        """
+        if self._buffer:
+            self._flush()
+        if self.template is None:
+            self.template = _get_template(state, self._arrays)
+
+        irow0 = self.nrows
+        self.nrows += nrows
+        self._grow()
+        self._active[irow0:self.nrows] = True
+        for name, unused_kind, unused_ncols in self.fields:
+            self._arrays[name][irow0:self.nrows] = arrays[name]
+        return irow0
+
+    def add_extras(self, irow0, state, attributes, nrows):
+        """
+        Stores the attributes of a block of cards that aren't in the arrays
+        and are different from the template
+
+        Parameters
+        ----------
+        irow0 : int
+            the row of the first card
+        state : Dict[name] = value
+            the ``__dict__`` of the first card, which has the values of the
+            attributes that are the same for all the cards
+        attributes : Dict[name] = (nrows, ) ndarray / List
+            the attributes that vary by card
+        nrows : int
+            the number of cards
+
+        """
+        template = self.template
+        extras = {}  # irow -> {name: value}
+        def _add_extra(irows, name, values=None, value=_MISSING):
+            for i, irow in enumerate(irows):
+                extrasi = extras.get(irow)
+                if extrasi is None:
+                    extrasi = extras[irow] = {}
+                if values is not None:
+                    extrasi[name] = values[i]
+                else:
+                    extrasi[name] = list(value) if isinstance(value, list) else value
+
+        all_rows = range(irow0, irow0 + nrows)
+        for name, value in state.items():
+            if name in self._arrays:
+                continue
+            default = template.get(name, _MISSING)
+            if name in attributes:
+                irows, values = _get_different_values(attributes[name], default)
+                _add_extra((irows + irow0).tolist(), name, values=values)
+            elif default is _MISSING or not _is_same(value, default):
+                _add_extra(all_rows, name, value=value)
+
+        for name in template:
+            if name not in state:
+                _add_extra(all_rows, name, value=_MISSING)
+        self.extras.update(extras)
+
+    def remove(self, irow):
+        """frees a card"""
+        self.active[irow] = False
+        self.extras.pop(irow, None)
+
+    def get_value(self, irow, name):
+        """gets an attribute that isn't in the arrays"""
+        extras = self.extras.get(irow)
+        if extras is not None and name in extras:
+            value = extras[name]
+            if value is _MISSING:
+                raise AttributeError(name)
+            return value
+
+        try:
+            value = self.template[name]
+        except KeyError:
+            raise AttributeError(name)
+        if isinstance(value, list):
+            # the list may be modified in place
+            value = list(value)
+            self.set_value(irow, name, value)
+        return value
+
+    def set_value(self, irow, name, value):
+        """sets an attribute that isn't in the arrays"""
+        extras = self.extras.get(irow)
+        if (name in self.template and not isinstance(value, list) and
+                _is_same(value, self.template[name])):
+            if extras is not None:
+                extras.pop(name, None)
+                if not extras:
+                    del self.extras[irow]
+            return
+        if extras is None:
+            extras = self.extras[irow] = {}
+        extras[name] = value
+
+    def set_array_value(self, irow, name, kind, ncols, value):
+        """sets an attribute that's in the arrays"""
+        try:
+            value = _pack(kind, ncols, value)
+        except (TypeError, ValueError):
+            msg = '%s.%s=%r cannot be stored in columnar storage' % (self.name, name, value)
+            raise TypeError(msg)
+        self.arrays[name][irow] = value
+
+    def get_state(self, irow):
+        """gets the ``__dict__`` of a card"""
+        state = {}
+        for name, kind, unused_ncols in self.fields:
+            state[name] = _unpack(kind, self.arrays[name][irow])
+            if isinstance(state[name], np.ndarray):
+                state[name] = state[name].copy()
+        for name, value in self.template.items():
+            state[name] = list(value) if isinstance(value, list) else value
+        for name, value in self.extras.get(irow, {}).items():
+            if value is _MISSING:
+                del state[name]
+            else:
+                state[name] = value
+        return state
+
+    def get_arrays(self):
+        """gets the active rows of the arrays"""
+        active = self.active[:self.nrows]
+        if active.all():
+            return {name: array[:self.nrows] for name, array in self.arrays.items()}
+        return {name: array[:self.nrows][active] for name, array in self.arrays.items()}
+
+
+class _ColumnarCard(object):
+    """
+    The base class for the proxy cards, which get/set their attributes from
+    the columnar storage
+    """
+    _card_class = None
+
+    def __getattr__(self, name):
+        """gets the attributes that aren't in the arrays (e.g., ``cp_ref``)"""
+        if name in ('_store', '_row') or name.startswith('__'):
+            raise AttributeError(name)
+        return self._store.get_value(self._row, name)
+
+    def __setattr__(self, name, value):
+        if hasattr(getattr(type(self), name, None), '__set__'):
+            # an array attribute or a property (e.g., comment)
+            object.__setattr__(self, name, value)
+        else:
+            self._store.set_value(self._row, name, value)
+
+    def __delattr__(self, name):
+        self._store.set_value(self._row, name, _MISSING)
+
+    def __eq__(self, card):
+        if not isinstance(card, self._card_class):
+            return False
+        if self.type != card.type:
+            return False
+        return self._is_same_fields(self.raw_fields(), card.raw_fields())
+
+    __hash__ = None
+
+    def __reduce__(self):
+        """pickles the proxy as a standard card"""
+        return (_rebuild_card, (self._card_class, self._store.get_state(self._row)))
+
+
+class _NodeList(list):
+    """a list of node ids that writes back to the columnar storage"""
+    def __init__(self, values, card, name):
+        list.__init__(self, values)
+        self._card = card
+        self._name = name
+
+    def __setitem__(self, i, value):
+        list.__setitem__(self, i, value)
+        setattr(self._card, self._name, list(self))
+
+    def __reduce__(self):
+        """copies/pickles the node ids as a list"""
+        return (list, (list(self), ))
+
+
+def _get_proxy_class(card_class):
+    """creates the proxy class for a card class (e.g., GRID)"""
+    try:
+        return _PROXY_CLASSES[card_class]
+    except KeyError:
+        pass
+
+    namespace = {
+        '_card_class' : card_class,
+        '__module__' : __name__,
+        '__doc__' : card_class.__doc__,
+    }
+    for name, kind, ncols in _CARD_FIELDS[card_class]:
+        namespace[name] = _array_property(name, kind, ncols)
+    proxy_class = type(card_class.__name__, (_ColumnarCard, card_class), namespace)
+    _PROXY_CLASSES[card_class] = proxy_class
+    return proxy_class
+
+
+def _array_property(name, kind, ncols):
+    """creates the property for an attribute that's in the arrays"""
+    def fget(self):
+        value = _unpack(kind, self._store.arrays[name][self._row])
+        if kind == 'nodes':
+            value = _NodeList(value, self, name)
+        return value
+
+    def fset(self, value):
+        self._store.set_array_value(self._row, name, kind, ncols, value)
+    return property(fget, fset)
+
+
+def _pack(kind, ncols, value):
+    """converts an attribute into the array value"""
+    if kind == 'int' or kind == 'int?':
+        if value is None and kind == 'int?':
+            return _NULL_INT
+        if type(value) not in integer_types or not _NULL_INT < value < 2147483648:
+            raise TypeError(value)
+        return value
+    elif kind == 'nodes':
+        if not isinstance(value, list) or len(value) != ncols:
+            raise TypeError(value)
+        for nid in value:
+            if nid is not None and (
+                    type(nid) not in integer_types or not _NULL_INT < nid < 2147483648):
+                raise TypeError(value)
+        if None in value:
+            value = [_NULL_INT if nid is None else nid for nid in value]
+        return value
+
+    if value is None and kind == 'xyz?':
+        return _NAN3
+    if not isinstance(value, np.ndarray) or value.dtype != np.float64 or value.shape != (ncols, ):
+        raise TypeError(value)
+    return value
+
+
+def _unpack(kind, value):
+    """converts the array value into the attribute"""
+    if kind == 'int':
+        return int(value)
+    elif kind == 'int?':
+        return None if value == _NULL_INT else int(value)
+    elif kind == 'nodes':
+        nids = value.tolist()
+        if _NULL_INT in nids:
+            nids = [None if nid == _NULL_INT else nid for nid in nids]
+        return nids
+    elif kind == 'xyz?' and np.isnan(value[0]):
+        return None
+    return value
+
+
+def _get_template(state, arrays):
+    """gets the attributes that aren't in the arrays and are simple"""
+    template = {}
+    for name, value in state.items():
+        if name in arrays or name == '_comment':
+            continue
+        if value is None or type(value) in (bool, float, str) + integer_types:
+            template[name] = value
+        elif type(value) is list and not value:
+            template[name] = value
+    return template
+
+
+def _is_same(value1, value2):
+    """is the attribute the same as the template value"""
+    if value1 is value2 and not isinstance(value1, (list, np.ndarray)):
+        return True
+    if type(value1) is not type(value2) or isinstance(value1, np.ndarray):
+        return False
+    if isinstance(value1, float):
+        return value1 == value2 and math.copysign(1., value1) == math.copysign(1., value2)
+    try:
+        return bool(value1 == value2)
+    except ValueError:
+        return False
+
+
+def _get_different_values(values, default):
+    """
+    Gets the values of an attribute that are different from the template
+    value (see ``_is_same``)
+
+    Parameters
+    ----------
+    values : (n, ) ndarray / List
+        the values of the attribute
+    default : varies
+        the template value; _MISSING if there isn't one
+
+    Returns
+    -------
+    irows : (ndiff, ) int ndarray
+        the rows that are different
+    values : List
+        the values that are different
+
+    """
+    if isinstance(values, np.ndarray):
+        if default is not _MISSING and values.dtype.kind == 'f' and type(default) is float:
+            is_diff = (values != default) | (np.signbit(values) != (math.copysign(1., default) < 0.))
+        elif default is not _MISSING and values.dtype.kind == 'i' and type(default) in integer_types:
+            is_diff = values != default
+        else:
+            is_diff = np.ones(len(values), dtype='bool')
+        irows = np.flatnonzero(is_diff)
+        return irows, values[irows].tolist()
+
+    if default is _MISSING:
+        return np.arange(len(values)), list(values)
+    irows = [i for i, value in enumerate(values) if not _is_same(value, default)]
+    return np.array(irows, dtype='int64'), [values[i] for i in irows]
+
+
+def get_card_identity(card):
+    """
+    Gets a key that identifies a card object.  The proxy of a card in a
+    ColumnarDict may be recreated, so the storage row is used.
+    """
+    if isinstance(card, _ColumnarCard):
+        return (id(card._store), card._row)
+    return id(card)
+
+
+def get_card_attributes(card):
+    """
+    Gets the attributes of a card that aren't stored in the arrays
+    (e.g., ``pid_ref``) as a dictionary
+    """
+    if isinstance(card, _ColumnarCard):
+        store = card._store
+        attributes = dict(store.template)
+        for name, value in store.extras.get(card._row, {}).items():
+            if value is _MISSING:
+                del attributes[name]
+            else:
+                attributes[name] = value
+        return attributes
+    return getattr(card, '__dict__', {})
+
+
+def _is_int_key(key):
+    """can the key be stored in the sorted int64 index"""
+    return (type(key) in integer_types or isinstance(key, np.integer)) and (
+        -2 ** 63 <= key < 2 ** 63)
+
+
+def _resize(array, nrows):
+    """grows an array"""
+    array2 = np.zeros((nrows, ) + array.shape[1:], dtype=array.dtype)
+    array2[:len(array)] = array
+    return array2
+
+
+def _rebuild_card(card_class, state):
+    """creates a standard card from the ``__dict__``"""
+    card = card_class.__new__(card_class)
+    card.__dict__.update(state)
+    return card
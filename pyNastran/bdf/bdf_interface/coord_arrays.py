@@ -0,0 +1,386 @@
+"""
+Defines the vectorized coordinate system engine:
+  - CoordArrays(cids, coord_types, origins, betas)
+  - get_grid_arrays(model, nids)
+  - get_xyz_in_coord_vectorized(model, nids, cid=0)
+
+All the coordinate systems of a model are resolved at once.  The coordinate
+systems are sorted into levels (e.g., a CORD2R that references a CORD2C that
+references the global system is on level 2), so each level is resolved with
+a few array operations instead of the recursive ``Coord.setup``.  The
+origins and the beta matrices are stored in stacked (ncoord, 3) and
+(ncoord, 3, 3) arrays, so the nodes are transformed from their CP to the
+global frame (and from the global frame to a CD/cid) in a single sweep.
+
+.. code-block:: python
+
+   >>> coord_arrays = CoordArrays.from_model(model)
+   >>> cps, cds, xyz_cp = get_grid_arrays(model, nids)
+   >>> xyz_cid0 = coord_arrays.transform_node_to_global(xyz_cp, cps)
+   >>> xyz_cd = coord_arrays.transform_node_to_local(xyz_cid0, cds)
+
+"""
+from __future__ import print_function
+import numpy as np
+
+from pyNastran.bdf.cards.coordinate_systems import (
+    RectangularCoord, CylindricalCoord, SphericalCoord)
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
+
+#: the coordinate system types (the last letter of the card name)
+_COORD_CLASSES = {
+    'R' : RectangularCoord,
+    'C' : CylindricalCoord,
+    'S' : SphericalCoord,
+}
+_CORD1_TYPES = ['CORD1R', 'CORD1C', 'CORD1S']
+_CORD2_TYPES = ['CORD2R', 'CORD2C', 'CORD2S']
+
+
+class CoordArrays(object):
+    """
+    Stores the resolved coordinate systems of a model as arrays, so points
+    can be transformed in a vectorized way
+    """
+    def __init__(self, cids, coord_types, origins, betas, levels=None):
+        """
+        Creates the CoordArrays
+
+        Parameters
+        ----------
+        cids : (ncoord, ) int ndarray
+            the sorted coordinate system ids
+        coord_types : (ncoord, ) str ndarray
+            the type of each coordinate system ('R', 'C', 'S')
+        origins : (ncoord, 3) float ndarray
+            the origins in the global frame
+        betas : (ncoord, 3, 3) float ndarray
+            the [i, j, k] axes of each coordinate system in the global frame
+        levels : List[(n, ) int ndarray]; default=None -> all on 1 level
+            the index of the coordinate systems that are resolved together;
+            a level only references the coordinate systems on the previous
+            levels
+
+        """
+        self.cids = cids
+        self.coord_types = coord_types
+        self.origins = origins
+        self.betas = betas
+        if levels is None:
+            levels = [np.arange(len(cids))]
+        self.levels = levels
+
+    @classmethod
+    def from_model(cls, model):
+        """
+        Resolves the CORD1x/CORD2x coordinate systems of a model; the model
+        doesn't need to be cross-referenced
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+
+        Returns
+        -------
+        coord_arrays : CoordArrays()
+            the resolved coordinate systems
+
+        Raises
+        ------
+        NotImplementedError
+            the model has a coordinate system that isn't a CORD1x/CORD2x
+            (e.g., a CORD3G)
+        RuntimeError
+            there is a circular reference or the axes of a coordinate
+            system are invalid
+
+        """
+        cids = np.array(sorted(model.coords), dtype='int64')
+        ncoords = len(cids)
+        coord_types = np.zeros(ncoords, dtype='|U1')
+
+        # the 3 points that define the coordinate system in the frame of a
+        # reference coordinate system:
+        #  - CORD2x: e1, e2, e3 in the rid frame
+        #  - CORD1x: the positions of g1, g2, g3 in their cp frames
+        xyz_ref = np.zeros((ncoords, 3, 3), dtype='float64')
+        cid_ref = np.zeros((ncoords, 3), dtype='int64')
+        for icoord, cid in enumerate(cids):
+            coord = model.coords[cid]
+            coord_type = coord.type
+            if coord_type in _CORD2_TYPES:
+                cid_ref[icoord, :] = coord.Rid()
+                xyz_ref[icoord, :, :] = [coord.e1, coord.e2, coord.e3]
+            elif coord_type in _CORD1_TYPES:
+                for inode, nid in enumerate(coord.node_ids):
+                    node = model.nodes[nid]
+                    cid_ref[icoord, inode] = node.Cp()
+                    xyz_ref[icoord, inode, :] = node.xyz
+            else:
+                raise NotImplementedError('coordinate system is not supported\n%s' % (
+                    coord.rstrip()))
+            coord_types[icoord] = coord_type[-1]
+
+        coord_arrays = cls(cids, coord_types,
+                           np.zeros((ncoords, 3), dtype='float64'),
+                           np.zeros((ncoords, 3, 3), dtype='float64'))
+        iref = coord_arrays.get_index(cid_ref.ravel()).reshape(ncoords, 3)
+
+        is_resolved = cids == 0
+        coord_arrays.betas[is_resolved] = np.eye(3)
+        coord_arrays.levels = [np.where(is_resolved)[0]]
+        while not is_resolved.all():
+            # the coordinate systems where all the reference coordinate
+            # systems are resolved
+            icoords = np.where(~is_resolved & is_resolved[iref].all(axis=1))[0]
+            if len(icoords) == 0:
+                cids_unresolved = cids[~is_resolved].tolist()
+                raise RuntimeError('Circular Reference: the coordinate systems %s '
+                                   'cannot be resolved' % cids_unresolved)
+
+            xyz = coord_arrays.transform_node_to_global(
+                xyz_ref[icoords].reshape(-1, 3),
+                cids[iref[icoords]].ravel()).reshape(-1, 3, 3)
+            coord_arrays.origins[icoords] = xyz[:, 0, :]
+            coord_arrays.betas[icoords] = _get_ijk(
+                cids[icoords], xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :])
+            is_resolved[icoords] = True
+            coord_arrays.levels.append(icoords)
+        return coord_arrays
+
+    def get_index(self, cids):
+        """
+        Gets the index of the coordinate systems
+
+        Parameters
+        ----------
+        cids : (n, ) int ndarray
+            the coordinate system ids
+
+        Returns
+        -------
+        icids : (n, ) int ndarray
+            the index into ``self.cids``
+
+        """
+        cids = np.asarray(cids)
+        icids = np.searchsorted(self.cids, cids)
+        icids[icids == len(self.cids)] = 0
+        is_missing = self.cids[icids] != cids
+        if is_missing.any():
+            raise KeyError('cids=%s not found; allowed=%s' % (
+                np.unique(cids[is_missing]).tolist(), self.cids.tolist()))
+        return icids
+
+    def transform_node_to_global(self, xyz, cps):
+        """
+        Transforms points from their local frames to the global frame
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the local frames (e.g., R, theta, z for a
+            cylindrical system)
+        cps : (n, ) int ndarray
+            the coordinate system of each point
+
+        Returns
+        -------
+        xyz_cid0 : (n, 3) float ndarray
+            the points in the global frame
+
+        """
+        icps = self.get_index(cps)
+        xyz_local = np.array(xyz, dtype='float64')
+        for coord_type, coord_class in sorted(_COORD_CLASSES.items()):
+            if coord_type == 'R':
+                continue
+            ipoints = np.where(self.coord_types[icps] == coord_type)[0]
+            if len(ipoints):
+                xyz_local[ipoints] = coord_class.coord_to_xyz_array(xyz_local[ipoints])
+        return np.einsum('ni,nij->nj', xyz_local, self.betas[icps]) + self.origins[icps]
+
+    def transform_node_to_local(self, xyz_cid0, cids):
+        """
+        Transforms points from the global frame to local frames
+
+        Parameters
+        ----------
+        xyz_cid0 : (n, 3) float ndarray
+            the points in the global frame
+        cids : int / (n, ) int ndarray
+            the coordinate system of all the points / each point
+
+        Returns
+        -------
+        xyz_cid : (n, 3) float ndarray
+            the points in the local frames (e.g., R, theta, z for a
+            cylindrical system)
+
+        """
+        xyz_cid0 = np.asarray(xyz_cid0)
+        if np.ndim(cids) == 0:
+            icid = self.get_index([cids])[0]
+            xyz_coord = np.dot(xyz_cid0 - self.origins[icid], self.betas[icid].T)
+            coord_class = _COORD_CLASSES[self.coord_types[icid]]
+            return coord_class.xyz_to_coord_array(xyz_coord)
+
+        icids = self.get_index(cids)
+        xyz_cid = np.einsum('nj,nij->ni', xyz_cid0 - self.origins[icids], self.betas[icids])
+        for coord_type, coord_class in sorted(_COORD_CLASSES.items()):
+            if coord_type == 'R':
+                continue
+            ipoints = np.where(self.coord_types[icids] == coord_type)[0]
+            if len(ipoints):
+                xyz_cid[ipoints] = coord_class.xyz_to_coord_array(xyz_cid[ipoints])
+        return xyz_cid
+
+    def update_coords(self, model):
+        """
+        Sets the origin and the i, j, k axes of the coordinate systems of a
+        cross-referenced model, which is the same as calling
+        ``coord.setup()`` for every coordinate system
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+
+        """
+        cids = np.hstack(self.levels)
+        cord1_cids = []
+        for cid in self.cids[cids].tolist():
+            coord = model.coords[cid]
+            if coord.type in _CORD2_TYPES and not coord.is_resolved:
+                # the reference coordinate system is on a previous level
+                rid = coord.Rid()
+                rid_trace = list(model.coords[rid].rid_trace)
+                if rid not in rid_trace:
+                    rid_trace.append(rid)
+                coord.rid_trace = rid_trace
+            elif coord.type in _CORD1_TYPES:
+                for nid in coord.node_ids:
+                    cp = model.nodes[nid].Cp()
+                    if cp not in coord.rid_trace:
+                        coord.rid_trace.append(cp)
+                cord1_cids.append(cid)
+
+        # the e1, e2, e3 points of a CORD1x are the global node positions
+        if cord1_cids:
+            nids = np.array([model.coords[cid].node_ids for cid in cord1_cids]).ravel()
+            cps, unused_cds, xyz_cp = get_grid_arrays(model, nids)
+            xyz_cid0 = self.transform_node_to_global(xyz_cp, cps).reshape(-1, 3, 3)
+            for cid, (e1, e2, e3) in zip(cord1_cids, xyz_cid0):
+                coord = model.coords[cid]
+                coord.e1 = e1
+                coord.e2 = e2
+                coord.e3 = e3
+                coord.is_resolved = True
+
+        for cid, origin, beta in zip(self.cids.tolist(), self.origins, self.betas):
+            coord = model.coords[cid]
+            coord.origin = origin.copy()
+            coord.i = beta[0, :].copy()
+            coord.j = beta[1, :].copy()
+            coord.k = beta[2, :].copy()
+
+
+def _get_ijk(cids, e1, e2, e3):
+    """
+    Finds the [i, j, k] axes from the global points that define a set of
+    coordinate systems (see ``Coord.setup``)
+    """
+    e13 = e3 - e1
+    e12 = e2 - e1
+    k = _normalize(cids, e12, 'e12')
+    j = _normalize(cids, np.cross(k, e13), 'cross(k, e13)')
+    i = np.cross(j, k)
+    return np.stack([i, j, k], axis=1)
+
+
+def _normalize(cids, vectors, name):
+    """normalizes a set of vectors and checks for zero length vectors"""
+    norms = np.linalg.norm(vectors, axis=1)
+    is_invalid = ~(norms > 0.)
+    if is_invalid.any():
+        raise RuntimeError('Invalid Unit Vector: cids=%s; %s=\n%s' % (
+            cids[is_invalid].tolist(), name, vectors[is_invalid]))
+    return vectors / norms[:, np.newaxis]
+
+
+def get_grid_arrays(model, nids):
+    """
+    Gets the CP, CD, and xyz values of a set of GRIDs
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    nids : (n, ) int ndarray
+        the GRID ids
+
+    Returns
+    -------
+    cps : (n, ) int ndarray
+        the input coordinate system of each GRID
+    cds : (n, ) int ndarray
+        the output coordinate system of each GRID
+    xyz_cp : (n, 3) float ndarray
+        the points in the CP coordinate system
+
+    """
+    nids = np.asarray(nids, dtype='int64')
+    nodes = model.nodes
+    if isinstance(nodes, ColumnarDict):
+        try:
+            grids = nodes.get_arrays('GRID')
+        except KeyError:
+            grids = None
+        if grids is not None and len(grids['nid']) == len(nodes):
+            isort = np.argsort(grids['nid'])
+            inids = isort[np.searchsorted(grids['nid'], nids, sorter=isort)]
+            return grids['cp'][inids], grids['cd'][inids], grids['xyz'][inids, :]
+
+    nnodes = len(nids)
+    cps = np.zeros(nnodes, dtype='int64')
+    cds = np.zeros(nnodes, dtype='int64')
+    xyz_cp = np.zeros((nnodes, 3), dtype='float64')
+    for i, nid in enumerate(nids.tolist()):
+        node = nodes[nid]
+        cps[i] = node.Cp()
+        cds[i] = node.Cd()
+        xyz_cp[i, :] = node.xyz
+    return cps, cds, xyz_cp
+
+
+def get_xyz_in_coord_vectorized(model, nids, cid=0):
+    """
+    Gets the positions of a set of GRIDs in a coordinate system
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    nids : (n, ) int ndarray
+        the GRID ids
+    cid : int; default=0
+        the coordinate system to get the positions in
+
+    Returns
+    -------
+    xyz_cid : (n, 3) float ndarray
+        the points in the cid coordinate system
+
+    Raises
+    ------
+    NotImplementedError
+        the model has a coordinate system that isn't a CORD1x/CORD2x
+
+    """
+    coord_arrays = CoordArrays.from_model(model)
+    cps, unused_cds, xyz_cp = get_grid_arrays(model, nids)
+    xyz_cid0 = coord_arrays.transform_node_to_global(xyz_cp, cps)
+    if cid == 0:
+        return xyz_cid0
+    return coord_arrays.transform_node_to_local(xyz_cid0, cid)
@@ -71,11 +71,40 @@ around the idea of cross-referencing, so it's recommended that you use it.
 from __future__ import print_function
 from collections import defaultdict
 import traceback
-from typing import List, Dict, Any
-from six import iteritems, itervalues
+from typing import List, Dict, Set, Optional, Any
+from six import iteritems, itervalues, integer_types, string_types
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.coord_arrays import CoordArrays
+from pyNastran.bdf.bdf_interface.columnar import (
+    ColumnarDict, get_card_identity, get_card_attributes)
+
+#: the attributes with the cards that are linked by cross_reference
+_XREF_SLOTS = [
+    'nodes', 'points', 'coords',
+    'elements', 'masses', 'rigid_elements', 'plotels',
+    'properties', 'properties_mass',
+    'materials', 'creep_materials', 'MATS1', 'MATS3', 'MATS8',
+    'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5', 'MATT8', 'MATT9',
+    'aero', 'aeros', 'caeros', 'paeros', 'trims', 'csschds', 'splines',
+    'aecomps', 'aelists', 'aeparams', 'aesurf', 'aesurfs', 'flutters',
+    'monitor_points',
+    'spcadds', 'spcs', 'spcoffs', 'mpcadds', 'mpcs', 'suport', 'suport1',
+    'se_suport',
+    'load_combinations', 'loads', 'dloads', 'dload_entries', 'dareas', 'tics',
+    'dphases',
+    'asets', 'omits', 'bsets', 'csets', 'qsets', 'usets',
+    'se_sets', 'se_bsets', 'se_csets', 'se_qsets', 'se_usets',
+    'dequations', 'dresps', 'dconstrs', 'dvcrels', 'dvmrels', 'dvprels',
+]
+
+#: the attributes with cards that store values that are calculated from the
+#: cards they reference, so they're re-linked when those cards are modified
+_XREF_CALCULATED_SLOTS = ['coords', 'loads']
+
+#: the *_ref values that aren't cards (e.g., AERO rho_ref)
+_NOT_CARDS = integer_types + string_types + (float, )
 
 class XrefMesh(BDFAttributes):
     """
@@ -89,6 +118,16 @@ class XrefMesh(BDFAttributes):
         self._nxref_errors = 100
         self._stop_on_xref_error = True
 
+        #: the (slot, key) of the cards that reference a (slot, key) card;
+        #: None if cross_reference(track_dependencies=True) wasn't used
+        self._xref_dependents = None  # type: Optional[Dict[Any, Set[Any]]]
+
+        #: the card identity -> (slot, key)
+        self._xref_card_keys = {}  # type: Dict[Any, Any]
+
+        #: the (slot, key) of the cards that were changed after cross referencing
+        self._dirty_cards = set()  # type: Set[Any]
+
     # def geom_check(self):
         # """
         # Performs various geometry checks
@@ -110,8 +149,9 @@ class XrefMesh(BDFAttributes):
                         xref_aero=True,
                         xref_sets=True,
                         xref_optimization=True,
-                        word=''):
-        # type: (bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, str) -> None
+                        word='',
+                        track_dependencies=False):
+        # type: (bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, bool, str, bool) -> None
         """
         Links up all the cards to the cards they reference
 
@@ -139,6 +179,12 @@ class XrefMesh(BDFAttributes):
             set cross referencing of SETx
         word : str; default=''
             model flag
+        track_dependencies : bool; default=False
+            stores the cards that reference each card, so the cards that are
+            changed (e.g., with add_card, update_card, replace_cards) and
+            the cards that reference them can be re-linked with
+            cross_reference_dirty() instead of cross referencing the
+            whole model
 
         To only cross-reference nodes:
 
@@ -184,6 +230,8 @@ class XrefMesh(BDFAttributes):
         self._cross_reference_superelements()
         #self.case_control_deck.cross_reference(self)
         self.pop_xref_errors()
+        if track_dependencies:
+            self._build_xref_dependencies()
 
         for super_id, superelement in sorted(self.superelement_models.items()):
             superelement.cross_reference(
@@ -193,7 +241,292 @@ class XrefMesh(BDFAttributes):
                 xref_materials=xref_materials, xref_loads=xref_loads,
                 xref_constraints=xref_constraints, xref_aero=xref_aero,
                 xref_sets=xref_sets, xref_optimization=xref_optimization,
-                word=' (Superelement %i)' % super_id)
+                word=' (Superelement %i)' % super_id,
+                track_dependencies=track_dependencies)
+
+    def mark_card_dirty(self, card_name, card_id):
+        # type: (str, Any) -> None
+        """
+        Flags a card that was modified, so it (and the cards that reference
+        it) will be re-linked by cross_reference_dirty().  add_card,
+        update_card, and replace_cards do this automatically.
+
+        Parameters
+        ----------
+        card_name : str
+            the name of the card (e.g., PSHELL)
+        card_id : int/str
+            the key of the card (e.g., the PSHELL pid)
+
+        .. code-block:: python
+
+          >>> model.cross_reference(track_dependencies=True)
+          >>> model.properties[10].t = 0.2
+          >>> model.mark_card_dirty('PSHELL', 10)
+          >>> model.cross_reference_dirty()
+
+        """
+        if self._xref_dependents is None:
+            return
+        slot = self._type_to_slot_map[card_name]
+        self._dirty_cards.add((slot, card_id))
+
+    def _count_card_ids(self):
+        # type: () -> Optional[Dict[str, int]]
+        """gets the number of cards of each type, so the added cards can be found"""
+        if self._xref_dependents is None:
+            return None
+        return dict((card_type, len(ids)) for card_type, ids in self._type_to_id_map.items())
+
+    def _mark_added_cards_dirty(self, ncard_ids):
+        # type: (Optional[Dict[str, int]]) -> None
+        """flags the cards that were added since _count_card_ids was called"""
+        if ncard_ids is None:
+            return
+        for card_type, ids in self._type_to_id_map.items():
+            nids = ncard_ids.get(card_type, 0)
+            if len(ids) > nids and card_type in self._type_to_slot_map:
+                slot = self._type_to_slot_map[card_type]
+                for card_id in ids[nids:]:
+                    self._dirty_cards.add((slot, card_id))
+
+    def get_dirty_cards(self, include_dependents=True):
+        # type: (bool) -> Dict[str, List[Any]]
+        """
+        Gets the cards that will be re-linked by cross_reference_dirty()
+
+        Parameters
+        ----------
+        include_dependents : bool; default=True
+            include the cards that reference the modified cards
+
+        Returns
+        -------
+        dirty_cards : Dict[str, List[int/str]]
+            the keys of the dirty cards for each attribute
+            (e.g., {'properties' : [10], 'elements' : [1, 2, 3]})
+
+        """
+        if include_dependents:
+            card_keys = self._get_xref_dependents_closure()
+        else:
+            card_keys = self._dirty_cards
+
+        dirty_cards = defaultdict(list)  # type: Dict[str, List[Any]]
+        for slot, key in card_keys:
+            dirty_cards[slot].append(key)
+        for keys in dirty_cards.values():
+            try:
+                keys.sort()
+            except TypeError:  # mixed key types
+                pass
+        return dict(dirty_cards)
+
+    def cross_reference_dirty(self):
+        # type: () -> int
+        """
+        Re-links the cards that were modified and the cards that reference
+        them, which is much faster than uncross_reference/cross_reference
+        when only a few cards change (e.g., the PSHELLs in an optimization).
+
+        Returns
+        -------
+        ncards : int
+            the number of re-linked cards
+
+        .. code-block:: python
+
+          >>> model.cross_reference(track_dependencies=True)
+          >>> model.update_card('PSHELL', 10, 4, 0.2)
+          >>> model.get_dirty_cards(include_dependents=False)
+          {'properties' : [10]}
+          >>> model.cross_reference_dirty()
+
+        """
+        if self._xref_dependents is None:
+            raise RuntimeError('the dependencies are not tracked; '
+                               'use cross_reference(track_dependencies=True)')
+        card_keys = self._sort_xref_keys(self._get_xref_dependents_closure())
+        cards = []
+        for card_key in card_keys:
+            for card in self._get_cards_from_key(card_key):
+                cards.append((card_key, card))
+                self._xref_card_keys[get_card_identity(card)] = card_key
+
+        for card_key, card in cards:
+            self._relink_card(card_key[0], card)
+        for card_key, card in cards:
+            self._add_xref_dependencies(card_key, card)
+        self._dirty_cards = set()
+        self.pop_xref_errors()
+        return len(cards)
+
+    def _build_xref_dependencies(self):
+        # type: () -> None
+        """
+        Creates the map of the cards to the cards that reference them
+        by inspecting the ``*_ref`` attributes
+        """
+        self._xref_dependents = defaultdict(set)
+        self._xref_card_keys = {}
+        self._dirty_cards = set()
+
+        # keep the cards (the columnar proxies) alive while the map is built
+        cards = list(self._iter_xref_cards())
+        card_keys = self._xref_card_keys
+        for card_key, card in cards:
+            card_keys[get_card_identity(card)] = card_key
+        for card_key, card in cards:
+            self._add_xref_dependencies(card_key, card)
+
+    def _iter_xref_cards(self):
+        """iterates over the ((slot, key), card) for the cross-referenceable cards"""
+        for slot in _XREF_SLOTS:
+            value = getattr(self, slot, None)
+            if value is None:
+                continue
+            elif isinstance(value, (dict, ColumnarDict)):
+                for key, cards in value.items():
+                    if isinstance(cards, list):
+                        for card in cards:
+                            yield (slot, key), card
+                    else:
+                        yield (slot, key), cards
+            elif isinstance(value, list):
+                for i, card in enumerate(value):
+                    yield (slot, i), card
+            else:
+                yield (slot, None), value
+
+    def _get_cards_from_key(self, card_key):
+        """gets the cards for a (slot, key); a deleted card returns no cards"""
+        slot, key = card_key
+        value = getattr(self, slot, None)
+        if value is None:
+            return []
+        elif isinstance(value, (dict, ColumnarDict)):
+            if key not in value:
+                return []
+            cards = value[key]
+        elif isinstance(value, list):
+            if key >= len(value):
+                return []
+            cards = value[key]
+        else:
+            cards = value
+        return cards if isinstance(cards, list) else [cards]
+
+    def _add_xref_dependencies(self, card_key, card):
+        """adds the cards that are referenced by a card to the map"""
+        card_keys = self._xref_card_keys
+        dependents = self._xref_dependents
+        for name, ref in get_card_attributes(card).items():
+            if ref is None or not name.endswith('_ref'):
+                continue
+            refs = [ref]
+            while refs:
+                ref = refs.pop()
+                if ref is None or isinstance(ref, _NOT_CARDS):
+                    continue
+                elif isinstance(ref, (list, tuple)):
+                    refs.extend(ref)
+                    continue
+                elif isinstance(ref, dict):
+                    refs.extend(ref.values())
+                    continue
+                ref_key = card_keys.get(id(ref))
+                if ref_key is None:
+                    ref_key = card_keys.get(get_card_identity(ref))
+                if ref_key is not None and ref_key != card_key:
+                    dependents[ref_key].add(card_key)
+
+    def _get_xref_dependents_closure(self):
+        """
+        Gets the dirty cards and the cards that reference them.
+
+        A card that was modified in place (e.g., update_card) is still
+        referenced by the same objects, so only the cards that store values
+        calculated from it (e.g., the CORD1R axes, the FORCE2 direction) are
+        re-linked.  All the cards that reference a replaced card are re-linked.
+        """
+        dependents = self._xref_dependents
+        card_keys = set(self._dirty_cards)
+        if dependents is None:
+            return card_keys
+        keys_to_check = [(card_key, self._is_card_replaced(card_key))
+                         for card_key in card_keys]
+        while keys_to_check:
+            card_key, is_replaced = keys_to_check.pop()
+            for dependent_key in dependents.get(card_key, ()):
+                if dependent_key in card_keys:
+                    continue
+                if is_replaced or dependent_key[0] in _XREF_CALCULATED_SLOTS:
+                    card_keys.add(dependent_key)
+                    keys_to_check.append((dependent_key, False))
+        return card_keys
+
+    def _is_card_replaced(self, card_key):
+        """is the card a different object than the one that was cross referenced"""
+        cards = self._get_cards_from_key(card_key)
+        if not cards:
+            return True
+        card_keys = self._xref_card_keys
+        return any(card_keys.get(get_card_identity(card)) != card_key for card in cards)
+
+    def _sort_xref_keys(self, card_keys):
+        """
+        Sorts the cards, so a card is re-linked after the cards it references
+        (e.g., a CORD1R is setup after its GRIDs)
+        """
+        dependents = self._xref_dependents
+        nreferences = dict((card_key, 0) for card_key in card_keys)
+        for card_key in card_keys:
+            for dependent_key in dependents.get(card_key, ()):
+                if dependent_key in nreferences:
+                    nreferences[dependent_key] += 1
+
+        sorted_keys = []
+        keys_to_add = [card_key for card_key, nrefs in nreferences.items() if nrefs == 0]
+        while keys_to_add:
+            card_key = keys_to_add.pop()
+            sorted_keys.append(card_key)
+            for dependent_key in dependents.get(card_key, ()):
+                if dependent_key in nreferences:
+                    nreferences[dependent_key] -= 1
+                    if nreferences[dependent_key] == 0:
+                        keys_to_add.append(dependent_key)
+
+        if len(sorted_keys) < len(nreferences):
+            # circular references
+            added_keys = set(sorted_keys)
+            sorted_keys.extend(card_key for card_key in nreferences
+                               if card_key not in added_keys)
+        return sorted_keys
+
+    def _relink_card(self, slot, card):
+        """cross references a card that may have already been cross referenced"""
+        if slot not in _XREF_SLOTS:
+            return
+        # the *_ref objects are reset, so the ids (e.g., Pid()) are used
+        # (AERO rho_ref is a float)
+        for name, ref in list(get_card_attributes(card).items()):
+            if not name.endswith('_ref') or name == 'elements_ref':
+                continue
+            if ref is not None and not isinstance(ref, _NOT_CARDS):
+                setattr(card, name, None)
+
+        try:
+            if slot == 'nodes':
+                card.cross_reference(self, self.grdset)
+            elif slot == 'coords':
+                card.cross_reference(self)
+                if card.type in ['CORD1R', 'CORD1C', 'CORD1S']:
+                    card.is_resolved = False
+                card.setup()
+            else:
+                card.cross_reference(self)
+        except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
+            self._store_xref_error(error, card)
 
     def _cross_reference_constraints(self):
         # type: () -> None
@@ -239,8 +572,15 @@ class XrefMesh(BDFAttributes):
         for coord in self.coords.values():
             coord.cross_reference(self)
 
-        for coord in self.coords.values():
-            coord.setup()
+        # the coordinate systems are resolved level by level instead of
+        # recursively; the recursive setup has the better error messages
+        try:
+            coord_arrays = CoordArrays.from_model(self)
+        except (NotImplementedError, RuntimeError, KeyError):
+            for coord in self.coords.values():
+                coord.setup()
+        else:
+            coord_arrays.update_coords(self)
 
     def _cross_reference_aero(self, check_caero_element_ids=False):
         # type: () -> None
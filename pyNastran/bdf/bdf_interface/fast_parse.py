@@ -0,0 +1,729 @@
+"""
+Parses the high-volume bulk data cards in blocks.  Defines:
+  - parse_cards_fast(model, cards_list, icards_skip=None)
+  - parse_cards_fast_block(model, cards_list, icard0, ncards=NCARDS_BLOCK)
+
+The fields of all the cards of a given type (e.g., GRID) are split into a
+single (ncards, nfields) string array, which is converted into integer and
+float arrays at once, rather than field by field with ``assign_type``.
+
+Any card that is unusual (e.g., an invalid field, a Nastran-style ``1.+3``
+float that isn't valid, a CHEXA20) is left for the standard reader, so the
+cards and the error messages are the same as ``add_card``.
+"""
+from __future__ import print_function
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CTRIA3, CQUAD4
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CHEXA8
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.elements.rigid import RBE2
+
+#: the characters that are removed by str.strip() for a blank field
+_WHITESPACE = np.array([0] + [ord(char) for char in ' \t\n\r\x0b\x0c'], dtype='uint32')
+
+#: the number of cards that are split into fields at once by
+#: ``parse_cards_fast_block``, which limits the size of the field arrays
+#: and the number of card objects that are waiting to be added to the model
+NCARDS_BLOCK = 10000
+
+
+def parse_cards_fast(model, cards_list, icards_skip=None):
+    """
+    Builds the card objects for the high-volume cards in ``cards_list``
+
+    Parameters
+    ----------
+    model : BDF()
+        the model that will store the cards
+    cards_list : List[card]
+        the cards from ``get_bdf_cards``, where a card is of the form
+        [card_name, comment, card_lines, ifile_iline]
+    icards_skip : Set[int]; default=None
+        the cards that have already been parsed
+
+    Returns
+    -------
+    parsed_cards : Dict[icard] = (card, class_instance, exception)
+        icard : int
+            the index into ``cards_list``
+        card : None
+            the fields aren't created
+        class_instance : BaseCard
+            the card object (e.g., GRID)
+        exception : None
+            cards with errors are left for ``add_card``
+
+    .. note:: the supported cards are GRID, CQUAD4, CTRIA3, CHEXA (CHEXA8),
+              CTETRA (CTETRA4), CBAR, CBUSH, CONM2, and RBE2
+    """
+    if icards_skip is None:
+        icards_skip = set()
+    if model.echo:
+        return {}
+    card_types = _get_fast_card_types(model)
+    if model.baror is not None:
+        card_types.discard('CBAR')
+
+    cards_by_type = {}
+    for icard, (card_name, comment, card_lines, unused_ifile_iline) in enumerate(cards_list):
+        if card_name == 'ECHOON':
+            # echoing needs the fields of each card
+            return {}
+        if card_name == 'BAROR':
+            # the CBAR defaults depend on the order of the cards
+            card_types.discard('CBAR')
+        if card_name not in card_types or icard in icards_skip:
+            continue
+        if card_name in cards_by_type:
+            cards_by_type[card_name].append((icard, comment, card_lines))
+        else:
+            cards_by_type[card_name] = [(icard, comment, card_lines)]
+
+    parsed_cards = {}
+    for card_name, cards in sorted(cards_by_type.items()):
+        if card_name not in card_types:
+            continue
+        nfields, build_cards = _FAST_CARDS[card_name]
+        fields, is_valid = _split_fields(cards, card_name, nfields)
+        block = FieldBlock(fields, is_valid)
+        comments = [comment for (unused_icard, comment, unused_card_lines) in cards]
+        cards_obj = build_cards(block, comments)
+
+        nparsed = 0
+        for (icard, unused_comment, unused_card_lines), card_obj in zip(cards, cards_obj):
+            if card_obj is not None:
+                parsed_cards[icard] = (None, card_obj, None)
+                nparsed += 1
+        model.log.debug('fast parsed %i/%i %s cards' % (nparsed, len(cards), card_name))
+    return parsed_cards
+
+
+def parse_cards_fast_block(model, cards_list, icard0, ncards=NCARDS_BLOCK):
+    """
+    Builds the card objects for the high-volume cards in
+    ``cards_list[icard0:icard0+ncards]``, so the cards can be added to the
+    model a block at a time
+
+    Parameters
+    ----------
+    model : BDF()
+        the model that will store the cards
+    cards_list : List[card]
+        the cards from ``get_bdf_cards``, where a card is of the form
+        [card_name, comment, card_lines, ifile_iline]
+    icard0 : int
+        the index of the first card of the block
+    ncards : int; default=NCARDS_BLOCK
+        the number of cards in the block
+
+    Returns
+    -------
+    parsed_cards : Dict[icard] = (card, class_instance, exception)
+        the cards from ``parse_cards_fast``, where icard is the index into
+        ``cards_list``
+
+    """
+    parsed_cards = parse_cards_fast(model, cards_list[icard0:icard0 + ncards])
+    return {icard0 + icard: parsed_card for icard, parsed_card in parsed_cards.items()}
+
+
+def _get_fast_card_types(model):
+    """gets the cards that are read with the standard card objects"""
+    card_types = set()
+    for card_name, (unused_nfields, unused_build_cards) in _FAST_CARDS.items():
+        if card_name not in model.cards_to_read:
+            continue
+        if card_name in model._card_parser:
+            card_class = model._card_parser[card_name][0]
+            if card_class is not _FAST_CLASSES[card_name]:
+                continue
+        elif card_name in model._card_parser_prepare:
+            # the standard _prepare_chexa adds a CHEXA8/CHEXA20
+            func = model._card_parser_prepare[card_name]
+            if (getattr(func, '__name__', '') != '_prepare_%s' % card_name.lower() or
+                    getattr(func, '__module__', '') != 'pyNastran.bdf.bdf'):
+                continue
+        else:
+            continue
+        card_types.add(card_name)
+    return card_types
+
+
+def _split_fields(cards, card_name, nfields):
+    """
+    Splits the card lines into an (ncards, nfields) array of fields
+
+    Single line small field cards (the usual case) are split in a single
+    step.  Large field, tabbed, and multi-line cards use ``to_fields``.
+
+    Parameters
+    ----------
+    cards : List[(icard, comment, card_lines)]
+        the cards to split
+    card_name : str
+        the card_name -> 'GRID'
+    nfields : int / None
+        the max number of fields on the card
+        None : the length of the longest card
+
+    Returns
+    -------
+    fields : (ncards, nfields) unicode ndarray
+        the fields (with the surrounding spaces)
+    is_valid : (ncards, ) bool ndarray
+        False if the card has more than nfields fields or can't be split
+    """
+    ncards = len(cards)
+    is_valid = np.ones(ncards, dtype='bool')
+    is_small = np.zeros(ncards, dtype='bool')
+    is_csv = np.zeros(ncards, dtype='bool')
+    small_lines = []
+    csv_lines = []
+    other_fields = []
+    for i, (unused_icard, unused_comment, card_lines) in enumerate(cards):
+        line = card_lines[0]
+        if len(card_lines) == 1 and '\t' not in line and '*' not in line and '=' not in line:
+            ncommas = line.count(',')
+            if ncommas == 0:
+                is_small[i] = True
+                small_lines.append(line)
+                continue
+            elif ncommas <= 8:
+                # pad the line to 9 fields; this is the same as to_fields
+                is_csv[i] = True
+                csv_lines.append(line + ',' * (8 - ncommas))
+                continue
+
+        if any('=' in line for line in card_lines):
+            # let to_fields raise the error
+            is_valid[i] = False
+            other_fields.append([])
+            continue
+        other_fields.append(to_fields(card_lines, card_name))
+
+    if nfields is None:
+        nfields = max([9] + [len(fieldsi) for fieldsi in other_fields])
+
+    nsmall_fields = min(nfields, 9)
+    fields = np.zeros((ncards, nfields), dtype='U8')
+    for is_linesi, linesi in ((is_small, small_lines), (is_csv, csv_lines)):
+        if not linesi:
+            continue
+        if linesi is small_lines:
+            # split the 72 character lines into 9 8-character fields
+            fieldsi = np.array(linesi, dtype='U72').view('U8').reshape(len(linesi), 9)
+        else:
+            fieldsi = np.array(','.join(linesi).split(',')).reshape(len(linesi), 9)
+            if fieldsi.dtype.itemsize > fields.dtype.itemsize:
+                fields = fields.astype(fieldsi.dtype)
+        fields[is_linesi, :nsmall_fields] = fieldsi[:, :nsmall_fields]
+        if nfields < 9:
+            is_valid[is_linesi] &= _is_blank(fieldsi[:, nfields:]).all(axis=1)
+
+    if other_fields:
+        iother = np.where(~(is_small | is_csv))[0]
+        for i, fieldsi in zip(iother, other_fields):
+            nfieldsi = len(fieldsi)
+            if nfieldsi > nfields:
+                if any(field.strip() for field in fieldsi[nfields:]):
+                    is_valid[i] = False
+                del fieldsi[nfields:]
+            elif nfieldsi < nfields:
+                fieldsi.extend([''] * (nfields - nfieldsi))
+        other_fields = np.array(other_fields, dtype='U')
+        if other_fields.dtype.itemsize > fields.dtype.itemsize:
+            fields = fields.astype(other_fields.dtype)
+        fields[iother, :] = other_fields
+    return fields, is_valid
+
+
+def _is_blank(fields):
+    """is the field blank (empty or whitespace), which is faster than np.char.strip"""
+    nchars = fields.dtype.itemsize // 4
+    codes = fields.view('uint32').reshape(fields.shape + (nchars, ))
+    is_blank = ~(codes > 32).any(axis=-1)
+    if ((codes < 32) & (codes != 0)).any():
+        # tabs, carriage returns, and other control characters
+        is_blank &= np.isin(codes, _WHITESPACE).all(axis=-1)
+    return is_blank
+
+
+class FieldBlock(object):
+    """
+    The fields of a set of cards of the same type.
+
+    The methods mirror the ``assign_type`` functions (e.g., ``integer``),
+    but operate on a column of fields.  Cards with a field that isn't
+    valid (or isn't simple) are flagged in ``is_valid``, so they can be
+    read by ``add_card``.
+    """
+    def __init__(self, fields, is_valid):
+        """
+        Parameters
+        ----------
+        fields : (ncards, nfields) unicode ndarray
+            the fields (with the surrounding spaces)
+        is_valid : (ncards, ) bool ndarray
+            is the card valid
+        """
+        self.fields = fields
+        self.is_valid = is_valid
+        self.is_blank = _is_blank(fields)
+
+    def nfields(self):
+        """gets the length of each card (the last non-blank field + 1)"""
+        is_filled = ~self.is_blank
+        nfields = self.fields.shape[1] - np.argmax(is_filled[:, ::-1], axis=1)
+        nfields[~is_filled.any(axis=1)] = 0
+        return nfields
+
+    def _integer(self, ifield):
+        """converts a column into integers and flags the non-integer fields"""
+        is_int = ~self.is_blank[:, ifield]
+        values = np.zeros(len(is_int), dtype='int64')
+        if not is_int.any():
+            return values, is_int
+
+        svalue = self.fields[is_int, ifield]
+        try:
+            # int(svalue)
+            values[is_int] = svalue.astype('int64')
+        except (ValueError, OverflowError):
+            values2 = np.zeros(len(svalue), dtype='int64')
+            is_int2 = np.ones(len(svalue), dtype='bool')
+            for i, svaluei in enumerate(svalue.tolist()):
+                try:
+                    values2[i] = int(svaluei)
+                except (ValueError, OverflowError):
+                    is_int2[i] = False
+            values[is_int] = values2
+            is_int[is_int] = is_int2
+        return values, is_int
+
+    def _double(self, ifield):
+        """converts a column into floats and flags the non-float fields"""
+        is_float = ~self.is_blank[:, ifield]
+        values = np.zeros(len(is_float), dtype='float64')
+        if not is_float.any():
+            return values, is_float
+
+        svalue = self.fields[is_float, ifield]
+        try:
+            # float(svalue)
+            values[is_float] = svalue.astype('float64')
+            is_float2 = np.ones(len(svalue), dtype='bool')
+        except ValueError:
+            # 1.0D+3, 1.0+3, 1.0-3
+            values2 = np.zeros(len(svalue), dtype='float64')
+            is_float2 = np.ones(len(svalue), dtype='bool')
+            for i, svaluei in enumerate(svalue.tolist()):
+                try:
+                    values2[i] = float(svaluei)
+                except ValueError:
+                    try:
+                        values2[i] = _nastran_double(svaluei.strip())
+                    except ValueError:
+                        is_float2[i] = False
+            values[is_float] = values2
+
+        # 1, but not +1 or -1 is an integer
+        is_float2 &= ~np.array([svaluei.strip().isdigit() for svaluei in svalue.tolist()],
+                               dtype='bool')
+        is_float[is_float] = is_float2
+        return values, is_float
+
+    def blank(self, ifield):
+        """flags the cards without a blank field"""
+        self.is_valid &= self.is_blank[:, ifield]
+
+    def integer(self, ifield):
+        """see ``assign_type.integer``"""
+        values, is_int = self._integer(ifield)
+        self.is_valid &= is_int
+        return values
+
+    def integer_or_blank(self, ifield, default):
+        """
+        see ``assign_type.integer_or_blank``
+
+        default : int / (ncards, ) int ndarray
+            the default value
+        """
+        values, is_int = self._integer(ifield)
+        is_blank = self.is_blank[:, ifield]
+        self.is_valid &= is_int | is_blank
+        return np.where(is_blank, default, values)
+
+    def integer_or_none(self, ifield):
+        """``assign_type.integer_or_blank`` with a default of None"""
+        values, is_int = self._integer(ifield)
+        is_blank = self.is_blank[:, ifield]
+        self.is_valid &= is_int | is_blank
+        return _where_none(is_blank, values)
+
+    def double_or_blank(self, ifield, default):
+        """see ``assign_type.double_or_blank``"""
+        values, is_float = self._double(ifield)
+        is_blank = self.is_blank[:, ifield]
+        self.is_valid &= is_float | is_blank
+        values[is_blank] = default
+        return values
+
+    def double_or_none(self, ifield):
+        """``assign_type.double_or_blank`` with a default of None"""
+        values, is_float = self._double(ifield)
+        is_blank = self.is_blank[:, ifield]
+        self.is_valid &= is_float | is_blank
+        return _where_none(is_blank, values)
+
+    def is_double(self, ifield):
+        """
+        Is the field a float according to ``assign_type.integer_or_double``
+        (e.g., 1.0, 1.0-3), rather than an integer
+        """
+        is_double = ~self.is_blank[:, ifield]
+        if is_double.any():
+            is_double[is_double] = [
+                '.' in svalue or '-' in svalue[1:] or '+' in svalue[1:]
+                for svalue in np.char.strip(self.fields[is_double, ifield]).tolist()]
+        return is_double
+
+    def integer_double_or_blank(self, ifield):
+        """
+        see ``assign_type.integer_double_or_blank``
+
+        Returns
+        -------
+        ints : (ncards, ) int ndarray
+            the integer values
+        floats : (ncards, ) float ndarray
+            the float values
+        is_int : (ncards, ) bool ndarray
+            is the field an integer
+        is_blank : (ncards, ) bool ndarray
+            is the field blank
+        """
+        is_blank = self.is_blank[:, ifield]
+        is_double = self.is_double(ifield)
+        ints, is_int = self._integer(ifield)
+        floats, is_float = self._double(ifield)
+        is_int &= ~is_double
+        self.is_valid &= is_blank | is_int | (is_double & is_float)
+        return ints, floats, is_int, is_blank
+
+    def components_or_blank(self, ifield, default):
+        """see ``assign_type.components_or_blank``"""
+        svalue = self.fields[:, ifield].tolist()
+        is_blank = self.is_blank[:, ifield]
+        values = [default] * len(svalue)
+        for i in np.where(~is_blank)[0]:
+            components = _components(svalue[i].strip())
+            if components is None:
+                self.is_valid[i] = False
+            else:
+                values[i] = components
+        return values
+
+
+def _where_none(is_blank, values):
+    """converts the values to a list and sets the blank fields to None"""
+    values = values.astype('object')
+    values[is_blank] = None
+    return values.tolist()
+
+
+def _nastran_double(svalue):
+    """
+    Converts a Nastran-style float (e.g., 1.0D+3, 1.0+3, 1.0-3).
+    This is the same as the ``ValueError`` branch of ``assign_type.double``.
+    """
+    svalue = svalue.upper()
+    if 'D' in svalue:
+        # 1.0D+3, 1.0D-3
+        return float(svalue.replace('D', 'E'))
+
+    # 1.0+3, 1.0-3
+    sign = ''
+    if svalue[0] in ('+', '-'):
+        sign = svalue[0]
+        svalue = svalue[1:]
+    if '+' in svalue:
+        svalue = sign + svalue.replace('+', 'E+')
+    elif '-' in svalue:
+        svalue = sign + svalue.replace('-', 'E-')
+    return float(svalue)
+
+
+def _components(svalue):
+    """
+    Gets the sorted components (e.g., '123') or None if they're invalid.
+    This is the same as ``assign_type.parse_components``.
+    """
+    if '.' in svalue:
+        return None
+    try:
+        value = int(svalue)
+    except ValueError:
+        return None
+    if value > 0 and '0' in svalue:
+        return None
+    components = ''.join(sorted(str(value)))
+    for i, component in enumerate(components):
+        if component not in '0123456' or component in components[i + 1:]:
+            return None
+    return components
+
+
+def _build_grid(block, comments):
+    """builds the GRID cards"""
+    nid = block.integer(1).tolist()
+    cp = block.integer_or_blank(2, 0).tolist()
+    xyz = np.column_stack([
+        block.double_or_blank(3, 0.),
+        block.double_or_blank(4, 0.),
+        block.double_or_blank(5, 0.)])
+    cd = block.integer_or_blank(6, 0).tolist()
+    ps = block.components_or_blank(7, '')
+    seid = block.integer_or_blank(8, 0).tolist()
+
+    cards = [None] * len(nid)
+    for i in np.where(block.is_valid)[0].tolist():
+        cards[i] = GRID(nid[i], xyz[i, :], cp[i], cd[i], ps[i], seid[i], comment=comments[i])
+    return cards
+
+
+def _theta_mcid(block, ifield):
+    """gets the THETA/MCID field for the CTRIA3/CQUAD4"""
+    ints, floats, is_int, is_blank = block.integer_double_or_blank(ifield)
+    theta_mcid = floats.astype('object')
+    theta_mcid[is_int] = ints[is_int].astype('object')
+    theta_mcid[is_blank] = 0.0
+    return theta_mcid.tolist()
+
+
+def _build_ctria3(block, comments):
+    """builds the CTRIA3 cards"""
+    eid = block.integer(1)
+    pid = block.integer_or_blank(2, eid).tolist()
+    nids = np.column_stack([block.integer(3), block.integer(4), block.integer(5)]).tolist()
+    theta_mcid = _theta_mcid(block, 6)
+    zoffset = block.double_or_blank(7, 0.0).tolist()
+    block.blank(8)
+    block.blank(9)
+    tflag = block.integer_or_blank(10, 0).tolist()
+    T1 = block.double_or_none(11)
+    T2 = block.double_or_none(12)
+    T3 = block.double_or_none(13)
+
+    eid = eid.tolist()
+    cards = [None] * len(eid)
+    for i in np.where(block.is_valid)[0].tolist():
+        cards[i] = CTRIA3(eid[i], pid[i], nids[i], zoffset=zoffset[i],
+                          theta_mcid=theta_mcid[i], tflag=tflag[i],
+                          T1=T1[i], T2=T2[i], T3=T3[i], comment=comments[i])
+    return cards
+
+
+def _build_cquad4(block, comments):
+    """builds the CQUAD4 cards"""
+    eid = block.integer(1)
+    pid = block.integer_or_blank(2, eid).tolist()
+    nids = np.column_stack([block.integer(3), block.integer(4),
+                            block.integer(5), block.integer(6)]).tolist()
+    theta_mcid = _theta_mcid(block, 7)
+    zoffset = block.double_or_blank(8, 0.0).tolist()
+    block.blank(9)
+    tflag = block.integer_or_blank(10, 0).tolist()
+    T1 = block.double_or_none(11)
+    T2 = block.double_or_none(12)
+    T3 = block.double_or_none(13)
+    T4 = block.double_or_none(14)
+
+    eid = eid.tolist()
+    cards = [None] * len(eid)
+    for i in np.where(block.is_valid)[0].tolist():
+        cards[i] = CQUAD4(eid[i], pid[i], nids[i], theta_mcid[i], zoffset[i],
+                          tflag[i], T1[i], T2[i], T3[i], T4[i], comment=comments[i])
+    return cards
+
+
+def _build_solid(card_class, nnodes):
+    """creates the function that builds the CTETRA4/CHEXA8 cards"""
+    def _build_solids(block, comments):
+        """builds the CTETRA4/CHEXA8 cards"""
+        eid = block.integer(1).tolist()
+        pid = block.integer(2).tolist()
+        nids = np.column_stack([block.integer(ifield)
+                                for ifield in range(3, 3 + nnodes)]).tolist()
+        cards = [None] * len(eid)
+        for i in np.where(block.is_valid)[0].tolist():
+            cards[i] = card_class(eid[i], pid[i], nids[i], comment=comments[i])
+        return cards
+    return _build_solids
+
+
+def _build_cbar(block, comments):
+    """builds the CBAR cards (without a BAROR)"""
+    eid = block.integer(1)
+    pid = block.integer_or_blank(2, eid).tolist()
+    nids = np.column_stack([block.integer(3), block.integer(4)]).tolist()
+    g0s, x1, is_g0, is_blank = block.integer_double_or_blank(5)
+    x1[is_blank] = 0.
+    x = np.column_stack([
+        x1,
+        block.double_or_blank(6, 0.),
+        block.double_or_blank(7, 0.)])
+
+    # G0 vector defining plane 1 is not defined
+    block.is_valid &= is_g0 | (np.linalg.norm(x, axis=1) != 0.0)
+
+    # offt isn't blank
+    block.blank(8)
+    pa = block.integer_or_blank(9, 0).tolist()
+    pb = block.integer_or_blank(10, 0).tolist()
+    wa = np.column_stack([block.double_or_blank(ifield, 0.0) for ifield in (11, 12, 13)])
+    wb = np.column_stack([block.double_or_blank(ifield, 0.0) for ifield in (14, 15, 16)])
+
+    eid = eid.tolist()
+    g0s = g0s.tolist()
+    cards = [None] * len(eid)
+    for i in np.where(block.is_valid)[0].tolist():
+        if is_g0[i]:
+            xi = None
+            g0 = g0s[i]
+        else:
+            xi = x[i, :]
+            g0 = None
+        cards[i] = CBAR(eid[i], pid[i], nids[i], xi, g0, 'GGG',
+                        pa[i], pb[i], wa[i, :], wb[i, :], comment=comments[i])
+    return cards
+
+
+def _build_cbush(block, comments):
+    """builds the CBUSH cards"""
+    eid = block.integer(1)
+    pid = block.integer_or_blank(2, eid).tolist()
+    ga = block.integer(3).tolist()
+    gb = block.integer_or_none(4)
+    cid = block.integer_or_none(8)
+    g0s, x1, is_g0, is_blank = block.integer_double_or_blank(5)
+    x = np.column_stack([
+        x1,
+        block.double_or_blank(6, 0.0),
+        block.double_or_blank(7, 0.0)])
+    is_x = ~is_g0 & ~is_blank
+    s = block.double_or_blank(9, 0.5).tolist()
+    ocid = block.integer_or_blank(10, -1).tolist()
+    s1 = block.double_or_none(11)
+    s2 = block.double_or_none(12)
+    s3 = block.double_or_none(13)
+
+    # the orientation vector can't be (x, x, x) without a cid
+    is_cid = ~block.is_blank[:, 8]
+    block.is_valid &= ~is_x | is_cid | (x.max(axis=1) != x.min(axis=1))
+
+    eid = eid.tolist()
+    g0s = g0s.tolist()
+    x = x.tolist()
+    cards = [None] * len(eid)
+    for i in np.where(block.is_valid)[0].tolist():
+        if is_g0[i]:
+            xi = None
+            g0 = g0s[i]
+        elif is_blank[i]:
+            xi = [None, None, None]
+            g0 = None
+        else:
+            xi = x[i]
+            g0 = None
+        cards[i] = CBUSH(eid[i], pid[i], [ga[i], gb[i]], xi, g0, cid=cid[i], s=s[i],
+                         ocid=ocid[i], si=[s1[i], s2[i], s3[i]], comment=comments[i])
+    return cards
+
+
+def _build_conm2(block, comments):
+    """builds the CONM2 cards"""
+    eid = block.integer(1).tolist()
+    nid = block.integer(2).tolist()
+    cid = block.integer_or_blank(3, 0).tolist()
+    mass = block.double_or_blank(4, 0.).tolist()
+    X = np.column_stack([block.double_or_blank(ifield, 0.0) for ifield in (5, 6, 7)]).tolist()
+    I = np.column_stack([block.double_or_blank(ifield, 0.0)
+                         for ifield in (9, 10, 11, 12, 13, 14)]).tolist()
+
+    cards = [None] * len(eid)
+    for i in np.where(block.is_valid)[0].tolist():
+        cards[i] = CONM2(eid[i], nid[i], mass[i], cid=cid[i], X=X[i], I=I[i],
+                         comment=comments[i])
+    return cards
+
+
+def _build_rbe2(block, comments):
+    """builds the RBE2 cards"""
+    eid = block.integer(1).tolist()
+    gn = block.integer(2).tolist()
+    cm = block.components_or_blank(3, None)
+
+    # the last field is alpha (a float) or the last Gmi (an integer)
+    nfields = block.nfields()
+    block.is_valid &= nfields > 4
+    ncards, nfields_max = block.fields.shape
+    ints = np.zeros((ncards, nfields_max), dtype='int64')
+    is_int = np.zeros((ncards, nfields_max), dtype='bool')
+    alphas = np.zeros(ncards, dtype='float64')
+    is_alpha = np.zeros(ncards, dtype='bool')
+    for ifield in range(4, nfields_max):
+        ints[:, ifield], is_int[:, ifield] = block._integer(ifield)
+        is_last = nfields == ifield + 1
+        if is_last.any():
+            is_double = block.is_double(ifield)[is_last]
+            floats, is_float = block._double(ifield)
+            is_alphai = np.zeros(ncards, dtype='bool')
+            is_alphai[is_last] = is_double
+            alphas[is_alphai] = floats[is_alphai]
+            block.is_valid[is_alphai & ~is_float] = False
+            is_alpha |= is_alphai
+
+    # the Gmi fields are integers
+    ngmi = nfields - is_alpha
+    is_gmi = np.arange(nfields_max)[np.newaxis, :] < ngmi[:, np.newaxis]
+    is_gmi[:, :4] = False
+    block.is_valid &= (is_int | ~is_gmi).all(axis=1)
+
+    ints = ints.tolist()
+    ngmi = ngmi.tolist()
+    alphas = alphas.tolist()
+    cards = [None] * ncards
+    for i in np.where(block.is_valid)[0].tolist():
+        cards[i] = RBE2(eid[i], gn[i], cm[i], ints[i][4:ngmi[i]], alphas[i],
+                        comment=comments[i])
+    return cards
+
+
+#: card_name : (nfields, build_cards); nfields=None is variable length
+_FAST_CARDS = {
+    'GRID' : (9, _build_grid),
+    'CTRIA3' : (14, _build_ctria3),
+    'CQUAD4' : (15, _build_cquad4),
+    'CTETRA' : (7, _build_solid(CTETRA4, 4)),
+    'CHEXA' : (11, _build_solid(CHEXA8, 8)),
+    'CBAR' : (17, _build_cbar),
+    'CBUSH' : (14, _build_cbush),
+    'CONM2' : (15, _build_conm2),
+    'RBE2' : (None, _build_rbe2),
+}
+
+#: the classes in BDF._card_parser that are created
+_FAST_CLASSES = {
+    'GRID' : GRID,
+    'CTRIA3' : CTRIA3,
+    'CQUAD4' : CQUAD4,
+    'CBUSH' : CBUSH,
+    'CONM2' : CONM2,
+    'RBE2' : RBE2,
+}
@@ -43,6 +43,7 @@ from six import string_types
 import numpy as np
 
 from pyNastran.bdf.bdf_interface.get_methods import GetMethods
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
 from pyNastran.bdf.cards.optimization import get_dvprel_key
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector_for_surf
@@ -140,7 +141,7 @@ class GetCard(GetMethods):
                 pass
             else:
                 adict = getattr(self, dict_name)
-                if isinstance(adict, dict):
+                if isinstance(adict, (dict, ColumnarDict)):
                     for key, card in adict.items():
                         if isinstance(card, list):
                             alist = card
@@ -101,7 +101,7 @@ scalar_keys = [
     '_xref', 'active_filename',
     'dumplines', 'echo', 'force_echo_off', 'include_dir',
     'is_msc', 'is_nx', 'punch',
-    'read_includes', 'save_file_structure', 'sol', 'sol_iline', 'nastran_format',
+    'read_includes', 'fast_parse', 'save_file_structure', 'sol', 'sol_iline', 'nastran_format',
     'is_superelements', 'is_zona', 'sol_method', 'debug',
     #'_unique_bulk_data_cards',
     #'is_bdf_vectorized',
@@ -0,0 +1,251 @@
+"""
+Defines the binary model cache for ``read_bdf(..., cache_dir=cache_dir)``:
+  - BDFModelCache(cache_dir, max_size=MAX_CACHE_SIZE, log=None)
+
+A cache entry is a pickled snapshot of the model (before cross-referencing)
+that's keyed on the content hash of the main BDF and the read options.  The
+entry stores the content hash of every INCLUDE file that was read, so
+changing an INCLUDE file is a cache miss.  The case control deck is
+recreated from the case control lines.  The nodes/elements/coords of a
+``BDF(storage='columnar')`` model are stored as arrays, which are faster to
+load than the card objects.
+
+The least recently used entries are deleted when the cache is larger than
+``max_size``.
+
+.. code-block:: python
+
+   >>> model = read_bdf(bdf_filename, cache_dir='bdf_cache')  # miss; parses the deck
+   >>> model = read_bdf(bdf_filename, cache_dir='bdf_cache')  # hit; loads the snapshot
+"""
+from __future__ import print_function
+import os
+import hashlib
+from six.moves.cPickle import load, dump, HIGHEST_PROTOCOL  # type: ignore
+
+import pyNastran
+from pyNastran.utils.log import get_logger2
+
+#: the default size of the cache (bytes)
+MAX_CACHE_SIZE = 2 * 1024 ** 3
+
+#: the extension of the cache files
+CACHE_EXT = '.bdfcache'
+
+#: the format of the cache files; incremented when the format changes
+CACHE_VERSION = 1
+
+#: the size of the chunks that are used to hash a file (bytes)
+_HASH_CHUNK_SIZE = 1024 ** 2
+
+#: these attributes are recreated when the model is loaded (the INCLUDE
+#: files aren't read, so there are no include_stats)
+_STATE_KEYS_TO_SKIP = ['case_control_deck', 'log', 'include_stats']
+
+
+class BDFModelCache(object):
+    """
+    Stores/loads snapshots of BDF models, so reading an unchanged deck skips
+    the parsing.
+    """
+    def __init__(self, cache_dir, max_size=MAX_CACHE_SIZE, log=None):
+        """
+        Creates the cache
+
+        Parameters
+        ----------
+        cache_dir : str
+            the directory for the cache files; created if it doesn't exist
+        max_size : int; default=MAX_CACHE_SIZE
+            the size of the cache (bytes); the least recently used entries
+            are deleted when the cache is larger
+        log : logger; default=None
+            the logger for the cache hits/misses
+
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self.log = get_logger2(log, debug=False)
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def get_cache_filename(self, bdf_filename, options):
+        # type: (str, Dict[str, Any]) -> str
+        """
+        Gets the cache filename, which is based on the content of the main
+        BDF, its path, and the read options
+
+        Parameters
+        ----------
+        bdf_filename : str
+            the main BDF
+        options : Dict[str, Any]
+            the read options that change the model (e.g., punch, storage)
+
+        Returns
+        -------
+        cache_filename : str
+            the path to the cache file
+
+        """
+        bdf_filename = os.path.abspath(bdf_filename)
+        sha = hashlib.sha1()
+        sha.update(_get_file_hash(bdf_filename).encode('ascii'))
+        key_str = '%s;%s;%s;%s' % (
+            CACHE_VERSION, pyNastran.__version__, bdf_filename, sorted(options.items()))
+        sha.update(key_str.encode('utf8'))
+        return os.path.join(self.cache_dir, sha.hexdigest() + CACHE_EXT)
+
+    def load_model(self, model, bdf_filename, options):
+        # type: (Any, str, Dict[str, Any]) -> bool
+        """
+        Loads the model from the cache
+
+        Parameters
+        ----------
+        model : BDF()
+            the model to load
+        bdf_filename : str
+            the main BDF
+        options : Dict[str, Any]
+            the read options that change the model (e.g., punch, storage)
+
+        Returns
+        -------
+        is_loaded : bool
+            True : the model was loaded (cache hit)
+            False : the deck needs to be read (cache miss)
+
+        """
+        cache_filename = self.get_cache_filename(bdf_filename, options)
+        if not os.path.exists(cache_filename):
+            self.log.info('bdf cache miss for %r' % bdf_filename)
+            return False
+
+        try:
+            with open(cache_filename, 'rb') as cache_file:
+                file_hashes = load(cache_file)
+                for filename, file_hash in file_hashes:
+                    if not os.path.exists(filename) or _get_file_hash(filename) != file_hash:
+                        self.log.info('bdf cache miss for %r; %r was modified' % (
+                            bdf_filename, filename))
+                        return False
+                state = load(cache_file)
+        except Exception as error:  # an incomplete/outdated file
+            self.log.warning('bdf cache file %r could not be loaded; %s' % (
+                cache_filename, str(error)))
+            _remove_file(cache_filename)
+            return False
+
+        model.__dict__.update(state)
+        for super_model in model.superelement_models.values():
+            super_model.log = model.log
+
+        # the last access time is used for the LRU deletion
+        os.utime(cache_filename, None)
+        self.log.info('bdf cache hit for %r; loaded %r' % (bdf_filename, cache_filename))
+        return True
+
+    def save_model(self, model, bdf_filename, options):
+        # type: (Any, str, Dict[str, Any]) -> str
+        """
+        Saves the model to the cache
+
+        Parameters
+        ----------
+        model : BDF()
+            the model (before cross-referencing)
+        bdf_filename : str
+            the main BDF
+        options : Dict[str, Any]
+            the read options that change the model (e.g., punch, storage)
+
+        Returns
+        -------
+        cache_filename : str
+            the path to the cache file
+
+        """
+        cache_filename = self.get_cache_filename(bdf_filename, options)
+        # the main BDF is part of the cache filename
+        bdf_filename = os.path.abspath(bdf_filename)
+        filenames = set(os.path.abspath(filename) for filename in model.active_filenames)
+        filenames.discard(bdf_filename)
+        file_hashes = [(filename, _get_file_hash(filename))
+                       for filename in sorted(filenames)]
+
+        state = model.__getstate__()
+        for key in _STATE_KEYS_TO_SKIP:
+            state.pop(key, None)
+
+        # write to a temporary file, so an interrupted write isn't loaded
+        tmp_filename = cache_filename + '.tmp%i' % os.getpid()
+        with open(tmp_filename, 'wb') as cache_file:
+            dump(file_hashes, cache_file, HIGHEST_PROTOCOL)
+            dump(state, cache_file, HIGHEST_PROTOCOL)
+        _replace_file(tmp_filename, cache_filename)
+        self.log.debug('bdf cache saved %r for %r' % (cache_filename, bdf_filename))
+        self.evict()
+        return cache_filename
+
+    def evict(self):
+        # type: () -> List[str]
+        """
+        Deletes the least recently used cache files until the cache is
+        smaller than max_size
+
+        Returns
+        -------
+        cache_filenames : List[str]
+            the deleted files
+
+        """
+        cache_files = []
+        size = 0
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(CACHE_EXT):
+                continue
+            cache_filename = os.path.join(self.cache_dir, filename)
+            stat = os.stat(cache_filename)
+            cache_files.append((stat.st_mtime, stat.st_size, cache_filename))
+            size += stat.st_size
+
+        cache_filenames = []
+        for unused_mtime, file_size, cache_filename in sorted(cache_files):
+            if size <= self.max_size:
+                break
+            _remove_file(cache_filename)
+            size -= file_size
+            cache_filenames.append(cache_filename)
+            self.log.debug('bdf cache deleted %r' % cache_filename)
+        return cache_filenames
+
+
+def _get_file_hash(filename):
+    # type: (str) -> str
+    """gets the sha1 hash of the content of a file"""
+    sha = hashlib.sha1()
+    with open(filename, 'rb') as bdf_file:
+        while True:
+            data = bdf_file.read(_HASH_CHUNK_SIZE)
+            if not data:
+                break
+            sha.update(data)
+    return sha.hexdigest()
+
+
+def _replace_file(src_filename, dst_filename):
+    """renames a file, which replaces the existing file"""
+    try:
+        os.replace(src_filename, dst_filename)
+    except AttributeError:  # py2
+        _remove_file(dst_filename)
+        os.rename(src_filename, dst_filename)
+
+
+def _remove_file(filename):
+    """deletes a file if it exists"""
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
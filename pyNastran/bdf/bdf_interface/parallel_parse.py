@@ -0,0 +1,141 @@
+"""
+Parses the bulk data cards across multiple processes.  Defines:
+  - parse_cards_parallel(model, cards_list, nprocs)
+
+The cards are converted into card objects (e.g., GRID, CQUAD4) on the worker
+processes using the standard ``add_card`` classmethods.  The card objects are
+then added to the model on the main process in the original card order, so
+duplicate ID detection and the parse error reporting are unchanged.
+"""
+from __future__ import print_function
+import multiprocessing
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+
+#: the card_name -> (card_class, add_card_function) map of the worker
+_WORKER_CARD_PARSER = {}
+
+#: cards that change the state of the reader and must be handled in order
+_SERIAL_CARDS = {'ECHOON', 'ECHOOFF', 'ENDDATA', 'INCLUDE'}
+
+
+def parse_cards_parallel(model, cards_list, nprocs, nchunks_per_proc=4, icards_skip=None):
+    """
+    Builds the card objects for the cards in ``cards_list`` on a pool of
+    worker processes.
+
+    Parameters
+    ----------
+    model : BDF()
+        the model that will store the cards
+    cards_list : List[card]
+        the cards from ``get_bdf_cards``, where a card is of the form
+        [card_name, comment, card_lines, ifile_iline]
+    nprocs : int
+        the number of worker processes
+    nchunks_per_proc : int; default=4
+        the number of chunks to split the cards into per process
+        (helps to balance the load)
+    icards_skip : Set[int]; default=None
+        the cards that have already been parsed (e.g., by ``parse_cards_fast``)
+
+    Returns
+    -------
+    parsed_cards : Dict[icard] = (card, class_instance, exception)
+        icard : int
+            the index into ``cards_list``
+        card : List[str]
+            the parsed fields of the card
+        class_instance : BaseCard / None
+            the card object (e.g., GRID) or None if there was an error
+        exception : Exception / None
+            the error from add_card or None if the card was created
+
+    .. note:: only cards with a simple ``add_card`` classmethod (the ones in
+              ``model._card_parser``) are parsed on the workers.  Replicated
+              cards, ``_prepare_*`` cards and rejected cards are left for the
+              main process.
+
+    """
+    if icards_skip is None:
+        icards_skip = set()
+    card_parser = model._card_parser
+    cards_to_read = model.cards_to_read
+    icards = []
+    jobs = []
+    for icard, (card_name, comment, card_lines, unused_ifile_iline) in enumerate(cards_list):
+        if icard in icards_skip:
+            continue
+        if (card_name in _SERIAL_CARDS or '=' in card_name or
+                card_name not in cards_to_read or card_name not in card_parser):
+            continue
+        icards.append(icard)
+        jobs.append((card_name, comment, card_lines))
+
+    if not jobs:
+        return {}
+
+    nchunks = min(len(jobs), nprocs * nchunks_per_proc)
+    chunk_size = len(jobs) // nchunks + (len(jobs) % nchunks > 0)
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    model.log.debug('parsing %i cards in %i chunks on %i processes' % (
+        len(jobs), len(chunks), nprocs))
+
+    pool = multiprocessing.Pool(processes=nprocs, initializer=_init_worker,
+                                initargs=(model._nastran_format,))
+    try:
+        # map preserves the order of the chunks, which keeps things deterministic
+        results = pool.map(_parse_cards_chunk, chunks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+    parsed_cards = {}
+    icards_iter = iter(icards)
+    for result in results:
+        for parsed_card in result:
+            parsed_cards[next(icards_iter)] = parsed_card
+    return parsed_cards
+
+
+def _init_worker(mode):
+    """creates the card parser on the worker process"""
+    from pyNastran.bdf.bdf import BDF
+    model = BDF(debug=None, mode=mode)
+    _WORKER_CARD_PARSER.clear()
+    _WORKER_CARD_PARSER.update(model._card_parser)
+
+
+def _parse_cards_chunk(jobs):
+    """
+    Creates the card objects for a chunk of cards on the worker process
+
+    Parameters
+    ----------
+    jobs : List[(card_name, comment, card_lines)]
+        the cards to parse
+
+    Returns
+    -------
+    parsed_cards : List[(card, class_instance, exception)]
+        see ``parse_cards_parallel``
+
+    """
+    parsed_cards = []
+    for card_name, comment, card_lines in jobs:
+        # this is the same as create_card_object(is_list=False, has_none=False)
+        card = wipe_empty_fields(to_fields(card_lines, card_name))
+        card_obj = BDFCard(card, has_none=False)
+
+        card_class = _WORKER_CARD_PARSER[card_name][0]
+        try:
+            class_instance = card_class.add_card(card_obj, comment=comment)
+        except Exception as exception:
+            # the error is raised when the card is added on the main process,
+            # so the cards before it are still loaded
+            parsed_cards.append((card, None, exception))
+            continue
+        parsed_cards.append((card, class_instance, None))
+    return parsed_cards
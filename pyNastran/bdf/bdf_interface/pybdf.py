@@ -6,10 +6,14 @@ Main BDF class.  Defines:
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
+import io
+import mmap
+import time
 from io import open
+from multiprocessing.pool import ThreadPool
 from collections import defaultdict
 from itertools import count
-from typing import List, Dict, Optional, Union, Set, Any, cast
+from typing import List, Dict, Tuple, Optional, Union, Set, Any, cast
 from six import StringIO
 
 import numpy as np
@@ -27,11 +31,14 @@ FILE_MANAGEMENT = (
 )
 EXECUTIVE_CASE_SPACES = tuple(list(FILE_MANAGEMENT) + ['SOL ', 'SET ', 'SUBCASE '])
 
+#: the number of bytes that are decoded at once by ``get_lines_mmap``
+MMAP_CHUNK_SIZE = 2 ** 20
+
 
 class BDFInputPy(object):
     """BDF reader class that only handles lines and not building cards or parsing cards"""
     def __init__(self, read_includes, dumplines, encoding, nastran_format='msc',
-                 consider_superelements=True, log=None, debug=False):
+                 consider_superelements=True, log=None, debug=False, nthreads=1):
         """
         Parameters
         ----------
@@ -50,6 +57,14 @@ class BDFInputPy(object):
             a logger for printing INCLUDE files that are loadaed
         debug : bool; default=False
             used when testing; for the logger
+        nthreads : int; default=1
+            the number of threads used to read the INCLUDE files
+            1 : the INCLUDE files are read as they're reached
+            >1 : the INCLUDE tree is found up front and the files are read
+                 and decoded by a pool of threads, which is faster when the
+                 file system latency is high (e.g., a network drive); the
+                 files are spliced in the same order
+            (not used by ``get_lines_mmap``)
 
         """
         self.dumplines = dumplines
@@ -66,6 +81,14 @@ class BDFInputPy(object):
         self.debug = debug
         self.log = get_logger2(log, debug)
 
+        self.nthreads = nthreads
+        #: the (bdf_filename, nbytes, read_time) of the INCLUDE files in the
+        #: order they were spliced into the deck
+        self.include_stats = []  # type: List[Tuple[str, int, float]]
+        #: bdf_filename -> (lines, nbytes, read_time) for the INCLUDE files
+        #: that were read by the thread pool
+        self._prefetched_lines = {}  # type: Dict[str, Tuple[List[str], int, float]]
+
     def _check_pynastran_encoding(self, bdf_filename, encoding):
         """updates the $pyNastran: key=value variables"""
         line = '$pyNastran: punch=False'
@@ -155,6 +178,183 @@ class BDFInputPy(object):
                 bulk_data_lines, bulk_data_ilines,
                 superelement_lines, superelement_ilines)
 
+    def get_lines_mmap(self, bdf_filename, punch=False, chunk_size=MMAP_CHUNK_SIZE,
+                       stream_superelements=False):
+        # type: (str, bool, int, bool) -> Any
+        """
+        Memory-mapped version of ``get_lines``
+
+        The files are memory-mapped and decoded ``chunk_size`` bytes at a
+        time, so the full list of decoded lines and the ilines array are
+        never created.  The executive/case control decks are small, so they
+        are returned as lists.  The bulk data deck is returned as a lazy
+        generator and INCLUDE files are opened as they're reached.
+
+        Parameters
+        ----------
+        bdf_filename : str
+            the main bdf_filename
+        punch : bool; default=False
+            is this a punch file
+            True : no executive/case control decks
+            False : executive/case control decks exist
+        chunk_size : int; default=MMAP_CHUNK_SIZE
+            the number of bytes to decode at a time
+        stream_superelements : bool; default=False
+            True : bulk_data_lines yields (super_id, (line, (ifile, iline))),
+                   where super_id=0 is the main bulk data deck, and the
+                   superelement_lines/superelement_ilines aren't filled
+            False : the 'BEGIN SUPER=n' sections are stored in
+                    superelement_lines/superelement_ilines
+
+        Returns
+        -------
+        system_lines : List[str]
+            the system control lines (typically empty; used for alters)
+        executive_control_lines : List[str]
+            the executive control lines (stores SOL 101)
+        case_control_lines : List[str]
+            the case control lines (stores subcases)
+        bulk_data_lines : generator
+            yields the (line, (ifile, iline)) pairs of the bulk data deck
+        superelement_lines : Dict[int] = List[str]
+            the 'BEGIN SUPER=n' sections; filled as bulk_data_lines is consumed
+        superelement_ilines : Dict[int] = List[(int, int)]
+            the [ifile, iline] pair for each line in superelement_lines
+
+        .. note:: INCLUDE files (and self.active_filenames/self.include_lines)
+                  are only loaded as bulk_data_lines is consumed
+        .. note:: AUXMODEL decks are not supported
+
+        """
+        if self.nastran_format not in ['msc', 'nx']:
+            msg = 'nastran_format=%r is not supported by get_lines_mmap' % self.nastran_format
+            raise NotImplementedError(msg)
+
+        # the directory of the 1st BDF (include BDFs are relative to this one)
+        self.include_dir = os.path.dirname(os.path.abspath(bdf_filename))
+        self._ifile_next = 1
+
+        deck_lines = self._iter_mmap_lines(bdf_filename, 0, chunk_size, basename=True)
+        return _stream_lines_to_decks(deck_lines, punch, self.log,
+                                      consider_superelements=self.consider_superelements,
+                                      stream_superelements=stream_superelements)
+
+    def _iter_mmap_lines(self, bdf_filename, ifile, chunk_size, basename=False):
+        """
+        Yields the (line, (ifile, iline)) pairs of a memory-mapped file with
+        the INCLUDE files spliced in.
+
+        This is the generator version of ``get_main_lines`` and
+        ``lines_to_deck_lines``.
+        """
+        encoding = self.encoding
+        with self._open_file(bdf_filename, basename=basename) as bdf_file:
+            if os.fstat(bdf_file.fileno()).st_size == 0:
+                return
+            mapped_file = mmap.mmap(bdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                lines = self._iter_mmap_decoded_lines(
+                    mapped_file, bdf_file.name, ifile, encoding, chunk_size)
+                iline = -1
+                for line in lines:
+                    iline += 1
+                    if not line[:7].upper() == 'INCLUDE':
+                        yield line, (ifile, iline)
+                        continue
+
+                    include_iline = iline
+                    include_lines = self._get_include_lines_mmap(
+                        line.rstrip('\r\n\t'), lines)
+                    iline += len(include_lines) - 1
+                    bdf_filename2 = get_include_filename(include_lines,
+                                                         include_dir=self.include_dir)
+                    self.include_lines[self._ifile_next - 1].append(
+                        (include_lines, bdf_filename2))
+                    if not self.read_includes:
+                        continue
+
+                    ifile2 = self._ifile_next
+                    self._ifile_next += 1
+                    try:
+                        self._open_file_checks(bdf_filename2)
+                    except IOError:
+                        msg = 'There was an invalid filename found while parsing.\n'
+                        msg += 'bdf_filename2 = %r\n' % bdf_filename2
+                        msg += 'abs_filename2 = %r\n' % os.path.abspath(bdf_filename2)
+                        msg += 'include_lines = %s' % include_lines
+                        print(msg)
+                        raise
+                    yield ('\n$ INCLUDE processed:  %s\n' % bdf_filename2,
+                           (ifile, include_iline))
+                    for line_ifile_iline in self._iter_mmap_lines(bdf_filename2, ifile2,
+                                                                  chunk_size):
+                        yield line_ifile_iline
+            finally:
+                mapped_file.close()
+
+    def _iter_mmap_decoded_lines(self, mapped_file, bdf_filename, ifile, encoding, chunk_size):
+        """
+        Yields the decoded lines of a memory-mapped file.  The file is
+        decoded ``chunk_size`` bytes at a time and the chunks are split on
+        newlines, so a multi-byte character is never split.
+        """
+        nbytes = len(mapped_file)
+        i0 = 0
+        while i0 < nbytes:
+            i1 = min(i0 + chunk_size, nbytes)
+            if i1 < nbytes:
+                inewline = mapped_file.rfind(b'\n', i0, i1)
+                if inewline == -1:
+                    # the line is longer than the chunk
+                    inewline = mapped_file.find(b'\n', i1)
+                i1 = nbytes if inewline == -1 else inewline + 1
+
+            try:
+                chunk = mapped_file[i0:i1].decode(encoding)
+            except UnicodeDecodeError:
+                if ifile == 0:
+                    _show_bad_file(self, bdf_filename, encoding=encoding)
+                try:
+                    encoding2 = self._check_pynastran_encoding(bdf_filename, encoding=encoding)
+                except UnicodeDecodeError:
+                    encoding2 = encoding
+                if encoding2 == encoding:
+                    msg = (
+                        'Invalid Encoding: encoding=%r.  Fix it by:\n'
+                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
+                        "  2.  call read_bdf(...) with `encoding`'\n"
+                        "  3.  Add '$ pyNastran : encoding=latin1"
+                        ' (or other encoding) to the top of the main/INCLUDE file\n' % encoding)
+                    raise RuntimeError(msg)
+                encoding = encoding2
+                continue
+
+            # universal newlines (same as readlines)
+            for line in io.StringIO(chunk, newline=None):
+                yield line
+            i0 = i1
+
+    def _get_include_lines_mmap(self, line, lines):
+        """
+        Generator version of ``_get_include_lines``, which pulls the
+        continued lines of the INCLUDE from ``lines``
+        """
+        line_base = line.split('$')[0]
+        include_lines = [line_base.strip()]
+        if "'" in line_base:
+            line_base = line_base[8:].strip()
+            if not (line_base.startswith("'") and line_base.endswith("'")):
+                while not line.split('$')[0].endswith("'"):
+                    try:
+                        line = next(lines).split('$')[0].strip()
+                    except StopIteration:
+                        msg = 'There was an invalid filename found while parsing (index).\n'
+                        msg += 'include_lines = %s' % include_lines
+                        raise IndexError(msg)
+                    include_lines.append(line.strip())
+        return include_lines
+
     def _get_lines_zona(self, system_lines, bulk_data_lines, bulk_data_ilines, punch):
         """load and update the lines for ZONA"""
         system_lines2 = []
@@ -260,6 +460,9 @@ class BDFInputPy(object):
         if make_ilines:
             ilines = _make_ilines(nlines, ifile=0)
 
+        if self.read_includes and self.nthreads > 1:
+            self._prefetch_include_lines(lines)
+
         i = 0
         ifile = 1
         while i < nlines:
@@ -292,30 +495,114 @@ class BDFInputPy(object):
 
         if self.dumplines:
             self._dump_file('pyNastran_dump.bdf', lines, i)
+        self._prefetched_lines = {}
 
         #if make_ilines:
             #nilines = ilines.shape[0]
             #assert nlines == ilines.shape[0], 'nlines=%s nilines=%s' % (nlines, nilines)
         return lines, ilines
 
-    def _update_include(self, lines, nlines, ilines,
-                        include_lines, bdf_filename2, i, j, ifile, make_ilines=False):
-        """incorporates an include file into the lines"""
+    def _prefetch_include_lines(self, lines):
+        """
+        Finds the INCLUDE tree and reads the files with a pool of threads.
+        Each level of the tree (e.g., the INCLUDE files of the main BDF) is
+        read at once, so only the nested INCLUDE files wait on the file
+        that includes them.
+
+        Parameters
+        ----------
+        lines : List[str]
+            the lines from the main BDF
+
+        .. note:: a file that can't be read (e.g., a bad path/encoding) is
+                  skipped, so the error is raised when it's spliced in
+        """
+        pool = ThreadPool(self.nthreads)
         try:
-            self._open_file_checks(bdf_filename2)
-        except IOError:
-            crash_name = 'pyNastran_crash.bdf'
-            self._dump_file(crash_name, lines, j)
-            msg = 'There was an invalid filename found while parsing.\n'
-            msg += 'Check the end of %r\n' % crash_name
-            msg += 'bdf_filename2 = %r\n' % bdf_filename2
-            msg += 'abs_filename2 = %r\n' % os.path.abspath(bdf_filename2)
-            msg += 'include_lines = %s' % include_lines
-            #msg += 'len(bdf_filename2) = %s' % len(bdf_filename2)
-            print(msg)
-            raise
-            #raise IOError(msg)
+            lines_to_scan = [lines]
+            while lines_to_scan:
+                bdf_filenames = []
+                for linesi in lines_to_scan:
+                    for bdf_filename2 in self._get_include_filenames(linesi):
+                        bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+                        if (bdf_filename_inc not in self._prefetched_lines and
+                                bdf_filename_inc not in bdf_filenames):
+                            bdf_filenames.append(bdf_filename_inc)
+
+                # the results are in the same order as the filenames
+                results = pool.map(self._read_include_file, bdf_filenames)
+                lines_to_scan = []
+                for bdf_filename_inc, result in zip(bdf_filenames, results):
+                    if result is None:
+                        continue
+                    self._prefetched_lines[bdf_filename_inc] = result
+                    lines_to_scan.append(result[0])
+        finally:
+            pool.close()
+            pool.join()
+
+    def _get_include_filenames(self, lines):
+        """gets the INCLUDE filenames of a file for ``_prefetch_include_lines``"""
+        bdf_filenames = []
+        nlines = len(lines)
+        for i, line in enumerate(lines):
+            if not line[:7].upper() == 'INCLUDE':
+                continue
+            try:
+                unused_j, include_lines = self._get_include_lines(
+                    lines, line.rstrip('\r\n\t'), i, nlines)
+            except IndexError:
+                # the error is raised when the file is spliced in
+                break
+            bdf_filenames.append(get_include_filename(include_lines,
+                                                      include_dir=self.include_dir))
+        return bdf_filenames
+
+    def _read_include_file(self, bdf_filename_inc):
+        """
+        Reads and decodes a file on a worker thread
 
+        Returns
+        -------
+        lines_nbytes_read_time : (List[str], int, float) / None
+            the lines of the file, the size of the file, and the time it
+            took to read/decode the file; None if the file can't be read
+        """
+        time0 = time.time()
+        try:
+            with open(_filename(bdf_filename_inc), 'rb') as bdf_file:
+                data = bdf_file.read()
+            # universal newlines (same as readlines)
+            lines = io.StringIO(data.decode(self.encoding), newline=None).readlines()
+        except (IOError, OSError, UnicodeDecodeError):
+            return None
+        return lines, len(data), time.time() - time0
+
+    def _get_prefetched_lines(self, bdf_filename2):
+        """
+        Gets the lines of an INCLUDE file that was read by
+        ``_prefetch_include_lines`` (None if it wasn't read)
+        """
+        bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+        lines_nbytes_read_time = self._prefetched_lines.pop(bdf_filename_inc, None)
+        if lines_nbytes_read_time is None:
+            return None
+
+        # the same checks as _open_file
+        self._validate_open_file(bdf_filename2, bdf_filename_inc)
+        self.log.debug('opening %r' % bdf_filename_inc)
+        self.active_filenames.append(bdf_filename_inc)
+
+        lines2, nbytes, read_time = lines_nbytes_read_time
+        self.include_stats.append((bdf_filename_inc, nbytes, read_time))
+        return lines2
+
+    def _read_include_lines(self, bdf_filename2):
+        """
+        Reads an INCLUDE file, which checks the $ pyNastran: encoding=...
+        header if the file can't be decoded
+        """
+        time0 = time.time()
         read_again = False
         with self._open_file(bdf_filename2, basename=False) as bdf_file:
             #print('bdf_file.name = %s' % bdf_file.name)
@@ -356,6 +643,33 @@ class BDFInputPy(object):
                         ' (or other encoding) to the top of the main/INCLUDE file\n' % encoding2)
                     raise RuntimeError(msg)
 
+        bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+        nbytes = os.path.getsize(_filename(bdf_filename_inc))
+        self.include_stats.append((bdf_filename_inc, nbytes, time.time() - time0))
+        return lines2
+
+    def _update_include(self, lines, nlines, ilines,
+                        include_lines, bdf_filename2, i, j, ifile, make_ilines=False):
+        """incorporates an include file into the lines"""
+        try:
+            self._open_file_checks(bdf_filename2)
+        except IOError:
+            crash_name = 'pyNastran_crash.bdf'
+            self._dump_file(crash_name, lines, j)
+            msg = 'There was an invalid filename found while parsing.\n'
+            msg += 'Check the end of %r\n' % crash_name
+            msg += 'bdf_filename2 = %r\n' % bdf_filename2
+            msg += 'abs_filename2 = %r\n' % os.path.abspath(bdf_filename2)
+            msg += 'include_lines = %s' % include_lines
+            #msg += 'len(bdf_filename2) = %s' % len(bdf_filename2)
+            print(msg)
+            raise
+            #raise IOError(msg)
+
+        lines2 = self._get_prefetched_lines(bdf_filename2)
+        if lines2 is None:
+            lines2 = self._read_include_lines(bdf_filename2)
+
         #print('lines2 = %s' % lines2)
 
         #line2 = lines[j].split('$')
@@ -742,6 +1056,161 @@ def _lines_to_decks(lines, ilines, punch, log, keep_enddata=True,
         bulk_data_lines, bulk_data_ilines,
         superelement_lines, superelement_ilines)
 
+def _stream_lines_to_decks(deck_lines, punch, log, consider_superelements=False,
+                           stream_superelements=False):
+    """
+    Streaming version of ``_lines_to_decks``
+
+    Parameters
+    ----------
+    deck_lines : iterator
+        yields the (line, (ifile, iline)) pairs of the deck
+    punch : bool
+        True : starts from the bulk data deck
+        False : read the entire deck
+    consider_superelements : bool; default=False
+        parse 'begin super=2'
+    stream_superelements : bool; default=False
+        the bulk data yields (super_id, (line, (ifile, iline))), so the
+        'BEGIN SUPER=n' sections are streamed instead of being stored
+
+    Returns
+    -------
+    see ``BDFInputPy.get_lines_mmap``
+
+    """
+    superelement_lines = defaultdict(list)
+    superelement_ilines = defaultdict(list)
+    if punch:
+        if stream_superelements:
+            bulk_data_lines = _iter_superelement_bulk_data_lines(deck_lines)
+        else:
+            # the punch lines aren't stripped (same as _lines_to_decks)
+            bulk_data_lines = (line_ifile_iline for line_ifile_iline in deck_lines)
+        return [], [], [], bulk_data_lines, superelement_lines, superelement_ilines
+
+    executive_control_lines = []
+    case_control_lines = []
+    current_lines = executive_control_lines
+    is_superelement = False
+    flag = 1
+    old_flags = []
+    for line, unused_ifile_iline in deck_lines:
+        if flag == 1:
+            if line.upper().startswith('CEND'):
+                old_flags.append(flag)
+                flag = 2
+                current_lines = case_control_lines
+            executive_control_lines.append(line.rstrip())
+            continue
+
+        # we're in the case control deck (flag=2) or a 'BEGIN SUPER=1'
+        # section (flag=-1) and looking for a 'BEGIN BULK'
+        #
+        # we have to handle the comment because we could incorrectly
+        # flag the model as flipping to the BULK data section if we
+        # have BEGIN BULK in a comment
+        if '$' in line:
+            line, comment = line.split('$', 1)
+            current_lines.append('$' + comment.rstrip())
+
+        uline = line.upper().strip()
+        if uline.startswith('BEGIN'):
+            if _is_begin_bulk(uline):
+                old_flags.append(flag)
+                flag = 3
+                if is_superelement or consider_superelements:
+                    case_control_lines.append(line.rstrip())
+                break
+            elif 'SUPER' in uline and '=' in uline:
+                super_id = _get_super_id(line, uline)
+                old_flags.append(flag)
+                flag = -super_id
+                current_lines = superelement_lines[super_id]
+            elif 'AUXMODEL' in uline:
+                raise NotImplementedError('AUXMODEL is not supported by get_lines_mmap')
+            else:
+                msg = 'expected "BEGIN BULK" or "BEGIN SUPER=1"\nline = %s' % line
+                raise RuntimeError(msg)
+        elif uline.startswith('AUXMODEL'):
+            raise NotImplementedError('AUXMODEL is not supported by get_lines_mmap')
+        elif uline.startswith('SUPER'):
+            is_superelement = True
+        current_lines.append(line.rstrip())
+
+    _check_valid_deck(flag, old_flags)
+
+    # break out system commands
+    system_lines, executive_control_lines = _break_system_lines(executive_control_lines)
+
+    # clean comments
+    system_lines = [_clean_comment(line) for line in system_lines
+                    if _clean_comment(line) is not None]
+    executive_control_lines = [_clean_comment(line) for line in executive_control_lines
+                               if _clean_comment(line) is not None]
+    case_control_lines = [_clean_comment(line) for line in case_control_lines
+                          if _clean_comment(line) is not None]
+
+    is_extra_bulk = is_superelement or consider_superelements
+    if stream_superelements:
+        bulk_data_lines = _iter_superelement_bulk_data_lines(deck_lines)
+    else:
+        bulk_data_lines = _iter_bulk_data_lines(deck_lines, is_extra_bulk,
+                                                superelement_lines, superelement_ilines)
+    return (
+        system_lines, executive_control_lines, case_control_lines,
+        bulk_data_lines,
+        superelement_lines, superelement_ilines)
+
+def _iter_bulk_data_lines(deck_lines, is_extra_bulk, superelement_lines, superelement_ilines):
+    """
+    Yields the (line, (ifile, iline)) pairs of the bulk data deck.
+
+    If is_extra_bulk=True, the 'BEGIN SUPER=n' sections are stored in
+    superelement_lines/superelement_ilines instead of being yielded.
+    """
+    if not is_extra_bulk:
+        for line, ifile_iline in deck_lines:
+            yield line.rstrip(), ifile_iline
+        return
+
+    for super_id, (rline, ifile_iline) in _iter_superelement_bulk_data_lines(deck_lines):
+        if super_id == 0:
+            yield rline, ifile_iline
+        else:
+            superelement_lines[super_id].append(rline)
+            superelement_ilines[super_id].append(ifile_iline)
+
+def _iter_superelement_bulk_data_lines(deck_lines):
+    """
+    Yields the (super_id, (line, (ifile, iline))) pairs of the bulk data
+    deck, where super_id=0 is the main bulk data deck and super_id=n is a
+    'BEGIN SUPER=n' section.
+    """
+    super_id = 0
+    for line, ifile_iline in deck_lines:
+        lines_to_add = []
+        if '$' in line:
+            line, comment = line.split('$', 1)
+            lines_to_add.append('$' + comment.rstrip())
+
+        uline = line.upper().strip()
+        if uline.startswith('BEGIN'):
+            if 'SUPER' in uline:
+                super_id = _get_super_id(line, uline)
+            elif 'AUXMODEL' in uline:
+                raise NotImplementedError('AUXMODEL is not supported by get_lines_mmap')
+            else:
+                msg = 'expected "BEGIN AUXMODEL=1" or "BEGIN SUPER=1"\nline = %s' % line
+                raise RuntimeError(msg)
+
+        rline = line.rstrip()
+        if rline:
+            lines_to_add.append(rline)
+
+        for rline in lines_to_add:
+            yield super_id, (rline, ifile_iline)
+
 def _lines_to_decks_main(lines, ilines, keep_enddata=True, consider_superelements=False):
     make_ilines = ilines is not None
 
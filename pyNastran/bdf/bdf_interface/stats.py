@@ -1,3 +1,6 @@
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
+
+
 def get_bdf_stats(model, return_type='string', word=''):
     # type: (str) -> Union[str, List[str]]
     """
@@ -115,7 +118,7 @@ def get_bdf_stats(model, return_type='string', word=''):
         'is_superelements', 'special_cards', 'units',
         'sol', 'sol_iline', 'sol_method', 'cards_to_read', 'card_count',
         'superelement_models', 'wtmass', 'echo', 'force_echo_off',
-        'read_includes', 'reject_cards', 'reject_count', 'punch',
+        'read_includes', 'fast_parse', 'storage', 'reject_cards', 'reject_count', 'punch',
         'include_dir', 'include_filenames', 'save_file_structure',
         'rsolmap_to_str', 'nastran_format', 'nid_map', 'bdf_filename',
         'radset', 'is_zona',
@@ -288,7 +291,7 @@ def get_bdf_stats(model, return_type='string', word=''):
 
         groups = set([]) # type: Set[str]
 
-        if not isinstance(card_group, dict):
+        if not isinstance(card_group, (dict, ColumnarDict)):
             msgi = '%s is a %s; not dictionary, which is required by get_bdf_stats()' % (
                 card_group_name, type(card_group))
             model.log.error(msgi)
@@ -0,0 +1,140 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import tempfile
+import unittest
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.card_stream import iter_bdf_cards, get_bdf_stats_stream
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+MAIN_BDF = (
+    'SOL 101\n'
+    'CEND\n'
+    'BEGIN BULK\n'
+    'INCLUDE \'geom.inc\'\n'
+    'BAROR,,,,,0.,0.,1.\n'
+    'CBAR          10       2       1       2\n'
+    'PBAR           2       1      1.\n'
+    '$ springs\n'
+    'PELAS          3    100.                       4    200.\n'
+    'MAT1           1    3.+7              .3\n'
+    'DMIG    STIF           0       6       1\n'
+    'DMIG    STIF           1       1               1       1      1.\n'
+    'BEGIN SUPER=2\n'
+    'GRID         101              0.      0.      0.\n'
+    'ENDDATA\n'
+)
+GEOM_INC = (
+    'GRID           1              0.      0.      0.\n'
+    'GRID           2              1.      0.      0.\n'
+    'GRID*                 3                              1.              1.\n'
+    '*                     0.\n'
+)
+
+
+class TestCardStream(unittest.TestCase):
+    """tests iter_bdf_cards(...)"""
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.bdf_filename = os.path.join(self.dirname, 'main.bdf')
+        _write_file(self.bdf_filename, MAIN_BDF)
+        _write_file(os.path.join(self.dirname, 'geom.inc'), GEOM_INC)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_iter_bdf_cards(self):
+        """the streamed cards are the same as the model's cards"""
+        model = BDF(debug=None)
+        model.is_superelements = True
+        model.read_bdf(self.bdf_filename, xref=False)
+        cards = list(iter_bdf_cards(self.bdf_filename, debug=None))
+        self.assertEqual([(super_id, card.type) for super_id, card in cards], [
+            (0, 'GRID'), (0, 'GRID'), (0, 'GRID'), (0, 'BAROR'), (0, 'CBAR'), (0, 'PBAR'),
+            (0, 'PELAS'), (0, 'PELAS'), (0, 'MAT1'), (0, 'DMIG'), (2, 'GRID')])
+        nodes = [card for super_id, card in cards if super_id == 0 and card.type == 'GRID']
+        self.assertEqual(nodes, list(model.nodes.values()))
+        self.assertEqual(cards[4][1].x.tolist(), [0., 0., 1.])
+        self.assertEqual([cards[6][1].pid, cards[7][1].pid], [3, 4])
+        self.assertEqual(cards[6][1].comment, '$ springs\n')
+        self.assertEqual(cards[9][1].GCi.tolist(), model.dmigs['STIF'].GCi.tolist())
+        self.assertEqual(cards[10][1], model.superelement_models[2].nodes[101])
+
+        cards = list(iter_bdf_cards(self.bdf_filename, card_types=['pelas'], debug=None))
+        self.assertEqual([card.pid for unused_super_id, card in cards], [3, 4])
+
+        cards = list(iter_bdf_cards(self.bdf_filename, card_types=['GRID'], raw=True,
+                                    read_includes=False, debug=None))
+        self.assertEqual(cards, [(2, ('GRID', '101', None, '0.', '0.', '0.'))])
+
+    def test_bdf_stats_stream(self):
+        """the stats are found from the stream"""
+        msg = get_bdf_stats_stream(iter_bdf_cards(self.bdf_filename, raw=True, debug=None))
+        self.assertEqual(msg.split('\n'), [
+            '---BDF Statistics---',
+            'bdf.baror',
+            '  BAROR    : 1',
+            '',
+            'bdf.dmigs',
+            '  DMIG     : 2',
+            '',
+            'bdf.elements',
+            '  CBAR     : 1',
+            '',
+            'bdf.materials',
+            '  MAT1     : 1',
+            '',
+            'bdf.nodes',
+            '  GRID     : 3',
+            '',
+            'bdf.properties',
+            '  PBAR     : 1',
+            '  PELAS    : 1',
+            '',
+            '',
+            '---BDF Statistics (Superelement 2)---',
+            'bdf.nodes',
+            '  GRID     : 1',
+            '',
+            '',
+        ])
+
+        msg = get_bdf_stats_stream(iter_bdf_cards(self.bdf_filename, debug=None),
+                                   return_type='list')
+        self.assertIn('  PELAS    : 2', msg)
+        self.assertIn('  DMIG     : 1', msg)
+
+    def test_iter_bdf_cards_encoding(self):
+        """the pyNastran header is read with the encoding of the model"""
+        bdf_filename = os.path.join(self.dirname, 'latin1.bdf')
+        with open(bdf_filename, 'wb') as bdf_file:
+            bdf_file.write(
+                b'$ pyNastran: punch=True\n'
+                b'$ caf\xe9\n'
+                b'GRID           1              0.      0.      0.\n')
+        cards = list(iter_bdf_cards(bdf_filename, encoding='latin1', debug=None))
+        self.assertEqual([card.nid for unused_super_id, card in cards], [1])
+
+    def test_iter_bdf_cards_zona(self):
+        """the ZONA decks are read with the normal reader"""
+        bdf_filename = os.path.join(MODEL_PATH, 'aero', 'ztran.bdf')
+        model = read_bdf(bdf_filename, xref=False, debug=None)
+        cards = list(iter_bdf_cards(bdf_filename, card_types=['GRID', 'CAERO7'], debug=None))
+        self.assertEqual([card.type for unused_super_id, card in cards],
+                         ['GRID', 'GRID', 'CAERO7'])
+        self.assertEqual(cards[2][1].eid, 1001)
+        self.assertEqual(cards[0][1], model.nodes[1])
+
+
+def _write_file(filename, msg):
+    with open(filename, 'w') as bdf_file:
+        bdf_file.write(msg)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,201 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import copy
+import pickle
+import unittest
+from six import StringIO
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF, GRID, CQUAD4
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+
+BULK_DATA = [
+    '$ node 1',
+    'GRID           1       0      0.      0.      0.',
+    'GRID           2       1      1.      0.      0.       1     123',
+    'GRID           3              1.      1.      0.',
+    'GRID           4              0.      1.      0.',
+    'GRID           5              0.      0.      1.',
+    'CORD2R         1       0      0.      0.      0.      0.      0.      1.\n'
+    '              1.      0.      0.',
+    'CORD1R         2       1       2       3',
+    'CQUAD4         1       1       1       2       3       4',
+    'CQUAD4         2       1       1       2       3       4      2.     0.1\n'
+    '                       1     0.1     0.2     0.3     0.4',
+    'CTRIA3         3       1       1       2       3',
+    'CTETRA         4       2       1       2       3       5',
+    'CTETRA        10       2       1       2       3       5               2\n'
+    '               3',
+    'CBAR           5       3       1       2      0.      0.      1.',
+    'CBAR           6       3       1       2       3',
+    'CROD           7       4       1       2',
+    'CELAS1         8       5       1       1       2       1',
+    'PSHELL         1       1      .1',
+    'PSOLID         2       1',
+    'PBAR           3       1      1.      1.      1.      1.',
+    'PROD           4       1      1.',
+    'PELAS          5    100.',
+    'MAT1           1    3.+7              .3     0.1',
+]
+
+
+class TestColumnar(unittest.TestCase):
+    """tests BDF(storage='columnar')"""
+
+    def test_columnar_read(self):
+        """the columnar storage reads/writes/cross-references the same model"""
+        model, model_columnar = _read_models('\n'.join(BULK_DATA))
+        assert isinstance(model_columnar.nodes, ColumnarDict)
+        assert isinstance(model_columnar.elements, ColumnarDict)
+        assert isinstance(model_columnar.coords, ColumnarDict)
+        self.assertEqual(model.card_count, model_columnar.card_count)
+        for attr in ['nodes', 'elements', 'coords']:
+            cards = getattr(model, attr)
+            cards_columnar = getattr(model_columnar, attr)
+            self.assertEqual(list(cards), list(cards_columnar))
+            for key, card in cards.items():
+                card_columnar = cards_columnar[key]
+                self.assertIsInstance(card_columnar, type(card))
+                self.assertEqual(card.raw_fields(), card_columnar.raw_fields())
+                self.assertEqual(card, card_columnar)
+                self.assertEqual(card.comment, card_columnar.comment)
+        self.assertEqual(model_columnar.nodes[1].comment, '$ node 1\n')
+        self.assertEqual(model_columnar.nodes[2].comment, '')
+        self.assertIsNone(model_columnar.elements[5].g0)
+        self.assertIsNone(model_columnar.elements[6].x)
+        self.assertIsNone(model_columnar.elements[10].nodes[4])
+        self.assertEqual(repr(model_columnar.elements),
+                         'ColumnarDict(objects=1, CQUAD4=2, CTRIA3=1, CTETRA4=1, '
+                         'CTETRA10=1, CBAR=2, CROD=1)')
+
+        model.cross_reference()
+        model_columnar.cross_reference()
+        self.assertEqual(model_columnar.nodes[2].cp_ref.cid, 1)
+        self.assertEqual(model_columnar.elements[1].nodes_ref[1].nid, 2)
+        np.testing.assert_allclose(model.get_xyz_in_coord(cid=0),
+                                   model_columnar.get_xyz_in_coord(cid=0))
+        mass, cg, inertia = mass_properties(model)
+        mass2, cg2, inertia2 = mass_properties(model_columnar)
+        self.assertAlmostEqual(mass, mass2)
+        np.testing.assert_allclose(cg, cg2)
+        np.testing.assert_allclose(inertia, inertia2)
+        self.assertEqual(_write(model), _write(model_columnar))
+
+    def test_columnar_update(self):
+        """setting an attribute writes to the arrays"""
+        unused_model, model = _read_models('\n'.join(BULK_DATA))
+        node = model.nodes[3]
+        node.xyz[2] = 4.
+        node.cp = 1
+        self.assertEqual(model.nodes[3].xyz.tolist(), [1., 1., 4.])
+        self.assertEqual(model.nodes[3].cp, 1)
+
+        model.nodes[3].xyz = np.array([1., 2., 3.])
+        model.nodes[3].ps = '12'
+        self.assertEqual(model.nodes[3].xyz.tolist(), [1., 2., 3.])
+        self.assertEqual(model.nodes[3].ps, '12')
+        self.assertEqual(model.nodes[4].ps, '')
+
+        elem = model.elements[1]
+        elem.update_field(3, 10)
+        elem.T1 = 0.5
+        self.assertEqual(model.elements[1].nodes, [10, 2, 3, 4])
+        self.assertEqual(model.elements[1].T1, 0.5)
+        self.assertIsNone(model.elements[3].T1)
+
+        arrays = model.nodes.get_arrays('GRID')
+        self.assertEqual(arrays['nid'].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(arrays['xyz'][2].tolist(), [1., 2., 3.])
+        self.assertEqual(model.elements.get_arrays('CQUAD4')['nodes'][0].tolist(),
+                         [10, 2, 3, 4])
+        with self.assertRaises(TypeError):
+            model.nodes[3].cp = 'cat'
+
+        del model.nodes[3]
+        self.assertNotIn(3, model.nodes)
+        self.assertEqual(list(model.nodes), [1, 2, 4, 5])
+        self.assertEqual(model.nodes.get_arrays('GRID')['nid'].tolist(), [1, 2, 4, 5])
+        model.nodes[1] = GRID(1, [2., 0., 0.])
+        model.nodes[3] = GRID(3, [3., 0., 0.])
+        self.assertEqual(list(model.nodes), [1, 2, 4, 5, 3])
+        self.assertEqual(model.nodes[1].xyz.tolist(), [2., 0., 0.])
+
+        # the card is stored as an object if it can't be stored in the arrays
+        model.elements[20] = CQUAD4(20, None, [1, 2, 3, 4])
+        self.assertIs(type(model.elements[20]), CQUAD4)
+
+    def test_columnar_dict(self):
+        """the ColumnarDict acts like a dict"""
+        nodes = ColumnarDict()
+        cards = {}
+        for nid in list(range(10000, 0, -1)) + list(range(20000, 30000)):
+            cards[nid] = GRID(nid, [float(nid), 0., 0.])
+            nodes[nid] = cards[nid]
+        nodes['cat'] = GRID(1, [0., 0., 0.])
+        cards['cat'] = nodes['cat']
+        for nid in range(5000, 25000):
+            cards.pop(nid, None)
+            nodes.pop(nid, None)
+        self.assertEqual(len(nodes), len(cards))
+        self.assertEqual(list(nodes), list(cards))
+        self.assertEqual(list(nodes.keys()), list(cards.keys()))
+        self.assertNotIn(5000, nodes)
+        self.assertIn(4999, nodes)
+        self.assertEqual(nodes[25000].xyz[0], 25000.)
+        self.assertEqual(nodes[1].nid, 1)
+        self.assertEqual([node.nid for node in nodes.values()],
+                         [node.nid for node in cards.values()])
+
+        nodes2 = pickle.loads(pickle.dumps(nodes))
+        self.assertEqual(list(nodes2.items()), list(nodes.items()))
+        nodes3 = copy.deepcopy(nodes)
+        self.assertEqual(nodes3, nodes)
+        self.assertIs(type(copy.deepcopy(nodes[1])), GRID)
+        self.assertIs(type(pickle.loads(pickle.dumps(nodes[1]))), GRID)
+        nodes.clear()
+        self.assertEqual(len(nodes), 0)
+
+    def test_columnar_add_arrays(self):
+        """a block of cards may be added from arrays"""
+        nodes = ColumnarDict()
+        nodes[10] = GRID(10, [0., 0., 0.])
+        nids = np.array([1, 2, 3])
+        arrays = {
+            'nid' : nids, 'cp' : np.zeros(3, dtype='int32'),
+            'xyz' : np.array([[1., 0., 0.], [2., 0., 0.], [3., 0., 0.]]),
+            'cd' : np.array([0, 0, 1]), 'seid' : np.zeros(3, dtype='int32'),
+        }
+        node = GRID(1, [1., 0., 0.])
+        self.assertTrue(nodes.add_arrays(node, nids, arrays, {'ps' : ['', '123', '']}))
+        self.assertEqual(list(nodes), [10, 1, 2, 3])
+        self.assertEqual(nodes[3].xyz.tolist(), [3., 0., 0.])
+        self.assertEqual(nodes[3].cd, 1)
+        self.assertEqual([nodes[nid].ps for nid in nids], ['', '123', ''])
+        self.assertEqual(nodes[2].write_card(),
+                         GRID(2, [2., 0., 0.], ps='123').write_card())
+
+        # a duplicate key
+        self.assertFalse(nodes.add_arrays(node, nids, arrays))
+        self.assertEqual(len(nodes), 4)
+
+
+def _read_models(bulk_data):
+    """reads the punch deck with the dict and columnar storage"""
+    models = []
+    for storage in ['dict', 'columnar']:
+        model = BDF(debug=None, storage=storage)
+        model.read_bdf(StringIO(bulk_data + '\n'), punch=True, xref=False)
+        models.append(model)
+    return models
+
+
+def _write(model):
+    """writes the model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
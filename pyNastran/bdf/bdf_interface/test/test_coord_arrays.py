@@ -0,0 +1,112 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import unittest
+from six import StringIO
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.coord_arrays import CoordArrays, get_grid_arrays
+
+BULK_DATA = [
+    'GRID           1              0.      0.      0.',
+    'GRID           2       3      1.     30.      2.',
+    'GRID           3       4      2.     20.     40.       5',
+    'GRID           4              0.      1.      1.',
+    'GRID           5       4      1.      2.      3.       3',
+    'GRID           6       2      4.      5.      6.       6',
+    'SPOINT        10',
+    'CORD2R         1       0      1.      2.      3.      1.      2.      4.',
+    '              2.      2.      3.',
+    'CORD2C         2       1      1.      0.      0.      1.      1.      1.',
+    '              2.      0.      5.',
+    'CORD2S         3       2      0.     10.      0.      1.     10.      1.',
+    '              0.     20.      5.',
+    'CORD2R         4       3      1.     10.     10.      2.     20.     30.',
+    '              0.      5.      5.',
+    'CORD1R         5       2       3       4',
+    'CORD1C         6       1       4       2',
+]
+
+
+class TestCoordArrays(unittest.TestCase):
+    """tests the vectorized coordinate system engine"""
+
+    def test_coord_arrays(self):
+        """the stacked arrays are the same as the resolved coords"""
+        model = _read_model()
+        coord_arrays = CoordArrays.from_model(model)
+        self.assertEqual(coord_arrays.cids.tolist(), [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(coord_arrays.coord_types.tolist(),
+                         ['R', 'R', 'C', 'S', 'R', 'R', 'C'])
+        # CORD2R 4 -> CORD2S 3 -> CORD2C 2 -> CORD2R 1 -> 0
+        # CORD1C 6 -> GRID 2 -> CORD2S 3
+        # CORD1R 5 -> GRID 3 -> CORD2R 4
+        self.assertEqual([level.tolist() for level in coord_arrays.levels],
+                         [[0], [1], [2], [3], [4, 6], [5]])
+
+        model.cross_reference()
+        for i, (cid, coord) in enumerate(sorted(model.coords.items())):
+            np.testing.assert_allclose(coord_arrays.origins[i], coord.origin, atol=1e-12)
+            np.testing.assert_allclose(coord_arrays.betas[i], coord.beta(), atol=1e-12)
+            self.assertEqual(coord.cid, cid)
+        self.assertEqual(model.coords[4].rid_trace, [1, 2, 3])
+        self.assertEqual(model.coords[5].rid_trace, [3, 4, 0])
+        self.assertTrue(model.coords[5].is_resolved)
+
+        nids = [1, 2, 3, 4, 5, 6]
+        cps, cds, xyz_cp = get_grid_arrays(model, nids)
+        self.assertEqual(cds.tolist(), [0, 0, 5, 0, 3, 6])
+        xyz_cid0 = coord_arrays.transform_node_to_global(xyz_cp, cps)
+        xyz_cid0_expected = [model.nodes[nid].get_position() for nid in nids]
+        np.testing.assert_allclose(xyz_cid0, xyz_cid0_expected, atol=1e-12)
+
+        xyz_cd = coord_arrays.transform_node_to_local(xyz_cid0, cds)
+        xyz_cd_expected = [model.nodes[nid].get_position_wrt(model, cd)
+                           for nid, cd in zip(nids, cds)]
+        np.testing.assert_allclose(xyz_cd, xyz_cd_expected, atol=1e-12)
+
+    def test_get_xyz_in_coord(self):
+        """the vectorized methods match the node methods"""
+        for storage in ['dict', 'columnar']:
+            model = _read_model(storage=storage)
+            model.cross_reference()
+            nids = sorted(model.nodes)
+            for cid in [0, 2, 4]:
+                xyz_cid = model.get_xyz_in_coord(cid=cid)
+                self.assertEqual(xyz_cid.shape, (7, 3))
+                xyz_cid_expected = [model.nodes[nid].get_position_wrt(model, cid)
+                                    for nid in nids]
+                np.testing.assert_allclose(xyz_cid[:6, :], xyz_cid_expected, atol=1e-12)
+                self.assertEqual(xyz_cid[6, :].tolist(), [0., 0., 0.])
+
+            out = model.get_displacement_index_xyz_cp_cd()
+            icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+            self.assertEqual(sorted(icd_transform), [3, 5, 6])
+            self.assertEqual(icd_transform[5].tolist(), [2])
+            self.assertEqual(icp_transform[0].tolist(), [0, 3])
+            self.assertEqual(icp_transform[4].tolist(), [2, 4])
+            self.assertEqual(nid_cp_cd[:, 0].tolist(), [1, 2, 3, 4, 5, 6, 10])
+
+            xyz_cid = model.transform_xyzcp_to_xyz_cid(
+                xyz_cp[:6, :], nid_cp_cd[:6, 0], icp_transform, cid=4, atol=None)
+            np.testing.assert_allclose(xyz_cid, model.get_xyz_in_coord(cid=4)[:6, :],
+                                       atol=1e-12)
+
+    def test_circular_reference(self):
+        """a circular reference is found"""
+        model = BDF(debug=None)
+        model.add_cord2r(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.], rid=2)
+        model.add_cord2r(2, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.], rid=1)
+        with self.assertRaises(RuntimeError):
+            CoordArrays.from_model(model)
+
+
+def _read_model(storage='dict'):
+    """reads the punch deck"""
+    model = BDF(debug=None, storage=storage)
+    model.read_bdf(StringIO('\n'.join(BULK_DATA) + '\n'), punch=True, xref=False)
+    return model
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
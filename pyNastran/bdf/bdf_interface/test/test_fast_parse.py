@@ -0,0 +1,164 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import unittest
+from six import StringIO
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.fast_parse import (
+    parse_cards_fast, parse_cards_fast_block, NCARDS_BLOCK)
+
+CARDS = [
+    # small field
+    'GRID           1       0      0.      0.      0.',
+    'GRID           2            1.-3    1.+3  1.0D+2       1     123',
+    'GRID           3             .5     -.5    1e-3               0       1',
+    # csv/large field/tabs
+    'GRID,4,,1.,2.,3.',
+    'GRID*                  5               0              1.              2.\n'
+    '*                     3.               0',
+    'GRID\t6\t\t1.\t2.\t3.',
+    'CQUAD4         1       1       1       2       3       4',
+    'CQUAD4         2               1       2       3       4      2.     0.1\n'
+    '                       1     0.1     0.2     0.3     0.4',
+    'CQUAD4,3,1,1,2,3,4,2',
+    'CTRIA3         4       1       1       2       3      5.',
+    'CTRIA3,5,1,1,2,3,,0.1',
+    'CTETRA         6       2       1       2       3       4',
+    'CTETRA         7       2       1       2       3       4       5       6\n'
+    '               7       8       9      10',
+    'CHEXA          8       2       1       2       3       4       5       6\n'
+    '               7       8',
+    'CBAR           9       3       1       2      0.      1.      0.',
+    'CBAR          10       3       1       2       5',
+    'CBUSH         11       4       1       2       5',
+    'CBUSH         12       4       1       2      1.      0.      0.',
+    'CBUSH         13       4       1       2                               0',
+    'CONM2        101       1       0     1.0     0.1',
+    'CONM2        102       2            2.-3\n'
+    '            1.0     0.0     2.0     0.0     0.0     3.0',
+    'RBE2         201       1  123456       2       3       4',
+    'RBE2         202       1     123       2       3    1.-6',
+    'RBE2,203,1,12,2,3,4,5,6\n,7,8,9,10',
+]
+
+
+class TestFastParse(unittest.TestCase):
+    """tests the block parser for the high-volume cards"""
+
+    def test_fast_parse_cards(self):
+        """the fast parser creates the same cards as add_card"""
+        model, model_fast = _read_models('\n'.join(CARDS))
+        assert model_fast.fast_parse
+        self.assertEqual(model.card_count, model_fast.card_count)
+        for attr in ['nodes', 'elements', 'masses', 'rigid_elements']:
+            objs = getattr(model, attr)
+            objs_fast = getattr(model_fast, attr)
+            self.assertEqual(list(objs), list(objs_fast))
+            for key, obj in sorted(objs.items()):
+                obj_fast = objs_fast[key]
+                self.assertIs(type(obj), type(obj_fast))
+                _assert_dict_equal(self, obj.__dict__, obj_fast.__dict__)
+
+        bdf_file = StringIO()
+        bdf_file_fast = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model_fast.write_bdf(bdf_file_fast, close=False)
+        self.assertEqual(bdf_file.getvalue(), bdf_file_fast.getvalue())
+
+    def test_fast_parse_fallback(self):
+        """unusual cards are left for add_card"""
+        model = BDF(debug=None)
+        lines = '\n'.join(CARDS).split('\n')
+        cards_list = model.get_bdf_cards(lines)[0]
+        parsed_cards = parse_cards_fast(model, cards_list)
+        card_names = [cards_list[icard][0] for icard in sorted(parsed_cards)]
+
+        # the CTETRA10 uses add_card
+        self.assertEqual(len(parsed_cards), len(cards_list) - 1)
+        self.assertEqual(card_names.count('CTETRA'), 1)
+        self.assertEqual(card_names.count('CHEXA'), 1)
+        self.assertEqual(card_names.count('GRID'), 6)
+
+        cards_list = model.get_bdf_cards(['ECHOON'] + lines)[0]
+        self.assertEqual(parse_cards_fast(model, cards_list), {})
+
+    def test_fast_parse_block(self):
+        """the cards of a block are the same as the cards of the whole deck"""
+        model = BDF(debug=None)
+        lines = '\n'.join(CARDS).split('\n')
+        cards_list = model.get_bdf_cards(lines)[0]
+        parsed_cards = parse_cards_fast(model, cards_list)
+
+        parsed_cards_block = {}
+        for icard0 in range(0, len(cards_list), 5):
+            parsed_cardsi = parse_cards_fast_block(model, cards_list, icard0, ncards=5)
+            self.assertTrue(all(icard0 <= icard < icard0 + 5 for icard in parsed_cardsi))
+            parsed_cards_block.update(parsed_cardsi)
+        self.assertEqual(sorted(parsed_cards_block), sorted(parsed_cards))
+        for icard, (unused_card, card_obj, unused_exception) in parsed_cards.items():
+            card_obj_block = parsed_cards_block[icard][1]
+            self.assertIs(type(card_obj), type(card_obj_block))
+            _assert_dict_equal(self, card_obj.__dict__, card_obj_block.__dict__)
+
+        # the deck is read in more than one block
+        nnodes = NCARDS_BLOCK + 5
+        cards = ['GRID,%i,,%i.,0.,0.' % (nid, nid) for nid in range(1, nnodes + 1)]
+        model, model_fast = _read_models('\n'.join(cards))
+        self.assertEqual(len(model_fast.nodes), nnodes)
+        self.assertEqual(model.nodes[nnodes].xyz.tolist(), model_fast.nodes[nnodes].xyz.tolist())
+
+    def test_fast_parse_errors(self):
+        """errors are the same as add_card"""
+        bad_cards = [
+            'GRID         1.5       0      0.      0.      0.',
+            'GRID           2       0       1      0.      0.',
+            'GRID           3       0      0.      0.      0.       0     127',
+            'CQUAD4         4       1       1       2       3',
+            'CTRIA3         5       1       1       2       3               0.      1.',
+            'CBAR           6       3       1       2',
+            'CONM2          7       1       0       A',
+            'RBE2           8       1  123456       2     3.5       4',
+        ]
+        for card in bad_cards:
+            msgs = []
+            for fast_parse in [False, True]:
+                model = BDF(debug=None)
+                model.fast_parse = fast_parse
+                bdf_file = StringIO(card + '\n')
+                with self.assertRaises(Exception) as context:
+                    model.read_bdf(bdf_file, punch=True, xref=False)
+                msgs.append(str(context.exception))
+            self.assertEqual(msgs[0], msgs[1], msg=card)
+
+
+def _read_models(bulk_data):
+    """reads the punch deck with and without the fast parser"""
+    models = []
+    for fast_parse in [False, True]:
+        model = BDF(debug=None)
+        model.fast_parse = fast_parse
+        model.read_bdf(StringIO(bulk_data + '\n'), punch=True, xref=False, validate=False)
+        models.append(model)
+    return models
+
+
+def _assert_dict_equal(self, dict1, dict2):
+    """checks that the values and types of the card attributes are the same"""
+    self.assertEqual(sorted(dict1), sorted(dict2))
+    for key, value1 in dict1.items():
+        value2 = dict2[key]
+        self.assertIs(type(value1), type(value2), msg=key)
+        if isinstance(value1, np.ndarray):
+            self.assertEqual(value1.dtype, value2.dtype, msg=key)
+            self.assertEqual(value1.tolist(), value2.tolist(), msg=key)
+        elif isinstance(value1, list):
+            self.assertEqual([type(val) for val in value1],
+                             [type(val) for val in value2], msg=key)
+            self.assertEqual(value1, value2, msg=key)
+        else:
+            self.assertEqual(value1, value2, msg=key)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,70 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyNastran.bdf.bdf import read_bdf
+
+MAIN_BDF = (
+    'SOL 101\n'
+    'CEND\n'
+    'BEGIN BULK\n'
+    'INCLUDE \'nodes1.inc\'\n'
+    'INCLUDE \'nodes2.inc\'\n'
+    'PSHELL         1       1      .1\n'
+    'ENDDATA\n'
+)
+NODES1_INC = (
+    'GRID           1              0.      0.      0.\r\n'
+    'INCLUDE \'nested.inc\'\r\n'
+    'GRID           3              1.      1.      0.\r\n'
+)
+NODES2_INC = 'GRID           4              0.      1.      0.\n'
+NESTED_INC = 'GRID           2              1.      0.      0.\n'
+
+
+class TestIncludePrefetch(unittest.TestCase):
+    """tests read_bdf(..., nthreads=nthreads)"""
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.bdf_filename = os.path.join(self.dirname, 'main.bdf')
+        _write_file(self.bdf_filename, MAIN_BDF)
+        _write_file(os.path.join(self.dirname, 'nodes1.inc'), NODES1_INC)
+        _write_file(os.path.join(self.dirname, 'nodes2.inc'), NODES2_INC)
+        _write_file(os.path.join(self.dirname, 'nested.inc'), NESTED_INC)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_include_prefetch(self):
+        """the INCLUDE files are spliced in the same order"""
+        model = read_bdf(self.bdf_filename, xref=False, debug=None)
+        model2 = read_bdf(self.bdf_filename, xref=False, debug=None, nthreads=4)
+        self.assertEqual(list(model2.nodes), [1, 2, 3, 4])
+        self.assertEqual(list(model2.nodes), list(model.nodes))
+        self.assertEqual(model2.active_filenames, model.active_filenames)
+        self.assertEqual(dict(model2.include_filenames), dict(model.include_filenames))
+
+        filenames = [os.path.basename(filename) for filename, unused_nbytes, unused_time
+                     in model2.include_stats]
+        self.assertEqual(filenames, ['nodes1.inc', 'nested.inc', 'nodes2.inc'])
+        nbytes = [stat[1] for stat in model2.include_stats]
+        self.assertEqual(nbytes, [stat[1] for stat in model.include_stats])
+        self.assertEqual(nbytes[1], len(NESTED_INC))
+
+    def test_include_prefetch_missing(self):
+        """a missing INCLUDE file is an error"""
+        os.remove(os.path.join(self.dirname, 'nested.inc'))
+        with self.assertRaises(IOError):
+            read_bdf(self.bdf_filename, xref=False, debug=None, nthreads=4)
+
+
+def _write_file(filename, msg):
+    with open(filename, 'wb') as bdf_file:
+        bdf_file.write(msg.encode('ascii'))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,99 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyNastran.bdf.bdf import read_bdf
+from pyNastran.bdf.bdf_interface.model_cache import BDFModelCache, CACHE_EXT
+
+MAIN_BDF = (
+    'SOL 101\n'
+    'CEND\n'
+    'SUBCASE 1\n'
+    '    LOAD = 1\n'
+    'BEGIN BULK\n'
+    'INCLUDE \'geom.inc\'\n'
+    'CQUAD4         1       1       1       2       3       4\n'
+    'PSHELL         1       1      .1\n'
+    'MAT1           1    3.+7              .3\n'
+    'FORCE          1       3       0    100.      0.      0.      1.\n'
+    'ENDDATA\n'
+)
+GEOM_INC = (
+    'GRID           1              0.      0.      0.\n'
+    'GRID           2              1.      0.      0.\n'
+    'GRID           3              1.      1.      0.\n'
+    'GRID           4              0.      1.      0.\n'
+)
+
+
+class TestModelCache(unittest.TestCase):
+    """tests read_bdf(..., cache_dir=cache_dir)"""
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.dirname, 'cache')
+        self.bdf_filename = os.path.join(self.dirname, 'main.bdf')
+        _write_file(self.bdf_filename, MAIN_BDF)
+        _write_file(os.path.join(self.dirname, 'geom.inc'), GEOM_INC)
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_cache_hit(self):
+        """an unchanged deck is loaded from the cache"""
+        for storage in ['dict', 'columnar']:
+            model = read_bdf(self.bdf_filename, debug=None, storage=storage,
+                             cache_dir=self.cache_dir)
+            model2 = read_bdf(self.bdf_filename, debug=None, storage=storage,
+                              cache_dir=self.cache_dir)
+            self.assertEqual(model2.card_count, model.card_count)
+            self.assertEqual(list(model2.nodes), [1, 2, 3, 4])
+            self.assertEqual(model2.elements[1].nodes_ref[2].xyz.tolist(), [1., 1., 0.])
+            self.assertEqual(model2.case_control_deck.get_subcase_parameter(1, 'LOAD')[0], 1)
+            self.assertEqual(model2.sol, 101)
+        self.assertEqual(len(_get_cache_files(self.cache_dir)), 2)
+
+    def test_cache_include_modified(self):
+        """modifying an INCLUDE file is a cache miss"""
+        model = read_bdf(self.bdf_filename, debug=None, cache_dir=self.cache_dir)
+        self.assertEqual(model.nodes[4].xyz.tolist(), [0., 1., 0.])
+
+        _write_file(os.path.join(self.dirname, 'geom.inc'),
+                    GEOM_INC.replace('0.      1.      0.', '0.      2.      0.'))
+        model = read_bdf(self.bdf_filename, debug=None, cache_dir=self.cache_dir)
+        self.assertEqual(model.nodes[4].xyz.tolist(), [0., 2., 0.])
+        model = read_bdf(self.bdf_filename, debug=None, cache_dir=self.cache_dir)
+        self.assertEqual(model.nodes[4].xyz.tolist(), [0., 2., 0.])
+        self.assertEqual(len(_get_cache_files(self.cache_dir)), 1)
+
+    def test_cache_evict(self):
+        """the least recently used files are deleted"""
+        cache = BDFModelCache(self.cache_dir, max_size=0)
+        model = read_bdf(self.bdf_filename, debug=None, xref=False)
+        cache_filename = cache.save_model(model, self.bdf_filename, {})
+        self.assertFalse(os.path.exists(cache_filename))
+
+        cache.max_size = 10 ** 9
+        cache.save_model(model, self.bdf_filename, {})
+        cache_filename2 = cache.save_model(model, self.bdf_filename, {'punch' : True})
+        self.assertEqual(len(_get_cache_files(self.cache_dir)), 2)
+        os.utime(cache_filename, (1., 1.))
+        cache.max_size = os.path.getsize(cache_filename2)
+        self.assertEqual(cache.evict(), [cache_filename])
+        self.assertEqual(_get_cache_files(self.cache_dir),
+                         [os.path.basename(cache_filename2)])
+
+
+def _write_file(filename, msg):
+    with open(filename, 'w') as bdf_file:
+        bdf_file.write(msg)
+
+
+def _get_cache_files(cache_dir):
+    return [filename for filename in os.listdir(cache_dir) if filename.endswith(CACHE_EXT)]
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,107 @@
+# pylint: disable=W0212
+from __future__ import print_function, unicode_literals
+import unittest
+from six import StringIO
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF, PSHELL
+
+BULK_DATA = [
+    'GRID           1              0.      0.      0.',
+    'GRID           2              1.      0.      0.',
+    'GRID           3              1.      1.      0.',
+    'GRID           4              0.      1.      0.',
+    'GRID           5       1      0.      0.      1.',
+    'CORD1R         1       1       2       4',
+    'CQUAD4         1       1       1       2       3       4',
+    'CQUAD4         2       1       1       2       3       4',
+    'CTRIA3         3       2       1       2       3',
+    'PSHELL         1       1      .1',
+    'PSHELL         2       1      .2',
+    'MAT1           1    3.+7              .3',
+    'FORCE          1       5       0    100.      0.      0.      1.',
+]
+
+
+class TestXrefDependencies(unittest.TestCase):
+    """tests cross_reference(track_dependencies=True)"""
+
+    def test_xref_dirty_update(self):
+        """modifying a card in place only re-links that card"""
+        model = _read_model()
+        elem = model.elements[1]
+        pshell = model.properties[1]
+        self.assertEqual(model.get_dirty_cards(), {})
+
+        model.update_card('PSHELL', 1, 3, 0.5)
+        self.assertEqual(model.get_dirty_cards(include_dependents=False),
+                         {'properties' : [1]})
+        self.assertEqual(model.get_dirty_cards(), {'properties' : [1]})
+        self.assertEqual(model.cross_reference_dirty(), 1)
+        self.assertIs(elem.pid_ref, pshell)
+        self.assertAlmostEqual(elem.Thickness(), 0.5)
+        self.assertEqual(model.get_dirty_cards(), {})
+
+        # the CORD1R axes are calculated from the nodes
+        node = model.nodes[4]
+        node.xyz = np.array([0., 0., 1.])
+        model.mark_card_dirty('GRID', 4)
+        self.assertEqual(model.get_dirty_cards(),
+                         {'nodes' : [4], 'coords' : [1]})
+        model.cross_reference_dirty()
+        np.testing.assert_allclose(model.coords[1].i, [0., 0., 1.], atol=1e-12)
+        np.testing.assert_allclose(model.coords[1].j, [0., -1., 0.], atol=1e-12)
+        np.testing.assert_allclose(model.nodes[5].get_position(), [1., 0., 0.], atol=1e-12)
+
+    def test_xref_dirty_replace(self):
+        """replacing a card re-links the cards that reference it"""
+        model = _read_model()
+        replace_model = BDF(debug=None)
+        replace_model.properties[1] = PSHELL(1, mid1=1, t=0.3)
+        model.replace_cards(replace_model)
+        self.assertEqual(model.get_dirty_cards(include_dependents=False),
+                         {'properties' : [1]})
+        self.assertEqual(model.get_dirty_cards(),
+                         {'properties' : [1], 'elements' : [1, 2]})
+        self.assertEqual(model.cross_reference_dirty(), 3)
+        self.assertIs(model.elements[1].pid_ref, replace_model.properties[1])
+        self.assertAlmostEqual(model.elements[2].Thickness(), 0.3)
+        self.assertIs(model.properties[1].mid1_ref, model.materials[1])
+
+        model.add_card(['CQUAD4', 4, 2, 1, 2, 3, 4], 'CQUAD4')
+        self.assertEqual(model.get_dirty_cards(), {'elements' : [4]})
+        model.cross_reference_dirty()
+        self.assertIs(model.elements[4].pid_ref, model.properties[2])
+
+        model.uncross_reference()
+        self.assertIsNone(model.elements[1].pid_ref)
+        with self.assertRaises(RuntimeError):
+            model.cross_reference_dirty()
+
+    def test_xref_dirty_columnar(self):
+        """the dependencies work with the columnar storage"""
+        model = _read_model(storage='columnar')
+        model.nodes[3].xyz = np.array([1., 1., 0.5])
+        model.mark_card_dirty('GRID', 3)
+        self.assertEqual(model.get_dirty_cards(), {'nodes' : [3]})
+
+        replace_model = BDF(debug=None)
+        replace_model.properties[2] = PSHELL(2, mid1=1, t=0.4)
+        model.replace_cards(replace_model)
+        self.assertEqual(model.get_dirty_cards(),
+                         {'nodes' : [3], 'properties' : [2], 'elements' : [3]})
+        model.cross_reference_dirty()
+        self.assertAlmostEqual(model.elements[3].Thickness(), 0.4)
+        self.assertEqual(model.elements[3].nodes_ref[2].xyz.tolist(), [1., 1., 0.5])
+
+
+def _read_model(storage='dict'):
+    """reads the punch deck and tracks the cross-referencing"""
+    model = BDF(debug=None, storage=storage)
+    model.read_bdf(StringIO('\n'.join(BULK_DATA) + '\n'), punch=True, xref=False)
+    model.cross_reference(track_dependencies=True)
+    return model
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
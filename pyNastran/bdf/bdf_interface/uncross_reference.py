@@ -31,6 +31,9 @@ class UnXrefMesh(SafeXrefMesh):
         self._uncross_reference_sets()
         self._uncross_reference_optimization()
         self._uncross_reference_superelements()
+        self._xref_dependents = None
+        self._xref_card_keys = {}
+        self._dirty_cards = set()
 
         for super_id, superelement in sorted(self.superelement_models.items()):
             superelement.uncross_reference(word=' (Superelement %i)' % super_id)
@@ -8,6 +8,8 @@ import sys
 import traceback
 from six import iteritems, reraise
 
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
+
 def verify_bdf(model, xref):
     #for key, card in sorted(model.params.items()):
         #card._verify(xref)
@@ -318,7 +320,7 @@ def _validate_dict_list(model, objects_dict):
 def _validate_dict(model, objects):
     # type : (dict) -> None
     """helper method for validate_bdf"""
-    assert isinstance(objects, dict), type(objects)
+    assert isinstance(objects, (dict, ColumnarDict)), type(objects)
     ifailed = 0
     nmax_failed = 0
     for unused_id, obj in sorted(objects.items()):
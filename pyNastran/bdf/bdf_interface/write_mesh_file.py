@@ -17,6 +17,7 @@ import numpy as np
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.write_mesh import WriteMesh
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
 #from pyNastran.bdf.cards.nodes import write_xpoints
 from pyNastran.bdf.write_path import write_include
 
@@ -662,7 +663,7 @@ class WriteMeshs(WriteMesh):
 
 def _get_ifiles_dict(cards_dict):
     """gets the ids for a dictionary by file number"""
-    assert isinstance(cards_dict, dict), cards_dict
+    assert isinstance(cards_dict, (dict, ColumnarDict)), cards_dict
     ifiles_dict = defaultdict(list)
     for unused_id, card in sorted(cards_dict.items()):
         ifiles_dict[card.ifile].append(card)
@@ -670,7 +671,7 @@ def _get_ifiles_dict(cards_dict):
 
 def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
     """writes a dictionary by ifile"""
-    assert isinstance(cards, dict), cards
+    assert isinstance(cards, (dict, ColumnarDict)), cards
     assert isinstance(cards, (list, tuple, np.ndarray)), ids
     if bdf_file is None:
         return
@@ -683,7 +684,7 @@ def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
 
 def write_bdfs_dict(bdf_files, cards, size, is_double, is_long_ids):
     """writes a dictionary by ifile"""
-    assert isinstance(cards, dict), cards
+    assert isinstance(cards, (dict, ColumnarDict)), cards
     ifiles_dict = _get_ifiles_dict(cards)
     for file_id, file_cards in ifiles_dict.items():
         bdf_file = bdf_files[file_id]
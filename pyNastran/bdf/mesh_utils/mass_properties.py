@@ -13,6 +13,7 @@ from numpy.linalg import norm  # type: ignore
 import numpy as np
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.utils.mathematics import integrate_positive_unit_line
+from pyNastran.bdf.bdf_interface.coord_arrays import get_xyz_in_coord_vectorized
 
 NO_MASS = set([
     'GRID', 'PARAM', 'FORCE', 'FORCE1', 'FORCE2', 'MOMENT1', 'MOMENT2', 'LOAD',
@@ -56,6 +57,21 @@ NO_MASS = set([
     'SUPORT', 'SUPORT1',
 ])
 
+#: the element types whose mass is calculated in a vectorized way and the
+#: shape that's used for the geometry; the other elements (e.g., CBEAM,
+#: CTRIA6, CONM2) use ``element.Mass()``
+VECTORIZED_MASS_SHAPES = {
+    'CTRIA3' : 'tri', 'CTRIAR' : 'tri',
+    'CQUAD4' : 'quad', 'CQUADR' : 'quad',
+    'CBAR' : 'line', 'CROD' : 'line', 'CONROD' : 'line',
+    'CTETRA' : 'tetra', 'CPENTA' : 'penta', 'CHEXA' : 'hexa',
+}
+#: the number of corner nodes of a shape
+_SHAPE_NNODES = {
+    'line' : 2, 'tri' : 3, 'quad' : 4,
+    'tetra' : 4, 'penta' : 6, 'hexa' : 8,
+}
+
 def transform_inertia(mass, xyz_cg, xyz_ref, xyz_ref2, I_ref):
     """
     Transforms mass moment of inertia using parallel-axis theorem.
@@ -230,9 +246,11 @@ def mass_properties_no_xref(model, element_ids=None, mass_ids=None,
 
 def _mass_properties(model, elements, masses, reference_point, is_cg):
     """helper method for ``mass_properties``"""
-    mass = 0.
-    cg = array([0., 0., 0.])
-    I = array([0., 0., 0., 0., 0., 0., ])
+    element_masses, centroids, elements = _get_vectorized_element_masses(
+        model, elements)
+    mass = element_masses.sum()
+    cg = element_masses.dot(centroids)
+    I = _get_inertia(element_masses, centroids, reference_point)
     no_mass = NO_MASS
     for pack in [elements, masses]:
         for element in pack:
@@ -281,6 +299,204 @@ def _mass_properties(model, elements, masses, reference_point, is_cg):
         I = transform_inertia(mass, cg, xyz_ref, xyz_ref2, I)
     return mass, cg, I
 
+def _get_inertia(element_masses, centroids, reference_point):
+    """
+    Sums the inertia of a set of point masses about the reference point
+
+    Returns
+    -------
+    I : (6, ) float NDARRAY
+        moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
+
+    """
+    x, y, z = (centroids - reference_point).T
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    I = array([
+        element_masses.dot(y2 + z2),  # Ixx
+        element_masses.dot(x2 + z2),  # Iyy
+        element_masses.dot(x2 + y2),  # Izz
+        element_masses.dot(x * y),    # Ixy
+        element_masses.dot(x * z),    # Ixz
+        element_masses.dot(y * z),    # Iyz
+    ])
+    return I
+
+def _get_vectorized_element_masses(model, elements):
+    """
+    Calculates the mass and centroid of the elements in
+    ``VECTORIZED_MASS_SHAPES`` as arrays.
+
+    The mass per unit area/length/volume is found once per property (e.g.,
+    PSHELL/PCOMP, PBAR, PROD, PSOLID) and the areas, lengths, volumes, and
+    centroids are found from the node positions of all the elements of a
+    shape at once.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    elements : List[Element]
+        the elements to consider
+
+    Returns
+    -------
+    element_masses : (n, ) float ndarray
+        the masses of the vectorized elements
+    centroids : (n, 3) float ndarray
+        the centroids of the vectorized elements
+    other_elements : List[Element]
+        the elements that must use ``element.Mass()`` (e.g., the property
+        isn't supported or the element type isn't vectorized)
+
+    """
+    mass_per_unit_map = {}
+    shape_nids = defaultdict(list)
+    shape_mass_per_unit = defaultdict(list)
+    other_elements = []
+    for element in elements:
+        shape = VECTORIZED_MASS_SHAPES.get(element.type)
+        if shape is None:
+            other_elements.append(element)
+            continue
+
+        mass_per_unit = _get_mass_per_unit(element, shape, mass_per_unit_map)
+        if mass_per_unit is None:
+            # let element.Mass() handle the error
+            other_elements.append(element)
+            continue
+
+        if element.type == 'CBAR':
+            nids = [element.ga, element.gb]
+        else:
+            nids = element.nodes[:_SHAPE_NNODES[shape]]
+        shape_nids[shape].append(nids)
+        shape_mass_per_unit[shape].append(mass_per_unit)
+
+    element_masses = np.zeros(0, dtype='float64')
+    centroids = np.zeros((0, 3), dtype='float64')
+    if not shape_nids:
+        return element_masses, centroids, other_elements
+
+    shape_nids = {shape : np.array(nids, dtype='int32')
+                  for shape, nids in shape_nids.items()}
+    all_nids = np.unique(np.hstack([nids.ravel() for nids in shape_nids.values()]))
+    try:
+        xyz_cid0 = get_xyz_in_coord_vectorized(model, all_nids, cid=0)
+    except (KeyError, NotImplementedError):
+        # CORD3G, GRIDB
+        return element_masses, centroids, list(elements)
+
+    element_masses_list = [element_masses]
+    centroids_list = [centroids]
+    for shape, nids in sorted(shape_nids.items()):
+        xyz = xyz_cid0[np.searchsorted(all_nids, nids), :]
+        size, centroid = _get_size_centroid(shape, xyz)
+        element_masses_list.append(np.array(shape_mass_per_unit[shape]) * size)
+        centroids_list.append(centroid)
+    element_masses = np.hstack(element_masses_list)
+    centroids = np.vstack(centroids_list)
+    return element_masses, centroids, other_elements
+
+def _get_mass_per_unit(element, shape, mass_per_unit_map):
+    """
+    Gets the mass per unit area/length/volume of an element, which is
+    only calculated once per property
+
+    Returns
+    -------
+    mass_per_unit : float / None
+        None if the mass can't be calculated
+
+    """
+    try:
+        if shape in ['tri', 'quad']:
+            key = (element.Pid(), element.tflag, tuple(element.get_thickness_scale()))
+        elif element.type == 'CONROD':
+            key = (element.type, element.Mid(), element.A, element.nsm)
+        else:
+            key = (element.type, element.Pid())
+    except Exception:
+        return None
+
+    if key in mass_per_unit_map:
+        return mass_per_unit_map[key]
+
+    try:
+        if shape in ['tri', 'quad']:
+            mass_per_unit = element.MassPerArea()
+        elif shape == 'line':
+            mass_per_unit = element.MassPerLength()
+        else:
+            mass_per_unit = element.Rho()
+    except Exception:
+        mass_per_unit = None
+
+    if not isinstance(mass_per_unit, float):
+        mass_per_unit = None
+    mass_per_unit_map[key] = mass_per_unit
+    return mass_per_unit
+
+def _get_size_centroid(shape, xyz):
+    """
+    Gets the area/length/volume and centroid of a set of elements with the
+    same formulas as the element methods (e.g., CQUAD4.Area, CHEXA8.Volume)
+
+    Parameters
+    ----------
+    shape : str
+        the shape of the elements (e.g., 'tri', 'hexa')
+    xyz : (nelements, nnodes, 3) float ndarray
+        the positions of the corner nodes in the global frame
+
+    Returns
+    -------
+    size : (nelements, ) float ndarray
+        the area/length/volume of the elements
+    centroid : (nelements, 3) float ndarray
+        the centroids of the elements
+
+    """
+    if shape == 'line':
+        n1, n2 = xyz[:, 0, :], xyz[:, 1, :]
+        size = norm(n2 - n1, axis=1)
+        centroid = (n1 + n2) / 2.
+    elif shape == 'tri':
+        n1, n2, n3 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :]
+        size = 0.5 * norm(cross(n1 - n2, n1 - n3), axis=1)
+        centroid = (n1 + n2 + n3) / 3.
+    elif shape == 'quad':
+        size, centroid = _area_centroid(xyz)
+    elif shape == 'tetra':
+        n1, n2, n3, n4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        size = -np.einsum('ij,ij->i', n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
+        centroid = (n1 + n2 + n3 + n4) / 4.
+    elif shape == 'penta':
+        n1, n2, n3 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :]
+        n4, n5, n6 = xyz[:, 3, :], xyz[:, 4, :], xyz[:, 5, :]
+        area1 = 0.5 * norm(cross(n3 - n1, n2 - n1), axis=1)
+        area2 = 0.5 * norm(cross(n6 - n4, n5 - n4), axis=1)
+        c1 = (n1 + n2 + n3) / 3.
+        c2 = (n4 + n5 + n6) / 3.
+        size = np.abs((area1 + area2) / 2. * norm(c1 - c2, axis=1))
+        centroid = (c1 + c2) / 2.
+    elif shape == 'hexa':
+        area1, c1 = _area_centroid(xyz[:, :4, :])
+        area2, c2 = _area_centroid(xyz[:, 4:, :])
+        size = np.abs((area1 + area2) / 2. * norm(c1 - c2, axis=1))
+        centroid = (c1 + c2) / 2.
+    else:  # pragma: no cover
+        raise NotImplementedError(shape)
+    return size, centroid
+
+def _area_centroid(xyz):
+    """vectorized version of ``pyNastran.bdf.cards.elements.solid.area_centroid``"""
+    n1, n2, n3, n4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+    area = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+    centroid = (n1 + n2 + n3 + n4) / 4.
+    return area, centroid
+
 def _mass_properties_no_xref(model, elements, masses, reference_point, is_cg):  # pragma: no cover
     """
     Calculates mass properties in the global system about the
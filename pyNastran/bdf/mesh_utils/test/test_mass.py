@@ -4,6 +4,7 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
 from pyNastran.utils import object_methods
 
 rootpath = pyNastran.__path__[0]
@@ -162,5 +163,41 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_properties_vectorized(self):
+        """the vectorized elements have the same mass as the element methods"""
+        model = BDF(debug=False, log=None)
+        bdfname = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model.read_bdf(bdfname, xref=False)
+        model.add_cord2r(5, [1., 2., 3.], [1., 2., 4.], [2., 3., 3.])
+        model.add_grid(31, [0., 0., 0.], cp=5)
+        model.add_grid(32, [1., 2., 3.], cp=5)
+        model.add_prod(10, 2, 0.5, nsm=0.2)
+        model.add_crod(10, 10, [31, 32])
+        model.add_conrod(11, 2, [1, 32], A=0.3, nsm=0.1)
+        model.add_pbar(12, 2, A=0.4, nsm=0.3)
+        model.add_cbar(12, 12, [32, 3], [0., 0., 1.], None)
+        model.add_conm2(13, 31, 1.5, X=[0.1, 0.2, 0.3])
+        model.cross_reference()
+
+        reference_point = np.array([1., 2., 3.])
+        mass, cg, I = mass_properties(model, reference_point=reference_point,
+                                      inertia_reference='ref', scale=1.0)
+        masses = []
+        centroids = []
+        for element in list(model.elements.values()) + list(model.masses.values()):
+            masses.append(element.Mass())
+            centroids.append(element.center_of_mass())
+        masses = np.array(masses)
+        centroids = np.array(centroids)
+        x, y, z = (centroids - reference_point).T
+        I_expected = [
+            (masses * (y ** 2 + z ** 2)).sum(), (masses * (x ** 2 + z ** 2)).sum(),
+            (masses * (x ** 2 + y ** 2)).sum(), (masses * x * y).sum(),
+            (masses * x * z).sum(), (masses * y * z).sum(),
+        ]
+        self.assertAlmostEqual(mass, masses.sum())
+        assert np.allclose(cg, masses.dot(centroids) / masses.sum()), cg
+        assert np.allclose(I, I_expected), I
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
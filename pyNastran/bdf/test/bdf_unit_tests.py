@@ -8,7 +8,7 @@ from six import StringIO
 import pyNastran
 from pyNastran.utils import object_attributes, object_methods
 from pyNastran.bdf.cards.collpase_card import collapse_thru_by
-from pyNastran.bdf.bdf import BDF, read_bdf, CrossReferenceError
+from pyNastran.bdf.bdf import BDF, read_bdf, CrossReferenceError, DuplicateIDsError
 from pyNastran.bdf.write_path import write_include, _split_path
 from pyNastran.bdf.test.test_bdf import run_bdf, run_all_files_in_folder, compare
 from pyNastran.utils.log import get_logger
@@ -749,6 +749,31 @@ class TestBDF(Tester):
             assert fem.card_count['FLUTTER'] == 4, fem.card_count
             assert fem.card_count['DOPTPRM'] == 1, fem.card_count
 
+    def test_bdf_nprocs(self):
+        """checks that the multiprocess card parser matches the serial parser"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf'),
+            os.path.join(MODEL_PATH, 'aero', 'bah_plane', 'bah_plane.bdf'),
+        ]
+        for bdf_filename in bdf_filenames:
+            fem1 = read_bdf(bdf_filename, xref=False, log=log)
+            fem2 = read_bdf(bdf_filename, xref=False, log=log, nprocs=2)
+            assert fem1.card_count == fem2.card_count, bdf_filename
+            assert fem1.reject_count == fem2.reject_count, bdf_filename
+            assert list(fem1.nodes) == list(fem2.nodes), bdf_filename
+            assert list(fem1.elements) == list(fem2.elements), bdf_filename
+
+            bdf_file1 = StringIO()
+            bdf_file2 = StringIO()
+            fem1.write_bdf(bdf_file1, close=False)
+            fem2.write_bdf(bdf_file2, close=False)
+            assert bdf_file1.getvalue() == bdf_file2.getvalue(), bdf_filename
+
+        duplicates_filename = os.path.join(PKG_PATH, 'bdf', 'test', 'unit', 'duplicates.bdf')
+        with self.assertRaises(DuplicateIDsError):
+            read_bdf(duplicates_filename, xref=False, log=log, nprocs=2)
+
 def compare_mass_cg_inertia(fem1, reference_point=None, sym_axis=None):
     mass1, cg1, I1 = fem1.mass_properties(reference_point=reference_point, sym_axis=sym_axis)
     #mass1, cg1, I1 = fem1.mass_properties_no_xref(reference_point=reference_point, sym_axis=sym_axis)
@@ -0,0 +1,87 @@
+"""
+Measures the peak memory usage of ``read_bdf(..., use_mmap=True)``
+
+Usage:
+  benchmark_mmap.py [BDF_FILENAME] [--ngrid N] [--storage STORAGE]
+
+Options:
+  --ngrid N            the grid size of the generated CQUAD4 deck (N x N)
+                       used if BDF_FILENAME isn't given  [default: 300]
+  --storage STORAGE    the storage of the nodes/elements (dict, columnar)
+                       [default: dict]
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+import tracemalloc
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.test.benchmark_nprocs import write_plate_deck
+
+
+def get_peak_memory(bdf_filename, use_mmap, storage='dict'):
+    """
+    Reads the deck and gets the memory usage from tracemalloc
+
+    Returns
+    -------
+    model : BDF()
+        the model
+    peak : int
+        the peak memory usage (bytes)
+    final : int
+        the memory usage after the deck is read (bytes), which is mostly
+        the card objects
+
+    """
+    model = BDF(debug=None, storage=storage)
+    tracemalloc.start()
+    try:
+        model.read_bdf(bdf_filename, xref=False, validate=False, use_mmap=use_mmap)
+        final, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return model, peak, final
+
+
+def run_benchmark(bdf_filename, storage='dict'):
+    """
+    Reads the deck with and without use_mmap
+
+    The reader memory is the memory that's freed after the deck is read
+    (peak - final), which is the part that use_mmap reduces.
+    """
+    peaks = []
+    readers = []
+    for use_mmap in [False, True]:
+        time0 = time.time()
+        model, peak, final = get_peak_memory(bdf_filename, use_mmap, storage=storage)
+        dt = time.time() - time0
+        peaks.append(peak)
+        readers.append(peak - final)
+        ncards = sum(model.card_count.values())
+        print('use_mmap=%-5s ncards=%-9i time=%8.3f sec  peak=%8.1f MB (%.2f)  '
+              'reader=%8.1f MB (%.2f)' % (
+                  use_mmap, ncards, dt, peak / 1e6, peak / peaks[0],
+                  readers[-1] / 1e6, readers[-1] / readers[0]))
+    return peaks, readers
+
+
+def main(argv=None):  # pragma: no cover
+    """the interface for benchmark_mmap.py"""
+    from docopt import docopt
+    data = docopt(__doc__, argv=argv)
+    storage = data['--storage']
+    bdf_filename = data['BDF_FILENAME']
+    if bdf_filename is None:
+        bdf_filename = 'benchmark_mmap.bdf'
+        write_plate_deck(bdf_filename, int(data['--ngrid']))
+        run_benchmark(bdf_filename, storage=storage)
+        os.remove(bdf_filename)
+    else:
+        run_benchmark(bdf_filename, storage=storage)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv[1:])
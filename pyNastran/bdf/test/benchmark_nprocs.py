@@ -0,0 +1,72 @@
+"""
+Measures the wall-clock scaling of ``read_bdf(..., nprocs=n)``
+
+Usage:
+  benchmark_nprocs.py [BDF_FILENAME] [--nprocs N] [--ngrid N]
+
+Options:
+  --nprocs N   the max number of processes to test  [default: 4]
+  --ngrid N    the grid size of the generated CQUAD4 deck (N x N)
+               used if BDF_FILENAME isn't given  [default: 300]
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+
+from pyNastran.bdf.bdf import read_bdf
+
+
+def write_plate_deck(bdf_filename, ngrid):
+    """writes an (ngrid x ngrid) CQUAD4 plate"""
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write('CEND\nBEGIN BULK\n')
+        bdf_file.write('PSHELL,1,1,0.1\nMAT1,1,3.0e7,,0.3\n')
+        nid = 1
+        for j in range(ngrid):
+            for i in range(ngrid):
+                bdf_file.write('GRID,%i,,%s,%s,0.\n' % (nid, float(i), float(j)))
+                nid += 1
+        eid = 1
+        for j in range(ngrid - 1):
+            for i in range(ngrid - 1):
+                n1 = j * ngrid + i + 1
+                n2 = n1 + 1
+                n3 = n2 + ngrid
+                n4 = n1 + ngrid
+                bdf_file.write('CQUAD4,%i,1,%i,%i,%i,%i\n' % (eid, n1, n2, n3, n4))
+                eid += 1
+        bdf_file.write('ENDDATA\n')
+
+
+def run_benchmark(bdf_filename, nprocs_max):
+    """reads the deck with 1 to nprocs_max processes"""
+    times = []
+    for nprocs in range(1, nprocs_max + 1):
+        time0 = time.time()
+        model = read_bdf(bdf_filename, xref=False, validate=False, debug=None, nprocs=nprocs)
+        dt = time.time() - time0
+        times.append(dt)
+        ncards = sum(model.card_count.values())
+        print('nprocs=%-2i ncards=%-9i time=%8.3f sec  speedup=%.2f' % (
+            nprocs, ncards, dt, times[0] / dt))
+    return times
+
+
+def main(argv=None):  # pragma: no cover
+    """the interface for benchmark_nprocs.py"""
+    from docopt import docopt
+    data = docopt(__doc__, argv=argv)
+    nprocs_max = int(data['--nprocs'])
+    bdf_filename = data['BDF_FILENAME']
+    if bdf_filename is None:
+        bdf_filename = 'benchmark_nprocs.bdf'
+        write_plate_deck(bdf_filename, int(data['--ngrid']))
+        run_benchmark(bdf_filename, nprocs_max)
+        os.remove(bdf_filename)
+    else:
+        run_benchmark(bdf_filename, nprocs_max)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv[1:])
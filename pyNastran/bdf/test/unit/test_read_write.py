@@ -1,5 +1,7 @@
 from __future__ import unicode_literals, print_function
 import os
+import shutil
+import tempfile
 from codecs import open
 import unittest
 from six import PY2, StringIO
@@ -54,6 +56,108 @@ class TestReadWrite(unittest.TestCase):
         #bdf_name = os.path.join(TEST_PATH, 'include_dir', 'include.inc')
         model2.read_bdf(bdf_name, xref=False, punch=True)
 
+    def test_read_mmap(self):
+        """Tests use_mmap=True gives the same model as the standard reader"""
+        bdf_filenames = [
+            (os.path.join(TEST_PATH, 'test_include.bdf'), False),
+            (os.path.join(TEST_PATH, 'include_dir', 'include_alt.inc'), True),
+            (os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf'), False),
+        ]
+        for bdf_filename, punch in bdf_filenames:
+            model = BDF(log=log, debug=False)
+            model.read_bdf(bdf_filename, xref=False, punch=punch)
+
+            model2 = BDF(log=log, debug=False)
+            model2.read_bdf(bdf_filename, xref=False, punch=punch, use_mmap=True)
+            self.assertEqual(model.card_count, model2.card_count)
+            self.assertEqual(model.case_control_lines, model2.case_control_lines)
+            self.assertEqual(model.executive_control_lines, model2.executive_control_lines)
+            self.assertEqual(list(model.nodes), list(model2.nodes))
+
+            bdf_file = StringIO()
+            bdf_file2 = StringIO()
+            model.write_bdf(bdf_file, close=False)
+            model2.write_bdf(bdf_file2, close=False)
+            self.assertEqual(bdf_file.getvalue(), bdf_file2.getvalue())
+
+    def test_read_mmap_blocks(self):
+        """Tests use_mmap=True adds the cards a block at a time"""
+        import pyNastran.bdf.bdf as bdf_module
+        ncards_block = bdf_module.NCARDS_BLOCK
+        dirname = tempfile.mkdtemp()
+        try:
+            # the replicated cards (=, =1) are split across the blocks
+            bdf_module.NCARDS_BLOCK = 3
+
+            # the BAROR is applied to the CBAR before it like the standard reader
+            bdf_filename = os.path.join(dirname, 'baror.bdf')
+            with open(bdf_filename, 'w') as bdf_file:
+                bdf_file.write(
+                    'CEND\nBEGIN BULK\n'
+                    'GRID,1,,0.,0.,0.\n'
+                    'GRID,2,,1.,0.,0.\n'
+                    'CBAR,10,,1,2\n'
+                    '=,*1,=,*1,*1\n'
+                    'BAROR,,3,,,0.,1.,0.\n'
+                    'PBAR,3,4,1.\n'
+                    'MAT1,4,3.0e7,,0.3\n'
+                    'ENDDATA\n')
+            model2 = BDF(log=log, debug=False)
+            model2.read_bdf(bdf_filename, xref=False, use_mmap=True)
+            self.assertEqual(model2.elements[11].pid, 3)
+
+            bdf_filenames = [
+                bdf_filename,
+                os.path.join(MODEL_PATH, 'superelements', 'superelement.bdf'),
+                os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf'),
+            ]
+            for bdf_filename in bdf_filenames:
+                model = BDF(log=log, debug=False)
+                model.read_bdf(bdf_filename, xref=False)
+
+                model2 = BDF(log=log, debug=False)
+                model2.read_bdf(bdf_filename, xref=False, use_mmap=True)
+                self.assertEqual(model.card_count, model2.card_count)
+                self.assertEqual(sorted(model.nodes), sorted(model2.nodes))
+
+                bdf_file = StringIO()
+                bdf_file2 = StringIO()
+                model.write_bdf(bdf_file, close=False)
+                model2.write_bdf(bdf_file2, close=False)
+                self.assertEqual(bdf_file.getvalue(), bdf_file2.getvalue())
+        finally:
+            bdf_module.NCARDS_BLOCK = ncards_block
+            shutil.rmtree(dirname)
+
+    def test_read_mmap_memory(self):
+        """Tests use_mmap=True cuts the memory of the reader by more than half"""
+        try:
+            import tracemalloc
+        except ImportError:  # pragma: no cover
+            return
+        import pyNastran.bdf.bdf as bdf_module
+        from pyNastran.bdf.test.benchmark_mmap import get_peak_memory
+        from pyNastran.bdf.test.benchmark_nprocs import write_plate_deck
+        ncards_block = bdf_module.NCARDS_BLOCK
+        dirname = tempfile.mkdtemp()
+        try:
+            # the deck is much larger than a block
+            bdf_module.NCARDS_BLOCK = 100
+            bdf_filename = os.path.join(dirname, 'plate.bdf')
+            write_plate_deck(bdf_filename, 60)
+
+            model, peak, final = get_peak_memory(bdf_filename, False)
+            model2, peak2, final2 = get_peak_memory(bdf_filename, True)
+            self.assertEqual(model.card_count, model2.card_count)
+
+            # the card objects are the same size, so the memory that's freed
+            # after the deck is read (the lines and cards_list) is compared
+            self.assertLess(peak2, peak)
+            self.assertLess(peak2 - final2, 0.5 * (peak - final))
+        finally:
+            bdf_module.NCARDS_BLOCK = ncards_block
+            shutil.rmtree(dirname)
+
     def test_read_include_dir_1(self):
         """Tests various read methods using various include files"""
         # fails correctly
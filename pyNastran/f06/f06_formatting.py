@@ -1,7 +1,26 @@
+import re
+from itertools import chain, repeat
 import numpy as np
 #from numpy import angle, float32
 from pyNastran.utils import object_attributes
 
+#: the float kinds of F06Format, which match write_floats_10e/12e/13e
+#: kind -> (printf format, the values that are written as ' 0.0')
+F06_FLOAT_KINDS = {
+    '10e' : ('%10.3E', (' 0.000E+00', '-0.000E+00')),
+    '12e' : ('%12.5E', (' 0.00000E+00', '-0.00000E+00')),
+    '13e' : ('%13.6E', (' 0.000000E+00', '-0.000000E+00')),
+}
+
+#: {13e}, {13e:<13}, {12e:>12}, ...
+_FLOAT_TOKEN = re.compile(r'\{(1[023]e)(?::([<>])(\d+))?\}')
+
+#: the number of values that are rendered at once by F06Format.write
+F06_CHUNK_SIZE = 2 ** 17
+
+#: the buffer size of the F06 that's written by F06Writer.write_f06
+F06_BUFFER_SIZE = 2 ** 20
+
 
 def write_float_12e(val):
     """writes a Nastran formatted 12.5 float"""
@@ -107,6 +126,157 @@ def write_floats_8p1e(vals):
             vals2.append('%8.1E' % val)
     return vals2
 
+class F06Format(object):
+    """
+    A precompiled format that writes a block of F06 lines in a single
+    ``%`` operation instead of formatting one value at a time.
+
+    The lines are standard printf formats, but the floats that are written
+    with ``write_floats_13e`` (and friends) use a float token:
+
+      - '{13e}'      : '%s' % write_floats_13e([value])[0]
+      - '{13e:<13}'  : '%-13s' % write_floats_13e([value])[0]
+      - '{12e:>12}'  : '%12s' % write_floats_12e([value])[0]
+      - '{13e:>18}'  : '%18s' % write_floats_13e([value])[0]
+
+    A left justified float can't be wider than the float (e.g., '{13e:<14}').
+
+    A float token is written with the printf float format (e.g., '%13.6E')
+    and the zeros are replaced with ' 0.0' at the end, so the output is
+    identical to formatting each value.
+
+    .. code-block:: python
+
+       >>> fmt = F06Format(['%14i %6s     {13e:<13}  {13e}\n'])
+       >>> fmt.write(f06_file, node_ids, 'G', t1, t2)
+
+    """
+    def __init__(self, line_formats):
+        """
+        Parameters
+        ----------
+        line_formats : List[str]
+            the lines of a record (e.g., the 2 fibers of a plate), which
+            are written for each record
+        """
+        if isinstance(line_formats, str):
+            line_formats = [line_formats]
+        record_format = ''.join(line_formats)
+        self.record_format, self.replacements = _compile_f06_format(record_format)
+        self.nargs = len(re.findall('%[^%]', self.record_format.replace('%%', '')))
+
+    def format(self, *columns):
+        """
+        Formats the records
+
+        Parameters
+        ----------
+        *columns : (nrecords, ) ndarray / List / str / int
+            the values of each placeholder; a scalar is used for every
+            record
+
+        Returns
+        -------
+        msg : str
+            the formatted lines
+        """
+        assert len(columns) == self.nargs, 'nargs=%s ncolumns=%s' % (self.nargs, len(columns))
+        nrecords = None
+        values = []
+        for column in columns:
+            if isinstance(column, np.ndarray):
+                column = column.tolist()
+            elif not isinstance(column, list):
+                values.append(repeat(column))
+                continue
+            nrecords = len(column)
+            values.append(column)
+        assert nrecords is not None, 'a column must be an array'
+        args = tuple(chain.from_iterable(zip(*values)))
+        msg = (self.record_format * nrecords) % args
+        for zero, zero_str in self.replacements:
+            msg = msg.replace(zero, zero_str)
+        return msg
+
+    def write(self, f06_file, *columns):
+        """
+        Writes the records in chunks of ``F06_CHUNK_SIZE`` values
+
+        Parameters
+        ----------
+        f06_file : file
+            the file to write to
+        *columns : (nrecords, ) ndarray / List / str / int
+            see ``format``
+        """
+        nrecords = max([len(column) for column in columns
+                        if isinstance(column, (np.ndarray, list))])
+        nchunk = max(1, F06_CHUNK_SIZE // max(1, self.nargs))
+        for i0 in range(0, nrecords, nchunk):
+            i1 = i0 + nchunk
+            chunk = [column[i0:i1] if isinstance(column, (np.ndarray, list)) else column
+                     for column in columns]
+            f06_file.write(self.format(*chunk))
+
+
+def _compile_f06_format(record_format):
+    """
+    Replaces the float tokens of an F06Format with printf floats
+
+    Returns
+    -------
+    record_format : str
+        the printf format
+    replacements : List[(zero, zero_str)]
+        the formatted zeros and the string they're replaced with; the
+        zeros at the end of a line are replaced first
+
+    """
+    eol_replacements = {}
+    replacements = {}
+    for match in _FLOAT_TOKEN.finditer(record_format):
+        kind, justify, width = match.groups()
+        float_format, zeros = F06_FLOAT_KINDS[kind]
+        nchars = len(zeros[0])
+        zero_str = ' 0.0'
+        if justify == '<':
+            if int(width) > nchars:
+                raise ValueError('the width of %r must be <= %s' % (match.group(), nchars))
+            zero_str = zero_str.ljust(int(width))
+        elif justify == '>':
+            # a wider field is padded on the left by the printf format
+            zero_str = zero_str.rjust(min(int(width), nchars))
+
+        is_eol = record_format[match.end():match.end() + 1] == '\n'
+        replacementsi = eol_replacements if is_eol else replacements
+        if replacementsi.get(kind, zero_str) != zero_str:
+            raise ValueError('the %s zeros of %r are ambiguous' % (kind, record_format))
+        replacementsi[kind] = zero_str
+
+    replacement_list = []
+    for kind, zero_str in sorted(eol_replacements.items()):
+        if replacements.get(kind) == zero_str:
+            continue
+        for zero in F06_FLOAT_KINDS[kind][1]:
+            replacement_list.append((zero + '\n', zero_str + '\n'))
+    for kind, zero_str in sorted(replacements.items()):
+        for zero in F06_FLOAT_KINDS[kind][1]:
+            replacement_list.append((zero, zero_str))
+
+    record_format = _FLOAT_TOKEN.sub(_get_printf_float_format, record_format)
+    return record_format, replacement_list
+
+
+def _get_printf_float_format(match):
+    """gets the printf format of a float token (e.g., '{13e:>18}' -> '%18.6E')"""
+    kind, justify, width = match.groups()
+    float_format = F06_FLOAT_KINDS[kind][0]
+    if justify == '>':
+        nchars, precision = float_format[1:].split('.')
+        return '%%%i.%s' % (max(int(width), int(nchars)), precision)
+    return float_format
+
+
 def _eigenvalue_header(obj, header, itime, ntimes, dt):
     if obj.nonlinear_factor not in (None, np.nan):
         name = obj.data_code['name']
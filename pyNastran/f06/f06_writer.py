@@ -17,6 +17,7 @@ from six import string_types
 import pyNastran
 from pyNastran.op2.op2_interface.op2_f06_common import OP2_F06_Common
 from pyNastran.op2.op2_interface.result_set import ResultSet
+from pyNastran.f06.f06_formatting import F06_BUFFER_SIZE
 
 def make_stamp(title, today=None, build=None):
     if title is None:
@@ -232,6 +233,10 @@ class F06Writer(OP2_F06_Common):
                 self._results.add('constraint_forces')
             elif 'force' in result.lower(): # could use more validation...
                 self._results.add('element_forces')
+            elif ('thermalload' in result.lower().replace('_', '') and
+                  result != 'thermal_load_vectors'):
+                # the OEF thermal loads
+                self._results.add('element_forces')
             # thermalLoad_VU_3D, thermalLoad_1D, conv_thermal_load, thermalLoad_2D_3D
             self._results.add(result)
 
@@ -403,7 +408,8 @@ class F06Writer(OP2_F06_Common):
             #print("matrix_filename =", matrix_filename)
             #mat = open(matrix_filename, 'wb')
 
-            f06 = open(f06_outname, 'w')
+            # the result blocks are large, so buffer them on the way to disk
+            f06 = open(f06_outname, 'w', buffering=F06_BUFFER_SIZE)
             self._write_summary(f06)
         elif hasattr(f06_outname, 'read') and hasattr(f06_outname, 'write'):
             #f06 = f06_outname
@@ -1,10 +1,12 @@
 from __future__ import absolute_import
 
 import unittest
+from six import StringIO
+import numpy as np
 from pyNastran.f06.f06_formatting import (
     write_floats_8p4f, write_floats_8p1e,
-    write_floats_10e, write_floats_12e,
-    write_imag_floats_13e)
+    write_floats_10e, write_floats_12e, write_floats_13e,
+    write_imag_floats_13e, F06Format)
 from pyNastran.f06.f06_writer import (
     make_end, sorted_bulk_data_header, make_f06_header, make_stamp)
 
@@ -167,6 +169,48 @@ class TestF06Formatting(unittest.TestCase):
                          msg='\nimag %s+%sj:\nactual  =%r len(actual)=%i\nexpected=%r len(expected)=%i' % (
             val.real, val.imag, actual_imag, len(actual_imag), actual_imag, len(expected_imag)))
 
+    def test_f06_format(self):
+        """tests the block formatter is identical to write_floats_13e/12e"""
+        nids = np.arange(1, 9)
+        values = np.array([0., -0., 1., -1.5, 1e-30, -1e-200, 1e120, 123456.789],
+                          dtype='float64')
+
+        fmt = F06Format('%8i %4s {13e:>18} {13e:>13} {13e}\n')
+        expected = ''
+        for nid, value in zip(nids, values):
+            sval = write_floats_13e([value])[0]
+            expected += '%8i %4s %18s %13s %s\n' % (nid, 'G', sval, sval, sval)
+        self.assertEqual(fmt.format(nids, 'G', values, values, values), expected)
+
+        fmt = F06Format('%8i {13e:<13} {13e:<13}\n')
+        expected = ''
+        for nid, value in zip(nids, values):
+            sval = write_floats_13e([value])[0]
+            expected += '%8i %-13s %-13s\n' % (nid, sval, sval)
+        self.assertEqual(fmt.format(nids, values, values), expected)
+
+        # a record may span multiple lines
+        fmt = F06Format(['%8i {12e:>12}\n', '         {12e:>12}\n'])
+        expected = ''
+        for nid, value in zip(nids, values):
+            sval = write_floats_12e([value])[0]
+            expected += '%8i %12s\n         %12s\n' % (nid, sval, sval)
+        self.assertEqual(fmt.format(nids, values, values), expected)
+
+        f06_file = StringIO()
+        fmt.write(f06_file, nids, values, values)
+        self.assertEqual(f06_file.getvalue(), expected)
+
+    def test_f06_format_errors(self):
+        """tests the float tokens that can't be written exactly"""
+        # a left justified float can't be padded beyond the float
+        with self.assertRaises(ValueError):
+            F06Format('{13e:<14}\n')
+
+        # a zero can't be written as ' 0.0' and ' 0.0         ' in one record
+        with self.assertRaises(ValueError):
+            F06Format('{13e:<13} {13e} {13e}\n')
+
     def test_make_end(self):
         """miscellaneous F06 tester"""
         make_end(end_flag=True, options=None)
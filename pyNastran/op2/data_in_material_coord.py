@@ -1,6 +1,8 @@
 """
 Defines:
  - data_in_material_coord(bdf, op2, in_place=False)
+ - get_material_angles(bdf)
+ - get_ply_angles(bdf, element_layer)
 
 """
 from __future__ import print_function
@@ -11,6 +13,9 @@ from numpy import cos, sin, cross
 from numpy.linalg import norm  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.bdf_interface.coord_arrays import (
+    CoordArrays, get_xyz_in_coord_vectorized)
+from pyNastran.bdf.cards.properties.shell import CompositeShellProperty
 
 force_vectors = ['cquad4_force', 'cquad8_force', 'cquadr_force',
                  'ctria3_force', 'ctria6_force', 'ctriar_force']
@@ -18,6 +23,22 @@ stress_vectors = ['cquad4_stress', 'cquad8_stress', 'cquadr_stress',
                   'ctria3_stress', 'ctria6_stress', 'ctriar_stress']
 strain_vectors = ['cquad4_strain', 'cquad8_strain', 'cquadr_strain',
                   'ctria3_strain', 'ctria6_strain', 'ctriar_strain']
+composite_stress_vectors = [
+    'cquad4_composite_stress', 'cquad8_composite_stress', 'cquadr_composite_stress',
+    'ctria3_composite_stress', 'ctria6_composite_stress', 'ctriar_composite_stress']
+composite_strain_vectors = [
+    'cquad4_composite_strain', 'cquad8_composite_strain', 'cquadr_composite_strain',
+    'ctria3_composite_strain', 'ctria6_composite_strain', 'ctriar_composite_strain']
+
+#: the shell element types and the number of corner nodes
+SHELL_NCORNERS = {
+    'CQUAD4' : 4, 'CQUAD8' : 4, 'CQUADR' : 4,
+    'CTRIA3' : 3, 'CTRIA6' : 3, 'CTRIAR' : 3,
+}
+
+#: the maximum number of values of a result that are transformed at once,
+#: which limits the size of the temporary arrays
+CHUNK_SIZE = 2 ** 22
 
 
 def transf_Mohr(Sxx, Syy, Sxy, thetarad):
@@ -35,18 +56,25 @@ def transf_Mohr(Sxx, Syy, Sxy, thetarad):
     Sxx_theta, Syy_theta, Sxy_theta : np.ndarray
         Transformed stresses.
 
+    Notes
+    -----
+    The rotation of the Mohr's circle by 2*theta is written in terms of
+    cos(2*theta) and sin(2*theta), so it's linear in the stresses and
+    complex stresses are transformed directly.
+
     """
     Sxx = np.asarray(Sxx)
     Syy = np.asarray(Syy)
     Sxy = np.asarray(Sxy)
     thetarad = np.asarray(thetarad)
     Scenter = (Sxx + Syy)/2.
-    R = np.sqrt((Sxx - Scenter)**2 + Sxy**2)
-    thetarad_Mohr = np.arctan2(-Sxy, Sxx - Scenter) + 2*thetarad
-    cos_Mohr = cos(thetarad_Mohr)
-    Sxx_theta = Scenter + R*cos_Mohr
-    Syy_theta = Scenter - R*cos_Mohr
-    Sxy_theta = -R*sin(thetarad_Mohr)
+    Sdiff = Sxx - Scenter
+    cos2 = cos(2*thetarad)
+    sin2 = sin(2*thetarad)
+    Srot = Sdiff*cos2 + Sxy*sin2
+    Sxx_theta = Scenter + Srot
+    Syy_theta = Scenter - Srot
+    Sxy_theta = Sxy*cos2 - Sdiff*sin2
     return Sxx_theta, Syy_theta, Sxy_theta
 
 
@@ -130,7 +158,7 @@ def angle2vec(v1, v2):
 
     """
     denom = norm(v1, axis=1) * norm(v2, axis=1)
-    return np.arccos((v1 * v2).sum(axis=1) / denom)
+    return np.arccos(np.clip((v1 * v2).sum(axis=1) / denom, -1., 1.))
 
 
 def calc_imat(normals, csysi):
@@ -147,11 +175,267 @@ def calc_imat(normals, csysi):
     is not a unit vector.
     """
     jmat = cross(normals, csysi) # k x i
-    jmat /= norm(jmat)
+    jmat /= norm(jmat, axis=1)[:, np.newaxis]
     imat = cross(jmat, normals)
     return imat
 
 
+def get_material_angles(bdf):
+    """
+    Gets the angle from the element x-axis to the material x-axis of the
+    CQUAD4/CQUAD8/CQUADR/CTRIA3/CTRIA6/CTRIAR elements
+
+    The node positions, normals, and MCID axes of all the elements are
+    found at once; the BDF doesn't need to be cross-referenced unless
+    it has a coordinate system that isn't a CORD1x/CORD2x (e.g., CORD3G).
+
+    Parameters
+    ----------
+    bdf : :class:`.BDF` object
+        the model
+
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    thetarad : (nelements, ) float ndarray
+        the material angle of each element in radians
+
+    """
+    eids = []
+    ncorners = []
+    nids = []
+    thetadeg = []
+    mcids = []
+    for eid, elem in bdf.elements.items():
+        ncorner = SHELL_NCORNERS.get(elem.type)
+        if ncorner is None:
+            continue
+        nodes = elem.node_ids[:ncorner]
+        if ncorner == 3:
+            nodes = nodes + [nodes[0]]
+        eids.append(eid)
+        ncorners.append(ncorner)
+        nids.append(nodes)
+
+        theta_mcid = getattr(elem, 'theta_mcid', None)
+        if isinstance(theta_mcid, integer_types):
+            thetadeg.append(0.)
+            mcids.append(theta_mcid)
+        else:
+            thetadeg.append(0. if theta_mcid is None else theta_mcid)
+            mcids.append(-1)
+
+    eids = np.array(eids, dtype='int64')
+    thetarad = np.deg2rad(np.array(thetadeg, dtype='float64'))
+    if len(eids) == 0:
+        return eids, thetarad
+
+    ncorners = np.array(ncorners)
+    nids = np.array(nids, dtype='int64')
+    mcids = np.array(mcids, dtype='int64')
+
+    unique_nids, inids = np.unique(nids, return_inverse=True)
+    xyz_cid0 = _get_xyz_cid0(bdf, unique_nids)
+    corner = xyz_cid0[inids.reshape(nids.shape), :]
+    g1 = corner[:, 0, :]
+    g2 = corner[:, 1, :]
+    g3 = corner[:, 2, :]
+    g4 = corner[:, 3, :]
+    is_quad = ncorners == 4
+
+    # elems with MCID
+    imcid = np.where(mcids >= 0)[0]
+    if len(imcid):
+        normals = np.where(
+            is_quad[imcid, np.newaxis],
+            cross(g1[imcid] - g3[imcid], g2[imcid] - g4[imcid]),
+            cross(g1[imcid] - g2[imcid], g1[imcid] - g3[imcid]))
+        normals /= norm(normals, axis=1)[:, np.newaxis]
+        csysi = _get_coord_i(bdf, mcids[imcid])
+        imat = calc_imat(normals, csysi)
+        g21 = g2[imcid] - g1[imcid]
+        thetarad[imcid] = angle2vec(g21, imat)
+        # getting sign of THETA
+        check_normal = cross(g21, imat)
+        thetarad[imcid] *= np.sign((check_normal * normals).sum(axis=1))
+
+    #NOTE the quad angles are measured from the bisector of the diagonals
+    iquad = np.where(is_quad)[0]
+    if len(iquad):
+        g1 = g1[iquad]
+        g2 = g2[iquad]
+        betarad = angle2vec(g3[iquad] - g1, g2 - g1)
+        gammarad = angle2vec(g4[iquad] - g2, g1 - g2)
+        alpharad = (betarad + gammarad) / 2.
+        thetarad[iquad] += alpharad - betarad
+
+    isort = np.argsort(eids)
+    return eids[isort], thetarad[isort]
+
+
+def _get_xyz_cid0(bdf, nids):
+    """gets the global positions of a set of nodes"""
+    try:
+        return get_xyz_in_coord_vectorized(bdf, nids, cid=0)
+    except (KeyError, NotImplementedError):
+        # CORD3G, GRIDB
+        return np.array([bdf.nodes[nid].get_position() for nid in nids.tolist()])
+
+
+def _get_coord_i(bdf, cids):
+    """gets the global i axis of a set of coordinate systems"""
+    try:
+        coord_arrays = CoordArrays.from_model(bdf)
+        return coord_arrays.betas[coord_arrays.get_index(cids), 0, :]
+    except (KeyError, NotImplementedError):
+        return np.array([bdf.coords[cid].i for cid in cids.tolist()])
+
+
+def get_ply_angles(bdf, element_layer):
+    """
+    Gets the ply angles of the rows of a composite result
+
+    Parameters
+    ----------
+    bdf : :class:`.BDF` object
+        the model
+    element_layer : (nrows, 2) int ndarray
+        the element id and layer (1-based ply index) of each row
+
+    Returns
+    -------
+    thetarad : (nrows, ) float ndarray
+        the angle from the material x-axis to the fiber direction of each
+        row in radians; 0.0 for elements/layers that aren't found
+
+    """
+    eids = element_layer[:, 0]
+    layers = element_layer[:, 1]
+    thetadeg = np.zeros(len(eids), dtype='float64')
+    ueids, ieids = np.unique(eids, return_inverse=True)
+
+    # group the elements by property, so each PCOMP is only evaluated once
+    pid_eids = {}
+    for i, eid in enumerate(ueids.tolist()):
+        elem = bdf.elements.get(eid)
+        pid = getattr(elem, 'pid', None)
+        if pid is not None:
+            pid_eids.setdefault(pid, []).append(i)
+
+    for pid, ielems in pid_eids.items():
+        prop = bdf.properties.get(pid)
+        if not isinstance(prop, CompositeShellProperty):
+            continue
+        thetas = np.asarray(prop.get_thetas(), dtype='float64')
+        is_elem = np.zeros(len(ueids), dtype='bool')
+        is_elem[ielems] = True
+        irows = np.where(is_elem[ieids] & (layers >= 1) & (layers <= len(thetas)))[0]
+        thetadeg[irows] = thetas[layers[irows] - 1]
+    return np.deg2rad(thetadeg)
+
+
+def _get_row_angles(eids, thetarad, veceids):
+    """
+    Gets the material angles of the rows of a result
+
+    #NOTE assuming thetarad=0 for elements that exist in the op2 but
+    #     not in the supplied bdf file
+    """
+    vecthetarad = np.zeros(len(veceids), dtype='float64')
+    if len(eids) == 0:
+        return vecthetarad
+    ieids = np.searchsorted(eids, veceids)
+    ieids[ieids == len(eids)] = 0
+    exists = eids[ieids] == veceids
+    vecthetarad[exists] = thetarad[ieids[exists]]
+    return vecthetarad
+
+
+def _get_writeable_data(vector):
+    """
+    Gets the data of a result that will be modified in place; a read-only
+    memory-mapped result (``OP2.use_mmap``) is copied first
+    """
+    if not vector.data.flags.writeable:
+        vector.data = vector.data.copy()
+    return vector.data
+
+
+def _get_time_chunks(data):
+    """gets the time slices that are transformed at once"""
+    ntimes = data.shape[0]
+    nvalues = max(1, data[0].size)
+    ntimes_chunk = max(1, CHUNK_SIZE // nvalues)
+    return [slice(itime, itime + ntimes_chunk)
+            for itime in range(0, ntimes, ntimes_chunk)]
+
+
+def _transform_plane(data, irows, vecthetarad, icols, shear_factor=1.,
+                     iangle=None, itransverse=None):
+    """
+    Rotates a result from the element to the material coordinate system in
+    place for all the time steps
+
+    Parameters
+    ----------
+    data : (ntimes, nrows, ncols) float/complex ndarray
+        the result data
+    irows : slice / (n, ) int ndarray
+        the rows of data to transform
+    vecthetarad : (n, ) float ndarray
+        the angle of each row in radians
+    icols : (int, int, int)
+        the xx, yy, and xy columns
+    shear_factor : float; default=1.
+        the xy column is divided by shear_factor before the transform and
+        multiplied by it afterwards (2.0 for engineering shear strain)
+    iangle : int; default=None
+        the principal angle column, which is recalculated for real data
+    itransverse : (int, int); default=None
+        the xz and yz (transverse shear) columns
+
+    """
+    ixx, iyy, ixy = icols
+    cos1 = cos(vecthetarad)
+    sin1 = sin(vecthetarad)
+    cos2 = cos1 * cos1 - sin1 * sin1
+    sin2 = 2. * sin1 * cos1
+    is_real = not np.iscomplexobj(data)
+    for itime in _get_time_chunks(data):
+        block = data[itime, irows, :]
+        Sxx = block[:, :, ixx]
+        Syy = block[:, :, iyy]
+        Sxy = block[:, :, ixy] / shear_factor
+        Scenter = (Sxx + Syy) / 2.
+        Sdiff = Sxx - Scenter
+        Srot = Sdiff * cos2 + Sxy * sin2
+        Sxy_theta = Sxy * cos2 - Sdiff * sin2
+        block[:, :, ixx] = Scenter + Srot
+        block[:, :, iyy] = Scenter - Srot
+        block[:, :, ixy] = Sxy_theta * shear_factor
+        if iangle is not None and is_real:
+            block[:, :, iangle] = thetadeg_to_principal(
+                block[:, :, ixx], block[:, :, iyy], Sxy_theta)
+
+        if itransverse is not None:
+            ixz, iyz = itransverse
+            Qx = block[:, :, ixz].copy()
+            Qy = block[:, :, iyz]
+            block[:, :, ixz] = cos1 * Qx + sin1 * Qy
+            block[:, :, iyz] = -sin1 * Qx + cos1 * Qy
+        if not isinstance(irows, slice):
+            data[itime, irows, :] = block
+
+
+def _get_checked_rows(veceids):
+    """gets the rows with a non-zero element id"""
+    check = veceids != 0
+    if check.all():
+        return slice(None), veceids
+    return np.where(check)[0], veceids[check]
+
+
 def data_in_material_coord(bdf, op2, in_place=False):
     """Convert OP2 2D element outputs to material coordinates
 
@@ -164,6 +448,9 @@ def data_in_material_coord(bdf, op2, in_place=False):
     similarly to most of the post-processing tools (Patran, Femap, HyperView,
     etc). It handles both 2D elements with MCID or THETA.
 
+    The composite stresses/strains are output in the fiber direction of each
+    ply, so they're rotated by the PCOMP/PCOMPG ply angle.
+
     Parameters
     ----------
     bdf : :class:`.BDF` object
@@ -172,14 +459,16 @@ def data_in_material_coord(bdf, op2, in_place=False):
         A :class:`.OP2` object that corresponds to the 'bdf'.
     in_place : bool; default=False
         If true the original op2 object is modified, otherwise a new one
-        is created.
+        is created.  A result that is a read-only view of a memory map
+        (``OP2.use_mmap``) is copied; a writeable ``np.memmap`` is modified
+        in place.
 
     Returns
     -------
     op2_new : :class:`.OP2` object
         A :class:`.OP2` object with the abovementioned changes.
 
-    .. warning ::  doesn't handle composite stresses/strains/forces
+    .. warning ::  doesn't handle composite forces
     .. warning ::  doesn't handle solid stresses/strains/forces (e.g. MAT11)
     .. warning ::  zeros out data for CQUAD8s
 
@@ -189,259 +478,61 @@ def data_in_material_coord(bdf, op2, in_place=False):
     else:
         op2_new = copy.deepcopy(op2)
 
-    eids = np.array(list(bdf.elements.keys()))
-    elems = np.array(list(bdf.elements.values()))
-    mcid = np.array([is_mcid(e) for e in elems])
-    elemsmcid = elems[mcid]
-    elemstheta = elems[~mcid]
-
-    thetadeg = np.zeros(elems.shape)
-    thetadeg[~mcid] = np.array([check_theta(e) for e in elemstheta])
-    thetarad = np.deg2rad(thetadeg)
-
-    #NOTE separating quad types to get vectorizable "corner"
-    quad_types = ['CQUAD4', 'CQUAD8', 'CQUADR']
-    for quad_type in quad_types:
-        # elems with THETA
-        thisquad = np.array([quad_type in e.type for e in elemstheta])
-        if np.any(thisquad):
-            quadelems = elemstheta[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp = thetarad[~mcid]
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[~mcid] = tmp
-
-        # elems with MCID
-        thisquad = np.array([quad_type in e.type for e in elemsmcid])
-        if np.any(thisquad):
-            quadelems = elemsmcid[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            normals = np.array([e.Normal() for e in quadelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in quadelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thisquad] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thisquad] *= np.sign((check_normal * normals).sum(axis=1))
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[mcid] = tmp
-
-    tria_types = ['CTRIA3', 'CTRIA6', 'CTRIAR']
-    for tria_type in tria_types:
-        # elems with MCID
-        thistria = np.array([tria_type in e.type for e in elemsmcid])
-        if np.any(thistria):
-            triaelems = elemsmcid[thistria]
-            corner = np.array([e.get_node_positions() for e in triaelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            normals = np.array([e.Normal() for e in triaelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in triaelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thistria] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thistria] *= np.sign((check_normal * normals).sum(axis=1))
-            thetarad[mcid] = tmp
-
-    thetarad = dict([[eid, theta] for eid, theta in zip(eids, thetarad)])
+    eids, thetarad = get_material_angles(bdf)
 
     for vecname in force_vectors:
-        op2_vectors = getattr(op2, vecname)
         new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            if veceids.shape[0] == vector.data.shape[1] // 5:
-                steps = [5, 5, 5, 5, 5]
-            else: # assuming  always that veceids.shape[0] == vector.data.shape[1]
-                steps = [1]
-
-            for start, step in enumerate(steps):
-                slicei = slice(start, vector.data.shape[1], step)
-                # membrane terms
-                Sxx = vector.data[:, slicei, 0]
-                Syy = vector.data[:, slicei, 1]
-                Sxy = vector.data[:, slicei, 2]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 0].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 1].real = Syy_theta_real
-                    new_vector.data[:, slicei, 2].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 0].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 1].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 2].imag = Sxy_theta_imag
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 0] = Sxx_theta
-                    new_vector.data[:, slicei, 1] = Syy_theta
-                    new_vector.data[:, slicei, 2] = Sxy_theta
-
-                # bending terms
-                Sxx = vector.data[:, slicei, 3]
-                Syy = vector.data[:, slicei, 4]
-                Sxy = vector.data[:, slicei, 5]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 3].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 4].real = Syy_theta_real
-                    new_vector.data[:, slicei, 5].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 3].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 4].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 5].imag = Sxy_theta_imag
-
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 3] = Sxx_theta
-                    new_vector.data[:, slicei, 4] = Syy_theta
-                    new_vector.data[:, slicei, 5] = Sxy_theta
-
-                # transverse terms
-                Qx = vector.data[:, slicei, 6]
-                Qy = vector.data[:, slicei, 7]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Qx_new_real = cos(vecthetarad)*Qx.real + sin(vecthetarad)*Qy.real
-                    Qy_new_real = -sin(vecthetarad)*Qx.real + cos(vecthetarad)*Qy.real
-                    new_vector.data[:, slicei, 6].real = Qx_new_real
-                    new_vector.data[:, slicei, 7].real = Qy_new_real
-                    Qx_new_imag = cos(vecthetarad)*Qx.imag + sin(vecthetarad)*Qy.imag
-                    Qy_new_imag = -sin(vecthetarad)*Qx.imag + cos(vecthetarad)*Qy.imag
-                    new_vector.data[:, slicei, 6].imag = Qx_new_imag
-                    new_vector.data[:, slicei, 7].imag = Qy_new_imag
-                else:
-                    Qx_new = cos(vecthetarad)*Qx + sin(vecthetarad)*Qy
-                    Qy_new = -sin(vecthetarad)*Qx + cos(vecthetarad)*Qy
-                    new_vector.data[:, slicei, 6] = Qx_new
-                    new_vector.data[:, slicei, 7] = Qy_new
+        for subcase, new_vector in new_vectors.items():
+            veceids = get_eids_from_op2_vector(new_vector)
+            vecthetarad = _get_row_angles(eids, thetarad, veceids)
+            data = _get_writeable_data(new_vector)
+            if veceids.shape[0] == data.shape[1] // 5:
+                # the center and corner values of an element use the same angle
+                vecthetarad = np.repeat(vecthetarad, 5)
+
+            # membrane, bending, and transverse terms
+            _transform_plane(data, slice(None), vecthetarad, (0, 1, 2))
+            _transform_plane(data, slice(None), vecthetarad, (3, 4, 5),
+                             itransverse=(6, 7))
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
             if 'quad8' in vecname:
                 for j in [1, 2, 3, 4]:
-                    new_vector.data[:, j, :] = 0
-
-    for vecname in stress_vectors:
-        op2_vectors = getattr(op2, vecname)
-        new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane stresses
-            if vector.data.shape[2] > 3:
-                Sxx = vector.data[:, :, 1][:, check]
-                Syy = vector.data[:, :, 2][:, check]
-                Sxy = vector.data[:, :, 3][:, check]
-            else:
-                Sxx = vector.data[:, :, 0][:, check]
-                Syy = vector.data[:, :, 1][:, check]
-                Sxy = vector.data[:, :, 2][:, check]
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = Sxx_theta_real
-                tmp.imag = Sxx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = Syy_theta_real
-                tmp.imag = Syy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = Sxy_theta_real
-                tmp.imag = Sxy_theta_imag
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                new_vector.data[:, :, 1][:, check] = Sxx_theta
-                new_vector.data[:, :, 2][:, check] = Syy_theta
-                new_vector.data[:, :, 3][:, check] = Sxy_theta
-                thetadeg_new = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
-
-            #TODO implement transformation for corner nodes
-            #     for now we just zero the wrong values
-            if 'quad8' in vecname:
-                for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
-
-    for vecname in strain_vectors:
-        op2_vectors = getattr(op2, vecname)
-        new_vectors = getattr(op2_new, vecname)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane strains
-            if vector.data.shape[2] > 3:
-                exx = vector.data[:, :, 1][:, check]
-                eyy = vector.data[:, :, 2][:, check]
-                exy = vector.data[:, :, 3][:, check] / 2.
-            else:
-                exx = vector.data[:, :, 0][:, check]
-                eyy = vector.data[:, :, 1][:, check]
-                exy = vector.data[:, :, 2][:, check] / 2.
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                exx_theta_real, eyy_theta_real, exy_theta_real = transf_Mohr(exx.real, eyy.real, exy.real, vecthetarad)
-                exx_theta_imag, eyy_theta_imag, exy_theta_imag = transf_Mohr(exx.imag, eyy.imag, exy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = exx_theta_real
-                tmp.imag = exx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = eyy_theta_real
-                tmp.imag = eyy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = exy_theta_real * 2.
-                tmp.imag = exy_theta_imag * 2.
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                exx_theta, eyy_theta, exy_theta = transf_Mohr(exx, eyy, exy, vecthetarad)
-                thetadeg_new = thetadeg_to_principal(exx_theta, eyy_theta, exy_theta)
-                new_vector.data[:, :, 1][:, check] = exx_theta
-                new_vector.data[:, :, 2][:, check] = eyy_theta
-                new_vector.data[:, :, 3][:, check] = exy_theta * 2.
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
-
-            #TODO implement transformation for corner nodes
-            #     for now we just zero the wrong values
-            if 'quad8' in vecname:
-                for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
+                    data[:, j, :] = 0
+
+    for vecnames, shear_factor in [(stress_vectors, 1.), (strain_vectors, 2.)]:
+        for vecname in vecnames:
+            new_vectors = getattr(op2_new, vecname)
+            for subcase, new_vector in new_vectors.items():
+                irows, veceids = _get_checked_rows(get_eids_from_op2_vector(new_vector))
+                vecthetarad = _get_row_angles(eids, thetarad, veceids)
+                data = _get_writeable_data(new_vector)
+
+                # bottom and top in-plane stresses/strains
+                if data.shape[2] > 3:
+                    _transform_plane(data, irows, vecthetarad, (1, 2, 3),
+                                     shear_factor=shear_factor, iangle=4)
+                else:
+                    _transform_plane(data, irows, vecthetarad, (0, 1, 2),
+                                     shear_factor=shear_factor)
+
+                #TODO implement transformation for corner nodes
+                #     for now we just zero the wrong values
+                if 'quad8' in vecname:
+                    for i in [2, 3, 4, 5, 6, 7, 8, 9]:
+                        data[:, i, :] = 0
+
+    for vecnames, shear_factor in [(composite_stress_vectors, 1.),
+                                   (composite_strain_vectors, 2.)]:
+        for vecname in vecnames:
+            new_vectors = getattr(op2_new, vecname)
+            for subcase, new_vector in new_vectors.items():
+                # the fiber direction is the material x-axis rotated by the
+                # ply angle, so rotate back by the ply angle
+                vecthetarad = -get_ply_angles(bdf, new_vector.element_layer)
+                data = _get_writeable_data(new_vector)
+                _transform_plane(data, slice(None), vecthetarad, (0, 1, 2),
+                                 shear_factor=shear_factor, iangle=5,
+                                 itransverse=(3, 4))
     return op2_new
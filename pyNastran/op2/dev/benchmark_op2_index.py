@@ -0,0 +1,86 @@
+"""
+Compares the time to read a set of OP2s with and without the table of
+contents from the marker-only pre-scan (``OP2.use_index``).  With the
+index, the result objects are sized from the index, so the result data is
+only read by the second pass::
+
+    python -m pyNastran.op2.dev.benchmark_op2_index [folder]
+
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.op2_index import build_op2_index
+from pyNastran.utils.log import get_logger2
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+
+def benchmark_op2_index(op2_filenames, nrepeat=3):
+    """
+    Reads each OP2 with use_index=False/True and prints the best times
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the OP2s to read
+    nrepeat : int; default=3
+        the number of times each OP2 is read
+
+    Returns
+    -------
+    times : Dict[op2_filename] = (time_two_pass, time_index, time_prescan)
+        the best times of the OP2s that could be read
+
+    """
+    log = get_logger2(debug=None)
+    times = {}
+    print('%-60s %10s %10s %10s' % ('op2_filename', 'two-pass', 'index', 'prescan'))
+    for op2_filename in op2_filenames:
+        try:
+            time_two_pass = _get_read_time(op2_filename, False, nrepeat, log)
+            time_index = _get_read_time(op2_filename, True, nrepeat, log)
+        except Exception:
+            continue
+        t0 = time.time()
+        build_op2_index(op2_filename)
+        time_prescan = time.time() - t0
+        times[op2_filename] = (time_two_pass, time_index, time_prescan)
+        print('%-60s %10.4f %10.4f %10.4f' % (
+            os.path.relpath(op2_filename)[-60:], time_two_pass, time_index, time_prescan))
+
+    if times:
+        totals = [sum(timesi) for timesi in zip(*times.values())]
+        print('%-60s %10.4f %10.4f %10.4f' % tuple(['total'] + totals))
+    return times
+
+def _get_read_time(op2_filename, use_index, nrepeat, log):
+    """gets the best time to read an OP2"""
+    best_time = None
+    for unused_i in range(nrepeat):
+        model = OP2(debug=False, log=log)
+        model.use_index = use_index
+        t0 = time.time()
+        model.read_op2(op2_filename)
+        dt = time.time() - t0
+        if best_time is None or dt < best_time:
+            best_time = dt
+    return best_time
+
+def main():  # pragma: no cover
+    """runs the benchmark on the OP2s in a folder (default=models)"""
+    dirname = sys.argv[1] if len(sys.argv) > 1 else MODEL_PATH
+    op2_filenames = []
+    for root, unused_dirs, filenames in os.walk(dirname):
+        op2_filenames += [os.path.join(root, filename) for filename in filenames
+                          if filename.endswith('.op2')]
+    benchmark_op2_index(sorted(op2_filenames))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
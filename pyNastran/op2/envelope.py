@@ -0,0 +1,374 @@
+"""
+Defines the max/min envelope of a result over the subcases and time steps:
+ - envelope(results, headers=None)
+ - envelope_op2(op2_filename, result_name, headers=None, subcases=None,
+                eids=None, nids=None, log=None, debug=False, mode=None,
+                encoding=None)
+ - Envelope(headers=None)
+   - add_result(obj, itime=0)
+   - get_margins(allowables)
+   - export_to_csv(csv_filename)
+   - export_to_hdf5_filename(hdf5_filename)
+   - export_to_hdf5_file(hdf5_file)
+
+An envelope tracks the max, min, and abs_max (the max or min, whichever
+has the larger magnitude; see ``vector_utils.abs_max_min``) of each row
+(e.g., the element/node of a plate) and column (e.g., von_mises) of a
+real result, as well as the subcase, time index, and time/mode/frequency
+where the peak occurs.
+
+The time steps are reduced in chunks, so the data of a result (which may
+be a memory map or an HDF5 dataset) isn't loaded all at once.  With
+``envelope_op2``, the OP2 is read one time step at a time
+(see ``iter_op2_results``), so only the envelope is held in memory.
+
+"""
+from __future__ import print_function
+from six import string_types
+import numpy as np
+
+from pyNastran.op2.op2 import iter_op2_results
+from pyNastran.op2.vector_utils import abs_max_min_axis
+
+#: the peak values that are tracked
+ENVELOPE_KINDS = ['max', 'min', 'abs_max']
+
+#: the id arrays of the rows of a result and the names of the columns
+ENVELOPE_ROW_IDS = [
+    ('element_node', ['element_id', 'node_id']),
+    ('element_layer', ['element_id', 'layer']),
+    ('node_gridtype', ['node_id', 'grid_type']),
+    ('element', ['element_id']),
+    ('node', ['node_id']),
+]
+
+#: the maximum number of values of a result that are reduced at once,
+#: which limits the size of the temporary arrays
+CHUNK_SIZE = 2 ** 22
+
+
+def envelope(results, headers=None):
+    """
+    Gets the max/min envelope of a result over the subcases and time steps
+
+    Parameters
+    ----------
+    results : Dict[key] = ScalarObject / List[ScalarObject] /
+              Iterable[(isubcase, itime, ScalarObject)]
+        the results (e.g., model.cquad4_stress, the blocks of
+        ``iter_op2_results``), which must have the same rows
+    headers : List[str]; default=None -> all
+        the columns to envelope (e.g., ['omax', 'omin', 'von_mises'])
+
+    Returns
+    -------
+    env : Envelope
+        the envelope
+
+    .. code-block:: python
+
+       >>> model = read_op2(op2_filename)
+       >>> env = envelope(model.cquad4_stress, headers=['von_mises'])
+       >>> von_mises = env.values['max'][:, 0]
+       >>> isubcase = env.subcases['max'][:, 0]
+    """
+    if isinstance(results, dict):
+        results = results.values()
+
+    env = Envelope(headers=headers)
+    for result in results:
+        if isinstance(result, tuple):
+            unused_isubcase, itime, obj = result
+            env.add_result(obj, itime=itime)
+        else:
+            env.add_result(result)
+    return env
+
+
+def envelope_op2(op2_filename, result_name, headers=None, subcases=None,
+                 eids=None, nids=None, log=None, debug=False, mode=None, encoding=None):
+    """
+    Gets the max/min envelope of a result of an OP2, which is read one
+    time step at a time (see ``iter_op2_results``)
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    result_name : str
+        the name of the result (e.g., 'displacements', 'cquad4_stress')
+    headers : List[str]; default=None -> all
+        the columns to envelope (e.g., ['omax', 'omin', 'von_mises'])
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    eids / nids : List[int, ...] / int ndarray; default=None->all
+        the elements/nodes to read the results of
+    log : Log()
+        a logging object to write debug messages to
+        (.. seealso:: import logging)
+    debug : bool; default=False
+        enables the debug log and sets the debug in the logger
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, optistruct}
+    encoding : str
+        the unicode encoding (default=None; system default)
+
+    Returns
+    -------
+    env : Envelope
+        the envelope
+
+    .. code-block:: python
+
+       >>> env = envelope_op2(op2_filename, 'chexa_stress', headers=['von_mises'])
+       >>> env.export_to_csv('chexa_von_mises.csv')
+    """
+    results = iter_op2_results(op2_filename, result_name, subcases=subcases,
+                               eids=eids, nids=nids, log=log, debug=debug,
+                               mode=mode, encoding=encoding)
+    return envelope(results, headers=headers)
+
+
+class Envelope(object):
+    """
+    The max, min, and abs_max of a real result over the subcases and time
+    steps.  The peaks are stored by kind ('max', 'min', 'abs_max'):
+
+      - values[kind] : (nrows, ncolumns) float ndarray
+          the peak values
+      - subcases[kind] : (nrows, ncolumns) int ndarray
+          the subcase id of the peak
+      - itimes[kind] : (nrows, ncolumns) int ndarray
+          the index of the time step/mode/frequency of the peak in the
+          subcase
+      - times[kind] : (nrows, ncolumns) float ndarray
+          the time/mode/frequency of the peak (nan for a static result)
+
+    The first subcase/time step is used when a peak occurs more than once.
+    """
+    def __init__(self, headers=None):
+        """
+        Parameters
+        ----------
+        headers : List[str]; default=None -> all
+            the columns to envelope (e.g., ['omax', 'omin', 'von_mises'])
+        """
+        self.headers = headers
+        self.class_name = None
+        self.row_ids = None
+        self.row_id_names = None
+        self._icolumns = None
+        self.values = {}
+        self.subcases = {}
+        self.itimes = {}
+        self.times = {}
+
+        #: the number of time steps that were enveloped
+        self.ntimes = 0
+
+    @property
+    def nrows(self):
+        """the number of rows (e.g., the element/nodes)"""
+        return 0 if self.row_ids is None else self.row_ids.shape[0]
+
+    def add_result(self, obj, itime=0):
+        """
+        Adds the time steps of a result to the envelope
+
+        Parameters
+        ----------
+        obj : ScalarObject
+            a real result (e.g., model.cquad4_stress[1])
+        itime : int; default=0
+            the index of the first time step of obj in the subcase
+            (e.g., the itime of ``iter_op2_results``)
+        """
+        data = obj.data
+        if data.dtype.kind == 'c':
+            raise NotImplementedError('%s is complex' % obj.class_name)
+        row_ids, row_id_names = _get_row_ids(obj)
+        ntimes, nrows = data.shape[:2]
+        if self.row_ids is None:
+            self._build(obj, row_ids, row_id_names)
+        elif not np.array_equal(row_ids, self.row_ids):
+            raise ValueError('the ids of %s (subcase=%s) are different than the ids '
+                             'of the envelope' % (obj.class_name, obj.isubcase))
+        icolumns = self._icolumns
+
+        # the times of a static result are nan
+        times = np.full(ntimes, np.nan, dtype='float64')
+        ntimesi = min(ntimes, len(obj._times))
+        times[:ntimesi] = obj._times[:ntimesi]
+
+        nchunk = max(1, CHUNK_SIZE // max(1, nrows * len(icolumns)))
+        for i0 in range(0, ntimes, nchunk):
+            i1 = min(i0 + nchunk, ntimes)
+            block = np.asarray(data[i0:i1, :, :])[:, :, icolumns]
+            self._add_peak('max', block.max(axis=0), block.argmax(axis=0) + i0,
+                           obj.isubcase, itime, times)
+            self._add_peak('min', block.min(axis=0), block.argmin(axis=0) + i0,
+                           obj.isubcase, itime, times)
+            abs_values, iabs = abs_max_min_axis(block, axis=0)
+            self._add_peak('abs_max', abs_values, iabs + i0,
+                           obj.isubcase, itime, times)
+        self.ntimes += ntimes
+
+    def _build(self, obj, row_ids, row_id_names):
+        """sizes the envelope with the first result"""
+        result_headers = obj.get_headers()
+        if self.headers is None:
+            self.headers = list(result_headers)
+        elif isinstance(self.headers, string_types):
+            self.headers = [self.headers]
+        missing = [header for header in self.headers if header not in result_headers]
+        if missing:
+            raise KeyError('%s are not in the headers of %s; headers=%s' % (
+                missing, obj.class_name, result_headers))
+        self._icolumns = [result_headers.index(header) for header in self.headers]
+        self.class_name = obj.class_name
+        self.row_ids = row_ids
+        self.row_id_names = row_id_names
+
+        shape = (len(row_ids), len(self.headers))
+        self.values = {
+            'max' : np.full(shape, -np.inf, dtype='float64'),
+            'min' : np.full(shape, np.inf, dtype='float64'),
+            'abs_max' : np.full(shape, np.nan, dtype='float64'),
+        }
+        for kind in ENVELOPE_KINDS:
+            self.subcases[kind] = np.zeros(shape, dtype='int32')
+            self.itimes[kind] = np.full(shape, -1, dtype='int32')
+            self.times[kind] = np.full(shape, np.nan, dtype='float64')
+
+    def _add_peak(self, kind, values, itimes, isubcase, itime0, times):
+        """updates the peaks of a kind with the peaks of a block of time steps"""
+        old_values = self.values[kind]
+        if kind == 'max':
+            is_peak = values > old_values
+        elif kind == 'min':
+            is_peak = values < old_values
+        else:
+            is_peak = np.isnan(old_values) | (np.abs(values) > np.abs(old_values))
+        old_values[is_peak] = values[is_peak]
+        self.subcases[kind][is_peak] = isubcase
+        self.itimes[kind][is_peak] = itimes[is_peak] + itime0
+        self.times[kind][is_peak] = times[itimes[is_peak]]
+
+    def get_margins(self, allowables, kind='abs_max'):
+        """
+        Gets the margin of safety (allowable / abs(value) - 1) of the peaks
+
+        Parameters
+        ----------
+        allowables : float / (ncolumns, ) float ndarray / (nrows, ncolumns) float ndarray
+            the allowable of each column/row
+        kind : str; default='abs_max'
+            the peaks to use {max, min, abs_max}
+
+        Returns
+        -------
+        margins : (nrows, ncolumns) float ndarray
+            the margins; inf if the value is 0.0
+        """
+        values = np.abs(self.values[kind])
+        with np.errstate(divide='ignore'):
+            margins = np.asarray(allowables, dtype='float64') / values - 1.
+        return margins
+
+    def export_to_csv(self, csv_filename):
+        """
+        Writes the envelope to a CSV file with a row for each row of the
+        result and the value, subcase, itime, and time of each column and
+        kind (e.g., von_mises_max, von_mises_max_subcase, ...)
+        """
+        names = list(self.row_id_names)
+        columns = list(self.row_ids.T)
+        formats = ['%i'] * len(names)
+        for iheader, header in enumerate(self.headers):
+            for kind in ENVELOPE_KINDS:
+                name = '%s_%s' % (header, kind)
+                names += [name, name + '_subcase', name + '_itime', name + '_time']
+                columns += [self.values[kind][:, iheader], self.subcases[kind][:, iheader],
+                            self.itimes[kind][:, iheader], self.times[kind][:, iheader]]
+                formats += ['%.8e', '%i', '%i', '%.8e']
+
+        line_format = ','.join(formats) + '\n'
+        with open(csv_filename, 'w') as csv_file:
+            csv_file.write(','.join(names) + '\n')
+            for i0 in range(0, self.nrows, 10000):
+                i1 = i0 + 10000
+                rows = zip(*[column[i0:i1].tolist() for column in columns])
+                csv_file.write(''.join(line_format % row for row in rows))
+
+    def export_to_hdf5_filename(self, hdf5_filename):
+        """
+        Writes the envelope to an HDF5 file
+
+        .. seealso:: export_to_hdf5_file
+        """
+        import h5py
+        with h5py.File(hdf5_filename, 'w') as hdf5_file:
+            self.export_to_hdf5_file(hdf5_file)
+
+    def export_to_hdf5_file(self, hdf5_file):
+        """
+        Writes the envelope to an HDF5 file/group
+
+        Parameters
+        ----------
+        hdf5_file : H5File()
+            an h5py file/group object
+
+        The group has the row ids (e.g., ``element_node``), the ``headers``,
+        and a group for each kind ('max', 'min', 'abs_max') with the
+        ``values``, ``subcases``, ``itimes``, and ``times`` datasets.
+        """
+        hdf5_file.attrs['class_name'] = self.class_name
+        hdf5_file.attrs['ntimes'] = self.ntimes
+        hdf5_file.create_dataset('row_ids', data=self.row_ids)
+        hdf5_file.create_dataset('row_id_names', data=[name.encode('ascii')
+                                                       for name in self.row_id_names])
+        hdf5_file.create_dataset('headers', data=[header.encode('ascii')
+                                                  for header in self.headers])
+        for kind in ENVELOPE_KINDS:
+            group = hdf5_file.create_group(kind)
+            group.create_dataset('values', data=self.values[kind])
+            group.create_dataset('subcases', data=self.subcases[kind])
+            group.create_dataset('itimes', data=self.itimes[kind])
+            group.create_dataset('times', data=self.times[kind])
+
+    def __repr__(self):
+        msg = 'Envelope(class_name=%r, nrows=%s, headers=%s, ntimes=%s)' % (
+            self.class_name, self.nrows, self.headers, self.ntimes)
+        return msg
+
+
+def _get_row_ids(obj):
+    """
+    Gets the ids of the rows of a result
+
+    Returns
+    -------
+    row_ids : (nrows, nids) int ndarray
+        the ids (e.g., element_node)
+    row_id_names : List[str]
+        the names of the ids (e.g., ['element_id', 'node_id'])
+    """
+    for attr, names in ENVELOPE_ROW_IDS:
+        row_ids = getattr(obj, attr, None)
+        if isinstance(row_ids, np.ndarray):
+            if attr == 'element' and row_ids.ndim == 2:
+                if row_ids.shape == obj.data.shape[:2]:
+                    # the (ntimes, nelements) element of the strain energy
+                    if not np.array_equal(row_ids, np.broadcast_to(row_ids[0], row_ids.shape)):
+                        break
+                    row_ids = row_ids[0]
+                else:
+                    # the (nelements, 2) element of the random plates
+                    row_ids = row_ids[:, 0]
+            if row_ids.ndim == 1:
+                row_ids = row_ids.reshape(len(row_ids), 1)
+            return row_ids, names
+    raise NotImplementedError('%s does not have element/node ids that are '
+                              'constant over the time steps' % obj.class_name)
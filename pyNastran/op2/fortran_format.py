@@ -8,9 +8,12 @@ import sys
 from copy import deepcopy
 from struct import unpack
 
+import numpy as np
+
 from pyNastran.utils import object_attributes
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.errors import FortranMarkerError, SortCodeError
+from pyNastran.op2.op2_interface.op2_codes import SORT2_TABLES
 
 # this is still a requirement, but disabling it so readthedocs works
 if sys.version_info < (2, 7, 7):
@@ -20,6 +23,16 @@ if sys.version_info < (2, 7, 7):
     raise ImportError('Upgrade your Python to >= 2.7.7; version=(%s.%s.%s)' % (
         IMAJOR, MINOR1, MINOR2))
 
+#: the SORT1 result tables with an element id in the first word of each row
+ELEMENT_FILTER_PREFIXES = (b'OES', b'OSTR', b'OEF')
+
+#: the SORT1 result tables with a node id in the first word of each row
+#: (e.g., OUGV1, ROUGV1, TOUGV1, OQGV1, OPNL1, RADEFFM, RAQCONS, RAGEATC)
+NODE_FILTER_PREFIXES = (
+    b'OUG', b'BOUG', b'ROUG', b'TOUG', b'OUP', b'OCRUG', b'OVG', b'OAG',
+    b'OQG', b'OQP', b'OQMG', b'OPG', b'OPNL', b'OCRPG', b'OGPF',
+    b'RADCONS', b'RADEFFM', b'RADEATC', b'RAQ', b'RAG')
+
 class FortranFormat(object):
     """defines basic methods for reading Fortran formatted data files"""
     def __init__(self):
@@ -37,6 +50,11 @@ class FortranFormat(object):
         self.is_all_subcases = True
         self.valid_subcases = []
 
+        #: the sorted element/node ids to read (None -> all);
+        #: see ``set_element_ids`` and ``set_node_ids``
+        self.valid_eids = None
+        self.valid_nids = None
+
     def show(self, n, types='ifs', endian=None):  # pragma: no cover
         """Shows binary data"""
         return self.op2_reader.show(n, types=types, endian=endian)
@@ -83,12 +101,18 @@ class FortranFormat(object):
         op2_reader = self.op2_reader
         datai = b''
         n = 0
+        valid_ids = self._get_table4_valid_ids()
         if self.read_mode == 2:
             self.ntotal = 0
 
-            data, ndata = op2_reader._read_record_ndata()
-            n = table4_parser(data, ndata)
-            assert isinstance(n, integer_types), self.table_name
+            data, ndata = op2_reader._read_mapped_record_ndata()
+            if valid_ids is not None:
+                data, ndata = self._filter_table4_rows(data, ndata, valid_ids)
+            if ndata or valid_ids is None:
+                n = table4_parser(data, ndata)
+                assert isinstance(n, integer_types), self.table_name
+            else:
+                self.obj = None
 
             self._reset_vector_counter()
 
@@ -97,25 +121,98 @@ class FortranFormat(object):
 
             #n = op2_reader._skip_record()
             #n = table4_parser(datai, 300000)
-            if self.table_name in [b'R1TABRG', b'ONRGY1']:
+            if self.table_name in [b'R1TABRG', b'ONRGY1'] or valid_ids is not None:
                 data, ndata = op2_reader._read_record_ndata()
             else:
                 data, ndata = op2_reader._skip_record_ndata()
-            n = table4_parser(data, ndata)
-            if not isinstance(n, integer_types):
-                msg = 'n is not an integer; table_name=%s n=%s table4_parser=%s' % (
-                    self.table_name, n, table4_parser)
-                raise TypeError(msg)
-
-            #op2_reader._goto(n)
-            #n = op2_reader._skip_record()
-
-            self._init_vector_counter(record_len)
+            if valid_ids is not None:
+                # the arrays are sized from the filtered rows
+                data, ndata = self._filter_table4_rows(data, ndata, valid_ids)
+                record_len = ndata
+
+            if ndata or valid_ids is None:
+                n = table4_parser(data, ndata)
+                if not isinstance(n, integer_types):
+                    msg = 'n is not an integer; table_name=%s n=%s table4_parser=%s' % (
+                        self.table_name, n, table4_parser)
+                    raise TypeError(msg)
+
+                #op2_reader._goto(n)
+                #n = op2_reader._skip_record()
+
+                self._init_vector_counter(record_len)
+            else:
+                self.obj = None
         else:
             raise RuntimeError(self.read_mode)
         self._cleanup_data_members()
         return n
 
+    def _get_table4_valid_ids(self):
+        """
+        Gets the element/node ids that filter the rows of the current
+        table 4 (None -> all)
+        """
+        if self.valid_eids is None and self.valid_nids is None:
+            return None
+        # SORT2 tables have the time/frequency in the first word of each row
+        if (getattr(self, 'sort_method', None) != 1 or
+                self.table_name.endswith(b'2') or self.table_name in SORT2_TABLES):
+            return None
+
+        table_name = self.table_name
+        if self.valid_eids is not None and table_name.startswith(ELEMENT_FILTER_PREFIXES):
+            return self.valid_eids
+        if self.valid_nids is not None and table_name.startswith(NODE_FILTER_PREFIXES):
+            return self.valid_nids
+        return None
+
+    def _filter_table4_rows(self, data, ndata, valid_ids):
+        """
+        Removes the rows of a SORT1 table 4 record that don't belong to
+        the valid element/node ids
+
+        Parameters
+        ----------
+        data : bytes / memoryview
+            the table 4 record
+        ndata : int
+            the length of the record
+        valid_ids : (n, ) int ndarray
+            the sorted element/node ids to keep
+
+        Returns
+        -------
+        data : bytes / memoryview
+            the record with only the valid rows
+        ndata : int
+            the length of the filtered record
+
+        """
+        nbytes_row = self.num_wide * 4
+        if ndata == 0 or self.num_wide <= 0 or ndata % nbytes_row:
+            # the rows have a variable length
+            return data, ndata
+
+        nrows = ndata // nbytes_row
+        ids = np.frombuffer(data, dtype=self.idtype, count=ndata // 4).reshape(
+            nrows, self.num_wide)[:, 0] // 10
+        if ids.min() <= 0:
+            # continuation rows (e.g., the plies of a failure index table)
+            # belong to the previous element
+            irow = np.where(ids > 0, np.arange(nrows), 0)
+            ids = ids[np.maximum.accumulate(irow)]
+
+        i = np.searchsorted(valid_ids, ids)
+        i[i == len(valid_ids)] = 0
+        is_valid = valid_ids[i] == ids
+        if is_valid.all():
+            return data, ndata
+
+        rows = np.frombuffer(data, dtype='uint8', count=ndata).reshape(
+            nrows, nbytes_row)[is_valid]
+        return rows.tobytes(), rows.size
+
     def _reset_vector_counter(self):
         """
         if reading the data
@@ -5,7 +5,13 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=None,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None, nprocesses=1,
+            eids=None, nids=None)
+
+ - iter_op2_results(op2_filename, result_name, subcases=None, eids=None, nids=None,
+                    log=None, debug=False, mode=None, encoding=None)
+
+ - read_op2_inventory(op2_filename, log=None, debug=False, mode=None, encoding=None)
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
@@ -15,16 +21,23 @@ Defines the main OP2 class.  Defines:
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=None,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, nprocesses=1)
+   - get_result_lazy(op2_filename, table_name, isubcase=None, element_type=None,
+                     itime=None, combine=True, encoding=None)
+   - iter_result(op2_filename, result_name, encoding=None)
+   - get_op2_inventory(op2_filename, encoding=None)
    - set_mode(mode)
-   - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
-   - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
+   - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False, cid=0)
+   - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None,
+                                 cid=0)
 
 """
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
 import sys
+import copy
+from itertools import groupby
 from six import PY2, string_types
 from six.moves.cPickle import load, dump, dumps
 
@@ -42,7 +55,7 @@ from pyNastran.op2.errors import SortCodeError, DeviceCodeError, FortranMarkerEr
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
 from pyNastran.op2.op2_interface.transforms import (
-    transform_displacement_to_global, transform_gpforce_to_globali)
+    get_node_transforms, apply_node_transforms, apply_gpforce_transforms)
 from pyNastran.utils import check_path
 
 if PY2:
@@ -52,7 +65,8 @@ if PY2:
 def read_op2(op2_filename=None, combine=True, subcases=None,
              exclude_results=None, include_results=None,
              log=None, debug=True, debug_file=None, build_dataframe=None,
-             skip_undefined_matrices=True, mode=None, encoding=None):
+             skip_undefined_matrices=True, mode=None, encoding=None, nprocesses=1,
+             eids=None, nids=None):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -66,6 +80,9 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
                 will be used for superelements regardless of the option
     subcases : List[int, ...] / int; default=None->all subcases
         list of [subcase1_ID,subcase2_ID]
+    eids / nids : List[int, ...] / int ndarray; default=None->all
+        the elements/nodes to read the results of
+        (see ``OP2.set_element_ids`` and ``OP2.set_node_ids``)
     exclude_results / include_results : List[str] / str; default=None
         a list of result types to exclude/include
         one of these must be None
@@ -85,6 +102,9 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    nprocesses : int; default=1
+        the number of processes used to read the result tables of the
+        subcases in parallel (see ``OP2.read_op2``)
 
     Returns
     -------
@@ -99,12 +119,14 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
     """
     model = OP2(log=log, debug=debug, debug_file=debug_file, mode=mode)
     model.set_subcases(subcases)
+    model.set_element_ids(eids)
+    model.set_node_ids(nids)
     model.include_exclude_results(exclude_results=exclude_results,
                                   include_results=include_results)
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, nprocesses=nprocesses)
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
     ## doesn't support F06 writer
@@ -117,6 +139,97 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
     return model
 
 
+def iter_op2_results(op2_filename, result_name, subcases=None, eids=None, nids=None,
+                     log=None, debug=False, mode=None, encoding=None):
+    """
+    Reads a result of an OP2 one subtable (e.g., a time step of a
+    transient) at a time, so only a single time step is in memory.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    result_name : str
+        the name of the result (e.g., 'displacements', 'cquad4_stress')
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    eids / nids : List[int, ...] / int ndarray; default=None->all
+        the elements/nodes to read the results of
+        (see ``OP2.set_element_ids`` and ``OP2.set_node_ids``)
+    log : Log()
+        a logging object to write debug messages to
+        (.. seealso:: import logging)
+    debug : bool; default=False
+        enables the debug log and sets the debug in the logger
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, optistruct}
+    encoding : str
+        the unicode encoding (default=None; system default)
+
+    Yields
+    ------
+    isubcase : int
+        the subcase id
+    itime : int
+        the index of the time step/mode/frequency of a SORT1 table
+    obj : ScalarObject
+        the result object of the time step (e.g., obj.data is a
+        (1, nelements, nfields) array)
+
+    .. code-block:: python
+
+       >>> peak = 0.
+       >>> for isubcase, itime, stress in iter_op2_results(op2_filename, 'cquad4_stress'):
+       ...     peak = max(peak, stress.data[0, :, -1].max())
+
+    """
+    model = OP2(log=log, debug=debug, mode=mode)
+    model.set_subcases(subcases)
+    model.set_element_ids(eids)
+    model.set_node_ids(nids)
+    model.include_exclude_results(include_results=result_name)
+    return model.iter_result(op2_filename, result_name, encoding=encoding)
+
+
+def read_op2_inventory(op2_filename, log=None, debug=False, mode=None, encoding=None):
+    """
+    Lists the tables, subcases, element types, time steps, and the sizes
+    of the results of an OP2 without reading the results
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    log : Log()
+        a logging object to write debug messages to
+        (.. seealso:: import logging)
+    debug : bool; default=False
+        enables the debug log and sets the debug in the logger
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, optistruct}
+    encoding : str
+        the unicode encoding (default=None; system default)
+
+    Returns
+    -------
+    inventory : OP2Inventory
+        the tables and results of the OP2
+
+    .. code-block:: python
+
+       >>> inventory = read_op2_inventory(op2_filename)
+       >>> print(inventory.get_op2_stats(short=True))
+       >>> for key, result in inventory.results.items():
+       ...     print(result.table_name, result.isubcase, result.element_name,
+       ...           result.ntimes, result.nbytes)
+
+    """
+    model = OP2(log=log, debug=debug, mode=mode)
+    return model.get_op2_inventory(op2_filename, encoding=encoding)
+
+
 #class OP2(OP2_Scalar, OP2Writer):
 class OP2(OP2_Scalar):
     _properties = ['is_real', 'is_complex', 'is_random',
@@ -152,6 +265,9 @@ class OP2(OP2_Scalar):
         self.ask = False
         self.post = None
 
+        #: the cached transforms of the nodes (see ``_get_node_transforms``)
+        self._node_transforms = {}
+
     def object_attributes(self, mode='public', keys_to_skip=None):
         # type: (str, Optional[List[str]]) -> List[str]
         """
@@ -410,6 +526,7 @@ class OP2(OP2_Scalar):
         state = self.__dict__.copy()
         # Remove the unpicklable entries.
         del state['log']
+        state['_node_transforms'] = {}
         if hasattr(self, 'results') and hasattr(self._results, 'log'):
             del state['_results'].log
         #if hasattr(self, '_card_parser_b'):
@@ -550,7 +667,8 @@ class OP2(OP2_Scalar):
         #self.ask = ask
 
     def read_op2(self, op2_filename=None, combine=True,
-                 build_dataframe=None, skip_undefined_matrices=False, encoding=None):
+                 build_dataframe=None, skip_undefined_matrices=False, encoding=None,
+                 nprocesses=1):
         """
         Starts the OP2 file reading
 
@@ -571,6 +689,11 @@ class OP2(OP2_Scalar):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        nprocesses : int; default=1
+            the number of processes used to read the OUG/OES/OEF/OGPF/ONR
+            result tables; the tables of each subcase are read by a process
+            pool while this process reads the other tables, so a file with
+            many subcases is read faster
 
         """
         mode = self.mode
@@ -595,6 +718,10 @@ class OP2(OP2_Scalar):
         if hasattr(self, 'load_as_h5'):
             load_as_h5 = self.load_as_h5
 
+        pool = None
+        if nprocesses > 1 and op2_filename is not None and not load_as_h5:
+            pool, parallel_results = self._start_parallel_read(op2_filename, nprocesses, encoding)
+
         try:
             # get GUI object names, build objects, but don't read data
             OP2_Scalar.read_op2(self, op2_filename=op2_filename,
@@ -608,11 +735,20 @@ class OP2(OP2_Scalar):
             self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
             _create_hdf5_info(self.op2_reader.h5_file, self)
             OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+            if pool is not None:
+                self._merge_parallel_results(parallel_results.get())
         except FileNotFoundError:
+            if pool is not None:
+                pool.terminate()
             raise
         except:
+            if pool is not None:
+                pool.terminate()
             OP2_Scalar.close_op2(self, force=True)
             raise
+        if pool is not None:
+            pool.close()
+            pool.join()
         self._finalize()
         if build_dataframe:
             self.build_dataframe()
@@ -620,6 +756,385 @@ class OP2(OP2_Scalar):
         self.combine_results(combine=combine)
         self.log.debug('finished reading op2')
 
+    def _start_parallel_read(self, op2_filename, nprocesses, encoding):
+        """
+        Starts reading the result tables of the subcases with a process pool
+
+        Returns
+        -------
+        pool : multiprocessing.Pool / None
+            the process pool; None if there aren't multiple subcases
+        parallel_results : AsyncResult / None
+            the output of ``read_result_records`` for each subcase
+
+        """
+        from multiprocessing import Pool
+        from pyNastran.op2.op2_interface.op2_index import build_op2_index, get_op2_index
+        from pyNastran.op2.op2_interface.op2_parallel import (
+            get_parallel_tasks, read_result_records)
+        from pyNastran.op2.op2_interface.op2_scalar import RESULT_TABLES
+
+        if not self.use_index or self.debug_file is not None:
+            return None, None
+        if self.use_index_file:
+            index = get_op2_index(op2_filename, log=self.log)
+        else:
+            index = build_op2_index(op2_filename)
+
+        valid_subcases = None if self.is_all_subcases else self.valid_subcases
+        tasks, table_starts = get_parallel_tasks(
+            index, RESULT_TABLES, valid_subcases=valid_subcases)
+        if len(tasks) < 2:
+            return None, None
+
+        self.op2_reader.index = index
+        self.op2_reader.parallel_table_starts = table_starts
+        args = [(op2_filename, self.mode, encoding, self._results,
+                 self.valid_eids, self.valid_nids,
+                 index.get_table_index([table for table, unused_pairs in records]), records)
+                for records in tasks.values()]
+        self.log.debug('reading %i subcases with %i processes' % (len(tasks), nprocesses))
+        pool = Pool(min(nprocesses, len(tasks)))
+        parallel_results = pool.map_async(read_result_records, args, chunksize=1)
+        return pool, parallel_results
+
+    def _merge_parallel_results(self, parallel_results):
+        """
+        Adds the results that were read by the process pool to the result
+        dictionaries
+        """
+        for results, isubcase_name_map, result_names in parallel_results:
+            for result_name, key, obj in results:
+                # the static results are flagged with "nonlinear_factor in (None, np.nan)",
+                # which is an identity check, but the nan was copied by pickling
+                if _is_nan(getattr(obj, 'nonlinear_factor', None)):
+                    obj.nonlinear_factor = np.nan
+                    obj.data_code['nonlinear_factor'] = np.nan
+                storage = self.get_result(result_name)
+                if key in storage:
+                    raise RuntimeError('%s[%r] was read by multiple processes' % (
+                        result_name, key))
+                storage[key] = obj
+            for isubcase, subcase_name in isubcase_name_map.items():
+                if isubcase not in self.isubcase_name_map:
+                    self.isubcase_name_map[isubcase] = subcase_name
+            self.result_names.update(result_names)
+
+    def get_result_lazy(self, op2_filename, table_name, isubcase=None, element_type=None,
+                        itime=None, combine=True, encoding=None):
+        """
+        Reads the subtables of a result table that match the subcase,
+        element type, and time index by seeking to them.  The location of
+        the subtables is loaded from the .op2idx sidecar, which is written
+        the first time the OP2 is opened.  The other tables are not read.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2_filename
+        table_name : bytes / str
+            the name of the table (e.g., 'OUGV1', 'OES1X1')
+        isubcase : int; default=None -> all
+            the subcase id
+        element_type : int; default=None -> all
+            the element type (e.g., 33 for CQUAD4); 0 for nodal results
+        itime : int; default=None -> all
+            the index of the time step/mode/frequency of a SORT1 table;
+            the subtables of each (isubcase, element_type) are counted
+            separately
+        combine : bool; default=True
+            True : objects are isubcase based
+            False : objects are (isubcase, subtitle) based;
+                    will be used for superelements regardless of the option
+        encoding : str
+            the unicode encoding (default=None; system default)
+
+        Returns
+        -------
+        objs : List[ScalarObject]
+            the result objects that were read, which are also stored in
+            the result dictionaries (e.g., self.displacements)
+
+        .. note:: like read_op2, this may only be called once per OP2 object
+
+        """
+        from pyNastran.op2.op2_interface.op2_index import get_op2_index
+        if not isinstance(table_name, bytes):
+            table_name = table_name.encode('latin1')
+        index = get_op2_index(op2_filename, log=self.log)
+        records = index.get_result_records(
+            table_name, isubcase=isubcase, element_type=element_type, itime=itime)
+        if not records:
+            msg = 'table_name=%r isubcase=%s element_type=%s itime=%s was not found in %r' % (
+                table_name, isubcase, element_type, itime, op2_filename)
+            raise KeyError(msg)
+
+        objs = self._read_result_records(op2_filename, index, records, encoding=encoding)
+        self._finalize()
+        self.combine_results(combine=combine)
+        return objs
+
+    def _read_result_records(self, op2_filename, index, records, encoding=None):
+        """
+        Reads the selected subtables of the result tables
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2_filename
+        index : OP2Index
+            the table of contents of the OP2
+        records : List[(table, pairs)]
+            the tables and table 3/table 4 records to read
+            (see ``OP2Index.get_result_records``)
+        encoding : str
+            the unicode encoding (default=None; system default)
+
+        Returns
+        -------
+        objs : List[ScalarObject]
+            the result objects that were read
+
+        """
+        mode = self.mode
+        self._start_result_records(op2_filename, encoding)
+        try:
+            for read_mode in [1, 2]:
+                self._create_binary_debug()
+                objs = self._read_result_records_pass(index, records, read_mode, mode)
+        except:
+            OP2_Scalar.close_op2(self, force=True)
+            raise
+        OP2_Scalar.close_op2(self, force=True)
+        return objs
+
+    def iter_result(self, op2_filename, result_name, encoding=None):
+        """
+        Reads a result one subtable (e.g., a time step of a transient) at a
+        time.  The location of the subtables is found with the index (see
+        ``OP2.use_index_file``).  The other results are skipped.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2_filename
+        result_name : str
+            the name of the result (e.g., 'displacements', 'cquad4_stress'),
+            which should be the only included result
+            (see ``OP2.include_exclude_results``)
+        encoding : str
+            the unicode encoding (default=None; system default)
+
+        Yields
+        ------
+        isubcase : int
+            the subcase id
+        itime : int
+            the index of the time step/mode/frequency
+        obj : ScalarObject
+            the result object of the time step, which isn't stored in the
+            result dictionary (e.g., self.cquad4_stress)
+
+        .. note:: like read_op2, this may only be called once per OP2 object
+        .. note:: a SORT2 table has a subtable for each node/element, so
+                  all the time steps of a subcase are read at once and
+                  yielded one time step at a time
+
+        """
+        from pyNastran.op2.op2_interface.op2_index import build_op2_index, get_op2_index
+        if self.use_index_file:
+            index = get_op2_index(op2_filename, log=self.log)
+        else:
+            index = build_op2_index(op2_filename)
+
+        # self.mode is deleted by the modal tables (e.g., mode=1)
+        mode = self.mode
+        storage = self.get_result(result_name)
+
+        # some readers (e.g., ONR) don't skip the results that aren't
+        # included, so those are deleted after every subtable
+        storages = [self.get_result(name) for name in self.get_table_types()
+                    if name != 'params']
+        storages = [storagei for storagei in storages if isinstance(storagei, dict)]
+        # the number of time steps of each result (e.g., the subcase) that
+        # were read
+        counts = {}
+        self._start_result_records(op2_filename, encoding)
+        self._create_binary_debug()
+        try:
+            records = self._get_result_name_records(index, storage, storages, mode)
+            if not records:
+                raise KeyError('result_name=%r was not found in %r' % (
+                    result_name, op2_filename))
+
+            for table, pairs in records:
+                # the subtables of a time step (e.g., the CQUAD4, CTRIA3
+                # stress) are read together
+                for (isubcase, time), pairsi in groupby(pairs, key=_get_subtable_group):
+                    if not self.is_all_subcases and isubcase not in self.valid_subcases:
+                        continue
+
+                    self.obj = None
+                    records = [(table, list(pairsi))]
+                    for read_mode in [1, 2]:
+                        self._read_result_records_pass(index, records, read_mode, mode)
+                    objs = list(storage.items())
+                    _clear_storages(storages)
+                    self.obj = None
+                    for key, obj in objs:
+                        if hasattr(obj, 'finalize'):
+                            obj.finalize()
+                        if time is None:
+                            # SORT2
+                            objs_itime = [_get_time_slice(obj, itimei)
+                                          for itimei in range(obj.data.shape[0])]
+                        else:
+                            objs_itime = [obj]
+
+                        for obj_itime in objs_itime:
+                            itimei = counts.get(key, 0)
+                            counts[key] = itimei + 1
+                            yield obj_itime.isubcase, itimei, obj_itime
+        finally:
+            OP2_Scalar.close_op2(self, force=True)
+
+    def _get_result_name_records(self, index, storage, storages, mode):
+        """
+        Finds the subtables of the result tables that have a result by
+        reading the first subtable of each type (e.g., the CQUAD4 stress
+        in OES1X1)
+
+        Parameters
+        ----------
+        index : OP2Index
+            the table of contents of the OP2
+        storage : dict
+            the result dictionary (e.g., self.cquad4_stress)
+        storages : List[dict]
+            all the result dictionaries, which are cleared
+        mode : str
+            the version of Nastran (e.g., 'msc', 'nx')
+
+        Returns
+        -------
+        records : List[(table, pairs)]
+            the tables and table 3/table 4 records of the result
+            (see ``OP2Index.get_result_records``)
+
+        """
+        # the version of Nastran defines the table readers
+        self.read_mode = 1
+        self._setup_op2()
+        self.op2_reader.read_nastran_version(mode)
+        table_mapper = self._get_table_mapper()
+        is_result = {}
+        records = []
+
+        # the first subtable of a type may be in a subcase that's skipped
+        is_all_subcases = self.is_all_subcases
+        self.is_all_subcases = True
+        try:
+            for table, pairs in index.get_result_records(None):
+                if table.table_name not in table_mapper:
+                    continue
+                pairsi = []
+                for pair in pairs:
+                    subtable_type = _get_subtable_type(table.table_name, pair[0][3])
+                    if subtable_type not in is_result:
+                        self.obj = None
+                        for read_mode in [1, 2]:
+                            self._read_result_records_pass(index, [(table, [pair])],
+                                                           read_mode, mode)
+                        is_result[subtable_type] = len(storage) > 0
+                        _clear_storages(storages)
+                        self.obj = None
+                    if is_result[subtable_type]:
+                        pairsi.append(pair)
+                if pairsi:
+                    records.append((table, pairsi))
+        finally:
+            self.is_all_subcases = is_all_subcases
+        return records
+
+    def get_op2_inventory(self, op2_filename, encoding=None):
+        """
+        Gets the tables, subcases, element types, time steps, and the sizes
+        of the results of an OP2.  Only the markers and table 3 (header)
+        records are read (see ``OP2.use_index_file``), so no results are
+        read.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2_filename
+        encoding : str
+            the unicode encoding (default=None; system default)
+
+        Returns
+        -------
+        inventory : OP2Inventory
+            the tables and results of the OP2
+
+        """
+        from pyNastran.op2.op2_interface.op2_index import build_op2_index, get_op2_index
+        from pyNastran.op2.op2_interface.op2_inventory import get_op2_inventory
+        if self.use_index_file:
+            index = get_op2_index(op2_filename, log=self.log)
+        else:
+            index = build_op2_index(op2_filename)
+
+        # the version of Nastran defines the element names
+        self._start_result_records(op2_filename, encoding)
+        self.read_mode = 1
+        self._setup_op2()
+        try:
+            self.op2_reader.read_nastran_version(self.mode)
+        finally:
+            self.f.close()
+            self.f = None
+        return get_op2_inventory(index, element_mapper=self.element_mapper)
+
+    def _start_result_records(self, op2_filename, encoding):
+        """sets up the OP2 to read the result records that are found with the index"""
+        if encoding is None:
+            encoding = sys.getdefaultencoding()
+        self.encoding = encoding
+        self.is_vectorized = True
+        self._close_op2 = False
+
+        fname = os.path.splitext(op2_filename)[0]
+        self.op2_filename = op2_filename
+        self.bdf_filename = fname + '.bdf'
+        self.f06_filename = fname + '.f06'
+        self.h5_filename = fname + '.h5'
+        self.op2_reader.load_as_h5 = False
+
+    def _read_result_records_pass(self, index, records, read_mode, mode):
+        """
+        Reads the result records in the 1st (count) or 2nd (fill) pass
+        for the version of Nastran (e.g., 'msc', 'nx')
+
+        Returns
+        -------
+        objs : List[ScalarObject]
+            the result objects that were read (read_mode=2)
+
+        """
+        op2_reader = self.op2_reader
+        self.read_mode = read_mode
+        self._setup_op2()
+        op2_reader.read_nastran_version(mode)
+        op2_reader.index = index
+        objs = []
+        for table, pairs in records:
+            self.table_name = table.table_name
+            # the design cycle is in the key of the SOL 200 results
+            self._count = index.get_design_cycle(table)
+            for obj in op2_reader.read_results_table_records(table, pairs):
+                if not any(obj is obji for obji in objs):
+                    objs.append(obj)
+        return objs
+
     def create_objects_from_matrices(self):
         """
         creates the following objects:
@@ -731,7 +1246,7 @@ class OP2(OP2_Scalar):
         self.deprecated('load_hdf5', 'load_hdf5_filename', '1.2')
         return self.load_hdf5_filename(hdf5_filename, combine=True)
 
-    def load_hdf5_filename(self, hdf5_filename, combine=True):
+    def load_hdf5_filename(self, hdf5_filename, combine=True, lazy=False):
         """
         Loads an h5 file into an OP2 object
 
@@ -741,6 +1256,10 @@ class OP2(OP2_Scalar):
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            the ``data`` of the results are h5py.Datasets, which are read
+            when they're sliced (e.g., ``obj.data[itime, :, :]``); the file
+            is closed when the results are deleted
         """
         check_path(hdf5_filename, 'hdf5_filename')
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
@@ -749,8 +1268,12 @@ class OP2(OP2_Scalar):
 
         self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        if lazy:
+            h5_file = h5py.File(hdf5_filename, 'r')
+            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug, lazy=True)
+        else:
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
         self.combine_results(combine=combine)
 
     def load_hdf5_file(self, h5_file, combine=True):
@@ -778,16 +1301,36 @@ class OP2(OP2_Scalar):
         self.deprecated('export_to_hdf5', 'export_to_hdf5_filename', '1.2')
         return self.export_to_hdf5_filename(hdf5_filename)
 
-    def export_to_hdf5_filename(self, hdf5_filename):
+    def export_to_hdf5_filename(self, hdf5_filename, compression=None, compression_opts=None,
+                                float32=False, chunks=None, nthreads=1):
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the path to the an hdf5 file
+        compression : str; default=None
+            the compression of the results {None, gzip, lzf, blosc}
+            (blosc requires hdf5plugin)
+        compression_opts : int; default=None
+            the compression level (e.g., 0-9 for gzip)
+        float32 : bool; default=False
+            down-casts the float64/complex128 results to float32/complex64
+        chunks : bool; default=None -> True if compression is used
+            chunks the results along the (time, element/node) axes
+        nthreads : int; default=1
+            the number of threads used for the gzip compression, which
+            overlaps the export of the next result
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(
+            hdf5_filename, self, compression=compression, compression_opts=compression_opts,
+            float32=float32, chunks=chunks, nthreads=nthreads)
 
     def export_to_hdf5_file(self, hdf5_file, exporter=None):
         """
@@ -1092,7 +1635,8 @@ class OP2(OP2_Scalar):
                     self.log.info('  %s' % str(key))
         #self.log.info('subcase_key = %s' % self.subcase_key)
 
-    def transform_displacements_to_global(self, icd_transform, coords, xyz_cid0=None, debug=False):
+    def transform_displacements_to_global(self, icd_transform, coords, xyz_cid0=None, debug=False,
+                                          cid=0):
         """
         Transforms the ``data`` of displacement-like results into the
         global coordinate system for those nodes with different output
@@ -1100,6 +1644,10 @@ class OP2(OP2_Scalar):
         for nodes with their output in coordinate systems other than the
         global.
 
+        The transforms of the nodes are stacked into a (nnodes, 3, 3)
+        array, which is cached, and applied to all the time steps at
+        once (see ``get_node_transforms``).
+
         Used in combination with  ``BDF.get_displacement_index``
 
         Parameters
@@ -1118,6 +1666,9 @@ class OP2(OP2_Scalar):
             Use this if CD is not rectangular
         debug : bool; default=False
             developer debug
+        cid : int; default=0
+            the coordinate system to transform to
+            xyz_cid0 is required if cid != 0
 
         .. warning:: only works if all nodes are included...
                      ``test_pynastrangui isat_tran.dat isat_tran.op2 -f nastran``
@@ -1169,18 +1720,41 @@ class OP2(OP2_Scalar):
             self.applied_loads,
             self.load_vectors,
         ]
+        inode, transforms = self._get_node_transforms(icd_transform, coords, xyz_cid0, cid)
+        if debug:
+            self.log.debug('ntransformed_nodes = %s' % len(inode))
         for disp_like_dict in disp_like_dicts:
             if not disp_like_dict:
                 continue
             #print('-----------')
-            for subcase, result in disp_like_dict.items():
+            for unused_subcase, result in disp_like_dict.items():
                 if result.table_name in ['BOUGV1', 'BOPHIG', 'TOUGV1']:
                     continue
                 self.log.debug("transforming %s" % result.table_name)
-                transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                                 self.log, debug=debug)
+                apply_node_transforms(result.data, inode, transforms)
 
-    def transform_gpforce_to_global(self, nids_all, nids_transform, icd_transform, coords, xyz_cid0=None):
+    def _get_node_transforms(self, icd_transform, coords, xyz_cid0, cid):
+        """
+        Gets the transforms of the nodes (see ``get_node_transforms``)
+
+        The transforms are cached for each output coordinate system, so
+        the results of a model are transformed without rebuilding them.
+        The cache is reused when the same ``icd_transform``, ``coords``,
+        and ``xyz_cid0`` objects are passed in, so don't modify them
+        in-place between calls.
+        """
+        keys = (icd_transform, coords, xyz_cid0)
+        if cid in self._node_transforms:
+            cached_keys, inode, transforms = self._node_transforms[cid]
+            if all(key is cached_key for key, cached_key in zip(keys, cached_keys)):
+                return inode, transforms
+
+        inode, transforms = get_node_transforms(icd_transform, coords, xyz_cid0=xyz_cid0, cid=cid)
+        self._node_transforms[cid] = (keys, inode, transforms)
+        return inode, transforms
+
+    def transform_gpforce_to_global(self, nids_all, nids_transform, icd_transform, coords, xyz_cid0=None,
+                                    cid=0):
         """
         Transforms the ``data`` of GPFORCE results into the
         global coordinate system for those nodes with different output
@@ -1192,10 +1766,12 @@ class OP2(OP2_Scalar):
 
         Parameters
         ----------
-        nids_all : ???
-            ???
+        nids_all : (nnodes+nspoints, ) int ndarray
+            the sorted node ids that ``icd_transform`` indexes
+            (``BDF.point_ids``)
         nids_transform : dict{int cid : int ndarray nds}
             Dictionary from coordinate id to corresponding node ids.
+            Not used; the nodes are found with ``nids_all``.
         icd_transform : dict{int cid : int ndarray}
             Dictionary from coordinate id to index of the nodes in
             ``BDF.point_ids`` that their output (`CD`) in that
@@ -1204,8 +1780,12 @@ class OP2(OP2_Scalar):
             Dictionary of coordinate id to the coordinate object
             Use this if CD is only rectangular
             Use this if CD is not rectangular
-        xyz_cid0 : ???
+        xyz_cid0 : (nnodes+nspoints, 3) float ndarray
+            the nodes in the global frame
             required for cylindrical/spherical coordinate systems
+        cid : int; default=0
+            the coordinate system to transform to
+            xyz_cid0 is required if cid != 0
 
         """
         disp_like_dicts = [
@@ -1213,14 +1793,13 @@ class OP2(OP2_Scalar):
             #       even though it should be uncommented
             self.grid_point_forces,
         ]
+        inode, transforms = self._get_node_transforms(icd_transform, coords, xyz_cid0, cid)
         for disp_like_dict in disp_like_dicts:
             if not disp_like_dict:
                 continue
             self.log.debug('-----------')
-            for subcase, result in disp_like_dict.items():
-                transform_gpforce_to_globali(subcase, result,
-                                             nids_all, nids_transform,
-                                             icd_transform, coords, xyz_cid0, self.log)
+            for unused_subcase, result in disp_like_dict.items():
+                apply_gpforce_transforms(result, nids_all, inode, transforms)
 
         self.log.debug('-----------')
         return
@@ -1336,6 +1915,60 @@ def main():  # pragma: no cover
     ielem1_layer = solid_stress.getElementLayerIndex([[1, 0]])
     datai = data[0, ielem1_layer, :]
 
+def _get_subtable_type(table_name, header):
+    """
+    Gets the words of the table 3 header that define the result of a
+    subtable (the table name, approach code, table code, element type,
+    format code, and num_wide).  The strain energy (table_code=18) has the
+    element name in words 6-7 and the total energy in word 3.
+    """
+    if header[1] % 1000 == 18:
+        return (table_name, ) + tuple(header[:2]) + tuple(header[8:10]) + tuple(header[5:7])
+    return (table_name, ) + tuple(header[:3]) + tuple(header[8:10])
+
+def _get_subtable_group(pair):
+    """
+    Gets the (isubcase, time) of the subtables that are read together
+    (see ``OP2Index.get_result_records``), where the time is word 5 of the
+    table 3 header (e.g., the load set, mode, time step); time=None for a
+    SORT2 table, which has a subtable for each node/element
+    """
+    header = pair[0][3]
+    if (header[1] // 1000) & 2:
+        return header[3], None
+    return header[3], header[4]
+
+def _get_time_slice(obj, itime):
+    """
+    Gets the itime-th time step of a result (e.g., from a SORT2 table) as
+    a result object with a single time step; the arrays are views
+    """
+    ntimes, nrows = obj.data.shape[:2]
+    obj2 = copy.copy(obj)
+    for name, value in obj.__dict__.items():
+        # the data and the ids that change with the time step
+        # (e.g., node_element, the element of the strain energy)
+        if isinstance(value, np.ndarray) and (
+                (name == '_times' and value.ndim == 1) or
+                (value.ndim >= 2 and value.shape[:2] == (ntimes, nrows))):
+            setattr(obj2, name, value[itime:itime+1])
+    obj2.ntimes = 1
+    times_name = obj.data_code.get('name', 'dt') + 's'
+    times = getattr(obj, times_name, None)
+    if isinstance(times, list) and len(times) == ntimes:
+        setattr(obj2, times_name, times[itime:itime+1])
+    return obj2
+
+def _clear_storages(storages):
+    """deletes the results that were read"""
+    for storage in storages:
+        if storage:
+            storage.clear()
+
+def _is_nan(value):
+    """is the value a float nan"""
+    return isinstance(value, float) and np.isnan(value)
+
 def _create_hdf5_info(h5_file, op2_model):
     """exports the h5 info group"""
     load_as_h5 = False
@@ -4,8 +4,10 @@ Defines:
                  exclude_results=None, include_results=None,
                  validate=True, xref=True,
                  build_dataframe=False, skip_undefined_matrices=True,
-                 mode='msc', log=None, debug=True, debug_file=None, encoding=None)
- - OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='msc')
+                 mode='msc', log=None, debug=True, debug_file=None, encoding=None,
+                 storage='dict')
+ - OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='msc',
+           storage='dict')
    - OP2
 """
 from six.moves.cPickle import dump
@@ -30,7 +32,8 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
                   exclude_results=None, include_results=None,
                   validate=True, xref=True,
                   build_dataframe=False, skip_undefined_matrices=True,
-                  mode='msc', log=None, debug=True, debug_file=None, encoding=None):
+                  mode='msc', log=None, debug=True, debug_file=None, encoding=None,
+                  storage='dict'):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -64,6 +67,12 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    storage : str; default='dict'
+        the storage of the nodes, elements, and coords
+        'dict' : card objects
+        'columnar' : arrays (see ``BDF(storage='columnar')``); the GRID,
+                     CQUAD4, CTRIA3, and CTETRA/CPENTA/CHEXA tables are
+                     decoded directly into the arrays
 
     Returns
     -------
@@ -76,7 +85,8 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
                does not have so many methods
 
     """
-    model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
+    model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode,
+                    storage=storage)
     model.set_subcases(subcases)
     if exclude_results and include_results:
         msg = 'exclude_results or include_results must be None\n'
@@ -257,7 +267,7 @@ class OP2Geom(BDF, OP2GeomCommon):
                    '_sort_method', 'is_sort1', 'is_sort2',
                    'matrix_tables', 'table_name_str']
     def __init__(self, make_geom=True,
-                 debug=False, log=None, debug_file=None, mode='msc'):
+                 debug=False, log=None, debug_file=None, mode='msc', storage='dict'):
         """
         Initializes the OP2 object
 
@@ -274,9 +284,12 @@ class OP2Geom(BDF, OP2GeomCommon):
             sets the filename that will be written to
         mode : str; default='msc'
             {msc, nx}
+        storage : str; default='dict'
+            the storage of the nodes, elements, and coords
+            {dict, columnar}
 
         """
-        BDF.__init__(self, debug=debug, log=log)
+        BDF.__init__(self, debug=debug, log=log, storage=storage)
         OP2GeomCommon.__init__(self, make_geom=make_geom,
                                debug=debug, log=log, debug_file=debug_file, mode=mode)
 
@@ -5,9 +5,13 @@ defines:
  export_op2_to_hdf5(hdf5_filename, op2_model)
 
  model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
- model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
- export_op2_to_hdf5_file(hdf5_filename, op2_model)
- export_op2_to_hdf5_file(hdf5_file, op2_model)
+ model = load_op2_from_hdf5_file(model, h5_file, log, debug=False, lazy=False)
+ export_op2_to_hdf5_filename(hdf5_filename, op2_model, compression=None,
+                             compression_opts=None, float32=False, chunks=None,
+                             nthreads=1)
+ export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None,
+                         compression_opts=None, float32=False, chunks=None,
+                         nthreads=1)
 
 """
 from __future__ import (nested_scopes, generators, division, absolute_import,
@@ -21,6 +25,7 @@ import h5py
 
 import pyNastran
 from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.hdf5_writer import HDF5Writer
 
 from pyNastran.op2.tables.lama_eigenvalues.lama_objects import RealEigenvalues, ComplexEigenvalues, BucklingEigenvalues
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray, ComplexDisplacementArray
@@ -121,7 +126,11 @@ def _cast(h5_result_attr):
         return None
 
     if len(h5_result_attr.shape) == 0:
-        return np.array(h5_result_attr).tolist()
+        value = np.array(h5_result_attr).tolist()
+        if PY3 and isinstance(value, binary_type):
+            # h5py>=3 returns the strings as bytes
+            value = value.decode('utf8')
+        return value
         #raise NotImplementedError(h5_result_attr.dtype)
     return np.array(h5_result_attr)
 
@@ -913,7 +922,7 @@ def _load_eigenvalue(h5_result, log):
             setattr(obj, key, datai)
     return obj
 
-def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, complex_obj
+def _load_table(result_name, h5_result, objs, log, debug=False, lazy=False):# real_obj, complex_obj
     """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
@@ -975,12 +984,17 @@ def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, comp
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     debug=debug)
+                                     debug=debug, lazy=lazy)
     return obj
 
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     debug=False):
-    """helper method for ``_load_table``"""
+                                     debug=False, lazy=False):
+    """
+    helper method for ``_load_table``
+
+    lazy : bool; default=False
+        obj.data is the h5py.Dataset, which is read when it's sliced
+    """
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
         'is_sort1', 'is_sort2', 'table_name_str',
@@ -1000,6 +1014,9 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
             datai = _cast(h5_result.get(key))
             setattr(obj, key, datai)
             setattr(obj, '_times', datai)
+        elif lazy and key == 'data':
+            datai = h5_result.get(key)
+            obj.data = datai
         elif key not in data_code:
             datai = _cast(h5_result.get(key))
             if debug:  # pragma: no cover
@@ -1059,20 +1076,57 @@ def _get_obj_class(objs, class_name, result_name, unused_is_real, log):
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename, op2_model):
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_filename(hdf5_filename, op2_model, compression=None,
+                                compression_opts=None, float32=False, chunks=None,
+                                nthreads=1):
+    """
+    exports an OP2 object to an HDF5 file
+
+    see ``export_op2_to_hdf5_file``
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
 
     with h5py.File(hdf5_filename, 'w') as hdf5_file:
         op2_model.log.info('starting export_op2_to_hdf5_file of %r' % hdf5_filename)
-        export_op2_to_hdf5_file(hdf5_file, op2_model)
-
-def export_op2_to_hdf5_file(hdf5_file, op2_model):
-    """exports an OP2 object to an HDF5 file object"""
+        export_op2_to_hdf5_file(
+            hdf5_file, op2_model, compression=compression,
+            compression_opts=compression_opts, float32=float32, chunks=chunks,
+            nthreads=nthreads)
+
+def export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None,
+                            compression_opts=None, float32=False, chunks=None,
+                            nthreads=1):
+    """
+    exports an OP2 object to an HDF5 file object
+
+    Parameters
+    ----------
+    hdf5_file : h5py.File
+        the HDF5 file object
+    op2_model : OP2
+        the model
+    compression : str; default=None
+        the compression of the results {None, gzip, lzf, blosc}
+        (blosc requires hdf5plugin)
+    compression_opts : int; default=None
+        the compression level (e.g., 0-9 for gzip)
+    float32 : bool; default=False
+        down-casts the float64/complex128 results to float32/complex64
+    chunks : bool; default=None -> True if compression is used
+        chunks the results along the (time, element/node) axes
+    nthreads : int; default=1
+        the number of threads used for the gzip compression
+
+    """
     assert not isinstance(hdf5_file, str), hdf5_file
-    create_info_group(hdf5_file, op2_model)
-    export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    writer = HDF5Writer(compression=compression, compression_opts=compression_opts,
+                        float32=float32, chunks=chunks, nthreads=nthreads)
+    try:
+        create_info_group(hdf5_file, op2_model)
+        export_matrices(hdf5_file, op2_model)
+        _export_subcases(hdf5_file, op2_model, writer)
+    finally:
+        writer.close()
 
 def create_info_group(hdf5_file, op2_model):
     """creates the info HDF5 group"""
@@ -1097,8 +1151,8 @@ def export_matrices(hdf5_file, op2_model):
                 raise NotImplementedError(msg)
                 continue
 
-def _export_subcases(hdf5_file, op2_model):
-    """exports the subcases to HDF5"""
+def _export_subcases(hdf5_file, op2_model, writer):
+    """exports the subcases to HDF5 with the HDF5Writer"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
     for result_type in result_types:
@@ -1125,14 +1179,14 @@ def _export_subcases(hdf5_file, op2_model):
 
             #result_name = result_type + ':' + class_name
             result_name = result_type
-            result_group = subcase_group.create_group(result_name)
+            result_group = writer.create_group(subcase_group, result_name)
             obj.export_to_hdf5(result_group, op2_model.log)
 
 def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
     return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
 
 def load_op2_from_hdf5_filename(hdf5_filename, combine=True, log=None):
-    """loads an hdf5 file into an OP2 object"""
+    """loads an hdf5 file into an OP2 object (see ``OP2.load_hdf5_filename``)"""
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=None)
     model.op2_filename = hdf5_filename
@@ -1144,8 +1198,26 @@ def load_op2_from_hdf5_filename(hdf5_filename, combine=True, log=None):
     model.combine_results(combine=combine)
     return model
 
-def load_op2_from_hdf5_file(model, h5_file, log, debug=False):
-    """loads an h5 file object into an OP2 object"""
+def load_op2_from_hdf5_file(model, h5_file, log, debug=False, lazy=False):
+    """
+    loads an h5 file object into an OP2 object
+
+    Parameters
+    ----------
+    model : OP2
+        the model to load the results into
+    h5_file : h5py.File
+        the HDF5 file object
+    log : logger
+        the logger
+    debug : bool; default=False
+        prints the attributes of the results
+    lazy : bool; default=False
+        the ``data`` of the results are h5py.Datasets, which are read from
+        the file when they're sliced (e.g., ``obj.data[itime, :, :]``),
+        so h5_file must stay open
+
+    """
     for key in h5_file.keys():
         if key.startswith('Subcase'):
             h5_subcase = h5_file.get(key)
@@ -1168,7 +1240,8 @@ def load_op2_from_hdf5_file(model, h5_file, log, debug=False):
                     if objs is None:
                         log.warning('  skipping %s...' % result_name)
                         continue
-                    obj = _load_table(result_name, h5_result, objs, log=log, debug=debug)
+                    obj = _load_table(result_name, h5_result, objs, log=log, debug=debug,
+                                      lazy=lazy)
                     if obj is None:
                         continue
 
@@ -0,0 +1,267 @@
+"""
+Defines the chunked/compressed HDF5 export of the OP2 results:
+  - HDF5Writer(compression=None, compression_opts=None, float32=False,
+               chunks=None, nthreads=1)
+    - create_group(group, name)
+    - create_dataset(group, name, data)
+    - close()
+  - get_chunks(shape, itemsize)
+
+The result objects export themselves with ``group.create_dataset(name, data=value)``
+(see ``write_utils.export_to_hdf5``), so they're given an ``HDF5Group``,
+which passes the datasets to the ``HDF5Writer``.
+
+The ``data`` arrays are chunked along the (time, element/node) axes, so a
+time step or the time history of a few elements only reads a few chunks.
+
+The gzip/lzf compressed datasets use the byte shuffle filter, which
+groups the bytes of the floats, so they compress better.
+
+With ``compression='gzip'`` and ``nthreads > 1``, the chunks are shuffled
+and compressed with zlib by a pool of threads (zlib releases the GIL) and
+written with ``write_direct_chunk``, while the main thread moves on to the
+next result.  The file is the same as one written by HDF5's shuffle/gzip
+filters.
+
+"""
+from __future__ import print_function
+import zlib
+from collections import deque
+from itertools import product
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+try:
+    import hdf5plugin
+    IS_HDF5PLUGIN = True
+except ImportError:
+    IS_HDF5PLUGIN = False
+
+#: the target size of a chunk (1 MB)
+CHUNK_BYTES = 1024 * 1024
+
+#: the maximum number of time steps in a chunk
+TIME_CHUNK = 16
+
+#: the maximum number of compressed chunks that wait to be written
+MAX_PENDING_CHUNKS = 256
+
+
+def get_chunks(shape, itemsize):
+    """
+    Gets the chunk shape of a dataset, which keeps the trailing axes (e.g.,
+    the stress components) whole and splits the (time, element/node) axes
+
+    Parameters
+    ----------
+    shape : tuple
+        the shape of the array; (ntimes, nelements, nfields) for ``data``
+    itemsize : int
+        the number of bytes of a value
+
+    Returns
+    -------
+    chunks : tuple
+        the chunk shape
+
+    """
+    if len(shape) == 1:
+        return (max(1, min(shape[0], CHUNK_BYTES // itemsize)), )
+
+    # the size of a row (e.g., all the fields of an element at a time)
+    nrow_bytes = int(np.prod(shape[2:], dtype='int64')) * itemsize
+    if len(shape) == 2:
+        nrows = max(1, min(shape[0], CHUNK_BYTES // max(shape[1] * itemsize, 1)))
+        return (nrows, max(shape[1], 1))
+
+    ntimes = max(1, min(shape[0], TIME_CHUNK))
+    nrows = max(1, min(shape[1], CHUNK_BYTES // max(ntimes * nrow_bytes, 1)))
+    return (ntimes, nrows) + tuple(max(n, 1) for n in shape[2:])
+
+
+class HDF5Group(object):
+    """
+    Wraps an h5py Group, so the datasets that are created by the result
+    objects are written by the HDF5Writer
+    """
+    def __init__(self, group, writer):
+        self.group = group
+        self.writer = writer
+
+    @property
+    def attrs(self):
+        """the attributes of the group"""
+        return self.group.attrs
+
+    def create_group(self, name):
+        """creates a sub-group"""
+        return self.writer.create_group(self.group, name)
+
+    def create_dataset(self, name, data=None, **kwargs):
+        """creates a (chunked/compressed) dataset"""
+        if kwargs:
+            return self.group.create_dataset(name, data=data, **kwargs)
+        return self.writer.create_dataset(self.group, name, data)
+
+
+class HDF5Writer(object):
+    """
+    Creates the chunked/compressed datasets of the OP2 results
+    """
+    def __init__(self, compression=None, compression_opts=None, float32=False,
+                 chunks=None, nthreads=1):
+        """
+        Parameters
+        ----------
+        compression : str; default=None
+            the compression filter
+            None : no compression
+            'gzip' : zlib; compression_opts is the level (0-9; default=4)
+            'lzf' : fast, but only supported by h5py
+            'blosc' : requires hdf5plugin
+        compression_opts : int; default=None
+            the compression level
+        float32 : bool; default=False
+            down-casts the float64/complex128 arrays to float32/complex64
+        chunks : bool; default=None -> True if compression is used
+            chunks the arrays along the (time, element/node) axes
+        nthreads : int; default=1
+            the number of threads used for the gzip compression
+
+        """
+        if compression not in [None, 'gzip', 'lzf', 'blosc']:
+            raise ValueError("compression=%r and must be in [None, 'gzip', 'lzf', 'blosc']" % (
+                compression))
+        if compression == 'blosc' and not IS_HDF5PLUGIN:
+            raise ImportError("compression='blosc' requires hdf5plugin")
+        if compression == 'gzip' and compression_opts is None:
+            compression_opts = 4
+        if chunks is None:
+            chunks = compression is not None
+        if compression is not None and not chunks:
+            raise ValueError('compression=%r requires chunks=True' % compression)
+
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.float32 = float32
+        self.chunks = chunks
+        self.nthreads = nthreads
+
+        self._pool = None
+        if compression == 'gzip' and nthreads > 1:
+            self._pool = ThreadPool(nthreads)
+        #: the (dataset, offsets, AsyncResult) of the chunks that are being compressed
+        self._pending = deque()
+
+    def create_group(self, group, name):
+        """creates a group that writes (chunked/compressed) datasets"""
+        return HDF5Group(group.create_group(name), self)
+
+    def create_dataset(self, group, name, data):
+        """
+        Creates a dataset
+
+        Parameters
+        ----------
+        group : h5py.Group
+            the group
+        name : str
+            the name of the dataset
+        data : varies
+            the value (e.g., a float array, a string)
+
+        Returns
+        -------
+        dataset : h5py.Dataset
+            the dataset; the data may still be being compressed
+
+        """
+        if not isinstance(data, np.ndarray) or data.ndim == 0 or data.size == 0 or (
+                data.dtype.kind not in 'biufc'):
+            return group.create_dataset(name, data=data)
+
+        if self.float32:
+            if data.dtype == np.float64:
+                data = data.astype('float32')
+            elif data.dtype == np.complex128:
+                data = data.astype('complex64')
+
+        if not self.chunks:
+            return group.create_dataset(name, data=data)
+
+        chunks = get_chunks(data.shape, data.dtype.itemsize)
+        kwargs = self._get_filter_kwargs()
+        if self._pool is None:
+            return group.create_dataset(name, data=data, chunks=chunks, **kwargs)
+
+        dataset = group.create_dataset(name, shape=data.shape, dtype=data.dtype,
+                                       chunks=chunks, **kwargs)
+        self._compress_chunks(dataset, data, chunks)
+        return dataset
+
+    def _get_filter_kwargs(self):
+        """gets the compression filter arguments of create_dataset"""
+        if self.compression is None:
+            return {}
+        if self.compression == 'blosc':
+            if self.compression_opts is None:
+                return dict(hdf5plugin.Blosc())
+            return dict(hdf5plugin.Blosc(clevel=self.compression_opts))
+        kwargs = {'compression' : self.compression, 'shuffle' : True}
+        if self.compression_opts is not None:
+            kwargs['compression_opts'] = self.compression_opts
+        return kwargs
+
+    def _compress_chunks(self, dataset, data, chunks):
+        """compresses the chunks with the thread pool"""
+        level = self.compression_opts
+        ranges = [range(0, n, nchunk) for n, nchunk in zip(data.shape, chunks)]
+        for offsets in product(*ranges):
+            slices = tuple(slice(i, i + nchunk) for i, nchunk in zip(offsets, chunks))
+            chunk = data[slices]
+            if chunk.shape != chunks:
+                # the edge chunks are padded to the full size
+                chunk2 = np.zeros(chunks, dtype=data.dtype)
+                chunk2[tuple(slice(0, n) for n in chunk.shape)] = chunk
+                chunk = chunk2
+            result = self._pool.apply_async(_compress_chunk, (chunk, level))
+            self._pending.append((dataset, offsets, result))
+            if len(self._pending) > MAX_PENDING_CHUNKS:
+                self._write_pending(MAX_PENDING_CHUNKS // 2)
+        self._write_pending(len(self._pending), wait=False)
+
+    def _write_pending(self, nchunks, wait=True):
+        """
+        Writes the compressed chunks in order
+
+        Parameters
+        ----------
+        nchunks : int
+            the maximum number of chunks to write
+        wait : bool; default=True
+            wait for the chunks to be compressed; otherwise, stop at the
+            first chunk that isn't done
+
+        """
+        pending = self._pending
+        for unused_i in range(nchunks):
+            if not pending or (not wait and not pending[0][2].ready()):
+                break
+            dataset, offsets, result = pending.popleft()
+            dataset.id.write_direct_chunk(offsets, result.get())
+
+    def close(self):
+        """writes the remaining chunks"""
+        self._write_pending(len(self._pending))
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+def _compress_chunk(chunk, level):
+    """applies the HDF5 shuffle and gzip filters to a chunk"""
+    itemsize = chunk.dtype.itemsize
+    shuffled = np.ascontiguousarray(chunk).view('uint8').reshape(-1, itemsize).T
+    return zlib.compress(shuffled.tobytes(), level)
@@ -5,7 +5,7 @@ from struct import Struct, unpack
 from six import string_types
 
 import numpy as np
-from numpy import frombuffer, radians, sin, cos, ones, dtype as npdtype
+from numpy import frombuffer, radians, sin, cos, dtype as npdtype
 
 from pyNastran import is_release
 from pyNastran.f06.f06_writer import F06Writer
@@ -204,6 +204,64 @@ class OP2Common(Op2Codes, F06Writer):
             #print('self.format_code=%s orig=%s' % (self.format_code,
                                                    #self.format_code_original))
 
+    def _set_obj_data(self, obj, itime, itotal, itotal2, values):
+        """
+        Sets ``obj.data[itime, itotal:itotal2, :] = values``
+
+        In the memory-mapped read mode (``use_mmap``), values is a view of
+        the OP2, so only its location is stored and obj.data becomes a view
+        of the OP2 at the end of the read (see ``OP2MmapData``).  SORT2
+        records overwrite the rows of the previous element, so they're
+        always copied.
+        """
+        mmap_data = self.op2_reader.mmap_data
+        if (mmap_data is not None and self.sort_method == 1 and
+                mmap_data.add(obj, itime, itotal, itotal2, values)):
+            return
+        obj.data[itime, itotal:itotal2, :] = values
+
+    def _get_vector_eids_dt(self, data, nelements, dt, num_wide=None):
+        """
+        Gets the element ids and the time of the rows of a vectorized
+        table 4 record, which is like ``get_eid_dt_from_eid_device``
+
+        Parameters
+        ----------
+        data : bytes
+            the table 4 record
+        nelements : int
+            the number of rows
+        dt : int/float/None
+            the time/frequency of a SORT1 table
+        num_wide : int; default=None -> self.num_wide
+            the number of words per row
+
+        Returns
+        -------
+        eids : (nelements, ) int ndarray
+            the element ids
+        dt : int/float/None
+            the time/frequency; a SORT2 row has the time in the first
+            word, and like add_sort1, the time of the last row is kept
+
+        """
+        if num_wide is None:
+            num_wide = self.num_wide
+        ints = frombuffer(data, dtype=self.idtype, count=nelements * num_wide).reshape(
+            nelements, num_wide)
+        if self.sort_method == 1:
+            return ints[:, 0] // 10, dt
+
+        # SORT2: the element id is the nonlinear_factor
+        eids = np.full(nelements, self.nonlinear_factor, dtype=ints.dtype)
+        if nelements:
+            if self._analysis_code_fmt == b'i':
+                dt = ints[-1, 0]
+            else:
+                floats = frombuffer(data, dtype=self.fdtype, count=nelements * num_wide)
+                dt = floats[(nelements - 1) * num_wide]
+        return eids, dt
+
     def _set_times_dtype(self):
         self.data_code['_times_dtype'] = 'float32'
         if self.analysis_code == 1:   # statics / displacement / heat flux
@@ -966,23 +1024,25 @@ class OP2Common(Op2Codes, F06Writer):
         #assert self.obj is not None
 
         obj = self.obj
-        if self.use_vector and is_vectorized and 0:  # TODO: not done....
+        if self.use_vector and is_vectorized:
             itime = obj.itime
             n = nnodes * 4 * 8
             itotal = obj.itotal
             itotal2 = itotal + nnodes
-            if obj.itime == 0:
-                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
-                #nids = ints[:, 0] // 10
-                nids = ones(nnodes, dtype='int32') * eid
-                assert nids.min() > 0, nids.min()
-                obj.node_gridtype[itotal:itotal2, 0] = nids
-                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
 
-            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8).copy()
-            obj._times[itime] = floats[:, 0]
-            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2]
-            assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
+            obj.node_gridtype[itime, 0] = eid
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+
+            if obj.itime == 0:
+                if self._analysis_code_fmt == b'i':
+                    times = ints[:, 0].copy()
+                else:
+                    assert self._analysis_code_fmt == b'f'
+                    times = floats[:, 0].copy()
+                obj._times = times
+            obj.node_gridtype[itime, 1] = ints[0, 1]
+            obj.data[itotal:itotal2, itime, 0] = floats[:, 2]
             obj.itotal = itotal2
         else:
             n = 0
@@ -1030,7 +1090,7 @@ class OP2Common(Op2Codes, F06Writer):
             assert nids.min() > 0, nids.min()
             obj.node_gridtype[obj.itotal:itotal2, 0] = nids
             obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1].copy()
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            self._set_obj_data(obj, obj.itime, obj.itotal, itotal2, floats[:, 2:])
             obj.itotal = itotal2
         else:
             n = 0
@@ -1077,7 +1137,7 @@ class OP2Common(Op2Codes, F06Writer):
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1].copy()
 
             floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
-            obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:].copy()
+            self._set_obj_data(obj, obj.itime, obj.itotal, itotal2, floats[:, 2:])
             obj._times[itime] = dt
             obj.itotal = itotal2
         else:
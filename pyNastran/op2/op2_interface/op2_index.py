@@ -0,0 +1,690 @@
+"""
+Defines the table of contents of an OP2, which is found with a marker-only
+pre-scan of the file:
+  - OP2Index
+  - OP2TableIndex
+  - build_op2_index(op2_filename, n0=None, endian=None)
+  - get_op2_index(op2_filename, n0=None, endian=None, log=None)
+  - save_op2_index(index, op2_filename, index_filename=None)
+  - load_op2_index(op2_filename, index_filename=None)
+
+An OP2 is a series of Fortran blocks (``[nbytes, data, nbytes]``).  The
+blocks are either markers (a single integer) or the data of a record.  The
+pre-scan only reads the block lengths and the markers and jumps over the
+data, so the sizes and offsets of every table, subtable, and record are
+known before the tables are parsed.  The reader uses the index to jump over
+records and tables in a single seek instead of walking the continuation
+blocks.
+
+The table 3 record of the result tables (584 bytes) is also stored, so the
+num_wide/element_type of each subtable is known.  The result objects are
+pre-sized from the index:
+  - read_mode=1 : the table 3 parsers create the result objects from the
+                  stored table 3 records and the table 4 parsers count the
+                  rows from the indexed record lengths, so the table 3/4
+                  records of an indexed result table aren't read (R1TABRG,
+                  ONRGY1, and the tables filtered by ids are still read)
+  - read_mode=2 : the arrays are filled, which is the only pass that reads
+                  the result data
+
+The index may be saved to a ``.op2idx`` sidecar file next to the OP2, so
+the next time the OP2 is opened, the pre-scan is skipped.  The sidecar
+stores the size and modification time of the OP2 and is rebuilt when
+they change.
+
+"""
+from __future__ import print_function
+from bisect import bisect_right
+import os
+import mmap
+from struct import Struct
+import numpy as np
+
+#: the length of a table 3 (header) record of a result table
+TABLE3_NDATA = 584
+
+#: the version of the .op2idx file format
+OP2IDX_VERSION = 2
+
+
+class OP2TableIndex(object):
+    """
+    The location of a table (e.g., OUGV1, OES1X1, GEOM1) in the OP2
+
+    Attributes
+    ----------
+    table_name : bytes
+        the name of the table
+    start : int
+        the offset of the table name record
+    end : int
+        the offset after the last marker of the table
+    subtables : List[(isubtable, offset, ndata, header)]
+        the records of the table, where:
+          - isubtable : int; the subtable flag (e.g., -1, -2, -3, -4)
+          - offset : int; the offset of the record
+          - ndata : int; the number of bytes in the record
+          - header : (10, ) int tuple / None
+              the first 10 words (approach_code, table_code,
+              element_type, isubcase, ..., format_code, num_wide)
+              of a 584 byte table 3 record
+
+    """
+    def __init__(self, table_name, start):
+        self.table_name = table_name
+        self.start = start
+        self.end = None
+        self.subtables = []
+
+    def get_headers(self):
+        """
+        Gets the table 3 headers and the table 4 record sizes of a result
+        table
+
+        Returns
+        -------
+        headers : List[(header, ndata)]
+            header : (10, ) int tuple
+                the first 10 words of the table 3 record
+            ndata : int
+                the number of bytes in the following table 4 record
+
+        """
+        return [(table3[3], table4[2]) for table3, table4 in self.get_result_pairs()]
+
+    def get_result_pairs(self):
+        """
+        Gets the table 3 (header) and table 4 (data) records of a result
+        table
+
+        Returns
+        -------
+        pairs : List[(table3, table4)]
+            table3 : (isubtable, offset, ndata, header)
+                the table 3 record
+            table4 : (isubtable, offset, ndata, header)
+                the table 4 record that follows it
+
+        """
+        pairs = []
+        subtables = self.subtables
+        nsubtables = len(subtables)
+        i = 0
+        while i < nsubtables:
+            if subtables[i][3] is not None and i + 1 < nsubtables:
+                pairs.append((subtables[i], subtables[i + 1]))
+                i += 2
+            else:
+                i += 1
+        return pairs
+
+    def get_subtable_pairs(self):
+        """
+        Gets the table 3 (header) and table 4 (data) records of a result
+        table that's only made of the -1/-2 records and table 3/table 4
+        pairs (-3/-4, -5/-6, ...)
+
+        Returns
+        -------
+        pairs : List[(table3, table4)] / None
+            the table 3/table 4 records (see ``get_result_pairs``);
+            None if the table has another layout
+
+        """
+        subtables = self.subtables
+        nsubtables = len(subtables)
+        if nsubtables % 2 or [subtable[0] for subtable in subtables] != list(
+                range(-1, -nsubtables - 1, -1)):
+            return None
+        pairs = list(zip(subtables[2::2], subtables[3::2]))
+        if any(table3[3] is None for table3, unused_table4 in pairs):
+            return None
+        return pairs
+
+    def __repr__(self):
+        return 'OP2TableIndex(table_name=%r, start=%s, end=%s, nrecords=%s)' % (
+            self.table_name, self.start, self.end, len(self.subtables))
+
+
+class OP2Index(object):
+    """
+    The table of contents of an OP2
+
+    Attributes
+    ----------
+    tables : List[OP2TableIndex]
+        the tables in the order they're in the file
+    records : Dict[int] = (ndata, end)
+        the record offset (the position of its first marker) to the number
+        of bytes in the record and the offset after its last block
+    table3_records : Dict[int] = bytes
+        the record offset to the data of a table 3 record (584 bytes), so
+        the result objects are sized without reading the OP2
+    is_complete : bool
+        was the end of the file reached; if False, the file ends with a
+        structure that isn't understood and the tables after the last
+        indexed table are read by walking the markers
+    n0 : int / None
+        the offset of the first table name record
+    endian : bytes / None
+        the endian (b'<' or b'>')
+
+    """
+    def __init__(self):
+        self.tables = []
+        self.records = {}
+        self.table3_records = {}
+        self.is_complete = False
+        self.n0 = None
+        self.endian = None
+        self._table_starts = []
+
+    def get_record(self, n):
+        """
+        Gets the size of the record that starts at offset n
+
+        Returns
+        -------
+        record : (ndata, end) / None
+            ndata : int
+                the number of bytes in the record
+            end : int
+                the offset after the last block of the record
+            None : there is no record at offset n
+
+        """
+        return self.records.get(n)
+
+    def get_table(self, n):
+        """
+        Gets the table that contains offset n
+
+        Returns
+        -------
+        table : OP2TableIndex / None
+            the table; None if there is no indexed table at offset n
+
+        """
+        i = bisect_right(self._table_starts, n) - 1
+        if i < 0:
+            return None
+        table = self.tables[i]
+        if table.end is None or n >= table.end:
+            return None
+        return table
+
+    def get_table_names(self):
+        """gets the names of the indexed tables"""
+        return [table.table_name for table in self.tables]
+
+    def get_table_index(self, tables):
+        """
+        Gets the index of some of the tables, which is smaller to send to
+        another process
+
+        Parameters
+        ----------
+        tables : List[OP2TableIndex]
+            the tables to keep
+
+        Returns
+        -------
+        index : OP2Index
+            the index of the tables and their records
+
+        """
+        index = OP2Index()
+        index.n0 = self.n0
+        index.endian = self.endian
+        offsets = sorted(self.records)
+        for table in tables:
+            index._add_table(table)
+            i0 = bisect_right(offsets, table.start) - 1
+            i1 = bisect_right(offsets, table.end)
+            for offset in offsets[max(i0, 0):i1]:
+                if table.start <= offset < table.end:
+                    index.records[offset] = self.records[offset]
+                    if offset in self.table3_records:
+                        index.table3_records[offset] = self.table3_records[offset]
+        return index
+
+    def get_result_offsets(self):
+        """
+        Maps the result subtables to their location in the OP2
+
+        Returns
+        -------
+        offsets : Dict[key] = (table3_offset, table4_offset)
+            key : (table_name, isubcase, element_type, itime)
+                itime is the count of the previous subtables with the same
+                (table_name, isubcase, element_type), so it's the time
+                step/mode/frequency index for SORT1 results
+            table3_offset / table4_offset : int
+                the offsets of the header/data records
+
+        """
+        offsets = {}
+        for table, pairs in self.get_result_records(None):
+            for table3, table4, itime in pairs:
+                header = table3[3]
+                key = (table.table_name, header[3], header[2], itime)
+                offsets[key] = (table3[1], table4[1])
+        return offsets
+
+    def get_result_records(self, table_name, isubcase=None, element_type=None, itime=None):
+        """
+        Finds the table 3/table 4 records of the result tables
+
+        Parameters
+        ----------
+        table_name : bytes / None
+            the name of the table (e.g., b'OUGV1'); None for all tables
+        isubcase : int; default=None -> all
+            the subcase id
+        element_type : int; default=None -> all
+            the element type (e.g., 33 for CQUAD4); 0 for nodal results
+        itime : int; default=None -> all
+            the index of the subtable for the (table_name, isubcase,
+            element_type), which is the time step/mode/frequency index
+            for SORT1 results
+
+        Returns
+        -------
+        records : List[(table, pairs)]
+            table : OP2TableIndex
+                the table
+            pairs : List[(table3, table4, itime)]
+                the selected table 3/table 4 records
+                (see ``OP2TableIndex.get_result_pairs``)
+
+        """
+        records = []
+        counts = {}
+        for table in self.tables:
+            if table_name is not None and table.table_name != table_name:
+                continue
+            pairs = []
+            for table3, table4 in table.get_result_pairs():
+                header = table3[3]
+                key = (table.table_name, header[3], header[2])
+                itimei = counts.get(key, 0)
+                counts[key] = itimei + 1
+                if isubcase is not None and header[3] != isubcase:
+                    continue
+                if element_type is not None and header[2] != element_type:
+                    continue
+                if itime is not None and itimei != itime:
+                    continue
+                pairs.append((table3, table4, itimei))
+            if pairs:
+                records.append((table, pairs))
+        return records
+
+    def get_design_cycle(self, table):
+        """
+        Gets the design cycle of a table in a SOL 200 OP2, which is the
+        number of R1TABRG tables with data before it (``OP2._count`` is
+        incremented by the first table 4 record of an R1TABRG table)
+
+        Parameters
+        ----------
+        table : OP2TableIndex
+            the table
+
+        Returns
+        -------
+        count : int
+            the count in the key of the results (e.g., self.displacements)
+
+        """
+        count = 0
+        for tablei in self.tables:
+            if tablei.start >= table.start:
+                break
+            if tablei.table_name == b'R1TABRG' and len(tablei.subtables) > 3:
+                count += 1
+        return count
+
+    def _add_table(self, table):
+        """adds a completed table"""
+        self.tables.append(table)
+        self._table_starts.append(table.start)
+
+    def __repr__(self):
+        return 'OP2Index(ntables=%s, nrecords=%s, is_complete=%s)' % (
+            len(self.tables), len(self.records), self.is_complete)
+
+
+def build_op2_index(op2_filename, n0=None, endian=None):
+    """
+    Creates the table of contents of an OP2 with a marker-only pre-scan
+
+    Parameters
+    ----------
+    op2_filename : str
+        the path to the OP2
+    n0 : int; default=None -> after the OP2 header
+        the offset of the first table name record
+    endian : bytes; default=None -> from the first marker
+        the endian (b'<' or b'>')
+
+    Returns
+    -------
+    index : OP2Index
+        the table of contents; the tables after an unrecognized structure
+        aren't indexed
+
+    """
+    index = OP2Index()
+    with open(op2_filename, 'rb') as op2_file:
+        try:
+            data = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError, OverflowError):  # pragma: no cover
+            # empty file or a file that is too big for a 32-bit address space
+            return index
+        try:
+            if endian is None:
+                endian = _get_endian(data)
+            if endian is not None and n0 is None:
+                n0 = _get_first_table_offset(data, endian)
+            index.n0 = n0
+            index.endian = endian
+            if n0 is not None:
+                _scan_tables(index, data, n0, endian)
+        finally:
+            data.close()
+    return index
+
+def get_op2_index_filename(op2_filename):
+    """gets the path to the .op2idx sidecar of an OP2"""
+    return os.path.splitext(op2_filename)[0] + '.op2idx'
+
+def get_op2_index(op2_filename, n0=None, endian=None, log=None):
+    """
+    Loads the index of an OP2 from the .op2idx sidecar or creates it and
+    writes the sidecar
+
+    Parameters
+    ----------
+    op2_filename : str
+        the path to the OP2
+    n0 : int; default=None -> after the OP2 header
+        the offset of the first table name record
+    endian : bytes; default=None -> from the first marker
+        the endian (b'<' or b'>')
+    log : logger; default=None
+        a logger for the sidecar messages
+
+    Returns
+    -------
+    index : OP2Index
+        the table of contents
+
+    """
+    index = load_op2_index(op2_filename)
+    if index is not None and (n0 is None or index.n0 == n0) and (
+            endian is None or index.endian == endian):
+        if log is not None:
+            log.debug('loaded %s' % get_op2_index_filename(op2_filename))
+        return index
+
+    index = build_op2_index(op2_filename, n0=n0, endian=endian)
+    try:
+        index_filename = save_op2_index(index, op2_filename)
+    except (IOError, OSError):
+        # a read-only folder
+        if log is not None:
+            log.debug('cannot write %s' % get_op2_index_filename(op2_filename))
+    else:
+        if log is not None:
+            log.debug('wrote %s' % index_filename)
+    return index
+
+def save_op2_index(index, op2_filename, index_filename=None):
+    """
+    Writes the index to a .op2idx sidecar file
+
+    Parameters
+    ----------
+    index : OP2Index
+        the table of contents of op2_filename
+    op2_filename : str
+        the path to the OP2; the size/modification time are saved
+    index_filename : str; default=None -> <op2_filename>.op2idx
+        the path to the sidecar
+
+    Returns
+    -------
+    index_filename : str
+        the path to the sidecar
+
+    """
+    if index_filename is None:
+        index_filename = get_op2_index_filename(op2_filename)
+
+    record_offsets = np.array(sorted(index.records), dtype='int64')
+    records = np.array([index.records[offset] for offset in record_offsets],
+                       dtype='int64').reshape(len(record_offsets), 2)
+
+    tables = np.array([(table.start, table.end) for table in index.tables],
+                      dtype='int64').reshape(len(index.tables), 2)
+    subtables = []
+    headers = []
+    for itable, table in enumerate(index.tables):
+        for isubtable, offset, ndata, header in table.subtables:
+            isubtable = 0 if isubtable is None else isubtable
+            is_header = header is not None
+            subtables.append((itable, isubtable, offset, ndata, is_header))
+            headers.append(header if is_header else (0,) * 10)
+    subtables = np.array(subtables, dtype='int64').reshape(len(subtables), 5)
+    headers = np.array(headers, dtype='int64').reshape(len(headers), 10)
+
+    table3_offsets = np.array(sorted(index.table3_records), dtype='int64')
+    table3_records = np.frombuffer(
+        b''.join(index.table3_records[offset] for offset in table3_offsets),
+        dtype='uint8').reshape(len(table3_offsets), TABLE3_NDATA)
+
+    with open(index_filename, 'wb') as index_file:
+        np.savez(
+            index_file,
+            version=np.array(OP2IDX_VERSION),
+            op2_stats=_get_op2_stats(op2_filename),
+            is_complete=np.array(index.is_complete),
+            n0=np.array(-1 if index.n0 is None else index.n0),
+            endian=np.array(b'' if index.endian is None else index.endian),
+            table_names=np.array([table.table_name for table in index.tables], dtype='|S8'),
+            tables=tables,
+            subtables=subtables,
+            headers=headers,
+            record_offsets=record_offsets,
+            records=records,
+            table3_offsets=table3_offsets,
+            table3_records=table3_records,
+        )
+    return index_filename
+
+def load_op2_index(op2_filename, index_filename=None):
+    """
+    Reads the index from a .op2idx sidecar file
+
+    Parameters
+    ----------
+    op2_filename : str
+        the path to the OP2
+    index_filename : str; default=None -> <op2_filename>.op2idx
+        the path to the sidecar
+
+    Returns
+    -------
+    index : OP2Index / None
+        the table of contents; None if the sidecar doesn't exist, can't
+        be read, or doesn't match the size/modification time of the OP2
+
+    """
+    if index_filename is None:
+        index_filename = get_op2_index_filename(op2_filename)
+    if not os.path.exists(index_filename):
+        return None
+
+    try:
+        with open(index_filename, 'rb') as index_file:
+            with np.load(index_file, allow_pickle=False) as data:
+                if data['version'] != OP2IDX_VERSION:
+                    return None
+                if not np.array_equal(data['op2_stats'], _get_op2_stats(op2_filename)):
+                    return None
+                arrays = dict((key, data[key]) for key in data.files)
+    except (IOError, OSError, ValueError, KeyError):
+        # a corrupt sidecar is rebuilt
+        return None
+
+    index = OP2Index()
+    index.is_complete = bool(arrays['is_complete'])
+    n0 = int(arrays['n0'])
+    index.n0 = None if n0 == -1 else n0
+    endian = arrays['endian'].item()
+    index.endian = endian if endian else None
+    index.records = dict(
+        (offset, (ndata, end)) for offset, (ndata, end)
+        in zip(arrays['record_offsets'].tolist(), arrays['records'].tolist()))
+    index.table3_records = dict(
+        (offset, record.tobytes()) for offset, record
+        in zip(arrays['table3_offsets'].tolist(), arrays['table3_records']))
+
+    for table_name, (start, end) in zip(arrays['table_names'].tolist(), arrays['tables'].tolist()):
+        table = OP2TableIndex(table_name, start)
+        table.end = end
+        index._add_table(table)
+
+    for (itable, isubtable, offset, ndata, is_header), header in zip(
+            arrays['subtables'].tolist(), arrays['headers'].tolist()):
+        header = tuple(header) if is_header else None
+        isubtable = None if isubtable == 0 else isubtable
+        index.tables[itable].subtables.append((isubtable, offset, ndata, header))
+    return index
+
+def _get_op2_stats(op2_filename):
+    """gets the size and modification time, which flag a stale sidecar"""
+    stat = os.stat(op2_filename)
+    return np.array([stat.st_size, stat.st_mtime], dtype='float64')
+
+def _get_endian(data):
+    """gets the endian from the first marker; None if it's not an OP2"""
+    for endian in [b'<', b'>']:
+        if len(data) >= 4 and Struct(endian + b'i').unpack_from(data, 0)[0] == 4:
+            return endian
+    return None
+
+def _get_first_table_offset(data, endian):
+    """
+    Skips the OP2 header, which is:
+      - [3, date, 7, 'NASTRAN FORT TAPE ID CODE - ', 2, version, -1, 0]
+        for PARAM,POST,-1
+      - nothing for PARAM,POST,-2
+    """
+    struct_i = Struct(endian + b'i')
+    nbytes = len(data)
+    n = 0
+    if nbytes < 12 or struct_i.unpack_from(data, 4)[0] != 3:
+        return n
+
+    for unused_i in range(3):
+        # 3 [date], 7 [tape code], 2 [version]
+        n += 12
+        if n + 4 > nbytes:
+            return None
+        n += 8 + struct_i.unpack_from(data, n)[0]
+    # -1, 0
+    n += 24
+    if n > nbytes:
+        return None
+    return n
+
+def _scan_tables(index, data, n, endian):
+    """scans the tables of an OP2 that's been loaded into an mmap"""
+    struct_3i = Struct(endian + b'3i')
+    struct_i = Struct(endian + b'i')
+    struct_10i = Struct(endian + b'10i')
+    nbytes = len(data)
+
+    def read_marker(n):
+        """reads a [4, marker, 4] block; None for something else"""
+        if n + 12 > nbytes:
+            return None
+        nbytes1, marker, nbytes2 = struct_3i.unpack_from(data, n)
+        if nbytes1 != 4 or nbytes2 != 4:
+            return None
+        return marker
+
+    def read_record(n):
+        """reads the blocks of a record, which start with a positive marker"""
+        ndata = 0
+        nblocks = 0
+        marker = read_marker(n)
+        while marker is not None and marker > 0:
+            n += 12
+            if n + 4 > nbytes:
+                return None
+            nblock, = struct_i.unpack_from(data, n)
+            if nblock < 0 or n + 8 + nblock > nbytes:
+                return None
+            if struct_i.unpack_from(data, n + 4 + nblock)[0] != nblock:
+                return None
+            ndata += nblock
+            nblocks += 1
+            n += 8 + nblock
+            marker = read_marker(n)
+        if nblocks == 0:
+            return None
+        return ndata, n
+
+    while 1:
+        # the table name record or the end of the file
+        marker = read_marker(n)
+        if marker is None or marker == 0:
+            index.is_complete = (marker is None and n == nbytes) or marker == 0
+            return
+        out = read_record(n)
+        if out is None or out[0] != 8:
+            return
+        table = OP2TableIndex(data[n + 16:n + 24].strip(), n)
+        index.records[n] = out
+        n = out[1]
+
+        isubtable = None
+        while 1:
+            marker = read_marker(n)
+            if marker is None:
+                return
+            if marker > 0:
+                out = read_record(n)
+                if out is None:
+                    return
+                ndata = out[0]
+                header = None
+                if ndata == TABLE3_NDATA:
+                    header = struct_10i.unpack_from(data, n + 16)
+                    if out[1] == n + 20 + ndata:
+                        # a table 3 record in a single block
+                        index.table3_records[n] = data[n + 16:n + 16 + ndata]
+                table.subtables.append((isubtable, n, ndata, header))
+                index.records[n] = out
+                n = out[1]
+                continue
+
+            n += 12
+            if marker == 0:
+                # a bare 0 ends the table
+                break
+            isubtable = marker
+
+            # a table marker (e.g., -3) is followed by [1, 0] or
+            # the [1, flag] of a matrix column
+            if read_marker(n) == 1 and n + 24 <= nbytes and (
+                    struct_i.unpack_from(data, n + 12)[0] == 4):
+                n += 24
+                if read_marker(n) == 0:
+                    n += 12
+                    break
+        table.end = n
+        index._add_table(table)
@@ -0,0 +1,263 @@
+"""
+Defines the header-only inventory of an OP2:
+  - OP2Inventory
+  - ResultInventory
+  - get_op2_inventory(index, element_mapper=None, encoding='latin1')
+
+The inventory lists the tables, subcases, element types, and the number
+of time steps/modes/frequencies of the results and their sizes.  It's
+built from the index of the OP2 (see ``op2_index.py``), so only the
+markers and the table 3 (header) records are read; the table 4 (data)
+records are jumped over.  No table parsers are run and no result objects
+are created, so it's fast for a big OP2, and the sizes may be used to
+decide what to load (see ``OP2.include_exclude_results``).
+
+"""
+from __future__ import print_function
+from collections import OrderedDict
+from struct import Struct
+
+#: the tables where word 3 of the header is the element type
+ELEMENT_TABLE_PREFIXES = ('OES', 'OSTR', 'OEF', 'OEE')
+
+#: the analysis codes, where the time/frequency (word 5) is a float
+FLOAT_TIME_ANALYSIS_CODES = [5, 6, 10, 11]
+
+ANALYSIS_CODE_NAMES = {
+    1 : 'Statics',
+    2 : 'Normal modes or buckling (real eigenvalues)',
+    3 : 'Differential Stiffness 0 - obsolete',
+    4 : 'Differential Stiffness 1 - obsolete',
+    5 : 'Frequency',
+    6 : 'Transient',
+    7 : 'Pre-buckling',
+    8 : 'Post-buckling',
+    9 : 'Complex eigenvalues',
+    10 : 'Nonlinear statics',
+    11 : 'Geometric nonlinear statics',
+}
+
+FORMAT_CODE_NAMES = {
+    1 : 'Real',
+    2 : 'Real/Imaginary',
+    3 : 'Magnitude/Phase',
+}
+
+
+class ResultInventory(object):
+    """
+    The header info and size of a result (e.g., the CQUAD4 stress of
+    subcase 1 in OES1X1)
+
+    Attributes
+    ----------
+    table_name : str
+        the name of the table (e.g., 'OES1X1')
+    isubcase : int
+        the subcase id
+    element_type : int
+        the element type (e.g., 33 for CQUAD4); 0 for nodal results and
+        the strain energy (ONR) tables
+    element_name : str
+        the name of the element type (e.g., 'CQUAD4'); '' for nodal results
+    approach_code / table_code / format_code / num_wide : int
+        the codes of the table 3 record
+    ntimes : int
+        the number of subtables, which is the number of time
+        steps/modes/frequencies for a SORT1 result
+    times : List[int/float]
+        the time/mode/frequency (word 5) of the subtables
+    nvalues : int
+        the number of element/node entries of the first subtable, which is
+        ``nbytes / (4 * num_wide)`` of the table 4 record
+    nbytes : int
+        the number of bytes of the table 4 (data) records
+
+    """
+    def __init__(self, table_name, header, element_type, element_name):
+        approach_code, table_code, unused_element_type, isubcase = header[:4]
+        self.table_name = table_name
+        self.isubcase = isubcase
+        self.element_type = element_type
+        self.element_name = element_name
+        self.approach_code = approach_code
+        self.table_code = table_code
+        self.format_code = header[8]
+        self.num_wide = header[9]
+        self.ntimes = 0
+        self.times = []
+        self.nvalues = 0
+        self.nbytes = 0
+
+    @property
+    def analysis_code(self):
+        """the analysis code (e.g., 6 for transient)"""
+        return self.approach_code // 10
+
+    @property
+    def is_sort1(self):
+        """is the result SORT1"""
+        return not (self.table_code // 1000) & 2
+
+    def get_stats(self, short=False):
+        """gets a summary of the result"""
+        element_name = self.element_name if self.element_name else 'nodal'
+        sort = 'SORT1' if self.is_sort1 else 'SORT2'
+        if short:
+            return '%s[%s]; %s; table_code=%s; ntimes=%s; nvalues=%s; nbytes=%s\n' % (
+                self.table_name, self.isubcase, element_name, self.table_code,
+                self.ntimes, self.nvalues, self.nbytes)
+
+        msg = '%s[%s]; %s\n' % (self.table_name, self.isubcase, element_name)
+        msg += '  table_code=%s element_type=%s num_wide=%s\n' % (
+            self.table_code, self.element_type, self.num_wide)
+        msg += '  analysis=%s; format=%s; %s\n' % (
+            ANALYSIS_CODE_NAMES.get(self.analysis_code, '???'),
+            FORMAT_CODE_NAMES.get(self.format_code, '???'), sort)
+        msg += '  ntimes=%s nvalues=%s nbytes=%s\n' % (self.ntimes, self.nvalues, self.nbytes)
+        if self.times:
+            msg += '  times=[%g, ..., %g]\n' % (self.times[0], self.times[-1])
+        return msg
+
+    def __repr__(self):
+        return 'ResultInventory(table_name=%r, isubcase=%s, element_name=%r, ntimes=%s, nbytes=%s)' % (
+            self.table_name, self.isubcase, self.element_name, self.ntimes, self.nbytes)
+
+
+class OP2Inventory(object):
+    """
+    The tables and results of an OP2
+
+    Attributes
+    ----------
+    tables : OrderedDict[table_name] = nbytes
+        table_name : str
+            the name of the table (e.g., 'GEOM1', 'OUGV1')
+        nbytes : int
+            the size of the table; the sizes of the tables with the same
+            name are added
+    results : OrderedDict[key] = ResultInventory
+        key : (table_name, isubcase, table_code, element_type, element_name)
+            the table name, subcase id, table code (e.g., 1 for
+            displacement and 10 for velocity in OUGV1), and element
+            type/name of the result
+    is_complete : bool
+        was the whole OP2 indexed (see ``OP2Index.is_complete``)
+
+    """
+    def __init__(self):
+        self.tables = OrderedDict()
+        self.results = OrderedDict()
+        self.is_complete = False
+
+    @property
+    def subcases(self):
+        """gets the subcase ids of the results"""
+        return sorted(set(result.isubcase for result in self.results.values()))
+
+    @property
+    def nbytes(self):
+        """gets the size of the results"""
+        return sum(result.nbytes for result in self.results.values())
+
+    def get_op2_stats(self, short=False):
+        """
+        Gets a summary of the OP2, similar to ``OP2.get_op2_stats``
+
+        Parameters
+        ----------
+        short : bool; default=False
+            one line per result
+
+        Returns
+        -------
+        msg : str
+            the summary
+
+        """
+        msg = 'tables:\n'
+        for table_name, nbytes in self.tables.items():
+            msg += '  %-8s nbytes=%s\n' % (table_name, nbytes)
+        if not self.is_complete:
+            msg += '  ...the OP2 was not fully indexed\n'
+        msg += '\n'
+        for result in self.results.values():
+            msg += result.get_stats(short=short)
+            if not short:
+                msg += '\n'
+        return msg
+
+    def __repr__(self):
+        return 'OP2Inventory(ntables=%s, nresults=%s, nbytes=%s)' % (
+            len(self.tables), len(self.results), self.nbytes)
+
+
+def get_op2_inventory(index, element_mapper=None, encoding='latin1'):
+    """
+    Gets the inventory of an OP2 from its index
+
+    Parameters
+    ----------
+    index : OP2Index
+        the table of contents of the OP2 (see ``build_op2_index``)
+    element_mapper : Dict[element_type] = element_name; default=None
+        the names of the element types for the version of Nastran
+        (see ``Op2Codes.set_table_type``)
+    encoding : str; default='latin1'
+        the encoding of the table names
+
+    Returns
+    -------
+    inventory : OP2Inventory
+        the tables and results of the OP2
+
+    """
+    if element_mapper is None:
+        element_mapper = {}
+    inventory = OP2Inventory()
+    inventory.is_complete = index.is_complete
+
+    tables = inventory.tables
+    for table in index.tables:
+        table_name = table.table_name.decode(encoding)
+        tables[table_name] = tables.get(table_name, 0) + table.end - table.start
+
+    endian = index.endian if index.endian is not None else b'<'
+    struct_i = Struct(endian + b'i')
+    struct_f = Struct(endian + b'f')
+    struct_2i = Struct(endian + b'2i')
+
+    results = inventory.results
+    for table, pairs in index.get_result_records(None):
+        table_name = table.table_name.decode(encoding)
+        for table3, table4, unused_itime in pairs:
+            header = table3[3]
+            table_code = header[1]
+            element_type = header[2]
+            element_name = ''
+            if table_name.startswith(ELEMENT_TABLE_PREFIXES):
+                element_name = element_mapper.get(element_type, '')
+            elif table_name.startswith('ONR'):
+                # the strain energy tables have the element name in
+                # words 6-7 and the eigenvalue in word 3
+                element_type = 0
+                element_name = struct_2i.pack(*header[5:7]).decode(encoding).strip()
+            else:
+                element_type = 0
+
+            key = (table_name, header[3], table_code, element_type, element_name)
+            if key not in results:
+                results[key] = ResultInventory(table_name, header, element_type, element_name)
+            result = results[key]
+
+            ndata = table4[2]
+            if result.ntimes == 0 and result.num_wide > 0:
+                result.nvalues = ndata // (4 * result.num_wide)
+            result.ntimes += 1
+            result.nbytes += ndata
+
+            time = header[4]
+            if result.analysis_code in FLOAT_TIME_ANALYSIS_CODES:
+                time = struct_f.unpack(struct_i.pack(time))[0]
+            result.times.append(time)
+    return inventory
@@ -0,0 +1,174 @@
+"""
+Defines the memory-mapped read mode for the real SORT1 result tables:
+  - OP2MmapData
+
+In the memory-mapped read mode (``OP2.use_mmap = True``), the table 4
+records of the OUG/OES/OEF/OGPF/ONR-style tables are passed to the table
+parsers as a zero-copy ``memoryview`` of a memory map of the OP2 (instead
+of a ``bytes`` object).  The vectorized
+readers pass the results (e.g., ``floats[:, 2:]`` for a displacement) to
+``OP2Common._set_obj_data``, which gives them to ``OP2MmapData.add``.
+
+When every time step of a result is a single record and the records are
+evenly spaced in the file (the standard case for a transient/modal SORT1
+table), ``obj.data`` is a read-only strided view of the memory map, so the
+data is loaded from the disk when it's accessed.  Otherwise, the data is
+gathered from the memory map into ``obj.data`` at the end of the read.
+
+A view can't be modified in place (e.g., by a coordinate transform), so
+use ``obj.data = obj.data.copy()`` first.
+
+"""
+from __future__ import print_function
+import mmap
+import numpy as np
+
+#: the result tables that are passed to the parsers as a memoryview;
+#: the vectorized OUG/OES/OEF/OGPF/ONR readers accept one
+MMAP_TABLE_PREFIXES = (
+    b'OUG', b'BOUG', b'OVG', b'OAG', b'OQG', b'OQMG', b'OPG',
+    b'OES', b'OSTR', b'OEF', b'OGPF', b'ONR', b'OEE',
+)
+
+
+class OP2MmapData(object):
+    """
+    Tracks the location in the memory map of the result data
+
+    Attributes
+    ----------
+    data : mmap.mmap
+        the memory map of the OP2
+    segments : Dict[id(obj)] = (obj, segmentsi)
+        obj : ScalarObject
+            the result object
+        segmentsi : List[(itime, itotal, itotal2, offset, strides, shape)]
+            the location of obj.data[itime, itotal:itotal2, :] in the
+            memory map
+
+    """
+    def __init__(self, op2_file):
+        """
+        Parameters
+        ----------
+        op2_file : file
+            the opened OP2
+        """
+        self.data = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._bytes = np.frombuffer(self.data, dtype='uint8')
+        self._address = self._bytes.__array_interface__['data'][0]
+        self.segments = {}
+
+    def get_record(self, offset, ndata):
+        """
+        Gets a zero-copy view of a record
+
+        Parameters
+        ----------
+        offset : int
+            the offset of the data
+        ndata : int
+            the number of bytes in the record
+
+        Returns
+        -------
+        data : memoryview
+            the record
+
+        """
+        return memoryview(self.data)[offset:offset + ndata]
+
+    def add(self, obj, itime, itotal, itotal2, values):
+        """
+        Stores the location of obj.data[itime, itotal:itotal2, :]
+
+        Parameters
+        ----------
+        obj : ScalarObject
+            the result object
+        itime : int
+            the time index
+        itotal / itotal2 : int
+            the rows of obj.data
+        values : (itotal2 - itotal, ncols) float ndarray
+            the data, which is a view of a record
+
+        Returns
+        -------
+        is_mapped : bool
+            True : the location was stored
+            False : values isn't a view of the memory map, so it must be
+                    copied into obj.data
+
+        """
+        address = values.__array_interface__['data'][0] - self._address
+        if (values.ndim != 2 or address < 0 or address >= len(self.data) or
+                values.dtype != obj.data.dtype):
+            return False
+
+        key = id(obj)
+        if key not in self.segments:
+            self.segments[key] = (obj, [])
+        self.segments[key][1].append(
+            (itime, itotal, itotal2, address, values.strides, values.shape))
+        return True
+
+    def build_views(self, log=None):
+        """
+        Sets the obj.data of the result objects to views of the memory map,
+        which is done at the end of the read
+
+        Parameters
+        ----------
+        log : logger; default=None
+            logs the objects that couldn't be mapped
+
+        Returns
+        -------
+        nviews : int
+            the number of objects that are views of the memory map
+
+        """
+        nviews = 0
+        for obj, segments in self.segments.values():
+            view = self._get_view(obj, segments)
+            if view is not None:
+                obj.data = view
+                nviews += 1
+                continue
+
+            # the data is split over multiple records or the records aren't
+            # evenly spaced, so copy the data
+            if log is not None:
+                log.debug('gathering %s from the memory map' % obj.__class__.__name__)
+            for itime, itotal, itotal2, address, strides, shape in segments:
+                obj.data[itime, itotal:itotal2, :] = np.ndarray(
+                    shape, dtype=obj.data.dtype, buffer=self.data,
+                    offset=address, strides=strides)
+        self.segments = {}
+        return nviews
+
+    def _get_view(self, obj, segments):
+        """
+        Gets the strided view of the memory map for a result with a single
+        record per time step; None if it's not possible
+        """
+        ntimes, ntotal, ncols = obj.data.shape
+        if len(segments) != ntimes:
+            return None
+        segments = sorted(segments)
+        strides = segments[0][4]
+        offsets = []
+        for itime, (itimei, itotal, itotal2, address, stridesi, shape) in enumerate(segments):
+            if (itimei != itime or itotal != 0 or itotal2 != ntotal or
+                    stridesi != strides or shape != (ntotal, ncols)):
+                return None
+            offsets.append(address)
+
+        offsets = np.array(offsets, dtype='int64')
+        dtime = offsets[1] - offsets[0] if ntimes > 1 else 0
+        if not np.array_equal(np.diff(offsets), np.full(ntimes - 1, dtime, dtype='int64')):
+            return None
+        return np.ndarray(
+            (ntimes, ntotal, ncols), dtype=obj.data.dtype, buffer=self.data,
+            offset=int(offsets[0]), strides=(int(dtime),) + tuple(strides))
@@ -0,0 +1,131 @@
+"""
+Defines the parallel reading of the result tables of an OP2:
+  - get_parallel_tasks(index, table_names, valid_subcases=None)
+  - read_result_records(args)
+
+The OUG/OES/OEF/OGPF/ONR-style result tables of different subcases don't
+share any result objects, so the table 3/table 4 records of each subcase
+are read by a process pool with the standard table parsers, while the main
+process reads the other tables.  The result objects are sent back to the
+main process and merged into the result dictionaries (e.g.,
+``displacements``, ``cquad4_stress``).
+
+"""
+from __future__ import print_function
+from collections import OrderedDict
+
+from pyNastran.op2.op2_interface.op2_mmap import MMAP_TABLE_PREFIXES
+
+
+def get_parallel_tasks(index, table_names, valid_subcases=None):
+    """
+    Groups the result tables that may be read in parallel by subcase
+
+    Parameters
+    ----------
+    index : OP2Index
+        the table of contents of the OP2
+    table_names : Set[bytes]
+        the names of the result tables
+    valid_subcases : List[int]; default=None -> all
+        the subcases to read
+
+    Returns
+    -------
+    tasks : OrderedDict[isubcase] = records
+        isubcase : int
+            the subcase id
+        records : List[(table, pairs)]
+            the tables and table 3/table 4 records of the subcase
+            (see ``OP2Index.get_result_records``)
+    table_starts : Set[int]
+        the offsets of the tables that are read by the pool, which the
+        main process skips
+
+    """
+    tasks = OrderedDict()
+    table_starts = set()
+    if b'R1TABRG' in index.get_table_names():
+        # the optimization results depend on the design cycle count,
+        # which is found by reading the tables in order
+        return tasks, table_starts
+
+    for table, pairs in index.get_result_records(None):
+        table_name = table.table_name
+        if table_name not in table_names or not table_name.startswith(MMAP_TABLE_PREFIXES):
+            continue
+        if len(table.subtables) != 2 + 2 * len(pairs):
+            # the table isn't a standard [-1, -2, table3, table4, ...] table
+            continue
+
+        table_starts.add(table.start)
+        subcase_pairs = OrderedDict()
+        for pair in pairs:
+            isubcase = pair[0][3][3]
+            if isubcase not in subcase_pairs:
+                subcase_pairs[isubcase] = []
+            subcase_pairs[isubcase].append(pair)
+
+        for isubcase, pairsi in subcase_pairs.items():
+            if valid_subcases is not None and isubcase not in valid_subcases:
+                continue
+            if isubcase not in tasks:
+                tasks[isubcase] = []
+            tasks[isubcase].append((table, pairsi))
+    return tasks, table_starts
+
+def read_result_records(args):
+    """
+    Reads the result tables of a subcase in a worker process
+
+    Parameters
+    ----------
+    args : tuple
+        op2_filename : str
+            the op2_filename
+        mode : str
+            the version of Nastran (e.g., 'msc', 'nx')
+        encoding : str
+            the unicode encoding
+        results : ResultSet
+            the results to read (see ``OP2.include_exclude_results``)
+        valid_eids / valid_nids : (n, ) int ndarray / None
+            the elements/nodes to read (see ``OP2.set_element_ids``)
+        index : OP2Index
+            the index of the tables to read
+        records : List[(table, pairs)]
+            the tables and table 3/table 4 records to read
+
+    Returns
+    -------
+    results : List[(result_name, key, obj)]
+        result_name : str
+            the name of the result dictionary (e.g., 'displacements')
+        key : int/tuple
+            the key of the result in the dictionary
+        obj : ScalarObject
+            the result object
+    isubcase_name_map : Dict[isubcase] = List[subtitle, ...]
+        the subtitle/label of the subcases
+    result_names : Set[str]
+        the names of the results that were found
+
+    """
+    from pyNastran.op2.op2 import OP2
+    from pyNastran.utils.log import get_logger2
+
+    op2_filename, mode, encoding, results, valid_eids, valid_nids, index, records = args
+    model = OP2(debug=False, log=get_logger2(log=None, debug=None), mode=mode)
+    model._results = results
+    model.valid_eids = valid_eids
+    model.valid_nids = valid_nids
+    model._read_result_records(op2_filename, index, records, encoding=encoding)
+
+    objs = []
+    for result_name in model.get_table_types():
+        storage = model.get_result(result_name)
+        if not isinstance(storage, dict):
+            continue
+        for key, obj in storage.items():
+            objs.append((result_name, key, obj))
+    return objs, model.isubcase_name_map, model.result_names
@@ -55,6 +55,8 @@ from pyNastran.op2.tables.design_response import (
     WeightResponse, StressResponse, StrainResponse, ForceResponse,
     FlutterResponse, Convergence)
 from pyNastran.op2.tables.matrix import Matrix
+from pyNastran.op2.op2_interface.op2_index import build_op2_index, get_op2_index
+from pyNastran.op2.op2_interface.op2_mmap import MMAP_TABLE_PREFIXES
 
 #class MinorTables(object):
     #def __init__(self, op2_reader):
@@ -72,6 +74,12 @@ class OP2Reader(object):
         self.h5_file = None
 
         self.op2 = op2
+        #: the table of contents from the marker-only pre-scan
+        self.index = None
+        #: the memory map of the OP2 in the memory-mapped read mode
+        self.mmap_data = None
+        #: the offsets of the result tables that are read by a process pool
+        self.parallel_table_starts = set()
         #self.minor_tables = MinorTables(self)
 
         self.mapped_tables = {
@@ -1866,6 +1874,10 @@ class OP2Reader(object):
         # if we just use read_mode=2, some tests fail
         #
         if self.read_mode != read_mode_to_read_matrix and not self.debug_file:
+            indexed_table = self._get_indexed_table()
+            if indexed_table is not None:
+                self._goto(indexed_table.end)
+                return
             try:
                 self._skip_matrix_mat()  # doesn't work for matpools
             except MemoryError:
@@ -2438,6 +2450,27 @@ class OP2Reader(object):
             record = b''.join(records)
         return record, nrecord
 
+    def _read_mapped_record_ndata(self):
+        """
+        Reads a record as a zero-copy view of the memory map of the OP2
+        in the memory-mapped read mode.  A record that's split over
+        multiple blocks isn't contiguous, so it's read with
+        ``_read_record_ndata``.
+        """
+        if self.mmap_data is None or not self.op2.table_name.startswith(MMAP_TABLE_PREFIXES):
+            return self._read_record_ndata()
+        indexed_record = self._get_indexed_record()
+        if indexed_record is None:
+            return self._read_record_ndata()
+
+        # [4, marker, 4] [ndata, data, ndata]
+        ndata, end = indexed_record
+        n = self.op2.n
+        if end != n + 20 + ndata:
+            return self._read_record_ndata()
+        self._goto(end)
+        return self.mmap_data.get_record(n + 16, ndata), ndata
+
     def _read_block_ndata(self):
         """
         Reads a block following a pattern of:
@@ -2689,6 +2722,56 @@ class OP2Reader(object):
     #def log(self):
         #return self.op2.log
 
+    def build_index(self):
+        """
+        Creates the table of contents of the OP2 with a marker-only
+        pre-scan, which starts at the first table.  The index isn't used
+        when there's a debug file, so the debug file traces every marker.
+        """
+        op2 = self.op2
+        if self.index is not None and self.index.n0 == op2.f.tell():
+            # the index was created before the read (e.g., for a parallel read)
+            return
+        self.index = None
+        if not op2.use_index or self.is_debug_file:
+            return
+        if op2.use_index_file:
+            self.index = get_op2_index(op2.op2_filename, op2.f.tell(), op2._endian, log=self.log)
+        else:
+            self.index = build_op2_index(op2.op2_filename, op2.f.tell(), op2._endian)
+        if not self.index.is_complete:
+            self.log.debug('the OP2 index stops after %s tables' % len(self.index.tables))
+
+    def _get_indexed_record(self):
+        """
+        Gets the (ndata, end) of the record at the current position from
+        the index; None if the record isn't indexed
+        """
+        if self.index is None:
+            return None
+        return self.index.get_record(self.op2.n)
+
+    def _read_table3_record(self):
+        """
+        Reads a table 3 (header) record; the copy in the index is used for
+        the array sizing (read_mode=1), so the OP2 isn't read
+        """
+        if self.read_mode == 1 and self.index is not None:
+            data = self.index.table3_records.get(self.op2.n)
+            if data is not None:
+                self._goto(self.index.records[self.op2.n][1])
+                return data, len(data)
+        return self._read_record_ndata()
+
+    def _get_indexed_table(self):
+        """
+        Gets the OP2TableIndex of the table at the current position from
+        the index; None if the table isn't indexed
+        """
+        if self.index is None:
+            return None
+        return self.index.get_table(self.op2.n)
+
     def _skip_table_helper(self):
         """
         Skips the majority of geometry/result tables as they follow a very standard format.
@@ -2738,6 +2821,11 @@ class OP2Reader(object):
             a record of None indicates a skipped block
 
         """
+        indexed_record = self._get_indexed_record()
+        if indexed_record is not None:
+            self._goto(indexed_record[1])
+            return None
+
         unused_markers0 = self.get_nmarkers(1, rewind=False)
         record = self._skip_block()
 
@@ -2752,6 +2840,12 @@ class OP2Reader(object):
     def _skip_record_ndata(self, debug=True, macro_rewind=False):
         """the skip version of ``_read_record_ndata``"""
         op2 = self.op2
+        indexed_record = self._get_indexed_record()
+        if indexed_record is not None:
+            nrecord, n = indexed_record
+            self._goto(n)
+            return None, nrecord
+
         marker0 = self.get_marker1(rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [4, %i, 4]; macro_rewind=%s\n' % (
@@ -2794,6 +2888,10 @@ class OP2Reader(object):
 
         """
         op2 = self.op2
+        indexed_record = self._get_indexed_record()
+        if indexed_record is not None:
+            return indexed_record[0]
+
         if self.is_debug_file:
             self.binary_debug.write('_get_record_length\n')
         len_record = 0
@@ -2885,6 +2983,74 @@ class OP2Reader(object):
 
     def read_results_table(self):
         """Reads a results table"""
+        indexed_table = self._get_indexed_table()
+        if indexed_table is not None and indexed_table.start in self.parallel_table_starts:
+            # the table is read by the process pool
+            self._goto(indexed_table.end)
+            return
+        if self.read_mode == 1 and indexed_table is not None:
+            # the result objects are sized from the stored table 3 records
+            # and the table 4 record lengths, so the data isn't read
+            pairs = indexed_table.get_subtable_pairs()
+            if pairs is not None:
+                self.read_results_table_records(
+                    indexed_table, [(table3, table4, None) for table3, table4 in pairs])
+                return
+        self._read_results_table_header()
+        self._read_subtables()
+
+    def read_results_table_records(self, indexed_table, pairs):
+        """
+        Reads some of the subtables of a results table, which are found
+        with the index
+
+        Parameters
+        ----------
+        indexed_table : OP2TableIndex
+            the table
+        pairs : List[(table3, table4, itime)]
+            the table 3/table 4 records to read
+            (see ``OP2Index.get_result_records``)
+
+        Returns
+        -------
+        objs : List[ScalarObject]
+            the result objects that were filled (read_mode=2); a table
+            without a reader is skipped like in ``_read_subtables``
+
+        """
+        op2 = self.op2
+        self._goto(indexed_table.start)
+        self._read_results_table_header()
+
+        op2._table4_count = 0
+        op2.is_table_1 = True
+        op2._data_factor = 1
+        table_mapper = op2._get_table_mapper()
+        if op2.table_name not in table_mapper:
+            if self.read_mode == 2:
+                self.log.info("skipping table_name = %r" % op2.table_name)
+            self._goto(indexed_table.end)
+            op2._finish()
+            return []
+        table3_parser, table4_parser = table_mapper[op2.table_name]
+
+        objs = []
+        for table3, table4, unused_itime in pairs:
+            for isubtable, offset, unused_ndata, unused_header in [table3, table4]:
+                self._goto(offset)
+                op2.isubtable = isubtable
+                op2.is_start_of_subtable = True
+                self._read_subtable_3_4(table3_parser, table4_parser, False)
+            obj = getattr(op2, 'obj', None)
+            if self.read_mode == 2 and obj is not None and not any(obj is obji for obji in objs):
+                objs.append(obj)
+        self._goto(indexed_table.end)
+        op2._finish()
+        return objs
+
+    def _read_results_table_header(self):
+        """reads the table name and the -1/-2 records of a results table"""
         op2 = self.op2
         if self.is_debug_file:
             self.binary_debug.write('read_results_table - %s\n' % op2.table_name)
@@ -2934,7 +3100,6 @@ class OP2Reader(object):
             raise RuntimeError('the file hasnt been cleaned up; subtable_name_old=%s new=%s' % (
                 op2.subtable_name, subtable_name))
         op2.subtable_name = subtable_name
-        self._read_subtables()
 
     def generic_stop_table(self, data, ndata):  # pragma: no cover
         """print table data when things get weird"""
@@ -3012,6 +3177,13 @@ class OP2Reader(object):
             table4_parser = None
             passer = True
 
+            indexed_table = self._get_indexed_table()
+            if indexed_table is not None:
+                # none of the subtables are read, so jump to the end
+                self._goto(indexed_table.end)
+                op2._finish()
+                return
+
         # we need to check the marker, so we read it and rewind, so we don't
         # screw up our positioning in the file
         markers = self.get_nmarkers(1, rewind=True)
@@ -3106,7 +3278,7 @@ class OP2Reader(object):
                 'h5_file' : self.h5_file,
             }
             op2.obj = None
-            data, ndata = self._read_record_ndata()
+            data, ndata = self._read_table3_record()
             if not passer:
                 try:
                     table3_parser(data, ndata)
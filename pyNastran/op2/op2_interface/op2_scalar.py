@@ -6,6 +6,8 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
 
    **Methods**
    - set_subcases(subcases=None)
+   - set_element_ids(eids=None)
+   - set_node_ids(nids=None)
    - set_transient_times(times)
    - read_op2(op2_filename=None, combine=False)
    - set_additional_generalized_tables_to_read(tables)
@@ -57,6 +59,7 @@ from pyNastran import is_release
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.tables.grid_point_weight import GridPointWeight
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader
+from pyNastran.op2.op2_interface.op2_mmap import OP2MmapData
 from pyNastran.bdf.cards.params import PARAM
 
 #============================
@@ -670,6 +673,20 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         #: it takes double the RAM, but is easier to use
         self.apply_symmetry = True
 
+        #: should the table of contents be found with a marker-only
+        #: pre-scan, so records/tables are skipped with a single seek and
+        #: the result objects are sized from the index (read_mode=1)
+        self.use_index = True
+
+        #: should the index be loaded from/saved to a .op2idx sidecar file,
+        #: so the pre-scan is skipped the next time the OP2 is read
+        self.use_index_file = False
+
+        #: should the real SORT1 results (obj.data) be read-only views of a
+        #: memory map of the OP2 instead of copies, so the data is loaded
+        #: when it's accessed (see OP2MmapData); requires use_index
+        self.use_mmap = False
+
         LAMA.__init__(self)
         ONR.__init__(self)
         OGPF.__init__(self)
@@ -732,6 +749,47 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             self.valid_subcases = set(subcases)
         self.log.debug("set_subcases - subcases = %s" % self.valid_subcases)
 
+    def set_element_ids(self, eids=None):
+        """
+        Allows you to read only the element results (e.g., stress, force)
+        of the elements in eids
+
+        Parameters
+        ----------
+        eids : List[int, ...] / int ndarray / int; default=None->all elements
+            the element ids to read
+
+        The rows of the other elements are removed from the SORT1
+        OES/OSTR/OEF tables before they're parsed, so the result arrays
+        are sized by the number of selected elements.  SORT2 tables are
+        read in full.
+
+        """
+        self.valid_eids = _get_valid_ids(eids)
+        self.log.debug("set_element_ids - neids = %s" % (
+            'all' if self.valid_eids is None else len(self.valid_eids)))
+
+    def set_node_ids(self, nids=None):
+        """
+        Allows you to read only the nodal results (e.g., displacement,
+        spc force, grid point force) of the nodes in nids
+
+        Parameters
+        ----------
+        nids : List[int, ...] / int ndarray / int; default=None->all nodes
+            the node ids to read
+
+        The rows of the other nodes are removed from the SORT1
+        OUG/OQG/OPG/OGPF-style tables (including the relative ROUGV1,
+        the temperature TOUGV1, and the RADxxx/RAQxxx/RAGxxx modal
+        tables) before they're parsed, so the result arrays are sized by
+        the number of selected nodes.  SORT2 tables are read in full.
+
+        """
+        self.valid_nids = _get_valid_ids(nids)
+        self.log.debug("set_node_ids - nnids = %s" % (
+            'all' if self.valid_nids is None else len(self.valid_nids)))
+
     def set_transient_times(self, times):  # TODO this name sucks...
         """
         Takes a dictionary of list of times in a transient case and
@@ -1454,6 +1512,8 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self._create_binary_debug()
         self._setup_op2()
         self.op2_reader.read_nastran_version(mode)
+        if self.read_mode == 1:
+            self.op2_reader.build_index()
 
         #=================
         table_name = self.op2_reader._read_table_name(rewind=True, stop_on_failure=False)
@@ -1461,7 +1521,12 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             raise FatalError('There was a Nastran FATAL Error.  Check the F06.\nNo tables exist...')
 
         self._make_tables()
+        if self.read_mode == 2 and self.use_mmap and self.op2_reader.index is not None:
+            self.op2_reader.mmap_data = OP2MmapData(self.f)
         table_names = self._read_tables(table_name)
+        if self.op2_reader.mmap_data is not None:
+            self.op2_reader.mmap_data.build_views(self.log)
+            self.op2_reader.mmap_data = None
 
         self.close_op2(force=False)
         #self.remove_unpickable_data()
@@ -1499,7 +1564,7 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             'element_name', 'sort_bits', 'code', 'n', 'use_vector', 'ask',
             'stress_bits', 'expected_times', 'table_code', 'sort_code',
             'is_all_subcases', 'num_wide', '_table_mapper', 'label',
-            'apply_symmetry',
+            'apply_symmetry', 'use_index', 'use_index_file', 'use_mmap',
             'words', 'device_code', 'table_name', '_count', 'additional_matrices',
             # 350
             'data_names', '_close_op2',
@@ -1824,6 +1889,15 @@ def main():  # pragma: no cover
     #f06_outname = model + '.test_op2.f06'
     #o.write_f06(f06_outname)
 
+def _get_valid_ids(ids):
+    """gets the sorted, unique element/node ids (or None for all)"""
+    if ids is None:
+        return None
+    ids = np.unique(np.asarray(ids, dtype='int64').ravel())
+    if len(ids) == 0:
+        return None
+    return ids
+
 def create_binary_debug(op2_filename, debug_file, log):
     """helper method"""
     binary_debug = None
@@ -1,371 +1,301 @@
 """
 Defines:
+ - get_node_transforms(icd_transform, coords, xyz_cid0=None, cid=0)
+ - apply_node_transforms(data, inode, transforms)
+ - apply_gpforce_transforms(result, nids_all, inode, transforms)
  - transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
                                     log, debug=False)
  - transform_gpforce_to_globali(subcase, result,
                                  nids_all, nids_transform,
                                  i_transform, coords, xyz_cid0, log)
+
+The output (CD) frame of a node is stacked into a (nnodes, 3, 3) array of
+transformation matrices, which is built once for all the coordinate
+systems and applied to all the time steps of a result with a batched
+matrix multiply, so there's no loop over the coordinate systems or the
+time steps.
 """
 from __future__ import print_function
-import sys
 import numpy as np
 
-from pyNastran.femutils.coord_transforms import cylindrical_rotation_matrix
-from pyNastran.femutils.matrix3d import (
-    dot_n33_33,
-    #dot_n33_n33,
-    dot_33_n33, dot_n33_n3)
+#: the maximum number of values that are transformed at once, which
+#: limits the size of the temporary arrays for a big result
+BLOCK_SIZE = 4 * 1024 * 1024
 
 
-def transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                     log, debug=False):
+def get_node_transforms(icd_transform, coords, xyz_cid0=None, cid=0):
     """
-    Performs an inplace operation to transform the DISPLACMENT, VELOCITY,
-    ACCELERATION result into the global (cid=0) frame
+    Gets the transformation matrices from the output (CD) frame of the
+    nodes to the output coordinate system
+
+    Parameters
+    ----------
+    icd_transform : dict{int cid : int ndarray}
+        Dictionary from coordinate id to index of the nodes in
+        ``BDF.point_ids`` that their output (`CD`) in that
+        coordinate system.
+    coords : dict{int cid :Coord()}
+        Dictionary of coordinate id to the coordinate object
+    xyz_cid0 : (nnodes+nspoints, 3) float ndarray; default=None
+        the nodes in the global frame
+        required for cylindrical/spherical coordinate systems
+    cid : int; default=0
+        the coordinate system to transform to
+        xyz_cid0 is required if cid != 0, so the nodes that aren't in
+        icd_transform are transformed from the global frame
+
+    Returns
+    -------
+    inode : (n, ) int ndarray
+        the sorted indices of the nodes that are transformed; nodes
+        with an identity transform are skipped
+    transforms : (n, 3, 3) float ndarray
+        the transformation matrices, where
+        ``u_cid = transforms[i] @ u_cd``
 
     """
-    #print('result.name = ', result.class_name)
-    data = result.data
-    for cid, inode in icd_transform.items():
-        if cid in [-1, 0]:
+    if cid != 0:
+        # the global (cd=0) nodes are usually left out of icd_transform
+        if xyz_cid0 is None:
+            raise RuntimeError('xyz_cid0 is required to transform to cid=%s' % cid)
+        icd_transform = dict(icd_transform)
+        inode_all = [np.asarray(inode) for inode in icd_transform.values()]
+        inode_cd0 = np.setdiff1d(np.arange(len(xyz_cid0)), np.hstack(inode_all + [[]]))
+        icd_transform[0] = np.union1d(icd_transform.get(0, []), inode_cd0).astype('int32')
+
+    inodes = []
+    icoords = []
+    cids = []
+    for cd, inode in sorted(icd_transform.items()):
+        if cd == -1 or cd == cid or len(inode) == 0:
+            # SPOINTs/EPOINTs don't have a frame and nodes that are
+            # already in the output frame don't change
             continue
+        inodes.append(inode)
+        icoords.append(np.full(len(inode), len(cids), dtype='int32'))
+        cids.append(cd)
+
+    if not inodes:
+        return np.zeros(0, dtype='int32'), np.zeros((0, 3, 3), dtype='float64')
+
+    inode = np.hstack(inodes)
+    icoord = np.hstack(icoords)
+    isort = np.argsort(inode, kind='mergesort')
+    inode = inode[isort]
+    icoord = icoord[isort]
+
+    xyz = None if xyz_cid0 is None else np.asarray(xyz_cid0)[inode, :]
+    transforms = _get_frames(coords, cids, icoord, xyz)
+    if cid != 0:
+        frames_out = _get_frames(coords, [cid], np.zeros(len(inode), dtype='int32'), xyz)
+        transforms = np.matmul(frames_out.transpose(0, 2, 1), transforms)
+
+    is_identity = (transforms == np.eye(3)).all(axis=(1, 2))
+    if is_identity.any():
+        ikeep = np.where(~is_identity)[0]
+        inode = inode[ikeep]
+        transforms = transforms[ikeep]
+    return inode, transforms
+
+def _get_frames(coords, cids, icoord, xyz):
+    """
+    Gets the local frames of the nodes
+
+    Parameters
+    ----------
+    coords : dict{int cid :Coord()}
+        Dictionary of coordinate id to the coordinate object
+    cids : List[int]
+        the coordinate systems
+    icoord : (n, ) int ndarray
+        the index of the coordinate system of each node in cids
+    xyz : (n, 3) float ndarray / None
+        the nodes in the global frame
+
+    Returns
+    -------
+    frames : (n, 3, 3) float ndarray
+        the (e1, e2, e3) unit vectors of each node in the global frame
+        are the columns
+
+    """
+    ncoords = len(cids)
+    betas = np.zeros((ncoords, 3, 3), dtype='float64')
+    origins = np.zeros((ncoords, 3), dtype='float64')
+    # 0=rectangular, 1=cylindrical, 2=spherical
+    coord_types = np.zeros(ncoords, dtype='int32')
+    for i, cid in enumerate(cids):
         coord = coords[cid]
+        betas[i, :, :] = coord.beta()
+        origins[i, :] = coord.origin
         coord_type = coord.type
-        cid_transform = coord.beta()
-
-        # a global coordinate system has 1.0 along the main diagonal
-        is_global_cid = False
-        if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-            is_global_cid = True
-
-        if not is_global_cid and debug:
-            log.debug('coord\n%s' % coord)
-            log.debug(cid_transform)
-            log.debug('inode = [%s]' % ', '.join([str(val).rstrip('L') for val in inode.tolist()]))
-            log.debug('data.shape = %s' % str(data.shape))
-            log.debug('len(inode) = %s' % len(inode))
-            assert np.array_equal(inode, np.unique(inode))
-
-        if coord_type in ['CORD2R', 'CORD1R']:
-            if is_global_cid:
-                #self.log.debug('is_global_cid')
-                continue
-            #self.log.debug('rectangular')
-
-
-            # isat_tran.op2
-            #  - nspoint = 4
-            #  - ngrid = 5379
-            #
-            #  - ntotal = 5383
-            #  data.shape = (101, 8, 6)
-            translation = data[:, inode, :3]
-            rotation = data[:, inode, 3:]
-            data[:, inode, :3] = translation.dot(cid_transform)
-            data[:, inode, 3:] = rotation.dot(cid_transform)
-
-        elif coord_type in ['CORD2C', 'CORD1C']:
-            #self.log.debug('cylindrical')
-            if xyz_cid0 is None:
-                msg = 'xyz_cid0 is required for cylindrical coordinate transforms'
-                raise RuntimeError(msg)
-            _transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform,
-                                                is_global_cid)
-
+        if coord_type in ['CORD2C', 'CORD1C']:
+            coord_types[i] = 1
         elif coord_type in ['CORD2S', 'CORD1S']:
-            #print('spherical')
-            if xyz_cid0 is None:
-                msg = ('xyz_cid is required for spherical '
-                       'coordinate transforms')
-                raise RuntimeError(msg)
-            _transform_spherical_displacement(inode, data, coord, xyz_cid0, cid_transform,
-                                              is_global_cid)
-        else:
+            coord_types[i] = 2
+        elif coord_type not in ['CORD2R', 'CORD1R', 'CORD3G']:
             raise RuntimeError(coord)
 
+    # the rows of beta are the axes of the coordinate system
+    frames = betas.transpose(0, 2, 1)[icoord, :, :]
+
+    node_types = coord_types[icoord]
+    icurvilinear = np.where(node_types > 0)[0]
+    if len(icurvilinear):
+        if xyz is None:
+            msg = 'xyz_cid0 is required for cylindrical/spherical coordinate transforms'
+            raise RuntimeError(msg)
+        icoordi = icoord[icurvilinear]
+        xyz_local = np.einsum('nij,nj->ni', betas[icoordi, :, :],
+                              xyz[icurvilinear, :] - origins[icoordi, :])
+        rotations = _get_curvilinear_rotations(xyz_local, node_types[icurvilinear] == 2)
+        frames[icurvilinear, :, :] = np.matmul(frames[icurvilinear, :, :], rotations)
+    return frames
+
+def _get_curvilinear_rotations(xyz_local, is_spherical):
+    """
+    Gets the (R, theta, z) and (R, theta, phi) unit vectors of the nodes
+    in the rectangular frame of their coordinate system
+
+    Parameters
+    ----------
+    xyz_local : (n, 3) float ndarray
+        the nodes in the rectangular frame of their coordinate system
+    is_spherical : (n, ) bool ndarray
+        is the coordinate system spherical; otherwise, cylindrical
+
+    Returns
+    -------
+    rotations : (n, 3, 3) float ndarray
+        the unit vectors are the columns
 
-def _transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform, is_global_cid):
-    """helper method for transform_displacement_to_global"""
-    xyzi = xyz_cid0[inode, :]
-    rtz_cid = coord.xyz_to_coord_array(xyzi)
-
-    #print('rtz_cid:')
-    #print(rtz_cid)
-    thetad = rtz_cid[:, 1]
-    thetar = np.radians(thetad)
-    #print('thetad[cid=%s] = %s' % (coord.cid, thetad))
-    #print('thetar = ', thetar)
-    #self.log.debug('thetad = %s' % list(thetad))
-
-    #np.set_printoptions(precision=None, threshold=None, edgeitems=None, linewidth=None, suppress=True,
-                        #nanstr=None, infstr=None, formatter=None, sign=None, floatmode=None)
-    xforms = cylindrical_rotation_matrix(thetar, dtype='float64')
-    #print('xforms.shape = %s' % str(xforms.shape))
-
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode, :3]
-        rotation = data[itime, inode, 3:]
-        #theta_max1 = translation[:, 1].max()
-        #theta_max2 = rotation[:, 1].max()
-        #print('theta_max = ', max(theta_max1, theta_max2))
-
-        if is_global_cid:
-            translation2 = dot_n33_n3(xforms, translation)
-            rotation2 = dot_n33_n3(xforms, rotation)
-        else:
-            #print('cid_transform[cid=%s]:\n%s' % (coord.cid, cid_transform))
-            #print('xforms:\n%s' % (xforms))
-            #xforms2 = dot_33_n33(xforms, cid_transform)  # wrong shape
-            #xforms2a = dot_33_n33(cid_transform, xforms)
-            #xforms2b = dot_n33_33(xforms, cid_transform)
-            #xforms2b = xforms
-            # triple products
-            #xforms2c = dot_33_n33(cid_transform.T, dot_n33_33(xforms, cid_transform))
-            #xforms2d = dot_33_n33(cid_transform, dot_n33_33(xforms, cid_transform.T))
-
-            #print('xform A:\n%s'  % xforms2a)
-            #print('xform B:\n%s'  % xforms2b)
-            #translation2 = dot_n33_n3(xforms2a, translation)
-            #xforms2 = xforms2b
-            if 1:
-                xforms2b = dot_n33_33(xforms, cid_transform)
-                translation2 = dot_n33_n3(xforms2b, translation)
-                rotation2 = dot_n33_n3(xforms2b, rotation)
-            elif 0:  ## pragma: no cover
-                xforms2b = dot_n33_33(xforms, cid_transform)
-                translation2a = dot_n33_n3(xforms2b, translation)
-                rotation2a = dot_n33_n3(xforms2b, rotation)
-                print('translation2a.shape =', translation2a.shape)
-                assert translation.shape == translation2a.shape
-
-                translation2 = translation2a.dot(cid_transform)
-                rotation2 = rotation2a.dot(cid_transform)
-
-            elif 0:  ## pragma: no cover
-                # bad shape
-                translation2a = dot_n33_n3(xforms, translation)
-                rotation2a = dot_n33_n3(xforms, rotation)
-                print('translation2a.shape =', translation2a.shape)
-                assert translation.shape == translation2a.shape
-
-                translation2 = cid_transform.dot(translation2a.dot(cid_transform))
-                rotation2 = cid_transform.dot(rotation2a.dot(cid_transform))
-            else:  ## pragma: no cover
-                raise NotImplementedError('pick an option...')
-        #print('translation.shape', translation.shape)
-        #print('translation2.shape', translation2.shape)
-        data[itime, inode, :3] = translation2
-        data[itime, inode, 3:] = rotation2
-
-def _transform_spherical_displacement(inode, data, coord, xyz_cid0, cid_transform, is_global_cid):
-    """helper method for transform_displacement_to_global"""
-    xyzi = xyz_cid0[inode, :]
-    #_transform_spherical_displacement_func
-    #rtp_cid = coord.xyz_to_coord_array(xyzi)
-    #theta = rtp_cid[:, 1]
-    #phi = rtp_cid[:, 2]
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode, :3]
-        rotation = data[itime, inode, 3:]
-        #if 0:
-            #translation[:, 1] += theta
-            #translation[:, 2] += phi
-            #rotation[:, 1] += theta
-            #rotation[:, 2] += phi
-        translation = coord.coord_to_xyz_array(translation)
-        rotation = coord.coord_to_xyz_array(rotation)
-        if is_global_cid:
-            data[itime, inode, :3] = translation
-            data[itime, inode, 3:] = rotation
-            return
-        data[itime, inode, :3] = translation.dot(cid_transform)
-        data[itime, inode, 3:] = rotation.dot(cid_transform)
-
-def transform_gpforce_to_globali(subcase, result,
-                                 nids_all, nids_transform,
-                                 i_transform, coords, xyz_cid0, log):
     """
-    Performs an inplace operation to transform the GPFORCE result
-    into the global (cid=0) frame
+    x = xyz_local[:, 0]
+    y = xyz_local[:, 1]
+    z = xyz_local[:, 2]
+    phi = np.arctan2(y, x)
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+
+    # cylindrical:
+    #   e_r = [cos(theta), sin(theta), 0]
+    #   e_t = [-sin(theta), cos(theta), 0]
+    #   e_z = [0, 0, 1]
+    rotations = np.zeros((len(x), 3, 3), dtype='float64')
+    rotations[:, 0, 0] = cos_phi
+    rotations[:, 1, 0] = sin_phi
+    rotations[:, 0, 1] = -sin_phi
+    rotations[:, 1, 1] = cos_phi
+    rotations[:, 2, 2] = 1.
+
+    ispherical = np.where(is_spherical)[0]
+    if len(ispherical):
+        # spherical (theta is measured from the z-axis):
+        #   e_r = [sin(theta)*cos(phi), sin(theta)*sin(phi), cos(theta)]
+        #   e_t = [cos(theta)*cos(phi), cos(theta)*sin(phi), -sin(theta)]
+        #   e_p = [-sin(phi), cos(phi), 0]
+        theta = np.arctan2(np.hypot(x[ispherical], y[ispherical]), z[ispherical])
+        cos_theta = np.cos(theta)
+        sin_theta = np.sin(theta)
+        cos_phii = cos_phi[ispherical]
+        sin_phii = sin_phi[ispherical]
+        rotations[ispherical, :, :] = np.stack([
+            np.column_stack([sin_theta * cos_phii, cos_theta * cos_phii, -sin_phii]),
+            np.column_stack([sin_theta * sin_phii, cos_theta * sin_phii, cos_phii]),
+            np.column_stack([cos_theta, -sin_theta, np.zeros(len(theta))]),
+        ], axis=1)
+    return rotations
+
+def apply_node_transforms(data, inode, transforms):
+    """
+    Performs an inplace transform of the translations/rotations of the nodes
+
+    Parameters
+    ----------
+    data : (ntimes, nnodes, 6) float/complex ndarray
+        the result data (e.g., the displacements)
+    inode : (n, ) int ndarray
+        the indices of the nodes to transform
+    transforms : (n, 3, 3) float ndarray
+        the transformation matrices of the nodes
+
+    """
+    nnodes = len(inode)
+    if nnodes == 0:
+        return
+    ntimes, unused_nnodes_all, nfields = data.shape
+    transforms_t = transforms.transpose(0, 2, 1)
+
+    # the translations/rotations of a time step are a (nnodes, 2, 3) array,
+    # so all the vectors are transformed with one matrix multiply
+    ntimes_block = max(1, BLOCK_SIZE // (nnodes * nfields))
+    for itime in range(0, ntimes, ntimes_block):
+        itimes = slice(itime, min(itime + ntimes_block, ntimes))
+        vectors = data[itimes, inode, :]
+        vectors = vectors.reshape(vectors.shape[0], nnodes, nfields // 3, 3)
+        data[itimes, inode, :] = np.matmul(vectors, transforms_t).reshape(-1, nnodes, nfields)
+
+def apply_gpforce_transforms(result, nids_all, inode, transforms):
+    """
+    Performs an inplace transform of the grid point forces
+
+    Parameters
+    ----------
+    result : RealGridPointForcesArray
+        the grid point forces
+    nids_all : (nnodes+nspoints, ) int ndarray
+        the sorted node ids that ``inode`` indexes (see ``BDF.point_ids``)
+    inode : (n, ) int ndarray
+        the indices of the nodes to transform
+    transforms : (n, 3, 3) float ndarray
+        the transformation matrices of the nodes
 
     """
-    log.debug('result.name = %s' % result.class_name)
+    if not result.is_unique: # TODO: doesn't support preload
+        raise NotImplementedError(result)
+    if len(inode) == 0:
+        return
+
+    nids_all = np.asarray(nids_all)
+    # itransform[i] is the index of the transform of node nids_all[i]
+    # and -1 for the nodes that aren't transformed
+    itransform = np.full(len(nids_all), -1, dtype='int32')
+    itransform[inode] = np.arange(len(inode), dtype='int32')
+
     data = result.data
+    nids_gp = result.node_element[:, :, 0]
+    if (nids_gp == nids_gp[0, :]).all():
+        time_nids = [(slice(None), nids_gp[0, :])]
+    else:
+        time_nids = [(slice(itime, itime + 1), nids_gp[itime, :])
+                     for itime in range(nids_gp.shape[0])]
+
+    for itimes, nids in time_nids:
+        irow = np.searchsorted(nids_all, nids)
+        irow[irow == len(nids_all)] = 0
+        itransformi = np.where(nids_all[irow] == nids, itransform[irow], -1)
+        igp = np.where(itransformi >= 0)[0]
+        apply_node_transforms(data[itimes, :, :], igp, transforms[itransformi[igp], :, :])
+
+def transform_displacement_to_global(unused_subcase, result, icd_transform, coords, xyz_cid0,
+                                     unused_log, debug=False):
+    """
+    Performs an inplace operation to transform the DISPLACMENT, VELOCITY,
+    ACCELERATION result into the global (cid=0) frame
 
-    # inode_xyz :
-    #    the indices of the nodes in the model grid point list
-    for cid, inode_xyz in i_transform.items():
-        log.debug('cid = %s' % cid)
-        if cid in [-1, 0]:
-            continue
-        coord = coords[cid]
-        coord_type = coord.type
-        cid_transform = coord.beta()
-
-        # a global coordinate system has 1s along the main diagonal
-        is_global_cid = False
-        if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-            is_global_cid = True
-        nids = np.array(nids_transform[cid])
-
-        #from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
-        #result = RealGridPointForcesArray()
-        if result.is_unique: # TODO: doesn't support preload
-            #self.node_element = zeros((self.ntimes, self.ntotal, 2), dtype='int32')
-            nids_all_gp = result.node_element[0, :, 0]
-
-            log.debug('nids_all_gp = %s' % list(nids_all_gp))
-            log.debug('nids = %s' % list(nids))
-
-            # the indices of the grid points that we're transforming
-            inode_gp = np.where(np.in1d(nids_all_gp, nids))[0]
-            log.debug('inode_gp = %s' % list(inode_gp))
-            nids_gp = nids_all_gp[inode_gp]
-            log.debug('nids_gp = %s' % list(nids_gp))
-            if not np.array_equal(np.unique(nids_gp), np.unique(nids)):
-                msg = 'nids_gp=%s nids=%s' % (nids_gp, nids)
-                raise RuntimeError(msg)
-
-            log.debug('---------')
-            # the transformation index to go from xyz to the grid point forces
-            inode_gp_xyz = np.searchsorted(nids_all, nids_all_gp)
-            log.debug('nids_all = %s' % list(nids_all))
-            log.debug('nids_all_gp = %s' % list(nids_all_gp))
-            log.debug('inode_xyz = %s' % list(inode_xyz))
-            log.debug('inode_gp_xyz = %s' % list(inode_gp_xyz))
-            sys.stdout.flush()
-            assert len(inode_gp_xyz) == len(nids_all_gp), len(nids_all_gp)
-        else:
-            raise NotImplementedError(result)
-
-        if coord_type in ['CORD2R', 'CORD1R']:
-            if is_global_cid:
-                continue
-            #print('coord\n', coord)
-            #print(cid_transform)
-            #print('inode = %s' % inode)
-            #print('rectangular')
-            translation = data[:, inode_gp, :3]
-            rotation = data[:, inode_gp, 3:]
-            data[:, inode_gp, :3] = translation.dot(cid_transform)
-            data[:, inode_gp, 3:] = rotation.dot(cid_transform)
-        elif coord_type in ['CORD2C', 'CORD1C']:
-            #print('cylindrical')
-            if xyz_cid0 is None:
-                msg = ('xyz_cid is required for cylindrical '
-                       'coordinate transforms')
-                raise RuntimeError(msg)
-            #_transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform)
-            _transform_cylindrical_gpforce(inode_xyz, inode_gp, data, cid_transform, coord,
-                                           xyz_cid0, log)
+    """
+    inode, transforms = get_node_transforms(icd_transform, coords, xyz_cid0)
+    if debug:
+        assert np.array_equal(inode, np.unique(inode))
+    apply_node_transforms(result.data, inode, transforms)
+
+def transform_gpforce_to_globali(unused_subcase, result,
+                                 nids_all, unused_nids_transform,
+                                 i_transform, coords, xyz_cid0, unused_log):
+    """
+    Performs an inplace operation to transform the GPFORCE result
+    into the global (cid=0) frame
 
-        elif coord_type in ['CORD2S', 'CORD1S']:
-            log.debug('spherical')
-            if xyz_cid0 is None:
-                msg = ('xyz_cid is required for spherical '
-                       'coordinate transforms')
-                raise RuntimeError(msg)
-
-            _transform_spherical_gpforce(inode_xyz, inode_gp, data, cid_transform, coord,
-                                         xyz_cid0, log)
-        else:
-            raise RuntimeError(coord)
-    return
-
-def _transform_cylindrical_gpforce(unused_inode_xyz, inode_gp, data, cid_transform, coord,
-                                   xyz_cid0, log):
-    """helper method for transform_gpforce_to_globali"""
-    #xyzi = xyz_cid0[inode_xyz, :]s
-    #rtz_cid = coord.xyz_to_coord_array(xyzi)
-    #theta_xyz = rtz_cid[inode_xyz, 1]
-    #theta = rtz_cid[inode_gp_xyz, 1]
-    log.debug('coord\n%s' % coord)
-    log.debug(cid_transform)
-    #print('theta_xyz = %s' % list(theta_xyz))
-    #print('theta     = %s' % list(theta))
-
-    for itime in range(data.shape[0]):
-        #inode = np.where(np.in1d(nids_all, 2))[0]
-        #print('start', data[itime, inode_gp, :3])
-        translation = data[itime, inode_gp, :3]
-        rotation = data[itime, inode_gp, 3:]
-        if 0:
-            # horrible
-            translation = coord.coord_to_xyz_array(data[itime, inode_gp, :3])
-            rotation = coord.coord_to_xyz_array(data[itime, inode_gp, 3:])
-            data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## expectedly horrible
-            #translation[:, 1] += theta
-            #rotation[:, 1] += theta
-            #translation = coord.coord_to_xyz_array(data[itime, inode_gp, :3])
-            #rotation = coord.coord_to_xyz_array(data[itime, inode_gp, 3:])
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## actually not bad...
-            #translation = coord.xyz_to_coord_array(translation)
-            #rotation = coord.xyz_to_coord_array(rotation)
-            #translation[:, 1] += theta
-            #rotation[:, 1] += theta
-            #translation = coord.coord_to_xyz_array(translation)
-            #rotation = coord.coord_to_xyz_array(rotation)
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## not that bad, worse than previous
-            #translation = coord.xyz_to_coord_array(translation)
-            #rotation = coord.xyz_to_coord_array(rotation)
-            #translation[:, 1] += theta
-            #rotation[:, 1] += theta
-            #translation = coord.coord_to_xyz_array(translation)
-            #rotation = coord.coord_to_xyz_array(rotation)
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform.T)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform.T)
-        elif 1:
-            # doesn't work...actually pretty close
-            data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## very, very close
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform.T)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform.T)
-        #elif 0:
-            ## is this just the same as one of the previous?
-            #data[itime, inode_gp, :3] = cid_transform.T.dot(translation.T).T
-            #data[itime, inode_gp, 3:] = cid_transform.T.dot(rotation.T).T
-        else:
-            raise RuntimeError('no option selected...')
-
-        #if is_global_cid:
-            #data[itime, inode, :3] = translation
-            #data[itime, inode, 3:] = rotation
-            #continue
-        #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-        #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #print('end', data[itime, inode_gp, :3])
-
-def _transform_spherical_gpforce(inode_xyz, unused_inode_gp, data, cid_transform, coord,
-                                 unused_xyz_cid0, unused_log):
-    """helper method for transform_gpforce_to_globali"""
-    #xyzi = xyz_cid0[inode_xyz, :]
-    #rtp_cid = coord.xyz_to_coord_array(xyzi)
-    #theta = rtp_cid[:, 1]
-    #phi = rtp_cid[:, 2]
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode_xyz, :3]
-        rotation = data[itime, inode_xyz, 3:]
-        #if 0:
-            #translation[:, 1] += theta
-            #translation[:, 2] += phi
-            #rotation[:, 1] += theta
-            #rotation[:, 2] += phi
-        translation = coord.coord_to_xyz_array(data[itime, inode_xyz, :3])
-        rotation = coord.coord_to_xyz_array(data[itime, inode_xyz, 3:])
-        #if is_global_cid:
-            #data[itime, inode_xyz, :3] = translation
-            #data[itime, inode_xyz, 3:] = rotation
-            #continue
-        data[itime, inode_xyz, :3] = translation.dot(cid_transform)
-        data[itime, inode_xyz, 3:] = rotation.dot(cid_transform)
+    """
+    inode, transforms = get_node_transforms(i_transform, coords, xyz_cid0)
+    apply_gpforce_transforms(result, nids_all, inode, transforms)
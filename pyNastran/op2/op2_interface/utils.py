@@ -11,13 +11,25 @@ def build_obj(obj):
     if not obj.is_built:
         obj.build()
 
-def apply_mag_phase(floats, is_magnitude_phase, isave1, isave2):
-    """converts mag/phase data to real/imag"""
+def apply_mag_phase(floats, is_magnitude_phase, isave1, isave2, use_float64=False):
+    """
+    converts mag/phase data to real/imag
+
+    use_float64 : bool; default=False
+        does the mag/phase math in float64 and casts the result, which is
+        the same as the unvectorized readers (see ``polar_to_real_imag``)
+    """
     if is_magnitude_phase:
         mag = floats[:, isave1]
         phase = floats[:, isave2]
+        if use_float64:
+            complex_dtype = np.result_type(floats.dtype, np.complex64)
+            mag = mag.astype('float64')
+            phase = phase.astype('float64')
         rtheta = np.radians(phase)
         real_imag = mag * (np.cos(rtheta) + 1.j * np.sin(rtheta))
+        if use_float64:
+            real_imag = real_imag.astype(complex_dtype)
     else:
         real = floats[:, isave1]
         imag = floats[:, isave2]
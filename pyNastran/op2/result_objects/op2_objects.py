@@ -13,6 +13,18 @@ from pyNastran.utils import object_attributes, object_methods
 from pyNastran.op2.op2_interface.op2_codes import Op2Codes
 from pyNastran.op2.op2_interface.write_utils import write_table_header, export_to_hdf5
 
+#: the arrays with the element/node ids/layers of the rows of a result,
+#: which are checked in order; (attribute, column), where column=None is
+#: an (nrows, ) array or a 2D element array (see ``_get_row_ids``)
+ROW_ID_ARRAYS = {
+    'eids' : [('element_node', 0), ('element_layer', 0), ('node_element', 1),
+              ('element', None)],
+    'nids' : [('element_node', 1), ('node_element', 0), ('node_gridtype', 0),
+              ('node', None)],
+    'layers' : [('element_layer', 1)],
+}
+
+
 class BaseScalarObject(Op2Codes):
     def __init__(self):
         Op2Codes.__init__(self)
@@ -400,8 +412,145 @@ class ScalarObject(BaseScalarObject):
         state = BaseScalarObject.__getstate__(self)
         if 'dataframe' in state:
             del state['dataframe']
+        if '_row_index' in state:
+            del state['_row_index']
         return state
 
+    def get_rows(self, eids=None, nids=None, layers=None, itime=0):
+        """
+        Gets the rows of the result (the 2nd axis of ``data``) of a batch of
+        element/node ids/layers in a single call
+
+        Parameters
+        ----------
+        eids : (n, ) int ndarray / List[int]; default=None -> all
+            the element ids
+        nids : (n, ) int ndarray / List[int]; default=None -> all
+            the node ids (e.g., the corner nodes of a plate, the nodes of a
+            nodal result); 0 is the centroid of a plate/solid
+        layers : (n, ) int ndarray / List[int]; default=None -> all
+            the layers of a composite
+        itime : int; default=0
+            the time step for the results that have different ids for
+            each time step (e.g., RealGridPointForcesArray.node_element)
+
+        Returns
+        -------
+        irows : (nrows, ) int ndarray
+            the sorted rows, where ``data[:, irows, :]`` is the result of
+            the ids; the ids that aren't found are skipped
+
+        The lookup uses a sorted index of the ids (e.g., element_node[:, 0]),
+        which is built the first time an id type is used, so a query is
+        O(nids * log(nrows)).  The index isn't updated if the id arrays
+        are changed in place.
+
+        .. code-block:: python
+
+           >>> stress = model.cquad4_stress[1]
+           >>> irows = stress.get_rows(eids=[10, 11, 12])
+           >>> von_mises = stress.data[:, irows, -1]
+        """
+        queries = [(name, ids) for name, ids in [('eids', eids), ('nids', nids), ('layers', layers)]
+                   if ids is not None]
+        if not queries:
+            return np.arange(self.data.shape[1])
+
+        name, ids = queries[0]
+        irows = self._get_rows_by_id(name, ids, itime)
+        for name, ids in queries[1:]:
+            unused_source, row_ids = self._get_row_ids(name, itime)
+            irows = irows[np.in1d(row_ids[irows], ids)]
+        return irows
+
+    def _get_row_ids(self, name, itime=0):
+        """
+        Gets the eids/nids/layers of the rows
+
+        Returns
+        -------
+        source : (nrows, ...) int ndarray
+            the array with the ids (e.g., element_node)
+        row_ids : (nrows, ) int ndarray
+            the ids of the rows
+        """
+        for attr, icol in ROW_ID_ARRAYS[name]:
+            source = getattr(self, attr, None)
+            if not isinstance(source, np.ndarray):
+                continue
+            row_ids = source
+            if row_ids.ndim == 3:
+                # the ids change with the time step
+                row_ids = row_ids[itime]
+            elif icol is None and row_ids.ndim == 2:
+                if row_ids.shape == self.data.shape[:2]:
+                    # the (ntimes, nelements) element of the strain energy
+                    row_ids = row_ids[itime]
+                else:
+                    # the (nelements, 2) element of the random plates
+                    icol = 0
+            if icol is not None:
+                row_ids = row_ids[:, icol]
+            return source, row_ids
+        raise AttributeError('%s has no %s' % (self.class_name, name))
+
+    def _get_row_index(self, name, itime=0):
+        """
+        Gets the sorted index of the eids/nids/layers, which is cached
+
+        Returns
+        -------
+        iorder : (nrows, ) int ndarray / None
+            the rows sorted by id; None if the ids are sorted
+        sorted_ids : (nrows, ) int ndarray
+            the sorted ids
+        """
+        source, row_ids = self._get_row_ids(name, itime)
+        row_index = self.__dict__.setdefault('_row_index', {})
+        key = (name, itime)
+        if key in row_index:
+            sourcei, iorder, sorted_ids = row_index[key]
+            if sourcei is source and len(sorted_ids) == len(row_ids):
+                return iorder, sorted_ids
+
+        if np.all(row_ids[1:] >= row_ids[:-1]):
+            iorder = None
+            sorted_ids = np.ascontiguousarray(row_ids)
+        else:
+            iorder = np.argsort(row_ids)
+            sorted_ids = row_ids[iorder]
+        row_index[key] = (source, iorder, sorted_ids)
+        return iorder, sorted_ids
+
+    def _get_rows_by_id(self, name, ids, itime=0):
+        """gets the sorted rows of a batch of eids/nids/layers"""
+        iorder, sorted_ids = self._get_row_index(name, itime)
+        ids = np.unique(np.asarray(ids).ravel())
+        if ids.dtype != sorted_ids.dtype and sorted_ids.dtype.kind == 'i':
+            # searchsorted would cast the (big) sorted_ids to the dtype of
+            # the ids, so cast the ids; the ones that don't fit aren't found
+            iinfo = np.iinfo(sorted_ids.dtype)
+            ids = ids[(ids >= iinfo.min) & (ids <= iinfo.max)].astype(sorted_ids.dtype)
+        istart = np.searchsorted(sorted_ids, ids, side='left')
+        iend = np.searchsorted(sorted_ids, ids, side='right')
+
+        # the ids are repeated (e.g., the nodes of an element), so expand
+        # the [istart, iend) ranges
+        counts = iend - istart
+        nrows = counts.sum()
+        offsets = np.cumsum(counts) - counts
+        irows = np.repeat(istart - offsets, counts) + np.arange(nrows)
+        if iorder is not None:
+            irows = iorder[irows]
+            if nrows > len(iorder) // 16:
+                # sorting many rows is slower than a mask
+                is_row = np.zeros(len(iorder), dtype='bool')
+                is_row[irows] = True
+                irows = np.flatnonzero(is_row)
+            else:
+                irows.sort()
+        return irows
+
     def apply_data_code(self):
         if self.table_name is not None and self.table_name != self.data_code['table_name']:
             print(self.data_code)
@@ -545,6 +694,13 @@ class ScalarObject(BaseScalarObject):
             raise RuntimeError('grid_type=%s' % grid_type)
         return grid_type_str
 
+    def recast_gridtypes_as_strings(self, grid_types):
+        """converts an array of grid_type integers to a (n, ) str array"""
+        ugrid_types, igrid_types = np.unique(grid_types, return_inverse=True)
+        sgrid_types = np.array([self.recast_gridtype_as_string(grid_type)
+                                for grid_type in ugrid_types.tolist()], dtype='|U1')
+        return sgrid_types[igrid_types]
+
     def cast_grid_type(self, grid_type_str):
         """converts a grid_type string to an integer"""
         if grid_type_str == 'G':
@@ -31,7 +31,8 @@ from numpy import zeros, abs, angle, float32, searchsorted, unique, where
 from numpy import allclose, asarray, vstack, swapaxes, hstack
 
 from pyNastran.op2.result_objects.op2_objects import ScalarObject
-from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e, write_float_12e
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e, write_imag_floats_13e, write_float_12e, F06Format)
 
 
 SORT2_TABLE_NAME_MAP = {
@@ -674,20 +675,9 @@ class RealTableArray(TableArray):
         f06_file.write(''.join(header + words))
 
         node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-        t1 = self.data[0, :, 0]
-        t2 = self.data[0, :, 1]
-        t3 = self.data[0, :, 2]
-        r1 = self.data[0, :, 3]
-        r2 = self.data[0, :, 4]
-        r3 = self.data[0, :, 5]
-        for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-            sgridtype = self.recast_gridtype_as_string(gridtypei)
-            vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-            vals2 = write_floats_13e(vals)
-            (dx, dy, dz, rx, ry, rz) = vals2
-            f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                node_id, sgridtype, dx, dy, dz, rx, ry, rz))
+        sgridtype = self.recast_gridtypes_as_strings(self.node_gridtype[:, 1])
+        data = self.data[0, :, :]
+        REAL_TABLE_FORMAT.write(f06_file, node, sgridtype, *data.T)
         f06_file.write(page_stamp % page_num)
         return page_num
 
@@ -727,32 +717,15 @@ class RealTableArray(TableArray):
         gridtypes = self.node_gridtype[:, 1]
         unused_times = self._times
 
+        sgridtypes = self.recast_gridtypes_as_strings(gridtypes)
         for itime in range(self.ntimes):
             dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             if isinstance(dt, (float, float32)):
                 header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             else:
                 header[1] = ' %s = %10i\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nodes, gridtypes, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        node_id, sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype == 'S':
-                    f06_file.write('%14i %6s     %s\n' % (node_id, sgridtype, dx))
-                else:
-                    raise NotImplementedError(sgridtype)
+            write_real_table_rows(f06_file, nodes, sgridtypes, self.data[itime, :, :])
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
@@ -818,6 +791,45 @@ class RealTableArray(TableArray):
         return self.data[:, inids, i]
 
 
+#: the format of a row of a RealTableArray
+REAL_TABLE_FORMAT = F06Format(
+    '%14i %6s     {13e:<13}  {13e:<13}  {13e:<13}  {13e:<13}  {13e:<13}  {13e}\n')
+
+#: the format of an SPOINT row of a RealTableArray
+REAL_TABLE_SPOINT_FORMAT = F06Format('%14i %6s     {13e}\n')
+
+
+def write_real_table_rows(f06_file, nodes, sgridtypes, data):
+    """
+    Writes the rows of a time step of a RealTableArray
+
+    Parameters
+    ----------
+    f06_file : file
+        the file to write to
+    nodes : (nnodes, ) int ndarray
+        the node ids
+    sgridtypes : (nnodes, ) str ndarray
+        the grid types ('G', 'S', 'H', 'L'); the SPOINTs only have T1
+    data : (nnodes, 6) float ndarray
+        the T1, T2, T3, R1, R2, R3 values
+
+    """
+    is_spoint = sgridtypes == 'S'
+    # the rows change format at the SPOINTs, so write the runs of rows
+    # with the same format
+    istarts = np.hstack([0, np.where(is_spoint[1:] != is_spoint[:-1])[0] + 1])
+    iends = np.hstack([istarts[1:], len(nodes)])
+    for istart, iend in zip(istarts.tolist(), iends.tolist()):
+        if istart == iend:
+            continue
+        rows = slice(istart, iend)
+        if is_spoint[istart]:
+            REAL_TABLE_SPOINT_FORMAT.write(f06_file, nodes[rows], sgridtypes[rows], data[rows, 0])
+        else:
+            REAL_TABLE_FORMAT.write(f06_file, nodes[rows], sgridtypes[rows], *data[rows, :].T)
+
+
 class ComplexTableArray(TableArray):
     """
     complex displacement style table
@@ -1413,14 +1413,23 @@ class EPT(GeomCommon):
         PSHELL(2302,23,283) - the marker for Record 51
         """
         ntotal = 44  # 11*4
-        s = Struct(self._endian + b'iififi4fi')
         nproperties = (len(data) - n) // ntotal
-        for i in range(nproperties):
-            edata = data[n:n+44]
-            out = s.unpack(edata)
-            (pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  PSHELL=%s\n' % str(out))
+        if self.is_debug_file:
+            self._write_record_debug('PSHELL', Struct(self._endian + b'iififi4fi'),
+                                     data, n, nproperties)
+
+        # (pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4)
+        ints, floats = self._get_record_arrays(data, n, nproperties, 11)
+        is_big = ints[:, [0, 1, 3, 5, 10]].max(axis=1) > 1e8
+        pids, mid1s, unused_t, mid2s, unused_bk, mid3s = ints[:, :6].T.tolist()
+        mid4s = ints[:, 10].tolist()
+        ts, bks, tss, nsms, z1s, z2s = floats[:, [2, 4, 6, 7, 8, 9]].T.tolist()
+
+        n += nproperties * ntotal
+        for i, is_bigi in enumerate(is_big.tolist()):
+            pid = pids[i]
+            out = (pid, mid1s[i], ts[i], mid2s[i], bks[i], mid3s[i], tss[i],
+                   nsms[i], z1s[i], z2s[i], mid4s[i])
             prop = PSHELL.add_op2_data(out)
 
             if pid in self.properties:
@@ -1429,15 +1438,14 @@ class EPT(GeomCommon):
                 if prop == propi:
                     nproperties -= 1
                     continue
-                assert propi.type in ['PCOMP'], propi.get_stats()
+                assert propi.type in ['PCOMP', 'PCOMPG'], propi.get_stats()
                 nproperties -= 1
                 continue
 
-            if max(pid, mid1, mid2, mid3, mid4) > 1e8:
+            if is_bigi:
                 self.big_properties[pid] = prop
             else:
                 self._add_op2_property(prop)
-            n += ntotal
         if nproperties:
             self.card_count['PSHELL'] = nproperties
         return n
@@ -242,39 +242,40 @@ class GEOM1(GeomCommon):
         self.increase_card_count('CORD3G', nentries)
         return n
 
-    def _read_grid(self, data, n):  # 21.8 sec, 18.9
+    def _read_grid(self, data, n):
         """(4501,45,1) - the marker for Record 17"""
-        s = Struct(self._endian + b'ii3f3i')
         ntotal = 32
         nentries = (len(data) - n) // ntotal
-        nfailed = 0
-        for i in range(nentries):
-            edata = data[n:n + 32]
-            out = s.unpack(edata)
-            (nid, cp, x1, x2, x3, cd, ps, seid) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  GRID=%s\n' % str(out))
-            if nid < 10000000:
-                # cd can be < 0
-                if ps == 0:
-                    ps = ''
-                node = GRID(nid, np.array([x1, x2, x3]), cp, cd, ps, seid)
-                self._type_to_id_map['GRID'].append(nid)
-                self.nodes[nid] = node
-                #if nid in self.nodes:
-                    #self.reject_lines.append(str(node))
-                #else:
-                #self.nodes[nid] = node
-                #self.add_node(node)
-            else:
-                #self.log.warning('*nid=%s cp=%s x1=%-5.2f x2=%-5.2f x3=%-5.2f cd=%-2s ps=%s '
-                                 #'seid=%s' % (nid, cp, x1, x2, x3, cd, ps, seid))
-                #node = GRID(nid, np.array([x1, x2, x3]), cp, cd, ps, seid)
-                #self.rejects.append(str(node))
-                nfailed += 1
-            n += ntotal
+        if self.is_debug_file:
+            self._write_record_debug('GRID', Struct(self._endian + b'ii3f3i'), data, n, nentries)
+
+        # (nid, cp, x1, x2, x3, cd, ps, seid)
+        ints, floats = self._get_record_arrays(data, n, nentries, 8)
+        ikeep = np.where(ints[:, 0] < 10000000)[0]
+        nfailed = nentries - len(ikeep)
+        if nfailed:
+            ints = ints[ikeep, :]
+            floats = floats[ikeep, :]
+
+        nids = ints[:, 0].tolist()
+        cps = ints[:, 1].tolist()
+        xyzs = floats[:, 2:5].astype('float64')
+        cds = ints[:, 5].tolist()
+        pss = [ps if ps != 0 else '' for ps in ints[:, 6].tolist()]
+        seids = ints[:, 7].tolist()
+
+        # cd can be < 0
+        arrays = {'nid' : ints[:, 0], 'cp' : ints[:, 1], 'xyz' : xyzs,
+                  'cd' : ints[:, 5], 'seid' : ints[:, 7]}
+        if not nids or not self._add_card_arrays(
+                self.nodes, GRID(nids[0], xyzs[0, :], cps[0], cds[0], pss[0], seids[0]),
+                ints[:, 0], arrays, {'ps' : pss}):
+            nodes = self.nodes
+            for i, nid in enumerate(nids):
+                nodes[nid] = GRID(nid, xyzs[i, :], cps[i], cds[i], pss[i], seids[i])
+            self._type_to_id_map['GRID'].extend(nids)
         self.increase_card_count('GRID', nentries - nfailed)
-        return n
+        return n + nentries * ntotal
 
     def _read_seqgp(self, data, n):
         """(5301,53,4) - the marker for Record 27"""
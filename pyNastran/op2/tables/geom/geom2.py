@@ -271,6 +271,59 @@ class GEOM2(GeomCommon):
         self._add_element_object(elem, allow_overwrites=False)
         #print(str(elem)[:-1])
 
+    def add_op2_elements(self, elements, eids, nids):
+        """
+        Vectorized version of ``add_op2_element`` for a block of elements
+
+        Parameters
+        ----------
+        elements : List[Element]
+            the elements (e.g., CQUAD4s) to add
+        eids : (nelements, ) int ndarray
+            the element ids
+        nids : (nelements, nnodes) int ndarray
+            the node ids
+        """
+        ibad = np.where(eids <= 0)[0]
+        if len(ibad):
+            elem = elements[ibad[0]]
+            self.log.debug(elem)
+            raise ValueError(elem)
+
+        ibad = np.where((nids == -1).any(axis=1))[0]
+        assert len(ibad) == 0, elements[ibad[0]]
+        for elem in elements:
+            self._add_element_object(elem, allow_overwrites=False)
+
+    def _add_op2_element_arrays(self, build_element, eids, pids, nids, attributes=None):
+        """
+        Adds a block of elements of the same type (e.g., CQUAD4) to the
+        columnar storage (``storage='columnar'``) without creating the
+        element objects
+
+        Parameters
+        ----------
+        build_element : function
+            creates the i-th element (``elem = build_element(i)``)
+        eids / pids : (nelements, ) int ndarray
+            the element/property ids
+        nids : (nelements, nnodes) int ndarray
+            the node ids
+        attributes : Dict[name] = (nelements, ) ndarray / List; default=None
+            the other attributes of the elements (e.g., the CQUAD4 zoffset)
+
+        Returns
+        -------
+        is_added : bool
+            False if the elements must be added with ``add_op2_elements``
+            (e.g., storage='dict', a duplicate/invalid id)
+        """
+        if not len(eids) or eids.min() <= 0 or (nids == -1).any():
+            # add_op2_elements raises the error
+            return False
+        arrays = {'eid' : eids, 'pid' : pids, 'nodes' : nids}
+        return self._add_card_arrays(self.elements, build_element(0), eids, arrays, attributes)
+
 # 1-AEROQ4 (???)
 # AEROT3   (???)
 # 1-BEAMAERO (1701,17,0)
@@ -978,28 +1031,53 @@ class GEOM2(GeomCommon):
         """
         CHEXA(7308,73,253) - the marker for Record 45
         """
-        s = Struct(self._endian + b'22i')
-        ntotal = 88  # 22*4
-        nelements = (len(data) - n) // ntotal
-        for i in range(nelements):
-            edata = data[n:n+88]
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CHEXA=%s\n' % str(out))
-            (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
-             g11, g12, g13, g14, g15, g16, g17, g18, g19, g20) = out
+        return self._run_solid(data, n, 'CHEXA', 8, 20, CHEXA8, CHEXA20)
 
-            data_in = [eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, ]
-            big_nodes = [g9, g10, g11, g12, g13, g14, g15, g16,
-                         g17, g18, g19, g20]
-            if sum(big_nodes) > 0:
-                elem = CHEXA20.add_op2_data(data_in + big_nodes)
-            else:
-                elem = CHEXA8.add_op2_data(data_in)
-            self.add_op2_element(elem)
-            n += ntotal
-        self.card_count['CHEXA'] = nelements
-        return n
+    def _run_solid(self, data, n, card_name, nnodes, nnodes_big, element, element_big):
+        """
+        common method for CTETRA, CPENTA, CHEXA
+
+        Parameters
+        ----------
+        card_name : str
+            the name of the card (e.g., CHEXA)
+        nnodes / nnodes_big : int
+            the number of nodes of the linear/quadratic elements (e.g., 8/20)
+        element / element_big : Element
+            the linear/quadratic element classes (e.g., CHEXA8/CHEXA20)
+        """
+        nwords = nnodes_big + 2
+        ntotal = nwords * 4
+        nelements = (len(data) - n) // ntotal
+        if self.is_debug_file:
+            self._write_record_debug(card_name, Struct(self._endian + b'%ii' % nwords),
+                                     data, n, nelements)
+
+        # (eid, pid, g1, ..., gn)
+        ints = self._get_record_arrays(data, n, nelements, nwords)[0]
+        is_big = ints[:, 2 + nnodes:].sum(axis=1, dtype='int64') > 0
+
+        def build_element(row, is_bigi=False):
+            """creates the element for a (eid, pid, g1, ..., gn) row"""
+            if is_bigi:
+                return element_big.add_op2_data(row)
+            return element(row[0], row[1], row[2:2 + nnodes])
+
+        # the linear elements may be added to the columnar storage, while
+        # the quadratic elements (e.g., CHEXA20) are always objects
+        linear = ints[~is_big, :]
+        if len(linear) and self._add_op2_element_arrays(
+                lambda i: build_element(linear[i, :].tolist()),
+                linear[:, 0], linear[:, 1], linear[:, 2:2 + nnodes]):
+            ints = ints[is_big, :]
+            is_big = is_big[is_big]
+
+        if len(ints):
+            elements = [build_element(row, is_bigi)
+                        for row, is_bigi in zip(ints.tolist(), is_big.tolist())]
+            self.add_op2_elements(elements, ints[:, 0], ints[:, 2:])
+        self.card_count[card_name] = nelements
+        return n + nelements * ntotal
 
 # CHEXA20F
 # CHEXAFD
@@ -1425,26 +1503,7 @@ class GEOM2(GeomCommon):
         CPENT15F(16500,165,9999) - the marker for Record 65
         CPENT6FD(16000,160,9999) - the marker for Record 66
         """
-        s = Struct(self._endian + b'17i')
-        nelements = (len(data) - n) // 68
-        for i in range(nelements):
-            edata = data[n:n + 68]  # 17*4
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CPENTA=%s\n' % str(out))
-            (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
-             g11, g12, g13, g14, g15) = out
-
-            data_in = [eid, pid, g1, g2, g3, g4, g5, g6]
-            big_nodes = [g7, g8, g9, g10, g11, g12, g13, g14, g15]
-            if sum(big_nodes) > 0:
-                elem = CPENTA15.add_op2_data(data_in + big_nodes)
-            else:
-                elem = CPENTA6.add_op2_data(data_in)
-            self.add_op2_element(elem)
-            n += 68
-        self.card_count['CPENTA'] = nelements
-        return n
+        return self._run_solid(data, n, 'CPENTA', 6, 15, CPENTA6, CPENTA15)
 
 # CQDX4FD
 # CQDX9FD - same as CQDX4FD
@@ -1487,33 +1546,47 @@ class GEOM2(GeomCommon):
         """
         common method for CQUAD4, CQUADR
         """
-        nelements = (len(data) - n) // 56
-        s = Struct(self._endian + b'6iffii4f')
+        ntotal = 56  # 14*4
+        nelements = (len(data) - n) // ntotal
         if self.is_debug_file:
             self.binary_debug.write('ndata=%s\n' % (nelements * 44))
-
-        for i in range(nelements):
-            edata = data[n:n + 56]  # 14*4
-            out = s.unpack(edata)
-            (eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag,
-             t1, t2, t3, t4) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  %s=%s\n' % (element.type, str(out)))
-
-            theta_mcid = convert_theta_to_mcid(theta)
-            #print("eid=%s pid=%s n1=%s n2=%s n3=%s n4=%s theta=%s zoffs=%s blank=%s tflag=%s t1=%s t2=%s t3=%s t4=%s" % (
-                #eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag, t1, t2, t3, t4))
-
-            data_init = [
-                eid, pid, n1, n2, n3, n4, theta_mcid, zoffs,
-                tflag, t1, t2, t3, t4]
-            elem = element.add_op2_data(data_init)
-            self.add_op2_element(elem)
-            n += 56
+            self._write_record_debug(element.type, Struct(self._endian + b'6iffii4f'),
+                                     data, n, nelements)
+
+        # (eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag, t1, t2, t3, t4)
+        ints, floats = self._get_record_arrays(data, n, nelements, 14)
+        tflags = ints[:, 9]
+        ibad = np.where((tflags != 0) & (tflags != 1))[0]
+        assert len(ibad) == 0, 'data=%s tflag=%s' % (ints[ibad[0], :].tolist(), tflags[ibad[0]])
+
+        eids = ints[:, 0].tolist()
+        pids = ints[:, 1].tolist()
+        nids = ints[:, 2:6].tolist()
+        theta_mcids = convert_theta_to_mcid_array(floats[:, 6])
+        zoffsets = floats[:, 7].astype('float64')
+        thickness = _get_thickness(floats[:, 10:14])
+        attributes = {
+            'theta_mcid' : theta_mcids, 'zoffset' : zoffsets, 'tflag' : tflags,
+            'T1' : thickness[:, 0], 'T2' : thickness[:, 1],
+            'T3' : thickness[:, 2], 'T4' : thickness[:, 3],
+        }
+        zoffsets = zoffsets.tolist()
+        T1, T2, T3, T4 = thickness.T.tolist()
+        tflags = tflags.tolist()
+
+        def build_element(i):
+            """creates the i-th element"""
+            return element(eids[i], pids[i], nids[i], theta_mcids[i], zoffsets[i],
+                           tflags[i], T1[i], T2[i], T3[i], T4[i])
+
+        if not self._add_op2_element_arrays(
+                build_element, ints[:, 0], ints[:, 1], ints[:, 2:6], attributes):
+            elements = [build_element(i) for i in range(nelements)]
+            self.add_op2_elements(elements, ints[:, 0], ints[:, 2:6])
         #if stop:
             #raise RuntimeError('theta is too large...make the quad wrong')
         self.card_count[element.type] = nelements
-        return n
+        return n + nelements * ntotal
 
 # CQUAD4FD
 
@@ -1699,26 +1772,7 @@ class GEOM2(GeomCommon):
         CTETR10F(16600,166,9999) - the marker for Record 90
         CTETR4FD(16100,161,9999) - the marker for Record 91
         """
-        s = Struct(self._endian + b'12i')
-        nelements = (len(data) - n) // 48  # 12*4
-        for i in range(nelements):
-            edata = data[n:n + 48]
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CTETRA=%s\n' % str(out))
-            (eid, pid, n1, n2, n3, n4, n5, n6, n7, n8, n9, n10) = out
-            #print("out = ",out)
-
-            data_in = [eid, pid, n1, n2, n3, n4]
-            big_nodes = [n5, n6, n7, n8, n9, n10]
-            if sum(big_nodes) > 0:
-                elem = CTETRA10.add_op2_data(data_in + big_nodes)
-            else:
-                elem = CTETRA4.add_op2_data(data_in)
-            self.add_op2_element(elem)
-            n += 48
-        self.card_count['CTETRA'] = nelements
-        return n
+        return self._run_solid(data, n, 'CTETRA', 4, 10, CTETRA4, CTETRA10)
 
 # CTQUAD - 92
 # CTTRIA - 93
@@ -1728,25 +1782,43 @@ class GEOM2(GeomCommon):
         CTRIA3(5959,59,282)    - the marker for Record 94
         """
         ntotal = 52  # 13*4
-        s = Struct(self._endian + b'5iff3i3f')
-        nelements = (len(data) - n)// 52  # 13*4
-        for i in range(nelements):
-            edata = data[n:n+52]
-            out = s.unpack(edata)
-            #print("eid=%s pid=%s n1=%s n2=%s n3=%s theta=%s zoffs=%s blank1=%s blank2=%s tflag=%s t1=%s t2=%s t3=%s" %
-                  #(eid, pid, n1, n2, n3, theta, zoffs, blank1, blank2, tflag, t1, t2, t3))
-            (eid, pid, n1, n2, n3, theta, zoffs, blank1,
-             blank2, tflag, t1, t2, t3) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  CTRIA3=%s\n' % str(out))
-
-            theta_mcid = convert_theta_to_mcid(theta)
-            data_in = [eid, pid, n1, n2, n3, theta_mcid, zoffs, tflag, t1, t2, t3]
-            elem = CTRIA3.add_op2_data(data_in)
-            self.add_op2_element(elem)
-            n += ntotal
+        nelements = (len(data) - n) // ntotal
+        if self.is_debug_file:
+            self._write_record_debug('CTRIA3', Struct(self._endian + b'5iff3i3f'),
+                                     data, n, nelements)
+
+        # (eid, pid, n1, n2, n3, theta, zoffs, blank1, blank2, tflag, t1, t2, t3)
+        ints, floats = self._get_record_arrays(data, n, nelements, 13)
+        tflags = ints[:, 9]
+        ibad = np.where((tflags != 0) & (tflags != 1))[0]
+        assert len(ibad) == 0, ints[ibad[0], :].tolist()
+
+        eids = ints[:, 0].tolist()
+        pids = ints[:, 1].tolist()
+        nids = ints[:, 2:5].tolist()
+        theta_mcids = convert_theta_to_mcid_array(floats[:, 5])
+        zoffsets = floats[:, 6].astype('float64')
+        thickness = _get_thickness(floats[:, 10:13])
+        attributes = {
+            'theta_mcid' : theta_mcids, 'zoffset' : zoffsets, 'tflag' : tflags,
+            'T1' : thickness[:, 0], 'T2' : thickness[:, 1], 'T3' : thickness[:, 2],
+        }
+        zoffsets = zoffsets.tolist()
+        T1, T2, T3 = thickness.T.tolist()
+        tflags = tflags.tolist()
+
+        def build_element(i):
+            """creates the i-th element"""
+            return CTRIA3(eids[i], pids[i], nids[i], zoffset=zoffsets[i],
+                          theta_mcid=theta_mcids[i], tflag=tflags[i],
+                          T1=T1[i], T2=T2[i], T3=T3[i])
+
+        if not self._add_op2_element_arrays(
+                build_element, ints[:, 0], ints[:, 1], ints[:, 2:5], attributes):
+            elements = [build_element(i) for i in range(nelements)]
+            self.add_op2_elements(elements, ints[:, 0], ints[:, 2:5])
         self.card_count['CTRIA3'] = nelements
-        return n
+        return n + nelements * ntotal
 
 
 # CTRIAFD - 95
@@ -2033,3 +2105,37 @@ def convert_theta_to_mcid(theta):
         assert np.allclose(cid, cid_float), 'theta=%s cid=%s cid_float=%s' % (theta, cid, cid_float)
         theta = cid
     return theta
+
+def convert_theta_to_mcid_array(thetas):
+    """
+    Vectorized version of ``convert_theta_to_mcid``
+
+    Parameters
+    ----------
+    thetas : (n, ) float32 ndarray
+        the THETA/MCID field of the CTRIA3/CQUAD4s
+
+    Returns
+    -------
+    theta_mcids : List[float/int]
+        the THETA (float) or MCID (int) of the elements
+    """
+    thetas = thetas.astype('float64')
+    theta_mcids = thetas.tolist()
+    ibig = np.where(thetas > 511.)[0]
+    if len(ibig):
+        cid_floats = thetas[ibig] / 512. - 1
+        cids = cid_floats.astype('int64')
+        if not np.allclose(cids, cid_floats):
+            i = np.where(~np.isclose(cids, cid_floats))[0][0]
+            raise AssertionError('theta=%s cid=%s cid_float=%s' % (
+                thetas[ibig[i]], cids[i], cid_floats[i]))
+        for i, cid in zip(ibig.tolist(), cids.tolist()):
+            theta_mcids[i] = cid
+    return theta_mcids
+
+def _get_thickness(floats):
+    """gets the T1, T2, ... thickness of a CTRIA3/CQUAD4, where -1.0 is 1.0"""
+    thickness = floats.astype('float64')
+    thickness[thickness == -1.0] = 1.0
+    return thickness
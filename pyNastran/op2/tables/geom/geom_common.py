@@ -1,5 +1,7 @@
 #pylint: disable=W0613,R0201,C0111
 from struct import Struct
+import numpy as np
+from pyNastran.bdf.bdf_interface.columnar import ColumnarDict
 
 class SuppressLogging(object):
     def __init__(self):
@@ -33,6 +35,69 @@ class GeomCommon(object):
         self.binary_debug = SuppressFileIO()
         #self.log = SuppressLogging()
 
+    def _get_record_arrays(self, data, n, nrows, nwords):
+        """
+        Gets the rows of a fixed-width geometry record as arrays
+
+        Parameters
+        ----------
+        data : bytes
+            the record
+        n : int
+            the offset of the first row
+        nrows : int
+            the number of rows (e.g., the number of GRIDs)
+        nwords : int
+            the number of 4-byte words per row
+
+        Returns
+        -------
+        ints : (nrows, nwords) int32 ndarray
+            the integer view of the rows
+        floats : (nrows, nwords) float32 ndarray
+            the float view of the rows
+        """
+        nvalues = nrows * nwords
+        ints = np.frombuffer(data, dtype=self.idtype, count=nvalues, offset=n).reshape(nrows, nwords)
+        floats = np.frombuffer(data, dtype=self.fdtype, count=nvalues, offset=n).reshape(nrows, nwords)
+        return ints, floats
+
+    def _write_record_debug(self, card_name, structi, data, n, nrows):
+        """writes the rows of a fixed-width geometry record to the binary debug file"""
+        ntotal = structi.size
+        for unused_i in range(nrows):
+            out = structi.unpack(data[n:n + ntotal])
+            self.binary_debug.write('  %s=%s\n' % (card_name, str(out)))
+            n += ntotal
+
+    def _add_card_arrays(self, cards, card, keys, arrays, attributes):
+        """
+        Adds a block of cards of the same type to the columnar storage
+        (``storage='columnar'``) without creating the card objects
+
+        Parameters
+        ----------
+        cards : dict / ColumnarDict
+            the storage (e.g., ``self.nodes``)
+        card : BaseCard
+            the first card of the block
+        keys : (n, ) int ndarray
+            the ids of the cards
+        arrays / attributes : Dict[name] = (n, ...) ndarray
+            the values of the cards (see ``ColumnarDict.add_arrays``)
+
+        Returns
+        -------
+        is_added : bool
+            False if the cards must be added one by one (e.g., storage='dict',
+            a duplicate id)
+        """
+        if not isinstance(cards, ColumnarDict) or not cards.add_arrays(
+                card, keys, arrays, attributes):
+            return False
+        self._type_to_id_map[card.type].extend(keys.tolist())
+        return True
+
     def _read_fake(self, data, n):
         self.log.info('skipping %s in %s' % (self.card_name, self.table_name))
         #if (self.card_name == '' or '?' in self.card_name) and data:
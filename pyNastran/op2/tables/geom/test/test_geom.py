@@ -69,5 +69,47 @@ class TestOP2GeomUnit(unittest.TestCase):
             model, np.array(data, dtype='int32'), np.array(data, dtype='float32'))
         assert len(rbes) == 2, rbes
 
+    def test_storage_columnar(self):
+        """the GRID/CQUAD4/CHEXA tables are the same for both storages"""
+        grids = np.zeros((3, 8), dtype='int32')
+        grids[:, 0] = [1, 2, 3]
+        grids[:, 2:5] = np.array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.]],
+                                 dtype='float32').view('int32')
+        grids[1, 5] = 2  # cd
+        grids[2, 6] = 123  # ps
+
+        # eid, pid, n1, n2, n3, n4, theta, zoffset, blank, tflag, t1, t2, t3, t4
+        quads = np.zeros((2, 14), dtype='int32')
+        quads[:, :6] = [[10, 1, 1, 2, 3, 4], [11, 1, 2, 3, 4, 1]]
+        quads[:, 6] = np.array([45., 512. * (3 + 1)], dtype='float32').view('int32')
+        quads[:, 10:14] = np.array(-1., dtype='float32').view('int32')
+        quads[1, 10] = np.array(0.5, dtype='float32').view('int32')
+
+        # eid, pid, g1, ..., g20
+        hexas = np.zeros((2, 22), dtype='int32')
+        hexas[:, 0] = [20, 21]
+        hexas[:, 1] = 2
+        hexas[:, 2:10] = np.arange(1, 9)
+        hexas[1, 10:] = np.arange(9, 21)
+
+        cards = []
+        for storage in ['dict', 'columnar']:
+            model = OP2Geom(debug=False, storage=storage)
+            model._endian = b'<'
+            model._uendian = '<'
+            model._set_structs()
+            model.is_debug_file = False
+            for read_func, data in [(model._read_grid, grids),
+                                    (model._read_cquad4, quads),
+                                    (model._read_chexa, hexas)]:
+                datai = data.tobytes()
+                assert read_func(datai, 0) == len(datai)
+            assert model.card_count == {'GRID' : 3, 'CQUAD4' : 2, 'CHEXA' : 2}, model.card_count
+            assert model._type_to_id_map['CHEXA'] == [20, 21], model._type_to_id_map
+            assert model.elements[11].theta_mcid == 3, model.elements[11].theta_mcid
+            cards.append([card.write_card(size=16) for card in
+                          list(model.nodes.values()) + list(model.elements.values())])
+        assert cards[0] == cards[1], cards
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
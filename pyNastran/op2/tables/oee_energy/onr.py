@@ -503,7 +503,7 @@ class ONR(OP2Common):
                 obj.element[itime, ielement:ielement2] = eids
 
                 #[energy, percent, density]
-                obj.data[itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, itime, ielement, ielement2, floats[:, 1:])
                 obj.itotal2 = itotal2
                 obj.ielement = ielement2
             else:
@@ -566,9 +566,9 @@ class ONR(OP2Common):
                 #print(obj.data[obj.itime, itotal:itotal2, :])
                 #print(obj.data[obj.itime, itotal:itotal2, :].shape)
                 if obj.element_name == 'DMIG':
-                    obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2:]
+                    self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 2:])
                 else:
-                    obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:]
+                    self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 3:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -614,7 +614,7 @@ class ONR(OP2Common):
 
                 #[energyr, energyi, percent, density]
                 obj.element[obj.itime, itotal:itotal2] = eids
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -664,7 +664,7 @@ class ONR(OP2Common):
                     obj.element_type[obj.itime, itotal:itotal2, :] = s
 
                 #[energy, percent, density]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 4:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 4:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
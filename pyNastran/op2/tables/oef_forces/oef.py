@@ -640,7 +640,7 @@ class OEF(OP2Common):
                     #obj.element_type[obj.itime, itotal:itotal2, :] = strings[:, 3:]
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 3:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -731,7 +731,7 @@ class OEF(OP2Common):
                 obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                 #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 3:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -858,7 +858,7 @@ class OEF(OP2Common):
                         #obj.element_type[obj.itime, itotal:itotal2, :] = strings[:, 3:]
 
                     #[fapplied, free_conv, force_conv, frad, ftotal]
-                    obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                    self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 3:])
                     obj.itotal = itotal2
                     obj.ielement = ielement2
                 else:
@@ -1436,22 +1436,21 @@ class OEF(OP2Common):
                 self.binary_debug.write('  #elementi = [eid_device, axial, torque]\n')
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1633,7 +1632,7 @@ class OEF(OP2Common):
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
-                s1 = self.struct_i
+                s1 = Struct(self._endian + self._analysis_code_fmt)
                 s2 = Struct(self._endian + b'i8f')  # 36
                 for unused_i in range(nelements):
                     edata = data[n:n+4]
@@ -1827,17 +1826,16 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
 
@@ -1935,22 +1933,21 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
 
                 #(eid_device, axial, torque)
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2053,22 +2050,21 @@ class OEF(OP2Common):
 
             obj = self.obj
             #return nelements * self.num_wide * 4
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
 
                 #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2088,7 +2084,6 @@ class OEF(OP2Common):
         elif self.format_code in [2, 3] and self.num_wide == 17: # imag
             slot = self.cbar_force
 
-            # TODO: vectorize
             ntotal = 68  # 17*4
             nelements = ndata // ntotal
 
@@ -2098,43 +2093,66 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            s = Struct(self._endian + self._analysis_code_fmt + b'16f')
-            for unused_i in range(nelements):
-                edata = data[n:n + 68]
+            if self.use_vector and is_vectorized and self.sort_method == 1:
+                n = nelements * 4 * self.num_wide
+                itotal = obj.ielement
+                ielement2 = obj.itotal + nelements
+                itotal2 = ielement2
 
-                out = s.unpack(edata)
-                (eid_device,
-                 bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
-                 bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
-                if self.is_debug_file:
-                    self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
+                    eids = ints[:, 0] // 10
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
+
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                isave1 = [1, 2, 3, 4, 5, 6, 7, 8]
+                isave2 = [9, 10, 11, 12, 13, 14, 15, 16]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2,
+                                            use_float64=True)
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+                obj.ielement = ielement2
+            else:
+                s = Struct(self._endian + self._analysis_code_fmt + b'16f')
+                for unused_i in range(nelements):
+                    edata = data[n:n + 68]
+
+                    out = s.unpack(edata)
+                    (eid_device,
+                     bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
+                     bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
+                    if self.is_debug_file:
+                        self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
+                        eid, dt = get_eid_dt_from_eid_device(
+                            eid_device, self.nonlinear_factor, self.sort_method)
+                    if is_magnitude_phase:
+                        bm1a = polar_to_real_imag(bm1ar, bm1ai)
+                        bm2a = polar_to_real_imag(bm2ar, bm2ai)
+                        bm1b = polar_to_real_imag(bm1br, bm1bi)
+                        bm2b = polar_to_real_imag(bm2br, bm2bi)
+                        ts1 = polar_to_real_imag(ts1r, ts1i)
+                        ts2 = polar_to_real_imag(ts2r, ts2i)
+                        af = polar_to_real_imag(afr, afi)
+                        trq = polar_to_real_imag(trqr, trqi)
+                    else:
+                        bm1a = complex(bm1ar, bm1ai)
+                        bm2a = complex(bm2ar, bm2ai)
+                        bm1b = complex(bm1br, bm1bi)
+                        bm2b = complex(bm2br, bm2bi)
+                        ts1 = complex(ts1r, ts1i)
+                        ts2 = complex(ts2r, ts2i)
+                        af = complex(afr, afi)
+                        trq = complex(trqr, trqi)
+
+                    #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                    #print "%s" % (self.get_element_type(self.element_type)), data_in
                     eid, dt = get_eid_dt_from_eid_device(
                         eid_device, self.nonlinear_factor, self.sort_method)
-                if is_magnitude_phase:
-                    bm1a = polar_to_real_imag(bm1ar, bm1ai)
-                    bm2a = polar_to_real_imag(bm2ar, bm2ai)
-                    bm1b = polar_to_real_imag(bm1br, bm1bi)
-                    bm2b = polar_to_real_imag(bm2br, bm2bi)
-                    ts1 = polar_to_real_imag(ts1r, ts1i)
-                    ts2 = polar_to_real_imag(ts2r, ts2i)
-                    af = polar_to_real_imag(afr, afi)
-                    trq = polar_to_real_imag(trqr, trqi)
-                else:
-                    bm1a = complex(bm1ar, bm1ai)
-                    bm2a = complex(bm2ar, bm2ai)
-                    bm1b = complex(bm1br, bm1bi)
-                    bm2b = complex(bm2br, bm2bi)
-                    ts1 = complex(ts1r, ts1i)
-                    ts2 = complex(ts2r, ts2i)
-                    af = complex(afr, afi)
-                    trq = complex(trqr, trqi)
-
-                #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                #print "%s" % (self.get_element_type(self.element_type)), data_in
-                eid, dt = get_eid_dt_from_eid_device(
-                    eid_device, self.nonlinear_factor, self.sort_method)
-                obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
-                n += ntotal
+                    obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
+                    n += ntotal
         else:
             msg = self.code_information()
             print(msg)
@@ -2176,7 +2194,7 @@ class OEF(OP2Common):
                     obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2225,21 +2243,20 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 ielement = obj.ielement
                 ielement2 = ielement + nelements
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
                     obj.element[ielement:ielement2] = eids
 
                 #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, ielement, ielement2, floats[:, 1:])
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -2377,22 +2394,22 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 nlayers = nelements * nnodes_all
                 n = nelements * self.num_wide * 4
 
                 istart = obj.itotal
                 iend = istart + nlayers
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
 
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real).copy()
                     # Nastran makes this a 4 for CQUAD4s instead
                     # of 0 like the bilinear stress element...
                     ints[:, 2] = 0
 
                     nids = ints[:, 2:].reshape(nlayers, 9)[:, 0]
-                    eids = ints[:, 0] // 10
                     eids2 = vstack([eids] * nnodes_all).T.ravel()
                     obj.element_node[istart:iend, 0] = eids2
                     obj.element_node[istart:iend, 1] = nids
@@ -2402,7 +2419,7 @@ class OEF(OP2Common):
                 #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
                 obj.data[obj.itime, istart:iend, :] = results
             else:
-                s1 = Struct(self._endian + b'i4si8f')  # 8+36
+                s1 = Struct(self._endian + self._analysis_code_fmt + b'4si8f')  # 8+36
                 s2 = Struct(self._endian + b'i8f') # 36
 
                 for unused_i in range(nelements):
@@ -2643,23 +2660,22 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
 
                 # [f41, f21, f12, f32, f23, f43, f34, f14, kf1,
                 #  s12, kf2, s23, kf3, s34, kf4, s41]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2823,7 +2839,7 @@ class OEF(OP2Common):
                     obj.element[itotal:itotal2] = eids
 
                 # [hopa, bmu, bmv, tm, su, sv]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2876,7 +2892,7 @@ class OEF(OP2Common):
                     obj.element[itotal:itotal2] = eids
 
                 # [fx, sfy, sfz, u, v, w, sv, sw]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2916,17 +2932,17 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15).copy()
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15).copy()
-                    eids = ints[:, 0] // 10
                     nids_a = ints[:, 1]
                     nids_b = ints[:, 8]
                     assert eids.min() > 0, eids.min()
@@ -2962,7 +2978,6 @@ class OEF(OP2Common):
                         nid_b, bm1_b, bm2_b, ts1_b, ts2_b, af_b, trq_b)
                     n += ntotal
         elif self.format_code in [2, 3] and self.num_wide == 27:  # imag
-            # TODO: vectorize
             ntotal = 108  # 27*4
             nelements = ndata // ntotal
 
@@ -3123,7 +3138,7 @@ class OEF(OP2Common):
                     obj.element[itotal:itotal2] = eids
 
                 #[axial_force, torque]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 3:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 3:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -3246,7 +3261,7 @@ class OEF(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 # self.itime = 0
                 # self.ielement = 0
                 # self.itotal = 0
@@ -3256,11 +3271,10 @@ class OEF(OP2Common):
 
                 istart = obj.itotal
                 iend = istart + nelements
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
 
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real).copy()
-                    eids = ints[:, 0] // 10
+                if obj.itime == 0 or self.sort_method == 2:
                     obj.element[istart:iend] = eids
                 results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
@@ -3279,7 +3293,6 @@ class OEF(OP2Common):
                     obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
                     n += ntotal
         elif self.format_code in [2, 3] and self.num_wide == 13:  # imag
-            # TODO: vectorize
             ntotal = 52  # 13*4
             nelements = ndata // ntotal
             result_name = 'cbush_force'
@@ -3288,38 +3301,59 @@ class OEF(OP2Common):
             if auto_return:
                 return nelements * self.num_wide * 4, None, None
 
-            s = Struct(self._endian + self._analysis_code_fmt + b'12f')
-
             obj = self.obj
-            for unused_i in range(nelements):
-                edata = data[n:n + 52]
+            if self.use_vector and is_vectorized and self.sort_method == 1:
+                n = nelements * 4 * self.num_wide
+                itotal = obj.ielement
+                ielement2 = obj.itotal + nelements
+                itotal2 = ielement2
 
-                out = s.unpack(edata)
-                if self.is_debug_file:
-                    self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
-                (eid_device,
-                 fxr, fyr, fzr, mxr, myr, mzr,
-                 fxi, fyi, fzi, mxi, myi, mzi) = out
-                eid, dt = get_eid_dt_from_eid_device(
-                    eid_device, self.nonlinear_factor, self.sort_method)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
+                    eids = ints[:, 0] // 10
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
 
-                if is_magnitude_phase:
-                    fx = polar_to_real_imag(fxr, fxi)
-                    mx = polar_to_real_imag(mxr, mxi)
-                    fy = polar_to_real_imag(fyr, fyi)
-                    my = polar_to_real_imag(myr, myi)
-                    fz = polar_to_real_imag(fzr, fzi)
-                    mz = polar_to_real_imag(mzr, mzi)
-                else:
-                    fx = complex(fxr, fxi)
-                    mx = complex(mxr, mxi)
-                    fy = complex(fyr, fyi)
-                    my = complex(myr, myi)
-                    fz = complex(fzr, fzi)
-                    mz = complex(mzr, mzi)
-
-                obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
-                n += ntotal
+                #[fx, fy, fz, mx, my, mz]
+                real_imag = apply_mag_phase(floats, is_magnitude_phase,
+                                            [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12],
+                                            use_float64=True)
+                obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                obj.itotal = itotal2
+                obj.ielement = ielement2
+            else:
+                s = Struct(self._endian + self._analysis_code_fmt + b'12f')
+                for unused_i in range(nelements):
+                    edata = data[n:n + 52]
+
+                    out = s.unpack(edata)
+                    if self.is_debug_file:
+                        self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
+                    (eid_device,
+                     fxr, fyr, fzr, mxr, myr, mzr,
+                     fxi, fyi, fzi, mxi, myi, mzi) = out
+                    eid, dt = get_eid_dt_from_eid_device(
+                        eid_device, self.nonlinear_factor, self.sort_method)
+
+                    if is_magnitude_phase:
+                        fx = polar_to_real_imag(fxr, fxi)
+                        mx = polar_to_real_imag(mxr, mxi)
+                        fy = polar_to_real_imag(fyr, fyi)
+                        my = polar_to_real_imag(myr, myi)
+                        fz = polar_to_real_imag(fzr, fzi)
+                        mz = polar_to_real_imag(mzr, mzi)
+                    else:
+                        fx = complex(fxr, fxi)
+                        mx = complex(mxr, mxi)
+                        fy = complex(fyr, fyi)
+                        my = complex(myr, myi)
+                        fz = complex(fzr, fzi)
+                        mz = complex(mzr, mzi)
+
+                    obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
+                    n += ntotal
         #elif self.format_code == 2 and self.num_wide == 7:
             #self.log.warning(self.code_information())
             #asdf
@@ -10,7 +10,7 @@ from pyNastran.op2.result_objects.op2_objects import ScalarObject
 from pyNastran.f06.f06_formatting import (
     write_floats_13e, write_floats_12e,
     write_float_13e, write_float_12e,
-    _eigenvalue_header,
+    _eigenvalue_header, F06Format,
 )
 
 SORT2_TABLE_NAME_MAP = {
@@ -1550,37 +1550,15 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg_temp))
 
-            #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
             #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
             if self.element_type == 74:
-                for eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                        [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                    # ctria3
-                    #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
-                    f06_file.write('   %8i %18s %13s %13s   %13s %13s %13s   %13s %s\n' % (
-                        eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-
+                # ctria3
+                #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
+                CTRIA3_FORCE_FORMAT.write(f06_file, eids, *self.data[itime, :, :].T)
             elif self.element_type == 33:
-                for eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                        [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                    # cquad4
-                    #0         6    CEN/4  1.072685E+01  2.504399E+03 -2.455727E+01 -5.017930E+00 -2.081427E+01 -5.902618E-01 -9.126162E+00  4.194400E+01#
-                    #Fmt = '% 8i   ' + '%27.20E   ' * 8 + '\n'
-                    #f06_file.write(Fmt % (eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-                    #
-                    f06_file.write('0 %8i %8s %13s %13s %13s %13s %13s %13s %13s %s\n' % (
-                        eid, cen_word, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
+                # cquad4
+                #0         6    CEN/4  1.072685E+01  2.504399E+03 -2.455727E+01 -5.017930E+00 -2.081427E+01 -5.902618E-01 -9.126162E+00  4.194400E+01#
+                CQUAD4_FORCE_FORMAT.write(f06_file, eids, cen_word, *self.data[itime, :, :].T)
             else:
                 raise NotImplementedError(self.element_type)
             f06_file.write(page_stamp % page_num)
@@ -1588,6 +1566,22 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         return page_num - 1
 
 
+CTRIA3_FORCE_FORMAT = F06Format(
+    '   %8i {13e:>18} {13e:>13} {13e:>13}   {13e:>13} {13e:>13} {13e:>13}   {13e:>13} {13e}\n')
+CQUAD4_FORCE_FORMAT = F06Format(
+    '0 %8i %8s {13e:>13} {13e:>13} {13e:>13} {13e:>13} {13e:>13} {13e:>13} {13e:>13} {13e}\n')
+_PLATE_BILINEAR_FORCE_FORMATS = {}
+
+
+def _get_plate_bilinear_force_format(nnodes_per_eid):
+    """gets the F06Format of the centroid and corner lines of an element"""
+    if nnodes_per_eid not in _PLATE_BILINEAR_FORCE_FORMATS:
+        floats = ' '.join(['{13e:<13}'] * 7) + ' {13e}\n'
+        lines = ['0  %8i    %s ' + floats] + ['            %8i ' + floats] * (nnodes_per_eid - 1)
+        _PLATE_BILINEAR_FORCE_FORMATS[nnodes_per_eid] = F06Format(lines)
+    return _PLATE_BILINEAR_FORCE_FORMATS[nnodes_per_eid]
+
+
 class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
     def __init__(self, data_code, is_sort1, isubcase, dt):
         RealForceObject.__init__(self, data_code, isubcase)
@@ -1824,51 +1818,30 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         nids = self.element_node[:, 1]
         cen_word = 'CEN/%i' % nnodes
         if self.element_type  in [64, 82, 144]: # CQUAD8, CQUADR, CQUAD4
-            cyci = [0, 1, 2, 3, 4]
-            #cyc = cycle([0, 1, 2, 3, 4])  # TODO: this is totally broken...
             nnodes_per_eid = 5
         elif self.element_type  in [70, 75]: # CTRIAR, CTRIA6
-            cyci = [0, 1, 2, 3]
-            #cyc = cycle([0, 1, 2, 3])  # TODO: this is totally broken...
             nnodes_per_eid = 4
         else:
             raise NotImplementedError(self.element_type)
 
-        # TODO: this shouldn't be neccessary
-        cyc = cyci * (len(eids) // nnodes_per_eid)
         assert len(eids) % nnodes_per_eid == 0
+        plate_format = _get_plate_bilinear_force_format(nnodes_per_eid)
+        labels = (eids[::nnodes_per_eid], cen_word)
+        for inode in range(1, nnodes_per_eid):
+            labels += (nids[inode::nnodes_per_eid],)
 
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg_temp))
 
-            #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
             #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            for i, eid, nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(cyc, eids, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                # ctria3
-                #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
-                if i == 0:
-                    f06_file.write(
-                        '0  %8i    %s %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, cen_word, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-                else:
-                    f06_file.write(
-                        '            %8i %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-            # else:
-                # raise NotImplementedError(self.element_type)
+            # the centroid is followed by the corner nodes of the element
+            data = self.data[itime, :, :]
+            columns = labels[:2] + tuple(data[::nnodes_per_eid].T)
+            for inode in range(1, nnodes_per_eid):
+                columns += (labels[inode + 1],) + tuple(data[inode::nnodes_per_eid].T)
+            plate_format.write(f06_file, *columns)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -1602,15 +1602,18 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                self.obj_set_element(obj, itotal, itotal2, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
 
                 #(eid_device, stress)
                 obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
@@ -1762,7 +1765,7 @@ class OES(OP2Common):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1850,20 +1853,21 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CROD random SORT%s' % self.sort_method)
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                self.obj_set_element(obj, itotal, itotal2, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
 
                 #[axial, torsion, SMa, SMt]
-                obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -1908,7 +1912,6 @@ class OES(OP2Common):
 
         slot = self.get_result(result_name)
         if self.format_code == 1 and self.num_wide == 111:  # real
-            # TODO: vectorize
             ntotal = 444 # 44 + 10*40  (11 nodes)
 
             if self.is_stress:
@@ -1928,8 +1931,34 @@ class OES(OP2Common):
             nnodes = 10  # 11-1
             ntotal = self.num_wide * 4
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-real not vectorized')
+            if self.use_vector and is_vectorized and self.sort_method == 1:
+                n = nelements * 4 * self.num_wide
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 10)
+
+                obj._times[obj.itime] = dt
+                if obj.itime == 0:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 111)
+                    eids = ints[:, 0] // 10
+                    eids2 = repeat(eids, 11)
+
+                    ints2 = ints[:, 1:].reshape(nelements * 11, 10)
+
+                    nids = ints2[:, 0]
+                    assert eids.min() > 0, eids.min()
+                    obj.element_node[itotal:itotal2, 0] = eids2
+                    obj.element_node[itotal:itotal2, 1] = nids
+                    obj.xxb[itotal:itotal2] = floats2[:, 1]
+
+                #  0    1   2  3  4  5  6     7     8    9
+                # grid, sd, c, d, e, f, max, min, mst, msc
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats2[:, 2:])
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CBEAM real SORT%s' % self.sort_method)
@@ -2074,7 +2103,6 @@ class OES(OP2Common):
                             self.binary_debug.write('CBEAM-2 - eid=%i out2=%s\n' % (eid, str(out2)))
 
         elif self.format_code == 1 and self.num_wide == 67: # random
-            # TODO: vectorize
             ntotal = 268 # 1 + 11*6  (11 nodes)
 
             if self.is_stress:
@@ -2094,11 +2122,30 @@ class OES(OP2Common):
             nnodes = 10  # 11-1
             ntotal = self.num_wide * 4
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-random not vectorized')
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 67)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 6)
+
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0 or self.sort_method == 2:
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 67)
+                    ints2 = ints[:, 1:].reshape(nelements * 11, 6)
+                    assert eids.min() > 0, eids.min()
+                    obj.element_node[itotal:itotal2, 0] = repeat(eids, 11)
+                    obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
+                    obj.xxb[itotal:itotal2] = floats2[:, 1]
+
+                # grid, sd, sxc, sxd, sxe, sxf
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats2[:, 2:])
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CBEAM random SORT%s' % self.sort_method)
                 n1 = 28
                 n2 = 24 # 6*4
                 s1 = Struct(self._endian + self._analysis_code_fmt + b'i5f')
@@ -2173,7 +2220,7 @@ class OES(OP2Common):
                 self.obj_set_element(obj, itotal, itotal2, data, nelements)
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
@@ -2247,24 +2294,25 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 itime = obj.itime
                 obj._times[itime] = dt
-                self.obj_set_element(obj, itotal, itotal2, data, nelements)
+                if itime == 0 or self.sort_method == 2:
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
 
                 #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, itime, itotal, itotal2, floats[:, 1:])
                 obj.itotal = itotal2
                 obj.ielement = ielement2
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CSHEAR random SORT%s' % self.sort_method)
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'2f')
                 for unused_i in range(nelements):
                     edata = data[n:n + ntotal]
@@ -2340,7 +2388,7 @@ class OES(OP2Common):
 
                 #[s1a, s2a, s3a, s4a, axial, smaxa, smina, margin_tension,
                 # s1b, s2b, s3b, s4b,        smaxb, sminb, margin_compression]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, ielement, ielement2, floats[:, 1:])
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -2478,29 +2526,27 @@ class OES(OP2Common):
                 self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
             obj = self.obj
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
+                if self.table_name_str == 'OESXRMS1':
+                    assert self.sort_method == 1, self.code_information()
 
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
+                itotal = obj.itotal
+                itotal2 = itotal + nelements
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-                self.obj_set_element(obj, itotal, itotal2, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    assert eids.min() > 0, eids.min()
+                    obj.element[itotal:itotal2] = eids
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
 
                 #[s1a, s2a, s3a, s4a, axial,
                 # s1b, s2b, s3b, s4b]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
-                obj.itotal = ielement2
-                obj.ielement = ielement2
+                self._set_obj_data(obj, obj.itime, itotal, itotal2, floats[:, 1:])
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CBAR random SORT%s' % self.sort_method)
                 #print(self.code_information())
                 #print('self._analysis_code_fmt =', self._analysis_code_fmt)
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'9f')
@@ -2731,7 +2777,6 @@ class OES(OP2Common):
                         n += 84
 
         elif self.format_code in [2, 3] and self.num_wide == numwide_imag:  # complex
-            # TODO: vectorize
             ntotal = numwide_imag * 4
             nelements = ndata // ntotal
             self.ntotal += nelements * nnodes_expected
@@ -2836,71 +2881,37 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                itotali = obj.itotal + nelements
-                itotal2 = obj.itotal + nelements * nnodes_expected
-                obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    # (eid_device, cid, abcd, nnodes)
-                    ints = frombuffer(data, dtype=self.idtype).copy()
-                    try:
-                        ints1 = ints.reshape(nelements, numwide_real)
-                    except ValueError:
-                        msg = 'ints.shape=%s; size=%s ' % (str(ints.shape), ints.size)
-                        msg += 'nelements=%s numwide_real=%s nelements*numwide=%s' % (
-                            nelements, numwide_real, nelements * numwide_real)
-                        raise ValueError(msg)
-                    eids = ints1[:, 0] // 10
-                    cids = ints1[:, 1]
-                    #nids = ints1[:, 4]
-                    assert eids.min() > 0, eids.min()
-                    obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
-                    ints2 = ints1[:, 4:].reshape(nelements * nnodes_expected, 21)
-                    grid_device = ints2[:, 0]#.reshape(nelements, nnodes_expected)
-
-                    #print('%s-grid_device=%s' % (self.element_name, grid_device))
-                    unused_grid_device2 = repeat(grid_device, nnodes_expected)
-                    try:
-                        obj.element_node[itotal:itotal2, 1] = grid_device
-                    except ValueError:
-                        msg = '%s; nnodes=%s\n' % (self.element_name, nnodes_expected)
-                        msg += 'itotal=%s itotal2=%s\n' % (itotal, itotal2)
-                        msg += 'grid_device.shape=%s; size=%s\n' % (str(grid_device.shape), grid_device.size)
-                        #msg += 'nids=%s' % nids
-                        raise ValueError(msg)
-                    obj.element_cid[itotal:itotali, 0] = eids
-                    obj.element_cid[itotal:itotali, 1] = cids
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
-                # 1     9    15   2    10   16  3   11  17   8
-                #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
-                #isave = [1, 9, 15, 2, 10, 16, 3, 11, 17, 8]
-                #(grid_device,
-                    #sxx, sxy, s1, a1, a2, a3, pressure, svm,
-                    #syy, syz, s2, b1, b2, b3,
-                    #szz, sxz, s3, c1, c2, c3)
-                floats1 = floats.reshape(nelements * nnodes_expected, 21)#[:, 1:] # drop grid_device
-
-                # o1/o2/o3 is not max/mid/min.  They are not consistently ordered, so we force it.
-                max_mid_min = np.vstack([
-                    floats1[:, 3],
-                    floats1[:, 11],
-                    floats1[:, 17],
-                ]).T
-                max_mid_min.sort(axis=1)
-                assert max_mid_min.shape == (nelements * nnodes_expected, 3), max_mid_min.shape
-                obj.data[obj.itime, itotal:itotal2, 6:9] = max_mid_min[:, [2, 1, 0]]
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * nnodes_expected
+                ielement = obj.ielement
 
-                #obj.data[obj.itime, itotal:itotal2, :] = floats1[:, isave]
-                obj.data[obj.itime, itotal:itotal2, :6] = floats1[:, [1, 9, 15, 2, 10, 16]]
-                obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
+                # (eid_device, cid, abcd, grid) + (grid_device, sxx, syy, szz, txy, tyz, txz)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_random)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_random)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                obj._times[obj.itime] = dt
+                assert eids.min() > 0, eids.min()
+                cids = ints[:, 1]
+                assert cids.min() >= -1, cids.min()
+
+                # the first node is the centroid
+                grid_device = ints[:, 4:].reshape(nelements * nnodes_expected, 7)[:, 0].copy()
+                grid_device[::nnodes_expected] = 0
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
+                obj.element_node[itotal:itotal2, 1] = grid_device
+
+                # element_cid wraps around like add_eid_sort1
+                ielements = (ielement + np.arange(nelements)) % obj.nelements
+                obj.element_cid[ielements, 0] = eids
+                obj.element_cid[ielements, 1] = cids
+
+                floats2 = floats[:, 4:].reshape(nelements * nnodes_expected, 7)
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = itotali
+                obj.ielement = ielements[-1] + 1
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CSolid random SORT%s' % self.sort_method)
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'i4si')
                 struct2 = Struct(self._endian + b'i6f')
                 if self.is_debug_file and 0:
@@ -3315,35 +3326,22 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nelements * 2
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                assert eids.min() > 0, eids.min()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                obj.element[itotal:itotal2, :] = repeat(eids, 2)[:, np.newaxis]
 
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 8)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                # 2 layers per element; [fd, oxx, oyy, txy]
+                floats1 = floats[:, 1:].reshape(nelements * 2, 4)
+                obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CQUAD4-33 random SORT%s' % self.sort_method)
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'8f')
                 #cen = 0 # CEN/4
                 for i in range(nelements):
@@ -3403,32 +3401,21 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nelements * 2
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                assert eids.min() > 0, eids.min()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                obj.element[itotal:itotal2, :] = repeat(eids, 2)[:, np.newaxis]
 
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                # 2 layers per element; [fd, oxx, oyy, txy, ovm]
+                floats1 = floats[:, 1:].reshape(nelements * 2, 5)
+                obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'10f')
                 #cen = 0 # CEN/4
@@ -3661,35 +3648,22 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nelements * 2
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                assert eids.min() > 0, eids.min()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                obj.element[itotal:itotal2, :] = repeat(eids, 2)[:, np.newaxis]
 
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 10)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                # 2 layers per element; [fd, oxx, oyy, txy, ovm]
+                floats1 = floats[:, 1:].reshape(nelements * 2, 5)
+                obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CTRIA3 random SORT%s' % self.sort_method)
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'10f')
                 #cen = 0 # CEN/4
                 for i in range(nelements):
@@ -3740,35 +3714,22 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj.is_built is True, obj.is_built
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                ielement = obj.ielement
-                ielement2 = ielement + nelements
                 itotal = obj.itotal
-                itotal2 = itotal + nelements * nnodes_expected
+                itotal2 = itotal + nelements * 2
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                assert eids.min() > 0, eids.min()
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype)
-                    ints1 = ints.reshape(nelements, 9)
-                    eids = ints1[:, 0] // 10
-                    print(eids)
-                    eids = np.vstack([eids, eids]).T.ravel()
-                    print(eids.shape)
-                    print(eids)
-                    print(obj.element)
-                    assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2, 0] = eids
+                obj.element[itotal:itotal2, :] = repeat(eids, 2)[:, np.newaxis]
 
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
-                print(floats.shape)
-                #fd, sx, sy, txy,
-                floats1 = floats.reshape(nelements * nnodes_expected, 8)
-                obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
+                # 2 layers per element; [fd, oxx, oyy, txy]
+                floats1 = floats[:, 1:].reshape(nelements * 2, 4)
+                obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CTRIA3 random2 SORT%s' % self.sort_method)
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'8f')
                 cen = 0 # CEN/4
                 for i in range(nelements):
@@ -4124,47 +4085,22 @@ class OES(OP2Common):
 
             obj = self.obj
             #print('dt=%s, itime=%s' % (obj.itime, dt))
-            if self.use_vector and is_vectorized and 0:
-                # self.itime = 0
-                # self.ielement = 0
-                # self.itotal = 0
-                #self.ntimes = 0
-                #self.nelements = 0
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
-
-                istart = obj.itotal
-                iend = istart + nlayers
+                itotal = obj.itotal
+                itotal2 = itotal + nlayers
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_random)
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                assert eids.min() > 0, eids.min()
                 obj._times[obj.itime] = dt
+                obj.element[itotal:itotal2, :] = repeat(eids, 2 * nnodes_all)[:, np.newaxis]
 
-                if obj.itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                    ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all).copy()
-                    ints1[:, 0] = 0.
-                    nids = ints1.ravel()
-
-                    eids = ints[:, 0] // 10
-                    eids2 = array([eids] * (nnodes_all * 2), dtype='int32').T.ravel()
-                    nids2 = vstack([nids, nids]).T.ravel()
-                    obj.element_node[istart:iend, 0] = eids2
-                    obj.element_node[istart:iend, 1] = nids2
-                    #assert obj.element_node[:iend, 0].min() > 0, eids2
-                    if obj.nonlinear_factor is not None:
-                        float_mask = np.arange(nelements * numwide_real, dtype=np.int32).reshape(nelements, numwide_real)
-                        float_mask1 = float_mask[:, 2:].reshape(nlayers // 2, 17)[:, 1:].reshape(nlayers, 8)
-                        obj.float_mask = float_mask1
-
-                if obj.nonlinear_factor is not None:
-                    results = frombuffer(data, dtype=self.fdtype)[obj.float_mask].copy()
-                else:
-                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
-                    floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
-                    results = floats1[:, 1:].reshape(nlayers, 8).copy()
-
-                #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-                obj.data[obj.itime, istart:iend, :] = results
+                # (eid_device, j) + nnodes_all * (grid, [fd1, sx1, sy1, txy1], [fd2, sx2, sy2, txy2])
+                floats1 = floats[:, 2:].reshape(nelements * nnodes_all, 9)[:, 1:].reshape(nlayers, 4)
+                obj.fiber_curvature[itotal:itotal2] = floats1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
+                obj.itotal = itotal2
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CQUAD4-144/CQUAD8... random SORT%s' % self.sort_method)
                 n = 0
                 #numwide_random = 2 + 9 * nnodes_all
                 center_format = self._endian + self._analysis_code_fmt + b'4s i8f'
@@ -4183,7 +4119,6 @@ class OES(OP2Common):
                         '  #                fd2, sx2, sy2, txy2,)]\n'
                         '  nelements=%i; nnodes=%i # +1 centroid\n' % (ndata, nelements, nnodes))
 
-                grid_center = 0
                 for i in range(nelements):
                     edata = data[n:n+44]
                     #self.show_data(edata)
@@ -4202,7 +4137,7 @@ class OES(OP2Common):
                     if self.is_debug_file:
                         self.binary_debug.write('  eid=%i; C=[%s]\n' % (eid, ', '.join(['%r' % di for di in out])))
 
-                    obj.add_new_eid_sort1(dt, eid, grid_center, fd1, sx1, sy1)
+                    obj.add_new_eid_sort1(dt, eid, fd1, sx1, sy1, txy1)
                     obj.add_sort1(dt, eid, fd2, sx2, sy2, txy2)
                     n += 44
                     for inode in range(nnodes):
@@ -4220,8 +4155,8 @@ class OES(OP2Common):
                         assert isinstance(grid, int), grid
                         assert grid > 0, grid
 
-                        obj.add_new_node_sort1(dt, eid, grid, fd1, sx1, sy1)
-                        obj.add_sort1(dt, eid, grid, fd2, sx2, sy2)
+                        obj.add_new_node_sort1(dt, eid, fd1, sx1, sy1, txy1)
+                        obj.add_sort1(dt, eid, fd2, sx2, sy2, txy2)
                         n += 36
 
             #if self.read_mode == 1:
@@ -4315,7 +4250,7 @@ class OES(OP2Common):
 
                 #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
                 floats[:, 1] = 0
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
+                self._set_obj_data(obj, obj.itime, ielement, ielement2, floats[:, 1:])
                 obj.ielement = ielement2
                 obj.itotal = ielement2
             else:
@@ -4339,7 +4274,6 @@ class OES(OP2Common):
                         ex1, ey1, ez1, exy1)
                     n += ntotal
         elif self.format_code == 1 and self.num_wide == 25 and self.element_type in [88, 90]:
-            # TODO: vectorize
             #     ELEMENT      FIBER                        STRESSES/ TOTAL STRAINS                     EQUIVALENT    EFF. STRAIN     EFF. CREEP
             #        ID      DISTANCE           X              Y             Z               XY           STRESS    PLASTIC/NLELAST     STRAIN
             # 0       721  -7.500000E+00   5.262707E+02   2.589492E+02   0.000000E+00  -2.014457E-14   4.557830E+02   5.240113E-02   0.0
@@ -4363,42 +4297,29 @@ class OES(OP2Common):
 
             #return nelements * self.num_wide * 4
             obj = self.obj
-            is_vectorized = False
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
                 ielement = obj.ielement
                 ielement2 = ielement + nelements
                 itotal = obj.itotal
                 itotal2 = itotal + nelements * 2
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                assert eids.min() > 0, eids.min()
                 obj._times[obj.itime] = dt
-                #print('ielement=%s:%s' % (ielement, ielement2))
-                #print('itotal=%s:%s' % (itotal, itotal2))
-
-                if obj.itime == 0:
-                    try:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 25)
-                    except ValueError:
-                        unused_values = fromstring(data, dtype=self.idtype)
-
-                    eids = ints[:, 0] // 10
-                    #eids2 = vstack([eids, eids]).T.ravel()
-                    #print(eids.tolist())
-                    #sss
-                    obj.element[ielement:ielement2] = eids  # 150
-                     #print(obj.element_node[:10, :])
+                obj.element[ielement:ielement2] = eids
 
+                #[fiber_distance, oxx, oyy, ozz, txy, es, eps, ecs, exx, eyy, ezz, exy]
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 25)[:, 1:]
+                results = floats.reshape(nelements * 2, 12).copy()
 
-                #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
-                #floats[:, 1] = 0
-                obj.data[obj.itime, itotal:itotal2, :] = floats.reshape(nelements * 2, 12).copy()
-                #obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
+                # fiber_distance, ozz, and ezz are undefined for some elements
+                for icol in [0, 3, 10]:
+                    results[np.isnan(results[:, icol]), icol] = 0.
+                obj.data[obj.itime, itotal:itotal2, :] = results
                 obj.ielement = ielement2
                 obj.itotal = itotal2
             else:
-                if is_vectorized and self.use_vector:  # pragma: no cover
-                    self.log.debug('vectorize CTRIA3/CQUAD4_NL imag SORT%s' % self.sort_method)
                 etype = self.element_type
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'24f') # 1+24=25
                 for i in range(nelements):
@@ -4508,7 +4429,7 @@ class OES(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                 #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 2:].copy()
+                self._set_obj_data(obj, obj.itime, istart, iend, floats[:, 2:])
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize COMP_SHELL real SORT%s' % self.sort_method)
@@ -4879,18 +4800,20 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
             obj = self.obj
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * self.num_wide * 4
 
                 istart = obj.ielement
                 iend = istart + nelements
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
                 obj._times[obj.itime] = dt
-
-                self.obj_set_element(obj, istart, iend, data, nelements)
+                if obj.itime == 0 or self.sort_method == 2:
+                    assert eids.min() > 0, eids.min()
+                    obj.element[istart:iend] = eids
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                 #[tx, ty, tz, rx, ry, rz]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, istart, iend, floats[:, 1:])
             else:
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'6f')
                 for unused_i in range(nelements):
@@ -5169,7 +5092,7 @@ class OES(OP2Common):
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                 #[axial_stress, equiv_stress, total_strain,
                 # eff_plastic_creep_strain, eff_creep_strain, linear_torsional_stresss]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, istart, iend, floats[:, 1:])
             else:
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'6f')  # 1+6=7
                 for unused_i in range(nelements):
@@ -5244,7 +5167,7 @@ class OES(OP2Common):
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                 #[force, stress]
-                obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, ielement, ielement2, floats[:, 1:])
                 obj.itotal = ielement2
                 obj.ielement = ielement2
             else:
@@ -5311,25 +5234,23 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None
-            if self.use_vector and is_vectorized and self.sort_method == 1 and 0:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                ielement2 = obj.itotal + nelements
-                itotal2 = ielement2
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
-                itime = obj.itime
-                obj._times[itime] = dt
-                if itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
-                    eids = ints[:, 0] // 10
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 2
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
-
-                #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 21)
+                    obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+                    obj.element_node[itotal:itotal2, 1] = ints[:, 1:].reshape(nelements * 2, 10)[:, 0]
+
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 21)
+                floats2 = floats[:, 1:].reshape(nelements * 2, 10)
+                #[angle, sc, sd, se, sf, omax, omin, mst, msc]
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
                 ntotali = 40
                 struct1 = Struct(self._endian + self._analysis_code_fmt)
@@ -5384,26 +5305,26 @@ class OES(OP2Common):
 
             obj = self.obj
             assert obj is not None
-            if self.use_vector and is_vectorized and self.sort_method == 1 and 0:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                ielement2 = obj.itotal + nelements
-                itotal2 = ielement2
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
-                itime = obj.itime
-                obj._times[itime] = dt
-
-                if itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
-                    eids = ints[:, 0] // 10
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 2
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
-
-                #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 21)
+                    obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+                    obj.element_node[itotal:itotal2, 1] = ints[:, 1:].reshape(nelements * 2, 10)[:, 0]
+
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 21)
+                floats2 = floats[:, 1:].reshape(nelements * 2, 10)
+                #[angle, sc, sd, se, sf]
+                real_imag = apply_mag_phase(floats2, is_magnitude_phase, [2, 3, 4, 5], [6, 7, 8, 9],
+                                            use_float64=True)
+                obj.data[obj.itime, itotal:itotal2, 0] = floats2[:, 1]
+                obj.data[obj.itime, itotal:itotal2, 1:] = real_imag
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
                 ntotali = 40
                 struct1 = Struct(self._endian + self._analysis_code_fmt)
@@ -5464,25 +5385,24 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and self.sort_method == 1 and 0:
+            if self.use_vector and is_vectorized:
                 n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                ielement2 = obj.itotal + nelements
-                itotal2 = ielement2
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
-                itime = obj.itime
-                obj._times[itime] = dt
-                if itime == 0:
-                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
-                    eids = ints[:, 0] // 10
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 2
+                eids, dt = self._get_vector_eids_dt(data, nelements, dt)
+                obj._times[obj.itime] = dt
+                if obj.itime == 0 or self.sort_method == 2:
                     assert eids.min() > 0, eids.min()
-                    obj.element[itotal:itotal2] = eids
-
-                #[max_strain, avg_strain, margin]
-                obj.data[itime, itotal:itotal2, :] = floats[:, 1:].copy()
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
+                    obj.element_node[itotal:itotal2, 0] = repeat(eids, 2)
+                    obj.element_node[itotal:itotal2, 1] = ints[:, 1:].reshape(nelements * 2, 6)[:, 0]
+
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
+                floats2 = floats[:, 1:].reshape(nelements * 2, 6)
+                #[sc, sd, se, sf]
+                obj.angle[itotal:itotal2] = floats2[:, 1]
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
                 obj.itotal = itotal2
-                obj.ielement = ielement2
             else:
                 ntotali = 24
                 struct1 = Struct(self._endian + self._analysis_code_fmt)
@@ -5621,39 +5541,63 @@ class OES(OP2Common):
                 #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
 
-            struct1 = Struct(self._endian + b'2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f')  # 2 + 6*8 + 1 = 51
-            for unused_i in range(nelements):  # num_wide=51
-                edata = data[n:n + 204]
-                out = struct1.unpack(edata)
+            if self.use_vector and is_vectorized and self.sort_method == 1:
+                n = nelements * self.num_wide * 4
+                itotal = obj.itotal
+                itotal2 = itotal + nlayers
+                obj._times[obj.itime] = dt
 
-                if self.is_debug_file:
-                    self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
-
-                #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
-                #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
-                #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
-                #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
-                #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
-                #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
-                #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
-                #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
-                # A
-                assert out[3-1] == b'   C', out[3-1]
-                assert out[9-1] == b'   D', out[9-1]
-                assert out[15-1] == b'   E', out[15-1]
-                assert out[21-1] == b'   F', out[21-1]
-
-                # B
-                assert out[28-1] == b'   C', out[28-1]
-                assert out[34-1] == b'   D', out[34-1]
-                assert out[40-1] == b'   E', out[40-1]
-                assert out[46-1] == b'   F', out[46-1]
-
-                eid_device = out[0]
-                eid, dt = get_eid_dt_from_eid_device(
-                    eid_device, self.nonlinear_factor, self.sort_method)
-                obj.add_new_eid_sort1(dt, eid, *out[1:])
-                n += 204
+                # [eid_device, grid_a, 4*(loc, 5f), grid_b, 4*(loc, 5f)]
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                if obj.itime == 0:
+                    eids = ints[:, 0] // 10
+                    assert eids.min() > 0, eids.min()
+                    obj.element_node[itotal:itotal2, 0] = repeat(eids, 8)
+                    obj.element_node[itotal:itotal2, 1] = repeat(ints[:, [1, 26]].ravel(), 4)
+                    obj.element_node[itotal:itotal2, 2] = np.tile(np.arange(8, dtype='int32'), nelements)
+
+                #[long, eqs, te, eps, ecs]
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                floats_a = floats[:, 2:26].reshape(nelements, 4, 6)[:, :, 1:]
+                floats_b = floats[:, 27:51].reshape(nelements, 4, 6)[:, :, 1:]
+                results = np.hstack([floats_a, floats_b]).reshape(nlayers, 5)
+                obj.data[obj.itime, itotal:itotal2, :] = results
+                obj.itotal = itotal2
+                obj.ielement += nelements
+            else:
+                struct1 = Struct(self._endian + b'2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f')  # 2 + 6*8 + 1 = 51
+                for unused_i in range(nelements):  # num_wide=51
+                    edata = data[n:n + 204]
+                    out = struct1.unpack(edata)
+
+                    if self.is_debug_file:
+                        self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
+
+                    #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
+                    #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
+                    #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
+                    #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
+                    #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
+                    #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
+                    #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
+                    #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
+                    # A
+                    assert out[3-1] == b'   C', out[3-1]
+                    assert out[9-1] == b'   D', out[9-1]
+                    assert out[15-1] == b'   E', out[15-1]
+                    assert out[21-1] == b'   F', out[21-1]
+
+                    # B
+                    assert out[28-1] == b'   C', out[28-1]
+                    assert out[34-1] == b'   D', out[34-1]
+                    assert out[40-1] == b'   E', out[40-1]
+                    assert out[46-1] == b'   F', out[46-1]
+
+                    eid_device = out[0]
+                    eid, dt = get_eid_dt_from_eid_device(
+                        eid_device, self.nonlinear_factor, self.sort_method)
+                    obj.add_new_eid_sort1(dt, eid, *out[1:])
+                    n += 204
 
         elif self.format_code == 1 and self.num_wide == numwide_random:  # random
             msg = self.code_information()
@@ -5717,7 +5661,7 @@ class OES(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                 #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
-                obj.data[obj.itime, istart:iend, :] = floats[:, 1:].copy()
+                self._set_obj_data(obj, obj.itime, istart, iend, floats[:, 1:])
             else:
                 struct1 = Struct(self._endian + self._analysis_code_fmt + b'9f')
                 for i in range(nelements):
@@ -243,7 +243,7 @@ class HyperelasticQuadArray(OES_Object):
         return itot
 
     def eid_to_element_node_index(self, eids):
-        ind = np.ravel([np.searchsorted(self.element_node[:, 0] == eid) for eid in eids])
+        ind = self.get_rows(eids=eids)
         #ind = searchsorted(eids, self.element)
         #ind = ind.reshape(ind.size)
         #ind.sort()
@@ -2,7 +2,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from six import integer_types
 import numpy as np
-from numpy import zeros, searchsorted, unique, ravel
+from numpy import zeros, searchsorted, unique
 
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
@@ -230,7 +230,7 @@ class RandomCompositePlateArray(OES_Object):
         return itot
 
     def eid_to_element_node_index(self, eids):
-        ind = ravel([searchsorted(self.element_layer[:, 0] == eid) for eid in eids])
+        ind = self.get_rows(eids=eids)
         #ind = searchsorted(eids, self.element)
         #ind = ind.reshape(ind.size)
         #ind.sort()
@@ -184,7 +184,7 @@ class RealBushArray(OES_Object):
         return itot
 
     def eid_to_element_node_index(self, eids):
-        ind = np.ravel([np.searchsorted(self.element == eid) for eid in eids])
+        ind = self.get_rows(eids=eids)
         return ind
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
@@ -3,7 +3,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from six import integer_types
 from itertools import count
 import numpy as np
-from numpy import zeros, searchsorted, ravel
+from numpy import zeros, searchsorted
 ints = (int, np.int32)
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, OES_Object
@@ -194,7 +194,7 @@ class RealBush1DStressArray(OES_Object):
         return itot
 
     def eid_to_element_node_index(self, eids):
-        ind = ravel([searchsorted(self.element == eid) for eid in eids])
+        ind = self.get_rows(eids=eids)
         return ind
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
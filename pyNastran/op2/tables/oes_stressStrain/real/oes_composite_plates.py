@@ -2,11 +2,11 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from six import integer_types
 import numpy as np
-from numpy import zeros, searchsorted, unique, ravel
+from numpy import zeros, searchsorted, unique
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
-from pyNastran.f06.f06_formatting import write_floats_12e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import _eigenvalue_header, F06Format
 
 
 class RealCompositePlateArray(OES_Object):
@@ -243,7 +243,7 @@ class RealCompositePlateArray(OES_Object):
         return itot
 
     def eid_to_element_node_index(self, eids):
-        ind = ravel([searchsorted(self.element_layer[:, 0] == eid) for eid in eids])
+        ind = self.get_rows(eids=eids)
         #ind = searchsorted(eids, self.element)
         #ind = ind.reshape(ind.size)
         #ind.sort()
@@ -311,28 +311,17 @@ class RealCompositePlateArray(OES_Object):
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
 
             #[o11, o22, t12, t1z, t2z, angle, major, minor, ovm]
-            o11 = self.data[itime, :, 0]
-            o22 = self.data[itime, :, 1]
-            t12 = self.data[itime, :, 2]
-            t1z = self.data[itime, :, 3]
-            t2z = self.data[itime, :, 4]
-            angle = self.data[itime, :, 5]
-            major = self.data[itime, :, 6]
-            minor = self.data[itime, :, 7]
-            ovm = self.data[itime, :, 8]
-
-            for eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi in zip(
-                eids, layers, o11, o22, t12, t1z, t2z, angle, major, minor, ovm):
-
-                [o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi] = write_floats_12e([
-                 o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi])
-                f06_file.write('0 %8s %4s  %12s %12s %12s   %12s %12s  %6.2F %12s %12s %s\n'
-                               % (eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi))
+            COMPOSITE_PLATE_FORMAT.write(f06_file, eids, layers, *self.data[itime, :, :].T)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
 
 
+#: the format of a ply of a RealCompositePlateArray
+COMPOSITE_PLATE_FORMAT = F06Format(
+    '0 %8s %4s  {12e:>12} {12e:>12} {12e:>12}   {12e:>12} {12e:>12}  %6.2F {12e:>12} {12e:>12} {12e}\n')
+
+
 class RealCompositePlateStressArray(RealCompositePlateArray, StressObject):
     def __init__(self, data_code, is_sort1, isubcase, dt):
         RealCompositePlateArray.__init__(self, data_code, is_sort1, isubcase, dt)
@@ -2,12 +2,11 @@
 #pylint disable=C0103
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
-from itertools import count
 from six import integer_types
 import numpy as np
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import _eigenvalue_header, F06Format
 
 ints = (int, np.int32)
 
@@ -238,7 +237,7 @@ class RealPlateArray(OES_Object):
         return itot
 
     def eid_to_element_node_index(self, eids):
-        ind = np.ravel([np.searchsorted(self.element_node[:, 0] == eid) for eid in eids])
+        ind = self.get_rows(eids=eids)
         #ind = searchsorted(eids, self.element)
         #ind = ind.reshape(ind.size)
         #ind.sort()
@@ -258,52 +257,34 @@ class RealPlateArray(OES_Object):
 
         #cen_word = 'CEN/%i' % nnodes
         cen_word = cen
+        if self.element_type in [33, 74]:  # CQUAD4, CTRIA3
+            labels1 = (eids[0::2], )
+            labels2 = ('', )
+            fmt = PLATE_FORMAT
+        elif self.element_type in [64, 70, 75, 82, 144]:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+            # bilinear; the element id is only written on the CEN fiber 1 line
+            is_cen = nids[0::2] == 0
+            labels1 = (
+                np.where(is_cen, '0', ' '),
+                np.where(is_cen, eids[0::2].astype('U'), ''),
+                np.where(is_cen, cen_word, nids[0::2].astype('U')))
+            labels2 = ('', '')
+            fmt = PLATE_BILINEAR_FORMAT
+        else:
+            msg = 'element_name=%s self.element_type=%s' % (
+                self.element_name, self.element_type)
+            raise NotImplementedError(msg)
+
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg))
 
-            #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
-
             #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
-
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if self.element_type in [33, 74]:  # CQUAD4, CTRIA3
-                    if ilayer == 0:
-                        f06_file.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f06_file.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif self.element_type in [64, 70, 75, 82, 144]:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f06_file.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f06_file.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f06_file.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:
-                    msg = 'element_name=%s self.element_type=%s' % (
-                        self.element_name, self.element_type)
-                    raise NotImplementedError(msg)
+            data = self.data[itime, :, :]
+            fiber1 = data[0::2, :].T
+            fiber2 = data[1::2, :].T
+            fmt.write(f06_file, *(labels1 + tuple(fiber1) + labels2 + tuple(fiber2)))
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -379,6 +360,19 @@ class RealPlateStrainArray(RealPlateArray, StrainObject):
         return headers
 
 
+#: the format of the 2 fibers of a CQUAD4/CTRIA3
+PLATE_FORMAT = F06Format([
+    '0  %6i   {13e:<13}     {13e:<13}  {13e:<13}  {13e:<13}   %8.4f   {13e:<13}   {13e:<13}  {13e}\n',
+    '   %6s   {13e:<13}     {13e:<13}  {13e:<13}  {13e:<13}   %8.4f   {13e:<13}   {13e:<13}  {13e}\n',
+])
+
+#: the format of the 2 fibers of a node of a bilinear plate
+PLATE_BILINEAR_FORMAT = F06Format([
+    '%s  %8s %8s  {13e:<13}  {13e:<13} {13e:<13} {13e:<13}   %8.4f  {13e:<13} {13e:<13} {13e}\n',
+    '   %8s %8s  {13e:<13}  {13e:<13} {13e:<13} {13e:<13}   %8.4f  {13e:<13} {13e:<13} {13e}\n\n',
+])
+
+
 def _get_plate_msg(self):
     if self.is_von_mises:
         von_mises = 'VON MISES'
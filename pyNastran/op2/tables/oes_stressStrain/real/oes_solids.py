@@ -10,7 +10,7 @@ from numpy import zeros, where, searchsorted
 from numpy.linalg import eigh  # type: ignore
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header, F06Format
 
 
 class RealSolidArray(OES_Object):
@@ -269,60 +269,48 @@ class RealSolidArray(OES_Object):
         eids3 = self.element_cid[:, 0]
         cids3 = self.element_cid[:, 1]
 
+        cnnodes = nnodes + 1
+        eids = eids2[::cnnodes]
+        isort = np.argsort(eids3)
+        cids = cids3[isort[searchsorted(eids3, eids, sorter=isort)]]
+        nelements = len(eids)
+        nodes = nodes.reshape(nelements, cnnodes)
+        fmt = _get_solid_f06_format(cnnodes)
+
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg_temp))
 
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            ozz = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            tyz = self.data[itime, :, 4]
-            txz = self.data[itime, :, 5]
-            o1 = self.data[itime, :, 6]
-            o2 = self.data[itime, :, 7]
-            o3 = self.data[itime, :, 8]
-            ovm = self.data[itime, :, 9]
+            oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm = self.data[itime, :, :].T
             p = (o1 + o2 + o3) / -3.
 
-            cnnodes = nnodes + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm in zip(
-                count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, p, ovm):
-
-                j = where(eids3 == deid)[0]
-                cid = cids3[j]
-                A = [[doxx, dtxy, dtxz],
-                     [dtxy, doyy, dtyz],
-                     [dtxz, dtyz, dozz]]
-                (_lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
-
-                # o1-max
-                # o2-mid
-                # o3-min
-                assert do1 >= do2 >= do3, 'o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (deid, do1, do2, do3)
-                [oxxi, oyyi, ozzi, txyi, tyzi, txzi, o1i, o2i, o3i, pi, ovmi] = write_floats_13e(
-                    [doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm])
-
-                if i % cnnodes == 0:
-                    f06_file.write('0  %8s    %8iGRID CS  %i GP\n' % (deid, cid, nnodes))
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % ('CENTER', oxxi, txyi, o1i, v[0, 1], v[0, 2], v[0, 0], pi, ovmi,
-                           '', oyyi, tyzi, o2i, v[1, 1], v[1, 2], v[1, 0],
-                           '', ozzi, txzi, o3i, v[2, 1], v[2, 2], v[2, 0]))
-                else:
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % (node_id, oxxi, txyi, o1i, v[0, 1], v[0, 2], v[0, 0], pi, ovmi,
-                           '', oyyi, tyzi, o2i, v[1, 1], v[1, 2], v[1, 0],
-                           '', ozzi, txzi, o3i, v[2, 1], v[2, 2], v[2, 0]))
-                i += 1
+            # o1-max
+            # o2-mid
+            # o3-min
+            is_sorted = (o1 >= o2) & (o2 >= o3)
+            if not is_sorted.all():
+                i = np.where(~is_sorted)[0][0]
+                raise AssertionError('o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (
+                    eids2[i], o1[i], o2[i], o3[i]))
+
+            A = np.array([[oxx, txy, txz],
+                          [txy, oyy, tyz],
+                          [txz, tyz, ozz]]).transpose(2, 0, 1)
+            (unused_lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
+
+            values = [
+                oxx, txy, o1, v[:, 0, 1], v[:, 0, 2], v[:, 0, 0], p, ovm,
+                oyy, tyz, o2, v[:, 1, 1], v[:, 1, 2], v[:, 1, 0],
+                ozz, txz, o3, v[:, 2, 1], v[:, 2, 2], v[:, 2, 0]]
+            values = [value.reshape(nelements, cnnodes) for value in values]
+            columns = [eids, cids, nnodes]
+            for inode in range(cnnodes):
+                label = 'CENTER' if inode == 0 else nodes[:, inode]
+                valuesi = [value[:, inode] for value in values]
+                columns += [label] + valuesi[:8] + [''] + valuesi[8:14] + [''] + valuesi[14:]
+            fmt.write(f06_file, *columns)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -583,6 +571,22 @@ def _get_solid_msgs(self):
     hexa_msg += base_msg
     return tetra_msg, penta_msg, hexa_msg
 
+#: the formats of the RealSolidArray elements; cnnodes -> F06Format
+_SOLID_F06_FORMATS = {}
+
+def _get_solid_f06_format(cnnodes):
+    """gets the format of a CTETRA/CPENTA/CHEXA with cnnodes centroid/corner nodes"""
+    if cnnodes not in _SOLID_F06_FORMATS:
+        node_lines = [
+            '0              %8s  X  {13e:<13}  XY  {13e:<13}   A  {13e:<13}  LX%5.2f%5.2f%5.2f  {13e:<13}   {13e}\n',
+            '               %8s  Y  {13e:<13}  YZ  {13e:<13}   B  {13e:<13}  LY%5.2f%5.2f%5.2f\n',
+            '               %8s  Z  {13e:<13}  ZX  {13e:<13}   C  {13e:<13}  LZ%5.2f%5.2f%5.2f\n',
+        ]
+        _SOLID_F06_FORMATS[cnnodes] = F06Format(
+            ['0  %8s    %8iGRID CS  %i GP\n'] + node_lines * cnnodes)
+    return _SOLID_F06_FORMATS[cnnodes]
+
+
 def _get_f06_header_nnodes(self, is_mag_phase=True):
     tetra_msg, penta_msg, hexa_msg = _get_solid_msgs(self)
     if self.element_type == 39: # CTETRA
@@ -1119,7 +1119,7 @@ class ComplexGridPointForcesArray(ScalarObject):
                 msg += '%s\n' % str(self.code_information())
                 i = 0
                 for itime in range(self.ntimes):
-                    for ie, e in enumerate(self.node_element):
+                    for ie, e in enumerate(self.node_element[itime, :, :]):
                         (eid, nid) = e
                         ename1 = self.element_names[itime, ie]
                         ename2 = self.element_names[itime, ie]
@@ -1131,7 +1131,7 @@ class ComplexGridPointForcesArray(ScalarObject):
                         if not np.array_equal(t1, t2):
                             msg += '(%s, %s, %s)    (%s, %s, %s, %s, %s, %s)  (%s, %s, %s, %s, %s, %s)\n' % (
                                 eid, nid, ename1,
-                                t12, t22, t32, r12, r22, r32,
+                                t11, t21, t31, r11, r21, r31,
                                 t12, t22, t32, r12, r22, r32)
                             i += 1
                             if i > 10:
@@ -1158,7 +1158,7 @@ class ComplexGridPointForcesArray(ScalarObject):
                         if not np.array_equal(t1, t2):
                             msg += '(%s, %s, %s)    (%s, %s, %s, %s, %s, %s)  (%s, %s, %s, %s, %s, %s)\n' % (
                                 eid, nid, ename1,
-                                t12, t22, t32, r12, r22, r32,
+                                t11, t21, t31, r11, r21, r31,
                                 t12, t22, t32, r12, r22, r32)
                             i += 1
                             if i > 10:
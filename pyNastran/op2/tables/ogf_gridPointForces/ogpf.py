@@ -4,10 +4,12 @@ Defines the Real/Complex Forces created by:
 """
 from __future__ import print_function
 from struct import Struct
+import numpy as np
 from numpy import frombuffer
 
 from pyNastran.op2.op2_helper import polar_to_real_imag
 from pyNastran.op2.op2_interface.op2_common import OP2Common
+from pyNastran.op2.op2_interface.utils import apply_mag_phase
 from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import (
     RealGridPointForcesArray, ComplexGridPointForcesArray)
 
@@ -87,20 +89,22 @@ class OGPF(OP2Common):
 
                         nids = ints[:, 0] // 10
                         eids = ints[:, 1]
-                        strings = frombuffer(data, dtype=self._uendian + 'S8').reshape(nnodes, 5).copy()
+                        strings = frombuffer(data, dtype=self._uendian + 'S8').reshape(nnodes, 5)
+                        # the names are stripped like add_sort1
+                        elem_names = np.char.strip(strings[:, 1])
                         if obj.is_unique:
                             obj.node_element[itime, istart:iend, 0] = nids
                             obj.node_element[itime, istart:iend, 1] = eids
-                            obj.element_names[itime, istart:iend] = strings[:, 1]
+                            obj.element_names[itime, istart:iend] = elem_names
                         else:
                             obj.node_element[istart:iend, 0] = nids
                             obj.node_element[istart:iend, 1] = eids
-                            obj.element_names[istart:iend] = strings[:, 1]
+                            obj.element_names[istart:iend] = elem_names
 
 
                     floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 10)
                     #[f1, f2, f3, m1, m2, m3]
-                    obj.data[itime, istart:iend, :] = floats[:, 4:].copy()
+                    self._set_obj_data(obj, itime, istart, iend, floats[:, 4:])
                     #obj._times[obj.itime] = dt
                     #obj.itotal = itotal2
                     if self.is_debug_file:
@@ -136,31 +140,37 @@ class OGPF(OP2Common):
                     return nnodes * self.num_wide * 4
 
                 obj = self.obj
-                is_vectorized = False
                 if self.use_vector and is_vectorized:
-                    # self.itime = 0
-                    # self.ielement = 0
-                    # self.itotal = 0
-                    #self.ntimes = 0
-                    #self.nelements = 0
                     n = nnodes * self.num_wide * 4
 
                     istart = obj.itotal
                     iend = istart + nnodes
                     obj._times[obj.itime] = dt
 
-                    if obj.itime == 0:
-                        ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 16)
+                    itime = obj.itime
+                    if itime == 0 or obj.is_unique:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 16).copy()
                         nids = ints[:, 0] // 10
                         eids = ints[:, 1]
-                        obj.node_element[istart:iend, 0] = nids
-                        obj.node_element[istart:iend, 1] = eids
                         strings = frombuffer(data, dtype=self._uendian + 'S8').reshape(nnodes, 8)
-                        obj.element_names[istart:iend] = strings[:, 1].copy()
+                        # the names are stripped like add_sort1
+                        elem_names = np.char.strip(strings[:, 1])
+                        if obj.is_unique:
+                            obj.node_element[itime, istart:iend, 0] = nids
+                            obj.node_element[itime, istart:iend, 1] = eids
+                            obj.element_names[itime, istart:iend] = elem_names
+                        else:
+                            obj.node_element[istart:iend, 0] = nids
+                            obj.node_element[istart:iend, 1] = eids
+                            obj.element_names[istart:iend] = elem_names
 
                     floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 16)
                     #[f1, f2, f3, m1, m2, m3]
-                    obj.data[obj.itime, istart:iend, :] = floats[:, 4:].copy()
+                    real_imag = apply_mag_phase(floats, is_magnitude_phase,
+                                                [4, 5, 6, 7, 8, 9], [10, 11, 12, 13, 14, 15],
+                                                use_float64=True)
+                    obj.data[itime, istart:iend, :] = real_imag
+                    obj.itotal = iend
                 else:
                     s = Struct(self._endian + b'ii8s12f')
 
@@ -256,8 +256,7 @@ class TestGridPointForces(unittest.TestCase):
                 np.abs(total_moment_local_expected - total_moment_local))
             self.assertTrue(np.allclose(total_moment_local_expected, total_moment_local, atol=0.005), msg)
 
-    @unittest.expectedFailure
-    def test_broken_op2_solid_shell_bar_01_gpforce_radial_global_cd(self):
+    def test_op2_solid_shell_bar_01_gpforce_radial_global_cd(self):
         warning_log = SimpleLogger(level='warning')
         debug_log = SimpleLogger(level='debug')
         folder = os.path.join(model_path, 'sol_101_elements')
@@ -267,7 +266,6 @@ class TestGridPointForces(unittest.TestCase):
 
         #print("disp_orig =\n", op2_1.displacements[1].data[0, :4, :])
         #print("spc_orig =\n", op2_1.spc_forces[1].data[0, -3:, :])
-        print("gpf_orig =\n", op2_1.grid_point_forces[1].data[0, 2:8, :])
 
         op2_1.cross_reference(xref_elements=False,
                               xref_nodes_with_elements=False,
@@ -307,7 +305,6 @@ class TestGridPointForces(unittest.TestCase):
 
         #print("disp_new =\n", op2_1.displacements[1].data[0, :4, :])
         #print("spc_new =\n", op2_1.spc_forces[1].data[0, -3:, :])
-        print("gpf_new =\n", op2_1.grid_point_forces[1].data[0, 2:8, :])
 
         #-----------------------------------------------------------------------
         op2_filename2 = os.path.join(folder, 'static_solid_shell_bar.op2')
@@ -318,7 +315,6 @@ class TestGridPointForces(unittest.TestCase):
 
         #print("disp_goal =\n", op2_2.displacements[1].data[0, :4, :])
         #print("spc_goal =\n", op2_2.spc_forces[1].data[0, -3:, :])
-        print("gpf_goal =\n", op2_2.grid_point_forces[1].data[0, 2:8, :])
 
         #return
         #msg = 'displacements baseline=\n%s\ndisplacements xyz=\n%s' % (
@@ -437,7 +433,6 @@ class TestGridPointForces(unittest.TestCase):
         #print("spc_goal =\n", op2_2.spc_forces[1].data[0, -3:, :])
         #print("gpf_goal =\n", op2_2.grid_point_forces[1].data[0, :2, :])
 
-        return
         msg = 'displacements baseline=\n%s\ndisplacements xyz=\n%s' % (
             op2_1.displacements[1].data[0, :, :], op2_2.displacements[1].data[0, :, :])
         #print(msg)
@@ -447,12 +442,16 @@ class TestGridPointForces(unittest.TestCase):
             op2_1.grid_point_forces[1].data[0, :, :], op2_2.grid_point_forces[1].data[0, :, :])
         #print(msg)
 
-        assert op2_1.spc_forces[1].assert_equal(op2_2.spc_forces[1], atol=4.4341e-04), msg
-        assert op2_1.mpc_forces[1].assert_equal(op2_2.mpc_forces[1]), msg
-        assert op2_1.load_vectors[1].assert_equal(op2_2.load_vectors[1]), msg
+        # the radial model only has the displacements and grid point forces
+        assert len(op2_1.spc_forces) == 0, op2_1.spc_forces
         assert op2_1.grid_point_forces[1].assert_equal(op2_2.grid_point_forces[1], atol=0.000123), msg
         #-----------------------------------------------------------------------
+        # the grid point forces are now in the global frame, so the outputs
+        # are no longer in the radial coordinate systems
         gpforce = op2_1.grid_point_forces[1]
+        nid_cd_global = nid_cd.copy()
+        nid_cd_global[:, 1] = 0
+        icd_transform_global = {0 : np.arange(len(nid_cd))}
         data = _get_gpforce_data()
         for i, datai in enumerate(data):
             eids, nids, cid, summation_point, total_force_local_expected, total_moment_local_expected = datai
@@ -461,7 +460,7 @@ class TestGridPointForces(unittest.TestCase):
             out = gpforce.extract_interface_loads(
                 nids, eids,
                 coord_out, op2_1.coords,
-                nid_cd, icd_transform_1,
+                nid_cd_global, icd_transform_global,
                 xyz_cid0, summation_point, itime=0, debug=False, logger=op2_1.log)
             total_force_global, total_moment_global, total_force_local, total_moment_local = out
 
@@ -11,7 +11,8 @@ from pyNastran.op2.op2 import OP2
 from pyNastran.op2.data_in_material_coord import (
     data_in_material_coord,
     get_eids_from_op2_vector, force_vectors, stress_vectors,
-    strain_vectors)
+    strain_vectors, composite_stress_vectors, composite_strain_vectors,
+    get_material_angles, get_ply_angles)
 pkg_path = pyNastran.__path__[0]
 
 
@@ -109,6 +110,81 @@ class TestMaterialCoordReal(unittest.TestCase):
                     assert np.allclose(data[:, check], ref_result, rtol=RTOL, atol=ATOL)
             #print('OK')
 
+    def test_composite(self):
+        """the ply stresses/strains are rotated from the fiber direction"""
+        log = get_logger(level='warning')
+        bdf = BDF(debug=False, log=log)
+        op2 = OP2(debug=False, log=log)
+        basepath = os.path.join(pkg_path, 'op2', 'test', 'examples', 'test_flat_plate_composite')
+        bdf.read_bdf(os.path.join(basepath, 'flat_plate_composite.bdf'))
+        op2.read_op2(os.path.join(basepath, 'flat_plate_composite.op2'))
+        op2_new = data_in_material_coord(bdf, op2)
+        for vecname in composite_stress_vectors + composite_strain_vectors:
+            for subcase, vector in getattr(op2, vecname).items():
+                data = vector.data
+                data_new = getattr(op2_new, vecname)[subcase].data
+                thetadeg = np.rad2deg(get_ply_angles(bdf, vector.element_layer))
+                shear = 1. if 'stress' in vecname else 2.
+                scale = np.abs(data[:, :, :5]).max()
+                atol = 1e-5 * scale
+
+                i0 = thetadeg == 0.
+                assert np.allclose(data_new[:, i0, :5], data[:, i0, :5], atol=atol)
+                i90 = thetadeg == 90.
+                assert i90.sum() > 0
+                assert np.allclose(data_new[:, i90, 0], data[:, i90, 1], atol=atol)
+                assert np.allclose(data_new[:, i90, 1], data[:, i90, 0], atol=atol)
+                assert np.allclose(data_new[:, i90, 2], -data[:, i90, 2], atol=atol)
+                assert np.allclose(data_new[:, i90, 3], -data[:, i90, 4], atol=atol)
+                assert np.allclose(data_new[:, i90, 4], data[:, i90, 3], atol=atol)
+
+                # the principal values don't depend on the coordinate system
+                oxx, oyy, txy = data_new[0, :, 0], data_new[0, :, 1], data_new[0, :, 2] / shear
+                radius = np.sqrt(((oxx - oyy) / 2.) ** 2 + txy ** 2)
+                assert np.allclose((oxx + oyy) / 2. + radius, data[0, :, 6], atol=atol)
+                assert np.allclose(data_new[:, :, 6:], data[:, :, 6:])
+
+    def test_mmap_in_place(self):
+        """the memory mapped results are copied when modified in place"""
+        log = get_logger(level='warning')
+        folder, prefix, unused_subcase = CASES[0]
+        basepath = os.path.join(pkg_path, 'op2', 'test', 'examples', folder)
+        bdf = BDF(debug=False, log=log)
+        bdf.read_bdf(os.path.join(basepath, prefix + '.bdf'))
+        op2 = OP2(debug=False, log=log)
+        op2.read_op2(os.path.join(basepath, prefix + '.op2'))
+        op2_new = data_in_material_coord(bdf, op2)
+
+        op2_mmap = OP2(debug=False, log=log)
+        op2_mmap.use_mmap = True
+        op2_mmap.read_op2(os.path.join(basepath, prefix + '.op2'))
+        assert not op2_mmap.cquad4_force[1].data.flags.writeable
+        op2_mmap2 = data_in_material_coord(bdf, op2_mmap, in_place=True)
+        assert op2_mmap2 is op2_mmap
+        for vecname in force_vectors + stress_vectors + strain_vectors:
+            for subcase, vector in getattr(op2_new, vecname).items():
+                data = getattr(op2_mmap, vecname)[subcase].data
+                assert data.flags.writeable
+                assert np.array_equal(data, vector.data), vecname
+
+    def test_material_angles(self):
+        """the angles of the THETA/MCID elements"""
+        log = get_logger(level='warning')
+        bdf = BDF(debug=False, log=log)
+        bdf.add_grid(1, [0., 0., 0.])
+        bdf.add_grid(2, [1., 0., 0.])
+        bdf.add_grid(3, [1., 1., 0.])
+        bdf.add_grid(4, [0., 1., 0.])
+        bdf.add_cord2r(10, [0., 0., 0.], [0., 0., 1.], [1., 1., 0.])
+        bdf.add_ctria3(1, 1, [1, 2, 3], theta_mcid=30.)
+        bdf.add_ctria3(2, 1, [1, 2, 3], theta_mcid=10)
+        bdf.add_cquad4(3, 1, [1, 2, 3, 4], theta_mcid=30.)
+        bdf.add_cquad4(4, 1, [1, 2, 3, 4], theta_mcid=10)
+        bdf.add_conrod(5, 1, [1, 2])
+        eids, thetarad = get_material_angles(bdf)
+        assert np.array_equal(eids, [1, 2, 3, 4])
+        assert np.allclose(np.rad2deg(thetarad), [30., 45., 30., 45.])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
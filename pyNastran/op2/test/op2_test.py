@@ -1,11 +1,21 @@
 from __future__ import print_function
 import os
 import sys
+import shutil
+import tempfile
 from six import PY2
 
 import pyNastran
 from pyNastran.utils.dev import get_files_of_type
 PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+def get_model_files():
+    """Gets the files in the models folder"""
+    filenames = set()
+    for dirname, unused_dirnames, basenames in os.walk(MODEL_PATH):
+        filenames.update(os.path.join(dirname, basename) for basename in basenames)
+    return filenames
 
 def get_failed_files(filename):
     """Gets the list of failed files"""
@@ -98,7 +108,17 @@ def get_all_files(folders_file, file_type):
 def run(regenerate=True, make_geom=False, write_bdf=False, skip_dataframe=False,
         xref_safe=False,
         save_cases=True, debug=False, write_f06=True, compare=True, short_stats=False,
-        export_hdf5=True):
+        export_hdf5=True, models=False):
+    """
+    Runs the OP2 tests on the folders in foldersRead.txt
+
+    Parameters
+    ----------
+    models : bool; default=False
+        runs the OP2s in the pyNastran models folder instead and compares
+        the vectorized and unvectorized (scalar) results of each model;
+        the files that are written are deleted afterwards
+    """
     # works
     files = get_files_of_type('tests', '.op2')
 
@@ -115,7 +135,11 @@ def run(regenerate=True, make_geom=False, write_bdf=False, skip_dataframe=False,
 
 
     failed_cases_filename = 'failed_cases%s%s.in' % (sys.version_info[:2])
-    if get_skip_cards:
+    if models:
+        files2 = get_files_of_type(MODEL_PATH, '.op2')
+        compare = True
+        save_cases = False
+    elif get_skip_cards:
         files2 = parse_skipped_cards('skipped_cards.out')
     elif regenerate or not os.path.exists(failed_cases_filename):
         files2 = get_all_files(folders_file, '.op2')
@@ -143,16 +167,30 @@ def run(regenerate=True, make_geom=False, write_bdf=False, skip_dataframe=False,
     time0 = time.time()
 
     from pyNastran.op2.test.test_op2 import run_lots_of_files
-    failed_files = run_lots_of_files(files, make_geom=make_geom, write_bdf=write_bdf,
-                                     xref_safe=xref_safe,
-                                     write_f06=write_f06, delete_f06=delete_f06,
-                                     skip_dataframe=skip_dataframe,
-                                     write_op2=write_op2, export_hdf5=export_hdf5,
-                                     debug=debug,
-                                     skip_files=skip_files, stop_on_failure=stop_on_failure,
-                                     nstart=nstart, nstop=nstop, binary_debug=binary_debug,
-                                     compare=compare, short_stats=short_stats,
-                                     quiet=quiet, dev=True)
+    if models:
+        # the outputs are written next to the OP2s and in the working
+        # directory, so they're cleaned up
+        model_files = get_model_files()
+        cwd = os.getcwd()
+        dirname = tempfile.mkdtemp()
+        os.chdir(dirname)
+    try:
+        failed_files = run_lots_of_files(files, make_geom=make_geom, write_bdf=write_bdf,
+                                         xref_safe=xref_safe,
+                                         write_f06=write_f06, delete_f06=delete_f06,
+                                         skip_dataframe=skip_dataframe,
+                                         write_op2=write_op2, export_hdf5=export_hdf5,
+                                         debug=debug,
+                                         skip_files=skip_files, stop_on_failure=stop_on_failure,
+                                         nstart=nstart, nstop=nstop, binary_debug=binary_debug,
+                                         compare=compare, short_stats=short_stats,
+                                         quiet=quiet, dev=True)
+    finally:
+        if models:
+            for filename in get_model_files() - model_files:
+                os.remove(filename)
+            os.chdir(cwd)
+            shutil.rmtree(dirname)
     if save_cases:
         if PY2:
             write = 'wb'
@@ -185,7 +223,7 @@ def main():
 
     msg = "Usage:\n"
     #is_release = False
-    msg += "op2_test [-r] [-s] [-c] [-u] [-t] [-g] [-n] [-f] [-h] [-d] [-b] [--safe] [--skip_dataframe]\n"
+    msg += "op2_test [-r] [-s] [-c] [-u] [-t] [-g] [-n] [-f] [-h] [-d] [-b] [--safe] [--skip_dataframe] [--models]\n"
     msg += "  op2_test -h | --help\n"
     msg += "  op2_test -v | --version\n"
     msg += "\n"
@@ -207,6 +245,8 @@ def main():
     msg += "  --skip_dataframe       Disables pandas dataframe building; [default: False]\n"
     msg += "  -s, --save_cases       Disables saving of the cases (default=False)\n"
     msg += "  --safe                 Safe cross-references BDF (default=False)\n"
+    msg += "  --models               Runs the OP2s in the models folder and compares the\n"
+    msg += "                         vectorized and unvectorized results (default=False)\n"
     #msg += "  -z, --is_mag_phase    F06 Writer writes Magnitude/Phase instead of\n"
     #msg += "                        Real/Imaginary (still stores Real/Imag); [default: False]\n"
     #msg += "  -s <sub>, --subcase   Specify one or more subcases to parse; (e.g. 2_5)\n"
@@ -227,11 +267,12 @@ def main():
     compare = not data['--disablecompare']
     skip_dataframe = data['--skip_dataframe']
     xref_safe = data['--safe']
+    models = data['--models']
     run(regenerate=regenerate, make_geom=make_geom, write_bdf=write_bdf,
         xref_safe=xref_safe,
         save_cases=save_cases, write_f06=write_f06, export_hdf5=export_hdf5,
         short_stats=short_stats,
-        skip_dataframe=skip_dataframe, compare=compare, debug=debug)
+        skip_dataframe=skip_dataframe, compare=compare, debug=debug, models=models)
 
 if __name__ == '__main__':
     main()
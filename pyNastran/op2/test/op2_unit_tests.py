@@ -32,7 +32,8 @@ from pyNastran.bdf.test.bdf_unit_tests import Tester
     #RealPlateBilinearForceArray, RealPlateForceArray)
 #from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
 from pyNastran.op2.export_to_vtk import export_to_vtk_filename
-from pyNastran.op2.vector_utils import filter1d, abs_max_min_global, abs_max_min_vector
+from pyNastran.op2.vector_utils import (
+    filter1d, abs_max_min_global, abs_max_min_vector, abs_max_min_axis)
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray
 from pyNastran.femutils.test.utils import is_array_close
 
@@ -81,8 +82,8 @@ class TestOP2(Tester):
         bdf_model.add_grid(24, [0., 1., 0.], cp=0, cd=2)
         bdf_model.add_grid(25, [-1., 0., 0.], cp=0, cd=2)
 
-        #bdf_model.add_grid(31, [1., 0., 0.], cp=3, cd=3)  # [0,1,0]
-        #bdf_model.add_grid(32, [1., 90., 0.], cp=3, cd=3) # [0,-1,0]
+        bdf_model.add_grid(31, [1., 0., 0.], cp=3, cd=3)  # [0,1,0]
+        bdf_model.add_grid(32, [1., 90., 0.], cp=3, cd=3) # [0,0,1]
 
         origin = [0., 0., 0.]
         zaxis = [0., 0., 1.]
@@ -108,8 +109,8 @@ class TestOP2(Tester):
             [1., 0., 0., 0., 0., 0.], # 24 - answer=same as 23
             [1., 0., 0., 0., 0., 0.], # 25 - [-1, 0., 0.]
 
-            #[1., 0., 0., 0., 0., 0.], # 31 - [0,1,0]
-            #[1., 0., 0., 0., 0., 0.], # 32 - [0,-1,0]
+            [1., 0., 0., 0., 0., 0.], # 31 - [0,1,0]
+            [1., 0., 0., 0., 0., 0.], # 32 - [0,0,1]
         ]])
         #--------------------------------------------
         #icd_transform, icp_transform, xyz_cp, nid_cp_cd - bdf_model.get_displacement_index_xyz_cp_cd(
@@ -124,7 +125,7 @@ class TestOP2(Tester):
         isubcase = 1
         dt = None
         disp = RealDisplacementArray(data_code, is_sort1, isubcase, dt)
-        disp.data = dxyz
+        disp.data = dxyz.copy()
         op2_model.displacements[1] = disp
 
         op2_model.transform_displacements_to_global(
@@ -150,14 +151,24 @@ class TestOP2(Tester):
             [0., 1.,], # 24
             [-1., 0.,], # 25
 
-            #[0., 1.,], # 31
-            #[0., -1.,], # 32
+            [0., 1.,], # 31
+            [0., 0.,], # 32
         ])
         assert is_array_close(dispi, expected_disp)
         #print(is_array_close(dispi, expected_disp))
         #print(dispi)
+        assert is_array_close(op2_model.displacements[1].data[0, -1, :3], [0., 0., 1.])
 
-        ## TODO: fix the thetad in the cid=3 coordinates (nid=33,34)
+        # transform to the cid=3 cylindrical frame
+        disp2 = RealDisplacementArray(data_code, is_sort1, isubcase, dt)
+        disp2.data = dxyz.copy()
+        op2_model.displacements[1] = disp2
+        op2_model.transform_displacements_to_global(
+            icd_transform, bdf_model.coords, xyz_cid0=xyz_cid0, cid=3)
+        dispi = op2_model.displacements[1].data[0, :, :3]
+        assert is_array_close(dispi[0, :], [0., 0., 1.]) # 1
+        assert is_array_close(dispi[6, :], [1., 0., 0.]) # 23
+        assert is_array_close(dispi[9:, :], [[1., 0., 0.], [1., 0., 0.]]) # 31, 32
 
     def test_generalized_tables(self):
         """tests that set_additional_generalized_tables_to_read overwrites the GEOM1S class"""
@@ -244,6 +255,23 @@ class TestOP2(Tester):
             [-3.0, 2.0, 3.0],
         ])))
 
+    def test_abs_max_min_axis(self):
+        """the max/min is found along an axis with the index"""
+        values = np.array([
+            [0.0, 2.0, 1.0],
+            [0.0, 2.0, -3.0],
+            [3.0, 2.0, -3.0],
+            [-3.0, 2.0, 3.0],
+        ])
+        outs, iouts = abs_max_min_axis(values, axis=1)
+        self.assertTrue(np.array_equal(outs, [2.0, -3.0, 3.0, 3.0]))
+        self.assertTrue(np.array_equal(iouts, [1, 2, 0, 2]))
+        self.assertTrue(np.array_equal(outs, abs_max_min_vector(values)))
+
+        outs, iouts = abs_max_min_axis(values, axis=0)
+        self.assertTrue(np.array_equal(outs, [3.0, 2.0, 3.0]))
+        self.assertTrue(np.array_equal(iouts, [2, 0, 3]))
+
         # not an array
         #print(abs_max_min([
             #[0.0, 2.0, 1.0],
@@ -634,6 +662,86 @@ class TestOP2(Tester):
         op2b.load_hdf5_filename(hdf5_filename, combine=True)
         op2b.print_subcase_key()
 
+    def test_op2_hdf5_compression(self):
+        """tests the chunked/compressed hdf5 export and the lazy load"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements',
+                                    'transient_solid_shell_bar.op2')
+        hdf5_filename = os.path.join(MODEL_PATH, 'sol_101_elements',
+                                     'transient_solid_shell_bar.test_op2.h5')
+        model = read_op2(op2_filename, debug=False)
+        stress = model.cquad4_stress[1]
+
+        for kwargs in [{'compression' : 'gzip', 'nthreads' : 2},
+                       {'compression' : 'lzf'},
+                       {'float32' : True, 'chunks' : True}]:
+            model.export_to_hdf5_filename(hdf5_filename, **kwargs)
+            for lazy in [False, True]:
+                model2 = OP2(debug=False)
+                model2.load_hdf5_filename(hdf5_filename, combine=True, lazy=lazy)
+                stress2 = model2.cquad4_stress[1]
+                data2 = stress2.data[:]
+                if kwargs.get('float32'):
+                    self.assertEqual(data2.dtype, np.float32)
+                    assert np.allclose(stress.data, data2, rtol=1e-6), kwargs
+                else:
+                    np.testing.assert_array_equal(stress.data, data2)
+                np.testing.assert_array_equal(stress.element_node, stress2.element_node)
+                if lazy:
+                    stress2.data.file.close()
+        os.remove(hdf5_filename)
+
+    def test_op2_get_rows(self):
+        """tests the element/node/layer id lookup of the results"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        model = read_op2(os.path.join(folder, 'static_solid_shell_bar.op2'), log=log)
+        model2 = read_op2(os.path.join(folder, 'mode_solid_shell_bar.op2'), log=log)
+
+        stress = model.cquad4_stress[1]
+        eids = stress.element_node[:, 0]
+        nids = stress.element_node[:, 1]
+        irows = stress.get_rows(eids=[eids[-1], eids[0], -1])
+        np.testing.assert_array_equal(irows, np.where((eids == eids[0]) | (eids == eids[-1]))[0])
+        np.testing.assert_array_equal(stress.eid_to_element_node_index([eids[0]]),
+                                      np.where(eids == eids[0])[0])
+
+        # the nodes aren't sorted
+        irows = stress.get_rows(nids=[0, nids[1]])
+        np.testing.assert_array_equal(irows, np.where((nids == 0) | (nids == nids[1]))[0])
+        irows = stress.get_rows(eids=eids[:1], nids=[0])
+        np.testing.assert_array_equal(irows, np.where((eids == eids[0]) & (nids == 0))[0])
+        self.assertEqual(len(stress.get_rows()), stress.data.shape[1])
+
+        displacement = model.displacements[1]
+        nids = displacement.node_gridtype[:, 0]
+        np.testing.assert_array_equal(displacement.get_rows(nids=nids[::-3]),
+                                      np.arange(len(nids))[::-3][::-1])
+
+        composite = model2.cquad4_composite_stress[1]
+        eids = composite.element_layer[:, 0]
+        layers = composite.element_layer[:, 1]
+        irows = composite.get_rows(eids=eids[-1:], layers=[1])
+        np.testing.assert_array_equal(irows, np.where((eids == eids[-1]) & (layers == 1))[0])
+
+        gpforce = model.grid_point_forces[1]
+        nids = gpforce.node_element[0, :, 0]
+        np.testing.assert_array_equal(gpforce.get_rows(nids=nids[:1], itime=0),
+                                      np.where(nids == nids[0])[0])
+
+        # the (ntimes, nelements) element
+        strain_energy = model2.cquad4_strain_energy[1]
+        eids = strain_energy.element[2, :]
+        np.testing.assert_array_equal(strain_energy.get_rows(eids=eids[-2:], itime=2), [3, 4])
+        np.testing.assert_array_equal(strain_energy.get_rows(eids=[eids[0]]), [0])
+
+        # the (nelements, 2) element
+        model3 = read_op2(os.path.join(MODEL_PATH, 'random', 'rms_tri_oesrmx1.op2'), log=log)
+        for result_name in ['psd.cquad4_stress', 'psd.cquad4_strain']:
+            for random_plate in model3.get_result(result_name).values():
+                eids = random_plate.element[:, 0]
+                np.testing.assert_array_equal(random_plate.get_rows(eids=eids[:1]),
+                                              np.where(eids == eids[0])[0])
+
     def test_op2_solid_shell_bar_01_geom(self):
         """tests reading op2 geometry"""
         folder = os.path.join(MODEL_PATH, 'sol_101_elements')
@@ -1796,6 +1904,52 @@ class TestOP2(Tester):
         #print(eigenvector)
         assert len(eigenvector.modes) == 2, eigenvector.modes
 
+    def test_set_element_node_ids_01(self):
+        """specify the elements/nodes to extract"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.abspath(os.path.join(MODEL_PATH, 'sol_101_elements',
+                                                    'transient_solid_shell_bar.op2'))
+        model = read_op2(op2_filename, debug=False, log=log)
+        model2 = read_op2(op2_filename, debug=False, log=log,
+                          eids=[7, 16], nids=np.arange(10, 15))
+
+        isubcase = 1
+        disp = model.displacements[isubcase]
+        disp2 = model2.displacements[isubcase]
+        inode = np.arange(9, 14)
+        self.assertEqual(disp2.data.shape, (disp.data.shape[0], 5, 6))
+        self.assertTrue(np.array_equal(disp2.node_gridtype, disp.node_gridtype[inode, :]))
+        self.assertTrue(np.array_equal(disp2.data, disp.data[:, inode, :]))
+
+        stress = model.cquad4_stress[isubcase]
+        stress2 = model2.cquad4_stress[isubcase]
+        ieid = np.where(np.in1d(stress.element_node[:, 0], [7, 16]))[0]
+        self.assertEqual(stress2.data.shape[1], 20)
+        self.assertTrue(np.array_equal(stress2.element_node, stress.element_node[ieid, :]))
+        self.assertTrue(np.array_equal(stress2.data, stress.data[:, ieid, :]))
+        self.assertEqual(len(model2.ctetra_stress), 0)
+
+    def test_set_node_ids_rougv1(self):
+        """the relative eigenvectors (ROUGV1) are filtered by node id"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'femap_exhaust', 'modal_example.op2')
+        nids = [14161, 14200, 14202]
+        model = read_op2(op2_filename, debug=False, log=log)
+        model2 = read_op2(op2_filename, debug=False, log=log, nids=nids)
+
+        isubcase = 1
+        for eigenvectors, eigenvectors2 in [
+                (model.eigenvectors, model2.eigenvectors),
+                (model.op2_results.ROUGV1.eigenvectors,
+                 model2.op2_results.ROUGV1.eigenvectors)]:
+            eigenvector = eigenvectors[isubcase]
+            eigenvector2 = eigenvectors2[isubcase]
+            inode = np.searchsorted(eigenvector.node_gridtype[:, 0], nids)
+            self.assertEqual(eigenvector2.data.shape, (eigenvector.data.shape[0], 3, 6))
+            self.assertTrue(np.array_equal(eigenvector2.node_gridtype,
+                                           eigenvector.node_gridtype[inode, :]))
+            self.assertTrue(np.array_equal(eigenvector2.data, eigenvector.data[:, inode, :]))
+
     def test_random_ctria3(self):
         """runs a random test"""
         folder = os.path.join(MODEL_PATH, 'random')
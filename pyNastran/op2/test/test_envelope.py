@@ -0,0 +1,135 @@
+"""tests the max/min envelope of the results"""
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.envelope import envelope, envelope_op2, Envelope
+from pyNastran.utils.log import get_logger
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+
+class TestEnvelope(unittest.TestCase):
+    """tests the envelope of the results over the subcases/time steps"""
+
+    def test_envelope(self):
+        """the peaks and their subcase/time step are found"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        model = read_op2(op2_filename, log=log)
+        stresses = [model.cquad4_stress[1], model.cquad4_stress[2]]
+        headers = ['omax', 'omin', 'von_mises']
+        env = envelope(model.cquad4_stress, headers=headers)
+        self.assertEqual(env.headers, headers)
+        self.assertEqual(env.ntimes, 8)
+        self.assertTrue(np.array_equal(env.row_ids, stresses[0].element_node))
+
+        # (nsubcases * ntimes, nrows, ncolumns)
+        data = np.vstack([stress.data[:, :, [5, 6, 7]] for stress in stresses])
+        subcases = np.repeat([1, 2], 4)
+        itimes = np.tile(np.arange(4), 2)
+        times = np.hstack([stress._times for stress in stresses])
+        ipeaks = {
+            'max' : data.argmax(axis=0),
+            'min' : data.argmin(axis=0),
+        }
+        ipeaks['abs_max'] = np.where(data.max(axis=0) >= -data.min(axis=0),
+                                     ipeaks['max'], ipeaks['min'])
+        for kind, ipeak in ipeaks.items():
+            irow, icolumn = np.indices(ipeak.shape)
+            self.assertTrue(np.array_equal(env.values[kind], data[ipeak, irow, icolumn]), kind)
+            self.assertTrue(np.array_equal(env.subcases[kind], subcases[ipeak]), kind)
+            self.assertTrue(np.array_equal(env.itimes[kind], itimes[ipeak]), kind)
+            self.assertTrue(np.array_equal(env.times[kind], times[ipeak]), kind)
+
+        # the OP2 is read one time step at a time
+        env2 = envelope_op2(op2_filename, 'cquad4_stress', headers=headers, log=log)
+        self.assertEqual(env2.ntimes, 8)
+        for kind in ['max', 'min', 'abs_max']:
+            self.assertTrue(np.array_equal(env2.values[kind], env.values[kind]), kind)
+            self.assertTrue(np.array_equal(env2.subcases[kind], env.subcases[kind]), kind)
+            self.assertTrue(np.array_equal(env2.itimes[kind], env.itimes[kind]), kind)
+
+        margins = env.get_margins([1.e4, 1.e4, 2.e4])
+        self.assertTrue(np.allclose(margins[:, 2], 2.e4 / np.abs(env.values['abs_max'][:, 2]) - 1.))
+
+        # the rows must be the same
+        with self.assertRaises(ValueError):
+            env.add_result(model.ctria3_stress[1])
+        with self.assertRaises(KeyError):
+            envelope(model.cquad4_stress, headers=['cat'])
+
+    def test_envelope_static(self):
+        """a static result has a nan time"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = read_op2(op2_filename, log=log)
+        disp = model.displacements[1]
+        env = Envelope()
+        env.add_result(disp)
+        self.assertEqual(env.headers, disp.get_headers())
+        self.assertEqual(env.row_id_names, ['node_id', 'grid_type'])
+        self.assertTrue(np.array_equal(env.values['max'], disp.data[0]))
+        self.assertTrue(np.array_equal(env.values['abs_max'], disp.data[0]))
+        self.assertTrue(np.all(env.itimes['min'] == 0))
+        self.assertTrue(np.all(np.isnan(env.times['min'])))
+
+    def test_envelope_strain_energy(self):
+        """the (ntimes, nelements) element of the strain energy is supported"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        model = read_op2(op2_filename, log=log)
+        strain_energy = model.cquad4_strain_energy[1]
+        env = envelope([strain_energy], headers=['strain_energy'])
+        self.assertEqual(env.row_id_names, ['element_id'])
+        self.assertTrue(np.array_equal(env.row_ids[:, 0], strain_energy.element[0]))
+        self.assertTrue(np.array_equal(env.values['max'][:, 0],
+                                       strain_energy.data[:, :, 0].max(axis=0)))
+
+    def test_envelope_export(self):
+        """the envelope is written to a CSV and an HDF5 file"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        env = envelope_op2(op2_filename, 'chexa_stress', headers=['von_mises'], log=log)
+
+        dirname = tempfile.mkdtemp()
+        try:
+            csv_filename = os.path.join(dirname, 'envelope.csv')
+            env.export_to_csv(csv_filename)
+            with open(csv_filename, 'r') as csv_file:
+                lines = csv_file.readlines()
+            self.assertEqual(len(lines), env.nrows + 1)
+            names = lines[0].strip().split(',')
+            self.assertEqual(names[:4], ['element_id', 'node_id',
+                                         'von_mises_max', 'von_mises_max_subcase'])
+            csv_data = np.loadtxt(csv_filename, delimiter=',', skiprows=1)
+            self.assertTrue(np.array_equal(csv_data[:, :2], env.row_ids))
+            self.assertTrue(np.allclose(csv_data[:, names.index('von_mises_abs_max')],
+                                        env.values['abs_max'][:, 0]))
+            self.assertTrue(np.array_equal(csv_data[:, names.index('von_mises_min_itime')],
+                                           env.itimes['min'][:, 0]))
+
+            try:
+                import h5py
+            except ImportError:
+                return
+            hdf5_filename = os.path.join(dirname, 'envelope.h5')
+            env.export_to_hdf5_filename(hdf5_filename)
+            with h5py.File(hdf5_filename, 'r') as hdf5_file:
+                self.assertTrue(np.array_equal(hdf5_file['row_ids'][()], env.row_ids))
+                for kind in ['max', 'min', 'abs_max']:
+                    group = hdf5_file[kind]
+                    self.assertTrue(np.array_equal(group['values'][()], env.values[kind]))
+                    self.assertTrue(np.array_equal(group['subcases'][()], env.subcases[kind]))
+        finally:
+            shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -565,7 +565,7 @@ def get_test_op2_data():
 
     msg = "Usage:\n"
     #is_release = True
-    options = '[--skip_dataframe] [-z] [-w] [-t] [-s <sub>] [-x <arg>]... [--nx] [--safe] [--post POST] [--load_hdf5] [--memory]'
+    options = '[--skip_dataframe] [-z] [-w] [-t] [-s <sub>] [-x <arg>]... [--nx] [--safe] [--post POST] [--load_hdf5] [--memory] [--inventory]'
     if is_release:
         line1 = "test_op2 [-q] [-b] [-c] [-g] [-n] [-f] %s OP2_FILENAME\n" % options
     else:
@@ -602,6 +602,7 @@ def get_test_op2_data():
     msg += "  --nx                   Assume NX Nastran\n"
     msg += "  --post POST            Set the PARAM,POST flag\n"
     msg += "  --safe                 Safe cross-references BDF (default=False)\n"
+    msg += "  --inventory            Lists the tables/results/sizes without reading the results\n"
 
 
     if not is_release:
@@ -645,7 +646,12 @@ def main():
 
     time0 = time.time()
 
-    if data['--profile']:
+    if data['--inventory']:
+        from pyNastran.op2.op2 import read_op2_inventory
+        mode = 'nx' if data['--nx'] else None
+        inventory = read_op2_inventory(data['OP2_FILENAME'], debug=not data['--quiet'], mode=mode)
+        print(inventory.get_op2_stats(short=data['--short_stats']))
+    elif data['--profile']:
         import pstats
 
         import cProfile
@@ -0,0 +1,343 @@
+"""tests the OP2 table of contents"""
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pyNastran
+from pyNastran.op2.op2 import OP2, iter_op2_results, read_op2_inventory
+from pyNastran.op2.op2_interface.op2_index import (
+    build_op2_index, load_op2_index, get_op2_index_filename)
+from pyNastran.utils.log import get_logger
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+
+class TestOP2Index(unittest.TestCase):
+    """tests the marker-only pre-scan of an OP2"""
+
+    def test_op2_index(self):
+        """the tables, records, and table 3 headers are found"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        index = build_op2_index(op2_filename)
+        self.assertTrue(index.is_complete)
+        table_names = index.get_table_names()
+        self.assertEqual(table_names[:2], [b'PVT0', b'CASECC'])
+        self.assertEqual(table_names[-1], b'OPG1')
+        self.assertEqual(index.tables[-1].end, os.path.getsize(op2_filename) - 12)
+
+        for table in index.tables:
+            self.assertIs(index.get_table(table.start), table)
+            self.assertIs(index.get_table(table.end - 1), table)
+            ndata, unused_end = index.get_record(table.start)
+            self.assertEqual(ndata, 8)
+
+        oug = index.tables[table_names.index(b'OUGV1')]
+        headers = oug.get_headers()
+        self.assertEqual(len(headers), 1)
+        header, ndata = headers[0]
+        approach_code, table_code, unused_element_type, isubcase = header[:4]
+        num_wide = header[9]
+        self.assertEqual((approach_code, table_code, isubcase, num_wide), (13, 1, 1, 8))
+        self.assertEqual(ndata, 800)  # 25 nodes * 8 words * 4 bytes
+
+    def test_op2_index_read(self):
+        """the OP2 is the same with the index"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'freq_sine', 'good_sine.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            model1 = OP2(debug=False, log=log)
+            model1.use_index = False
+            model1.read_op2(op2_filename, skip_undefined_matrices=True)
+
+            model2 = OP2(debug=False, log=log)
+            model2.read_op2(op2_filename, skip_undefined_matrices=True)
+            self.assertTrue(model1 == model2)
+            self.assertEqual(model1.get_op2_stats(), model2.get_op2_stats())
+            self.assertEqual(sorted(model1.matrices), sorted(model2.matrices))
+            for name, matrix in model1.matrices.items():
+                self.assertEqual(str(matrix.data), str(model2.matrices[name].data))
+
+    def test_op2_index_presize(self):
+        """the result objects are sized from the index without reading the data"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        index = build_op2_index(op2_filename)
+        oug = index.tables[index.get_table_names().index(b'OUGV1')]
+        pairs = oug.get_subtable_pairs()
+        self.assertEqual(len(pairs), 21)
+        for table3, unused_table4 in pairs:
+            self.assertEqual(len(index.table3_records[table3[1]]), 584)
+
+        model = OP2(debug=False, log=log)
+        op2_reader = model.op2_reader
+        read_record_ndata = op2_reader._read_record_ndata
+        nrecords = {}
+        def _read_record_ndata(*args, **kwargs):
+            """counts the records that are read by the array sizing"""
+            if model.read_mode == 1:
+                nrecords[model.table_name] = nrecords.get(model.table_name, 0) + 1
+            return read_record_ndata(*args, **kwargs)
+        op2_reader._read_record_ndata = _read_record_ndata
+        model.read_op2(op2_filename)
+
+        # only the table name (and the peek at the next table name) and the
+        # -1/-2 header records are read, not the 168 table 3/4 records
+        self.assertEqual(nrecords[b'OES1X1'], 4)
+        self.assertEqual(nrecords[b'OUGV1'], 8)  # 2 tables
+        self.assertEqual(model.displacements[1].data.shape, (42, 25, 6))
+
+    def test_op2_index_sidecar(self):
+        """the .op2idx sidecar is written, reloaded, and rebuilt when stale"""
+        log = get_logger(level='warning')
+        dirname = tempfile.mkdtemp()
+        try:
+            op2_filename = os.path.join(dirname, 'transient_solid_shell_bar.op2')
+            shutil.copyfile(
+                os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+                op2_filename)
+            index_filename = get_op2_index_filename(op2_filename)
+            self.assertTrue(index_filename.endswith('transient_solid_shell_bar.op2idx'))
+
+            model = OP2(debug=False, log=log)
+            model.use_index_file = True
+            model.read_op2(op2_filename)
+            self.assertTrue(os.path.exists(index_filename))
+
+            index = build_op2_index(op2_filename)
+            index2 = load_op2_index(op2_filename)
+            self.assertEqual(index2.get_table_names(), index.get_table_names())
+            self.assertEqual(index2.records, index.records)
+            self.assertEqual(index2.n0, index.n0)
+            self.assertEqual(index2.get_result_offsets(), index.get_result_offsets())
+            for table, table2 in zip(index.tables, index2.tables):
+                self.assertEqual(table2.subtables, table.subtables)
+            self.assertEqual(index2.table3_records, index.table3_records)
+
+            offsets = index.get_result_offsets()
+            self.assertEqual(len([key for key in offsets if key[:3] == (b'OUGV1', 1, 0)]), 42)
+
+            # the sidecar is stale when the OP2 changes
+            mtime = os.path.getmtime(op2_filename)
+            os.utime(op2_filename, (mtime + 10., mtime + 10.))
+            self.assertIsNone(load_op2_index(op2_filename))
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_op2_get_result_lazy(self):
+        """a subset of a result table is read by seeking to it"""
+        log = get_logger(level='warning')
+        dirname = tempfile.mkdtemp()
+        try:
+            op2_filename = os.path.join(dirname, 'transient_solid_shell_bar.op2')
+            shutil.copyfile(
+                os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+                op2_filename)
+            model = OP2(debug=False, log=log)
+            model.read_op2(op2_filename)
+
+            model1 = OP2(debug=False, log=log)
+            objs = model1.get_result_lazy(op2_filename, 'OUGV1', isubcase=1)
+            self.assertTrue(os.path.exists(get_op2_index_filename(op2_filename)))
+            self.assertEqual(len(objs), 1)
+            self.assertIs(objs[0], model1.displacements[1])
+            self.assertEqual(len(model1.cquad4_stress), 0)
+            self.assertTrue(model1.displacements[1] == model.displacements[1])
+
+            # the 3rd time step of the CQUAD4 (144) stress
+            model2 = OP2(debug=False, log=log)
+            objs = model2.get_result_lazy(op2_filename, b'OES1X1', element_type=144, itime=2)
+            stress2 = model2.cquad4_stress[1]
+            stress = model.cquad4_stress[1]
+            self.assertEqual(objs, [stress2])
+            self.assertEqual(stress2.data.shape[0], 1)
+            self.assertEqual(stress2._times[0], stress._times[2])
+            self.assertTrue(np.array_equal(stress2.data[0], stress.data[2]))
+            self.assertTrue(np.array_equal(stress2.element_node, stress.element_node))
+
+            with self.assertRaises(KeyError):
+                OP2(debug=False, log=log).get_result_lazy(op2_filename, 'OUGV1', isubcase=2)
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_op2_get_result_lazy_sol200(self):
+        """the design cycle in the keys of a SOL 200 result matches read_op2"""
+        log = get_logger(level='warning')
+        dirname = tempfile.mkdtemp()
+        try:
+            for folder, op2_name, table_name, result_name in [
+                    ('sol200', 'model_200.op2', 'OUGV1', 'displacements'),
+                    ('other', 'dofm12.op2', 'OES1X1', 'ctria6_stress'),]:
+                op2_filename = os.path.join(dirname, op2_name)
+                shutil.copyfile(os.path.join(MODEL_PATH, folder, op2_name), op2_filename)
+                model = OP2(debug=False, log=log)
+                model.read_op2(op2_filename)
+                results = model.get_result(result_name)
+
+                model2 = OP2(debug=False, log=log)
+                model2.get_result_lazy(op2_filename, table_name)
+                results2 = model2.get_result(result_name)
+                self.assertEqual(sorted(results2), sorted(key for key in results
+                                                          if key in results2))
+                self.assertGreater(len(set(key[3] for key in results2)), 1)
+                for key, result2 in results2.items():
+                    self.assertEqual(result2.data.shape, results[key].data.shape)
+                    self.assertTrue(np.array_equal(result2.data, results[key].data))
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_op2_iter_results(self):
+        """a result is read one time step at a time"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+        stress = model.cquad4_stress[1]
+
+        itimes = []
+        for isubcase, itime, stress2 in iter_op2_results(op2_filename, 'cquad4_stress', log=log):
+            self.assertEqual(isubcase, 1)
+            self.assertEqual(stress2.data.shape, (1, ) + stress.data.shape[1:])
+            self.assertEqual(stress2._times[0], stress._times[itime])
+            self.assertTrue(np.array_equal(stress2.data[0], stress.data[itime]))
+            self.assertTrue(np.array_equal(stress2.element_node, stress.element_node))
+            itimes.append(itime)
+        self.assertEqual(itimes, list(range(len(stress._times))))
+
+        blocks = list(iter_op2_results(op2_filename, 'cquad4_stress', subcases=2, log=log))
+        self.assertEqual(blocks, [])
+
+        # the strain energy is in the same table for every element type
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'modes_elements.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+        self._check_iter_results(model, op2_filename, 'cquad4_strain_energy', log, 6)
+        self._check_iter_results(model, op2_filename, 'crod_strain_energy', log, 6)
+
+        with self.assertRaises(KeyError):
+            list(iter_op2_results(op2_filename, 'temperatures', log=log))
+
+    def test_op2_iter_results_gpforce(self):
+        """the grid point forces (OGPFB1) are read one frequency at a time"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+        self._check_iter_results(model, op2_filename, 'grid_point_forces', log, 7)
+
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+        self._check_iter_results(model, op2_filename, 'grid_point_forces', log, 1)
+
+    def test_op2_iter_results_sort2(self):
+        """a SORT2 result (OUGV2) is yielded one time step at a time"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'time_thermal_elements_sort2_nx.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+
+        # the OUGV2 (SORT2) and OUGV1 (SORT1) tables
+        keys = [key for key in model.temperatures if key[2] == 2]
+        self.assertEqual(len(keys), 1)
+        self._check_iter_results(model, op2_filename, 'temperatures', log, 18)
+        self._check_iter_results(model, op2_filename, 'thermal_load_vectors', log, 18)
+
+    def _check_iter_results(self, model, op2_filename, result_name, log, nblocks):
+        """
+        checks that the time steps from iter_op2_results match read_op2,
+        which has the rows of every time step (e.g., a grid point force
+        result has a different number of rows for each time step)
+        """
+        blocks = list(iter_op2_results(op2_filename, result_name, log=log))
+        self.assertEqual(len(blocks), nblocks)
+
+        results = list(model.get_result(result_name).values())
+        iblock = 0
+        for result in results:
+            for itime in range(result.data.shape[0]):
+                isubcase, itime2, result2 = blocks[iblock]
+                self.assertEqual(isubcase, result.isubcase)
+                self.assertEqual(itime2, itime)
+                self.assertEqual(result2.data.shape[0], 1)
+                np.testing.assert_array_equal(result2._times, result._times[itime:itime+1])
+                nrows = result2.data.shape[1]
+                np.testing.assert_array_equal(result2.data[0], result.data[itime, :nrows])
+                iblock += 1
+        self.assertEqual(iblock, nblocks)
+
+    def test_op2_inventory(self):
+        """the inventory matches the results of a full read"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        inventory = read_op2_inventory(op2_filename, log=log)
+        self.assertTrue(inventory.is_complete)
+        self.assertEqual(inventory.subcases, [1])
+        self.assertEqual(list(inventory.tables)[:2], ['PVT0', 'CASECC'])
+        self.assertLess(sum(inventory.tables.values()), os.path.getsize(op2_filename))
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+
+        displacement = model.displacements[1]
+        result = inventory.results[('OUGV1', 1, 1, 0, '')]
+        self.assertEqual(result.element_name, '')
+        self.assertTrue(result.is_sort1)
+        self.assertEqual(result.ntimes, displacement.data.shape[0])
+        self.assertEqual(result.nvalues, displacement.data.shape[1])
+        np.testing.assert_allclose(result.times, displacement._times)
+
+        stress = model.ctria3_stress[1]
+        result = inventory.results[('OES1X1', 1, 5, 74, 'CTRIA3')]
+        self.assertEqual(result.element_name, 'CTRIA3')
+        self.assertEqual(result.ntimes, stress.data.shape[0])
+        self.assertEqual(result.nvalues, stress.data.shape[1] // 2)
+        self.assertEqual(result.nbytes, stress.data.shape[0] * result.nvalues * 4 * 17)
+        inventory.get_op2_stats()
+        inventory.get_op2_stats(short=True)
+
+    def test_op2_mmap(self):
+        """the real SORT1 results are views of a memory map of the OP2"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+
+        model2 = OP2(debug=False, log=log)
+        model2.use_mmap = True
+        model2.read_op2(op2_filename)
+        self.assertTrue(model == model2)
+
+        # the displacements are in 2 OUGV1 tables, so they're gathered
+        self.assertTrue(model2.displacements[1].data.flags.writeable)
+        for res_name in ['spc_forces', 'cbar_stress', 'crod_force', 'grid_point_forces']:
+            obj = getattr(model, res_name)[1]
+            obj2 = getattr(model2, res_name)[1]
+            self.assertFalse(obj2.data.flags.owndata, res_name)
+            self.assertFalse(obj2.data.flags.writeable, res_name)
+            self.assertEqual(obj2.data.shape, obj.data.shape)
+            self.assertTrue(np.array_equal(obj2.data, obj.data), res_name)
+
+    def test_op2_parallel(self):
+        """the subcases are read by a process pool"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'pload4', 'ctria3.op2')
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+
+        model2 = OP2(debug=False, log=log)
+        model2.read_op2(op2_filename, nprocesses=2)
+        self.assertTrue(model == model2)
+        self.assertEqual(model.get_op2_stats(), model2.get_op2_stats())
+        self.assertEqual(list(model2.displacements), list(model.displacements))
+        self.assertEqual(len(model2.displacements), 6)
+        self.assertEqual(model2.isubcase_name_map, model.isubcase_name_map)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
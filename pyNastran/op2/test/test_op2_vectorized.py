@@ -0,0 +1,119 @@
+"""tests that the vectorized result readers match the unvectorized readers"""
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pyNastran
+from pyNastran.op2.op2 import OP2
+from pyNastran.utils.log import get_logger
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+
+def read_op2_vectorized(op2_filename, results=None, log=None):
+    """reads the OP2 with and without the vectorized readers"""
+    models = []
+    for use_vector in [True, False]:
+        model = OP2(log=log)
+        model.use_vector = use_vector
+        if results is not None:
+            model.set_results(results)
+        model.read_op2(op2_filename)
+        models.append(model)
+    return models
+
+
+class TestOP2Vectorized(unittest.TestCase):
+    """compares the use_vector=True/False reads"""
+
+    def _check_results(self, op2_filename, skip_results=None):
+        """checks that every array of every result is the same"""
+        if skip_results is None:
+            skip_results = []
+        log = get_logger(level='warning')
+        model, model_scalar = read_op2_vectorized(op2_filename, log=log)
+        table_types = model.get_table_types()
+        self.assertEqual(table_types, model_scalar.get_table_types())
+
+        nresults = 0
+        for table_type in table_types:
+            if table_type in skip_results:
+                continue
+            results = model.get_result(table_type)
+            results_scalar = model_scalar.get_result(table_type)
+            if not isinstance(results, dict):
+                continue
+            self.assertEqual(sorted(results), sorted(results_scalar), table_type)
+            for key, obj in results.items():
+                obj_scalar = results_scalar[key]
+                for name, value in sorted(vars(obj).items()):
+                    # float_mask is only used by the vectorized reader
+                    if not isinstance(value, np.ndarray) or name == 'float_mask':
+                        continue
+                    value_scalar = getattr(obj_scalar, name)
+                    msg = '%s %s %s' % (table_type, key, name)
+                    self.assertEqual(value.dtype, value_scalar.dtype, msg)
+                    np.testing.assert_array_equal(value, value_scalar, err_msg=msg)
+                nresults += 1
+        self.assertGreater(nresults, 0)
+
+    def test_random_sort2(self):
+        """the random and SORT2 stress/strain/force readers"""
+        op2_filename = os.path.join(MODEL_PATH, 'other', 'ofprand1.op2')
+
+        # the unvectorized OPG reader stores the SORT2 times as floats
+        skip_results = ['no.load_vectors', 'rms.load_vectors']
+        self._check_results(op2_filename, skip_results=skip_results)
+
+    def test_random_plates(self):
+        """the random CQUAD4/CTRIA3/CBAR readers"""
+        op2_filename = os.path.join(MODEL_PATH, 'random', 'rms_tri_oesrmx1.op2')
+        self._check_results(op2_filename)
+
+    def test_nonlinear(self):
+        """the nonlinear CQUAD4/CTRIA3/CBEAM readers"""
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2')
+        self._check_results(op2_filename)
+
+    def test_complex_grid_point_forces(self):
+        """the complex grid point force names are stripped like add_sort1"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'elements', 'freq_elements2.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'random', 'rms_tri_oesrmx1.op2'),
+        ]
+        dirname = tempfile.mkdtemp()
+        try:
+            for op2_filename in op2_filenames:
+                model, model_scalar = read_op2_vectorized(
+                    op2_filename, results=['grid_point_forces'], log=log)
+                self.assertEqual(len(model.grid_point_forces), len(model_scalar.grid_point_forces))
+                for key, gpforce in model.grid_point_forces.items():
+                    gpforce_scalar = model_scalar.grid_point_forces[key]
+                    self.assertTrue(gpforce.is_complex)
+                    self.assertTrue(np.array_equal(gpforce.element_names,
+                                                   gpforce_scalar.element_names))
+                    self.assertTrue(np.array_equal(gpforce.node_element,
+                                                   gpforce_scalar.node_element))
+                    self.assertTrue(np.array_equal(gpforce.data, gpforce_scalar.data))
+
+                    # the SOURCE column of the force balance
+                    f06_lines = []
+                    for i, gpforcei in enumerate([gpforce, gpforce_scalar]):
+                        f06_filename = os.path.join(dirname, 'gpforce_%i.f06' % i)
+                        with open(f06_filename, 'w') as f06_file:
+                            gpforcei.write_f06(f06_file, header=['', '', ''])
+                        with open(f06_filename, 'r') as f06_file:
+                            f06_lines.append(f06_file.readlines())
+                    self.assertEqual(f06_lines[0], f06_lines[1], op2_filename)
+        finally:
+            shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -7,6 +7,7 @@ defines some methods for working with arrays:
  - abs_max_min_global(values)
  - abs_max_min_vector(values)
  - abs_max_min(values, global_abs_max=True)
+ - abs_max_min_axis(values, axis=0)
  - principal_3d(o11, o22, o33, o12, o23, o13)
  - transform_force(force_in_local,
                    coord_out, coords,
@@ -346,34 +347,55 @@ def abs_max_min_vector(values):
     .. note:: [3.0,  2.0, -3.0] will return 3.0, and
               [-3.0, 2.0,  3.0] will return 3.0
 
+    """
+    outs = abs_max_min_axis(values, axis=1)[0]
+    return outs
+
+
+def abs_max_min_axis(values, axis=0):
+    """
+    Gets the max or min value (whichever has the larger magnitude) along an
+    axis and the location of it.  This is useful for finding the peak
+    principal stresses over the time steps of a result.
+
+    Parameters
+    ----------
+    values: ndarray/listtuple
+        an ND-array of values (e.g., [ntimes, nelements])
+    axis : int; default=0
+        the axis that is compressed
+
+    Returns
+    -------
+    abs_max_mins: ndarray
+        the max or min values (e.g., [nelements])
+    iabs_max_mins: int ndarray
+        the index of the max or min values along the axis
+
+    ::
+       >>> element1 = [0.0,  1.0, 2.0]  # 2.0
+       >>> element2 = [0.0, -3.0, 2.0]  # -3.0
+       >>> values, ivalues = abs_max_min_axis([element1, element2], axis=1)
+       >>> values
+       [2.0, -3.0]
+       >>> ivalues
+       [2, 1]
+
+    .. note:: [3.0,  2.0, -3.0] will return 3.0, and
+              [-3.0, 2.0,  3.0] will return 3.0
+
     """
     # support lists/tuples
     values = np.asarray(values)
 
-    # find the [maxs,
-    #           mins]
-    # we organize it as [maxs, mins], which is why the note applies
-    # we could make both of the edge cases return -3.0, but if you're using
-    # this function it shouldn't matter
-    maxs_mins = np.array([values.max(axis=1), values.min(axis=1)])
-
-    # we figure out the absolute max/min for each row
-    abs_vals = np.abs(maxs_mins)
-    absolute_maxs = abs_vals.max(axis=0)
-
-    outs = np.zeros(absolute_maxs.shape[0], dtype=values.dtype)
-    for i, absolute_max in enumerate(absolute_maxs):
-        # find the location of the absolute max value
-        # 1.  we take the first value (the where[0]) to chop the return value
-        #     since there is no else conditional
-        # 2.  we take the first value (the where[0][0]) to only get the max
-        #     value if 2+ values are returned
-        j = np.where(absolute_max == abs_vals[:, i])[0][0]
-
-        # get the raw value from the absoluted value, so:
-        # value = npabs(raw_value)
-        outs[i] = maxs_mins[j, i]
-    return outs
+    # the max is used if the magnitudes are the same, which is why the
+    # note applies
+    maxs = values.max(axis=axis)
+    mins = values.min(axis=axis)
+    is_max = np.abs(maxs) >= np.abs(mins)
+    outs = np.where(is_max, maxs, mins)
+    iouts = np.where(is_max, values.argmax(axis=axis), values.argmin(axis=axis))
+    return outs, iouts
 
 
 def abs_max_min(values, global_abs_max=True):